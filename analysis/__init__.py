@@ -0,0 +1,23 @@
+"""
+The resume analysis engine: text extraction, keyword and job matching, ATS
+scoring and feedback (also against a given job description), and PDF
+rendering.
+
+Nothing here imports Flask or touches the database, so batch workers, CLIs
+and benchmarks can import just this package. Heavy third-party libraries
+(pdfplumber, python-docx, ReportLab) are imported on first use.
+"""
+from analysis.skills import BASE_SKILLS, INDUSTRY_KEYWORDS, ACTION_VERBS
+from analysis.extract import extract_text_from_resume, is_valid_resume_content
+from analysis.jobs import (
+    load_jobs_data, known_skills, skill_forms, skill_ids, skill_taxonomy, implied_skills, extract_keywords, skill_vector,
+    suggest_job_role, fetch_jobs
+)
+from analysis.ats import (
+    get_recommendation_label, comprehensive_ats_analysis, calculate_content_score, calculate_resume_score,
+    analyze_for_improvements
+)
+from analysis.education import get_recommended_skills_by_degree, generate_education_description
+from analysis.catalogue import job_matrix
+from analysis.tailoring import jd_key, jd_vector, tailored_score
+from analysis.pdf import PDF_TEMPLATE_VERSION, build_resume_story, build_resume_sidecar, resume_sidecar, generate_ats_pdf
@@ -0,0 +1,81 @@
+"""
+Skill surface forms.
+
+One skill is written many ways: "Power BI" and "powerbi", "Node.js" and
+"nodejs", "CI/CD" and "ci-cd". skill_key() folds case, spacing and
+punctuation into one key, and the ``aliases`` of skill_taxonomy.json name
+the forms no folding can reach ("ml" for machine learning). SkillForms
+precomputes the map from every key to its canonical skill, so resolving a
+surface form is one dict lookup, and matches multi-word and punctuated
+forms in text a token at a time.
+"""
+import re
+
+SEPARATORS = re.compile(r'[\s\-_/.]+')
+# Lower-case words, keeping a leading dot (.net) and a trailing ++ or # (c++, c#)
+WORD = r'\.?[a-z]+(?:\+\+|#)?'
+# A word, and the separators joining it to the next word if only separators come between them
+TOKEN = re.compile(rf'(?<!\w)({WORD})(?!\w)([\s\-/.]+?(?={WORD}(?!\w)))?')
+
+
+def skill_key(form):
+    """The normalisation key of a surface form: lower case, without spaces, dashes, slashes or dots."""
+    form = form.strip().lower()
+    return ('.' if form.startswith('.') else '') + SEPARATORS.sub('', form)
+
+
+class SkillForms:
+    """
+    Normalisation index of a skill vocabulary. Forms that share a key, and
+    aliases, resolve to one canonical skill: the alias target, else the
+    first such form in sorted order.
+    """
+
+    def __init__(self, vocabulary, aliases):
+        canonical = {}  # key -> canonical skill
+        for alias, skill in sorted(aliases.items()):
+            if skill in vocabulary:
+                canonical.setdefault(skill_key(skill), skill)
+        for skill in sorted(vocabulary):
+            canonical.setdefault(skill_key(skill), skill)
+        for alias, skill in sorted(aliases.items()):
+            if skill in vocabulary:
+                canonical[skill_key(alias)] = canonical[skill_key(skill)]
+        self.canonical = canonical
+        self.skills = frozenset(canonical.values())
+        # Every known form as written, for callers holding the vocabulary's own spelling
+        self.forms = {form: canonical[skill_key(form)] for form in (*vocabulary, *aliases) if skill_key(form) in canonical}
+        # Keys of the leading words of multi-word forms ("power" of "power bi"), to know when to look further
+        self.prefixes = set()
+        for form in self.forms:
+            words = [word for word, _ in TOKEN.findall(form)]
+            for n in range(1, len(words)):
+                self.prefixes.add(words[0] + ''.join(word.lstrip('.') for word in words[1:n]))
+
+    def resolve(self, form):
+        """The canonical skill of ``form``, or None if it is not a known skill."""
+        skill = self.forms.get(form)
+        return skill if skill is not None else self.canonical.get(skill_key(form))
+
+    def normalise(self, form):
+        """resolve(form), or ``form`` in lower case when it is not a known skill."""
+        return self.resolve(form) or form.strip().lower()
+
+    def find(self, text):
+        """The canonical skills written in ``text``, once per place they occur."""
+        canonical, prefixes = self.canonical, self.prefixes
+        tokens = TOKEN.findall(text.lower())
+        found = [canonical[key] for key, _ in tokens if key in canonical]
+        # Multi-word forms: from each word that starts one, read on while the words are joined and still could
+        for i in [i for i, (key, joined) in enumerate(tokens) if joined and key in prefixes]:
+            key, joined = tokens[i]
+            here = [canonical.get(key)]
+            while joined and key in prefixes:
+                i += 1
+                word, joined = tokens[i]
+                key += word.lstrip('.')
+                skill = canonical.get(key)
+                if skill is not None and skill not in here:
+                    here.append(skill)
+                    found.append(skill)
+        return found
@@ -0,0 +1,1331 @@
+"""ATS scoring, role prediction, skill-gap analysis and resume feedback."""
+import re
+
+from analysis.skills import BASE_SKILLS, INDUSTRY_KEYWORDS, ACTION_VERBS
+from analysis.jobs import skill_forms, skill_ids, skill_taxonomy, role_skills, role_skill_bits
+
+
+def get_recommendation_label(score):
+    if score > 85:
+        return "Great 🌟"
+    elif score > 70:
+        return "Good ✅"
+    elif score > 50:
+        return "Can be Better 🔧"
+    elif score > 30:
+        return "Bad ⚠️"
+    else:
+        return "Flop ❌"
+
+def comprehensive_ats_analysis(text, keywords):
+    """Comprehensive ATS analysis with detailed feedback and suggestions."""
+    analysis = {
+        'ats_score': 0,
+        'job_matches': [],
+        'keyword_analysis': {},
+        'skill_gaps': {},
+        'improvements': [],
+        'quantified_suggestions': [],
+        'summary_suggestions': '',
+        'skills_suggestions': '',
+        'ats_explanation': ''
+    }
+    
+    # 1. Advanced ATS Score Calculation (0-100)
+    ats_score = calculate_advanced_ats_score(text, keywords)
+    analysis['ats_score'] = ats_score
+    
+    # 2. Job Role Prediction with Match Percentages
+    predicted_roles = predict_job_roles_with_scores(keywords, text)
+    analysis['job_matches'] = predicted_roles
+    
+    # 3. Keyword & Skill Match Analysis
+    keyword_analysis = analyze_keyword_matches(keywords, predicted_roles)
+    analysis['keyword_analysis'] = keyword_analysis
+    
+    # 4. Skill Gap Analysis by Role
+    skill_gaps = analyze_skill_gaps(keywords, predicted_roles)
+    analysis['skill_gaps'] = skill_gaps
+    
+    # 5. Quantifiable Bullet Point Improvements
+    quantified_suggestions = generate_quantified_suggestions(text, keywords, predicted_roles)
+    analysis['quantified_suggestions'] = quantified_suggestions
+    
+    # 6. Detailed Improvement Suggestions (Enhanced)
+    detailed_improvements = analyze_for_improvements(ats_score, text, keywords, predicted_roles)
+    analysis['improvements'] = detailed_improvements
+    
+    # 7. ATS-Optimized Summary and Skills
+    summary_suggestions = generate_ats_summary(text, keywords, predicted_roles)
+    skills_suggestions = generate_ats_skills_section(keywords, predicted_roles)
+    analysis['summary_suggestions'] = summary_suggestions
+    analysis['skills_suggestions'] = skills_suggestions
+    
+    # 8. ATS Explanation
+    analysis['ats_explanation'] = generate_ats_explanation(ats_score)
+    
+    # 9. AI Feedback Generator
+    ai_feedback = generate_ai_feedback(ats_score, predicted_roles, keywords, text)
+    analysis.update(ai_feedback)
+    
+    return analysis
+
+def calculate_advanced_ats_score(text, keywords):
+    """Advanced ATS score calculation with detailed criteria."""
+    # 1. Keyword Density & Relevance (Max 30 points)
+    keyword_score = min(30, len(keywords) * 3)
+    return max(0, min(100, int(keyword_score + calculate_content_score(text))))
+
+def calculate_content_score(text):
+    """The ATS criteria that don't depend on keywords (max 70 points, unrounded)."""
+    score = 0
+    text_lower = text.lower()
+    word_count = len(re.findall(r'\w+', text))
+    
+    # 2. Quantified Achievements (Max 25 points)
+    quantified_patterns = [
+        r'\d+\s*(%|percent|million|thousand|k|lakhs|x|\$|\£|\€)',
+        r'\d+\s*(years?|months?|days?)\s+of',
+        r'increased|decreased|improved|reduced|saved|generated|achieved',
+        r'\d+\s*(times?|fold|people|users|customers|clients)'
+    ]
+    quantified_count = sum(len(re.findall(pattern, text_lower)) for pattern in quantified_patterns)
+    quantified_score = min(25, quantified_count * 2)
+    score += quantified_score
+    
+    # 3. Action Verbs Usage (Max 15 points)
+    action_verb_count = sum(len(re.findall(f'\\b{verb}\\b', text_lower)) 
+                           for verb_list in ACTION_VERBS.values() 
+                           for verb in verb_list)
+    action_score = min(15, action_verb_count * 1.5)
+    score += action_score
+    
+    # 4. Resume Structure & Length (Max 15 points)
+    structure_score = 0
+    if 400 <= word_count <= 1000:
+        structure_score = 15
+    elif 300 <= word_count < 400 or 1000 < word_count <= 1500:
+        structure_score = 10
+    elif 200 <= word_count < 300 or 1500 < word_count <= 2000:
+        structure_score = 5
+    score += structure_score
+    
+    # 5. Contact Information & Professional Elements (Max 10 points)
+    contact_score = 0
+    if re.search(r'[\w\.-]+@[\w\.-]+', text_lower):
+        contact_score += 3
+    if re.search(r'\+?[\d\s\-\(\)]{10,}', text_lower):
+        contact_score += 2
+    if any(section in text_lower for section in ['experience', 'education', 'skills', 'summary']):
+        contact_score += 5
+    score += contact_score
+    
+    # 6. Industry-Specific Keywords (Max 5 points)
+    industry_keyword_count = sum(len(re.findall(f'\\b{kw}\\b', text_lower)) 
+                                for kw_list in INDUSTRY_KEYWORDS.values() 
+                                for kw in kw_list)
+    industry_score = min(5, industry_keyword_count * 0.5)
+    score += industry_score
+    
+    return score
+
+def predict_job_roles_with_scores(keywords, text):
+    """Predict job roles with match percentages based on skills and content."""
+    text_lower = text.lower()
+    role_matches = []
+    
+    # Weight factors for different aspects
+    SKILL_WEIGHT = 0.6
+    INDUSTRY_WEIGHT = 0.2
+    EXPERIENCE_WEIGHT = 0.15
+    CONTEXT_WEIGHT = 0.05
+    
+    ids = skill_ids()
+    role_bits = role_skill_bits()
+    # Skills implied by the ones named (django -> python) count as exact matches
+    keyword_bits = skill_taxonomy().expand(ids.bits(keywords))
+    # Role skills that appear anywhere in the text, even inside other words
+    text_bits = ids.bits(skill for skill in role_skills() if skill in text_lower)
+    found_bits = keyword_bits | text_bits
+    
+    for role, skills in BASE_SKILLS.items():
+        # Calculate skill overlap with weighted scoring
+        exact_matches = (role_bits[role] & keyword_bits).bit_count()
+        partial_matches = (role_bits[role] & text_bits & ~keyword_bits).bit_count()
+        
+        # Weight exact matches more heavily than partial matches
+        skill_score = (exact_matches * 2 + partial_matches) / (len(skills) * 2) * 100
+        skill_match_percentage = skill_score * SKILL_WEIGHT
+        
+        # Boost score for industry-specific keywords
+        industry_boost = 0
+        for industry, industry_kw in INDUSTRY_KEYWORDS.items():
+            industry_matches = sum(1 for kw in industry_kw if kw in text_lower)
+            industry_boost += industry_matches * 3  # Increased boost
+        
+        industry_score = min(20, industry_boost) * INDUSTRY_WEIGHT
+        
+        # Experience level detection
+        experience_score = 0
+        experience_indicators = {
+            'entry': ['intern', 'internship', 'junior', 'fresher', 'recent graduate'],
+            'mid': ['senior', 'lead', 'manager', 'specialist', 'professional'],
+            'senior': ['director', 'head', 'principal', 'chief', 'executive']
+        }
+        
+        # Detect experience level from text
+        for level, indicators in experience_indicators.items():
+            if any(indicator in text_lower for indicator in indicators):
+                if level == 'entry':
+                    experience_score = 5
+                elif level == 'mid':
+                    experience_score = 10
+                elif level == 'senior':
+                    experience_score = 15
+                break
+        
+        experience_score *= EXPERIENCE_WEIGHT
+        
+        # Context-based scoring (education, projects, etc.)
+        context_score = 0
+        if role == 'Data Analyst':
+            context_indicators = ['data', 'analysis', 'statistics', 'report', 'dashboard', 'visualization', 'reporting']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'Software Engineer':
+            context_indicators = ['software', 'development', 'programming', 'code', 'application', 'system']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'Project Manager':
+            context_indicators = ['project', 'management', 'planning', 'coordination', 'team', 'delivery']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'HR Specialist':
+            context_indicators = ['human resources', 'recruitment', 'employee', 'benefits', 'training', 'retention']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'Marketing Specialist':
+            context_indicators = ['marketing', 'campaign', 'brand', 'advertising', 'promotion', 'seo', 'strategy']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'Sales Representative':
+            context_indicators = ['sales', 'client', 'customer', 'revenue', 'quota', 'prospect']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'Business Analyst':
+            context_indicators = ['business', 'requirement', 'process', 'analysis', 'stakeholder', 'solution']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'Financial Analyst':
+            context_indicators = ['finance', 'financial', 'analysis', 'reporting', 'excel', 'budgeting', 'forecasting']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'Operations Manager':
+            context_indicators = ['operations', 'process', 'improvement', 'supply chain', 'logistics', 'quality']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'Customer Success':
+            context_indicators = ['customer', 'success', 'retention', 'satisfaction', 'support', 'account']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'Business Operations':
+            context_indicators = ['business', 'operations', 'strategy', 'process', 'analytics', 'reporting']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        elif role == 'Customer Experience':
+            context_indicators = ['customer', 'experience', 'satisfaction', 'retention', 'support', 'communication']
+            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
+            context_score = min(10, context_matches * 2)
+        
+        context_score *= CONTEXT_WEIGHT
+        
+        # Calculate final match percentage with better distribution
+        final_score = skill_match_percentage + industry_score + experience_score + context_score
+        final_score = min(100, final_score)
+        
+        # Only include roles with reasonable match (lowered threshold for better inclusivity)
+        if final_score > 15:
+            matched_skills = ids.in_order(skills, role_bits[role] & found_bits)
+            missing_skills = ids.in_order(skills, role_bits[role] & ~found_bits)
+            
+            role_matches.append({
+                'role': role,
+                'match_percentage': round(final_score, 1),
+                'matched_skills': matched_skills,
+                'missing_skills': missing_skills,
+                'skill_score': round(skill_match_percentage, 1),
+                'industry_score': round(industry_score, 1),
+                'experience_score': round(experience_score, 1),
+                'context_score': round(context_score, 1)
+            })
+    
+    # Sort by match percentage and return top matches
+    role_matches.sort(key=lambda x: x['match_percentage'], reverse=True)
+    return role_matches[:5]
+
+def analyze_keyword_matches(keywords, predicted_roles):
+    """Analyze keyword matches and missing keywords by role."""
+    analysis = {}
+    
+    for role_data in predicted_roles:
+        role = role_data['role']
+        matched = role_data['matched_skills']
+        missing = role_data['missing_skills'][:5]  # Top 5 missing skills
+        
+        analysis[role] = {
+            'found_keywords': matched,
+            'missing_keywords': missing,
+            'keyword_density': len(matched),
+            'improvement_needed': missing[:3] if missing else []
+        }
+    
+    return analysis
+
+def analyze_skill_gaps(keywords, predicted_roles):
+    """Comprehensive skill gap analysis with detailed recommendations for 100% job match."""
+    gaps = {}
+    
+    for role_data in predicted_roles:
+        role = role_data['role']
+        missing_skills = role_data['missing_skills']
+        matched_skills = role_data['matched_skills']
+        match_percentage = role_data['match_percentage']
+        
+        # Get comprehensive skill recommendations for the role
+        skill_recommendations = get_comprehensive_skill_recommendations(role, matched_skills, missing_skills)
+        
+        # Include gap severity information
+        gap_analysis = skill_recommendations['gap_analysis']
+        gap_severity = gap_analysis.get('gap_severity', {})
+        
+        gaps[role] = {
+            'match_percentage': match_percentage,
+            'current_skills': matched_skills,
+            'critical_gaps': missing_skills[:5],
+            'gap_severity': gap_severity,
+            'recommended_skills': skill_recommendations['recommended_skills'],
+            'learning_path': skill_recommendations['learning_path'],
+            'certifications': skill_recommendations['certifications'],
+            'projects': skill_recommendations['projects'],
+            'tools_platforms': skill_recommendations['tools_platforms'],
+            'soft_skills': skill_recommendations['soft_skills'],
+            'recommended_courses': skill_recommendations.get('recommended_courses', []),
+            'priority_level': 'High' if match_percentage > 70 else 'Medium' if match_percentage > 50 else 'Low',
+            'gap_analysis': gap_analysis,
+            'action_plan': skill_recommendations['action_plan']
+        }
+    
+    return gaps
+
+def get_comprehensive_skill_recommendations(role, matched_skills, missing_skills):
+    """Get comprehensive skill recommendations to achieve 100% job match."""
+    
+    # Course provider URLs for popular platforms
+    COURSE_PROVIDERS = {
+        'Udemy': 'https://www.udemy.com',
+        'Coursera': 'https://www.coursera.org',
+        'edX': 'https://www.edx.org',
+        'LinkedIn Learning': 'https://www.linkedin.com/learning',
+        'Pluralsight': 'https://www.pluralsight.com',
+        'Skillshare': 'https://www.skillshare.com'
+    }
+    
+    # Skill to course provider mapping
+    SKILL_COURSE_MAPPING = {
+        # Programming Languages
+        'Python': {'provider': 'Udemy', 'search_query': 'python programming'},
+        'Java': {'provider': 'Udemy', 'search_query': 'java programming'},
+        'JavaScript': {'provider': 'Udemy', 'search_query': 'javascript course'},
+        'C++': {'provider': 'Udemy', 'search_query': 'c++ programming'},
+        'C#': {'provider': 'Udemy', 'search_query': 'c sharp programming'},
+        'R': {'provider': 'Udemy', 'search_query': 'r programming'},
+        'SQL': {'provider': 'Udemy', 'search_query': 'sql course'},
+        'Go': {'provider': 'Udemy', 'search_query': 'go programming'},
+        'Rust': {'provider': 'Udemy', 'search_query': 'rust programming'},
+        
+        # Web Development Frameworks
+        'React': {'provider': 'Udemy', 'search_query': 'react js'},
+        'Angular': {'provider': 'Udemy', 'search_query': 'angular'},
+        'Vue.js': {'provider': 'Udemy', 'search_query': 'vue js'},
+        'Django': {'provider': 'Udemy', 'search_query': 'django python'},
+        'Flask': {'provider': 'Udemy', 'search_query': 'flask python'},
+        'Spring Boot': {'provider': 'Udemy', 'search_query': 'spring boot'},
+        'Node.js': {'provider': 'Udemy', 'search_query': 'node js'},
+        
+        # Data Analysis & Visualization Tools
+        'Excel': {'provider': 'Udemy', 'search_query': 'excel advanced'},
+        'Tableau': {'provider': 'Udemy', 'search_query': 'tableau'},
+        'Power BI': {'provider': 'Udemy', 'search_query': 'power bi'},
+        'Google Analytics': {'provider': 'Udemy', 'search_query': 'google analytics'},
+        'Jupyter Notebook': {'provider': 'Coursera', 'search_query': 'jupyter notebook'},
+        'Pandas': {'provider': 'Udemy', 'search_query': 'pandas python'},
+        'NumPy': {'provider': 'Udemy', 'search_query': 'numpy python'},
+        
+        # Databases
+        'MySQL': {'provider': 'Udemy', 'search_query': 'mysql database'},
+        'PostgreSQL': {'provider': 'Udemy', 'search_query': 'postgresql'},
+        'MongoDB': {'provider': 'Udemy', 'search_query': 'mongodb'},
+        'SQL Server': {'provider': 'Udemy', 'search_query': 'sql server'},
+        'Oracle': {'provider': 'Udemy', 'search_query': 'oracle database'},
+        'Redis': {'provider': 'Udemy', 'search_query': 'redis'},
+        'Elasticsearch': {'provider': 'Udemy', 'search_query': 'elasticsearch'},
+        
+        # Cloud Platforms
+        'AWS': {'provider': 'Udemy', 'search_query': 'aws certified'},
+        'Azure': {'provider': 'Udemy', 'search_query': 'microsoft azure'},
+        'Google Cloud': {'provider': 'Coursera', 'search_query': 'google cloud platform'},
+        
+        # DevOps Tools
+        'Git': {'provider': 'Udemy', 'search_query': 'git github'},
+        'Docker': {'provider': 'Udemy', 'search_query': 'docker'},
+        'Kubernetes': {'provider': 'Udemy', 'search_query': 'kubernetes'},
+        'Jenkins': {'provider': 'Udemy', 'search_query': 'jenkins'},
+        
+        # Project Management Tools
+        'JIRA': {'provider': 'Udemy', 'search_query': 'jira'},
+        'Asana': {'provider': 'Udemy', 'search_query': 'asana project management'},
+        'Trello': {'provider': 'Udemy', 'search_query': 'trello'},
+        'Microsoft Project': {'provider': 'Udemy', 'search_query': 'microsoft project'},
+        
+        # Marketing Tools
+        'SEO': {'provider': 'Udemy', 'search_query': 'seo'},
+        'Google Ads': {'provider': 'Udemy', 'search_query': 'google ads'},
+        'Facebook Ads': {'provider': 'Udemy', 'search_query': 'facebook ads'},
+        'HubSpot': {'provider': 'Udemy', 'search_query': 'hubspot'},
+        'Mailchimp': {'provider': 'Udemy', 'search_query': 'mailchimp'},
+        
+        # Design Tools
+        'Canva': {'provider': 'Skillshare', 'search_query': 'canva'},
+        'Figma': {'provider': 'Udemy', 'search_query': 'figma'},
+        'Adobe Creative Suite': {'provider': 'LinkedIn Learning', 'search_query': 'adobe creative suite'},
+        
+        # Soft Skills
+        'Communication': {'provider': 'Udemy', 'search_query': 'communication skills'},
+        'Leadership': {'provider': 'Udemy', 'search_query': 'leadership'},
+        'Problem Solving': {'provider': 'Udemy', 'search_query': 'problem solving'},
+        'Team Collaboration': {'provider': 'Udemy', 'search_query': 'team collaboration'},
+        'Time Management': {'provider': 'Udemy', 'search_query': 'time management'},
+        'Critical Thinking': {'provider': 'Udemy', 'search_query': 'critical thinking'},
+        'Negotiation': {'provider': 'Udemy', 'search_query': 'negotiation skills'},
+        
+        # General fallback
+        'default': {'provider': 'Udemy', 'search_query': ''}
+    }
+    
+    # Comprehensive skill databases for each role
+    role_skill_database = {
+        'Data Analyst': {
+            'technical_skills': {
+                'programming': ['Python', 'R', 'SQL', 'JavaScript', 'VBA'],
+                'tools': ['Excel', 'Tableau', 'Power BI', 'Google Analytics', 'Jupyter Notebook', 'Pandas', 'NumPy'],
+                'databases': ['MySQL', 'PostgreSQL', 'MongoDB', 'SQL Server', 'Oracle'],
+                'statistics': ['Statistical Analysis', 'A/B Testing', 'Regression Analysis', 'Data Visualization']
+            },
+            'soft_skills': ['Analytical Thinking', 'Problem Solving', 'Communication', 'Attention to Detail', 'Critical Thinking'],
+            'certifications': ['Google Data Analytics Certificate', 'Microsoft Power BI Certification', 'Tableau Desktop Specialist', 'AWS Certified Data Analytics'],
+            'projects': ['Sales Dashboard', 'Customer Segmentation Analysis', 'Predictive Analytics Model', 'Business Intelligence Report'],
+            'learning_path': [
+                'Week 1-2: Master Excel advanced functions and pivot tables',
+                'Week 3-4: Learn SQL fundamentals and practice queries',
+                'Week 5-8: Complete Python for Data Analysis course',
+                'Week 9-12: Build 2-3 data visualization projects using Tableau/Power BI'
+            ]
+        },
+        'Software Engineer': {
+            'technical_skills': {
+                'programming': ['Python', 'Java', 'JavaScript', 'C++', 'C#', 'Go', 'Rust'],
+                'frameworks': ['React', 'Angular', 'Vue.js', 'Django', 'Flask', 'Spring Boot', 'Node.js'],
+                'tools': ['Git', 'Docker', 'Kubernetes', 'Jenkins', 'AWS', 'Azure', 'Linux'],
+                'databases': ['MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Elasticsearch']
+            },
+            'soft_skills': ['Problem Solving', 'Team Collaboration', 'Code Review', 'Technical Writing', 'Agile Development'],
+            'certifications': ['AWS Certified Developer', 'Google Cloud Professional Developer', 'Microsoft Azure Developer', 'Oracle Java Certification'],
+            'projects': ['Full-Stack Web Application', 'REST API Development', 'Microservices Architecture', 'Mobile App Development'],
+            'learning_path': [
+                'Week 1-4: Master one programming language (Python/Java)',
+                'Week 5-8: Learn web development frameworks (React/Django)',
+                'Week 9-12: Build 2-3 full-stack projects with database integration',
+                'Week 13-16: Learn cloud platforms and DevOps tools'
+            ]
+        },
+        'Project Manager': {
+            'technical_skills': {
+                'methodologies': ['Agile', 'Scrum', 'Kanban', 'Waterfall', 'Lean', 'Six Sigma'],
+                'tools': ['JIRA', 'Asana', 'Trello', 'Microsoft Project', 'Confluence', 'Slack'],
+                'analytics': ['Project Analytics', 'Risk Management', 'Budget Planning', 'Resource Allocation']
+            },
+            'soft_skills': ['Leadership', 'Communication', 'Negotiation', 'Time Management', 'Stakeholder Management', 'Conflict Resolution'],
+            'certifications': ['PMP (Project Management Professional)', 'Certified ScrumMaster (CSM)', 'PRINCE2', 'Agile Certified Practitioner'],
+            'projects': ['Software Development Project', 'Marketing Campaign Management', 'Process Improvement Initiative', 'Team Restructuring Project'],
+            'learning_path': [
+                'Week 1-2: Master project management fundamentals and methodologies',
+                'Week 3-4: Learn Agile/Scrum frameworks and tools',
+                'Week 5-8: Practice with project management software (JIRA, Asana)',
+                'Week 9-12: Lead a small project and document lessons learned'
+            ]
+        },
+        'HR Specialist': {
+            'technical_skills': {
+                'systems': ['Workday', 'BambooHR', 'ADP', 'SuccessFactors', 'Taleo', 'HRIS'],
+                'analytics': ['HR Analytics', 'Recruitment Metrics', 'Employee Engagement Analysis', 'Performance Management'],
+                'compliance': ['Labor Law', 'Employment Regulations', 'Diversity & Inclusion', 'Workplace Safety']
+            },
+            'soft_skills': ['Interpersonal Skills', 'Empathy', 'Confidentiality', 'Cultural Awareness', 'Conflict Resolution', 'Coaching'],
+            'certifications': ['SHRM-CP', 'PHR (Professional in Human Resources)', 'CIPD', 'HR Analytics Certificate'],
+            'projects': ['Employee Onboarding Program', 'Performance Review System', 'Diversity Initiative', 'Training Program Development'],
+            'learning_path': [
+                'Week 1-2: Master HR fundamentals and employment law',
+                'Week 3-4: Learn HRIS systems and recruitment tools',
+                'Week 5-8: Develop skills in employee relations and performance management',
+                'Week 9-12: Create HR policies and procedures documentation'
+            ]
+        },
+        'Marketing Specialist': {
+            'technical_skills': {
+                'digital_marketing': ['SEO', 'SEM', 'Google Ads', 'Facebook Ads', 'Email Marketing', 'Content Marketing'],
+                'analytics': ['Google Analytics', 'Facebook Analytics', 'HubSpot', 'Mailchimp', 'Hootsuite'],
+                'design': ['Canva', 'Adobe Creative Suite', 'Figma', 'Video Editing', 'Graphic Design']
+            },
+            'soft_skills': ['Creativity', 'Communication', 'Strategic Thinking', 'Brand Management', 'Customer Focus', 'Data Interpretation'],
+            'certifications': ['Google Ads Certification', 'Facebook Blueprint', 'HubSpot Content Marketing', 'Google Analytics Certification'],
+            'projects': ['Digital Marketing Campaign', 'Brand Awareness Strategy', 'Lead Generation Campaign', 'Social Media Strategy'],
+            'learning_path': [
+                'Week 1-2: Master digital marketing fundamentals and platforms',
+                'Week 3-4: Learn SEO/SEM and paid advertising strategies',
+                'Week 5-8: Develop content creation and social media skills',
+                'Week 9-12: Execute a complete marketing campaign and measure results'
+            ]
+        },
+        'Sales Representative': {
+            'technical_skills': {
+                'crm': ['Salesforce', 'HubSpot', 'Pipedrive', 'Zoho CRM', 'Microsoft Dynamics'],
+                'tools': ['LinkedIn Sales Navigator', 'ZoomInfo', 'Calendly', 'DocuSign', 'Sales Analytics'],
+                'platforms': ['B2B Sales', 'B2C Sales', 'E-commerce', 'Lead Generation', 'Sales Automation']
+            },
+            'soft_skills': ['Persuasion', 'Active Listening', 'Relationship Building', 'Negotiation', 'Resilience', 'Goal Orientation'],
+            'certifications': ['Salesforce Certified Sales Cloud Consultant', 'HubSpot Sales Software', 'Challenger Sale Methodology', 'SPIN Selling'],
+            'projects': ['Sales Territory Development', 'Customer Acquisition Campaign', 'Sales Process Optimization', 'Client Retention Program'],
+            'learning_path': [
+                'Week 1-2: Master sales fundamentals and CRM systems',
+                'Week 3-4: Learn prospecting and lead generation techniques',
+                'Week 5-8: Develop negotiation and closing skills',
+                'Week 9-12: Build a sales pipeline and track performance metrics'
+            ]
+        },
+        'Business Analyst': {
+            'technical_skills': {
+                'analysis': ['Requirements Gathering', 'Process Mapping', 'Data Analysis', 'Business Process Modeling'],
+                'tools': ['Visio', 'Lucidchart', 'JIRA', 'Confluence', 'Power BI', 'Tableau'],
+                'methodologies': ['Agile', 'Waterfall', 'Six Sigma', 'Lean', 'BPMN']
+            },
+            'soft_skills': ['Critical Thinking', 'Communication', 'Stakeholder Management', 'Problem Solving', 'Documentation', 'Presentation Skills'],
+            'certifications': ['CBAP (Certified Business Analysis Professional)', 'PMI-PBA', 'Agile Analysis Certification', 'Six Sigma Green Belt'],
+            'projects': ['Business Process Improvement', 'Requirements Documentation', 'System Implementation', 'Data Analysis Project'],
+            'learning_path': [
+                'Week 1-2: Master business analysis fundamentals and methodologies',
+                'Week 3-4: Learn requirements gathering and documentation techniques',
+                'Week 5-8: Develop skills in process mapping and data analysis',
+                'Week 9-12: Complete a business analysis project from start to finish'
+            ]
+        }
+    }
+    
+    # Get role-specific recommendations
+    role_data = role_skill_database.get(role, {
+        'technical_skills': {'general': ['Problem Solving', 'Analytical Thinking', 'Communication']},
+        'soft_skills': ['Communication', 'Teamwork', 'Adaptability'],
+        'certifications': ['Industry-specific certifications'],
+        'projects': ['Relevant project experience'],
+        'learning_path': ['Focus on role-specific skills and experience']
+    })
+    
+    # Analyze gaps and create recommendations
+    gap_analysis = analyze_specific_gaps(role, matched_skills, missing_skills, role_data)
+    action_plan = create_action_plan(role, gap_analysis, role_data)
+    
+    # Generate course links for recommended skills
+    recommended_courses = generate_course_links(missing_skills, SKILL_COURSE_MAPPING, COURSE_PROVIDERS)
+    
+    return {
+        'recommended_skills': get_priority_skills(role_data, missing_skills),
+        'learning_path': role_data.get('learning_path', ['Focus on role-specific skills']),
+        'certifications': role_data.get('certifications', ['Industry certifications']),
+        'projects': role_data.get('projects', ['Relevant projects']),
+        'tools_platforms': get_tools_platforms(role_data),
+        'soft_skills': role_data.get('soft_skills', ['Communication', 'Teamwork']),
+        'gap_analysis': gap_analysis,
+        'action_plan': action_plan,
+        'recommended_courses': recommended_courses
+    }
+
+def analyze_specific_gaps(role, matched_skills, missing_skills, role_data):
+    """Analyze specific skill gaps with detailed explanations."""
+    analysis = {
+        'critical_gaps': [],
+        'moderate_gaps': [],
+        'nice_to_have': [],
+        'strengths': matched_skills,
+        'recommendations': [],
+        'gap_severity': {}
+    }
+    
+    # Categorize missing skills by importance and frequency
+    all_required_skills = []
+    skill_frequency = {}
+    
+    # Build comprehensive skill list with frequency
+    for category, skills in role_data.get('technical_skills', {}).items():
+        for skill in skills:
+            all_required_skills.append(skill)
+            skill_frequency[skill] = skill_frequency.get(skill, 0) + 1
+    
+    # Sort skills by frequency (more frequent = more critical)
+    sorted_skills = sorted(skill_frequency.items(), key=lambda x: x[1], reverse=True)
+    critical_skills = [skill[0] for skill in sorted_skills[:10]]
+    moderate_skills = [skill[0] for skill in sorted_skills[10:25]]
+    
+    # Categorize missing skills with severity levels ("powerbi" is "Power BI")
+    forms = skill_forms()
+    for skill in missing_skills:
+        skill_lower = forms.normalise(skill)
+        found_critical = False
+        found_moderate = False
+        
+        # Check if skill is in critical list
+        for critical_skill in critical_skills:
+            if skill_lower == forms.normalise(critical_skill):
+                analysis['critical_gaps'].append(skill)
+                analysis['gap_severity'][skill] = 'High'
+                found_critical = True
+                break
+        
+        # Check if skill is in moderate list
+        if not found_critical:
+            for moderate_skill in moderate_skills:
+                if skill_lower == forms.normalise(moderate_skill):
+                    analysis['moderate_gaps'].append(skill)
+                    analysis['gap_severity'][skill] = 'Medium'
+                    found_moderate = True
+                    break
+        
+        # If not found in either, it's nice to have
+        if not found_critical and not found_moderate:
+            analysis['nice_to_have'].append(skill)
+            analysis['gap_severity'][skill] = 'Low'
+    
+    # Generate specific recommendations with severity levels
+    if analysis['critical_gaps']:
+        critical_list = ', '.join(analysis['critical_gaps'][:5])
+        analysis['recommendations'].append(f"🔴 Priority 1 (High): Master {critical_list} - These are essential for {role} roles")
+    
+    if analysis['moderate_gaps']:
+        moderate_list = ', '.join(analysis['moderate_gaps'][:5])
+        analysis['recommendations'].append(f"🟡 Priority 2 (Medium): Learn {moderate_list} - These will significantly improve your competitiveness")
+    
+    if analysis['nice_to_have']:
+        nice_list = ', '.join(analysis['nice_to_have'][:5])
+        analysis['recommendations'].append(f"🟢 Priority 3 (Low): Consider {nice_list} - These are supplementary skills for advanced positions")
+    
+    return analysis
+
+def create_action_plan(role, gap_analysis, role_data):
+    """Create a detailed action plan to achieve 100% job match."""
+    action_plan = {
+        'immediate_actions': [],
+        'short_term_goals': [],
+        'long_term_goals': [],
+        'timeline': '12-16 weeks to achieve 100% job match potential'
+    }
+    
+    # Immediate actions (Week 1-2)
+    if gap_analysis['critical_gaps']:
+        action_plan['immediate_actions'].append(f"Start learning {gap_analysis['critical_gaps'][0]} - highest priority skill")
+        action_plan['immediate_actions'].append("Update resume with current skills and quantify achievements")
+        action_plan['immediate_actions'].append("Begin building a portfolio project showcasing your skills")
+    
+    # Short-term goals (Week 3-8)
+    action_plan['short_term_goals'].append("Complete 2-3 online courses in critical skills")
+    action_plan['short_term_goals'].append("Build 1-2 portfolio projects demonstrating expertise")
+    action_plan['short_term_goals'].append("Obtain 1 industry-relevant certification")
+    
+    # Long-term goals (Week 9-16)
+    action_plan['long_term_goals'].append("Master all critical skills for the role")
+    action_plan['long_term_goals'].append("Complete 3-4 portfolio projects")
+    action_plan['long_term_goals'].append("Achieve 2-3 professional certifications")
+    action_plan['long_term_goals'].append("Network with professionals in the field")
+    
+    return action_plan
+
+def generate_course_links(missing_skills, skill_course_mapping, course_providers):
+    """Generate course links for missing skills using popular course providers like Udemy."""
+    course_links = []
+    forms = skill_forms()
+    courses = {forms.normalise(name): info for name, info in skill_course_mapping.items()}
+    
+    for skill in missing_skills[:10]:  # Limit to top 10 missing skills
+        # Find course mapping for the skill, whichever way either side spells it
+        skill_info = courses.get(forms.normalise(skill), skill_course_mapping.get('default', {}))
+        
+        # Get provider and search query
+        provider = skill_info.get('provider', 'Udemy')
+        search_query = skill_info.get('search_query', skill.lower().replace(' ', '+'))
+        
+        # Get provider URL
+        provider_url = course_providers.get(provider, course_providers['Udemy'])
+        
+        # Generate search URL
+        if provider == 'Udemy':
+            search_url = f"{provider_url}/courses/search/?q={search_query}"
+        elif provider == 'Coursera':
+            search_url = f"{provider_url}/search?query={search_query}"
+        elif provider == 'edX':
+            search_url = f"{provider_url}/search?q={search_query}"
+        elif provider == 'LinkedIn Learning':
+            search_url = f"{provider_url}/search?keywords={search_query}"
+        elif provider == 'Pluralsight':
+            search_url = f"{provider_url}/search?q={search_query}"
+        elif provider == 'Skillshare':
+            search_url = f"{provider_url}/search/projects/?query={search_query}"
+        else:
+            # Default to Udemy if provider is unknown
+            search_url = f"{course_providers['Udemy']}/courses/search/?q={search_query}"
+        
+        course_links.append({
+            'skill': skill,
+            'provider': provider,
+            'url': search_url
+        })
+    
+    return course_links
+
+def get_priority_skills(role_data, missing_skills):
+    """Get prioritized skill recommendations."""
+    priority_skills = []
+    forms = skill_forms()
+    missing = {forms.normalise(s) for s in missing_skills}
+    
+    # Add critical missing skills first
+    for category, skills in role_data.get('technical_skills', {}).items():
+        for skill in skills[:5]:  # Top 5 skills per category
+            if forms.normalise(skill) in missing:
+                priority_skills.append(skill)
+    
+    return priority_skills[:10]  # Top 10 priority skills
+
+def get_tools_platforms(role_data):
+    """Get recommended tools and platforms."""
+    tools = []
+    for category, skills in role_data.get('technical_skills', {}).items():
+        if 'tools' in category.lower() or 'platforms' in category.lower():
+            tools.extend(skills)
+    return tools[:8]  # Top 8 tools/platforms
+
+def personalize_recommendations(role_data, matched_skills, missing_skills):
+    """Create personalized recommendations based on user's current skills."""
+    recommendations = {
+        'skill_progression': [],
+        'learning_resources': [],
+        'project_suggestions': [],
+        'certification_path': []
+    }
+    
+    # Determine user's experience level based on matched skills
+    basic_skills = 0
+    intermediate_skills = 0
+    advanced_skills = 0
+    
+    # Define skill levels for different categories
+    skill_levels = {
+        'basic': ['Excel', 'SQL', 'HTML', 'CSS', 'JavaScript Basics', 'Python Basics'],
+        'intermediate': ['Python', 'Java', 'React', 'Tableau', 'Power BI', 'Agile', 'Scrum'],
+        'advanced': ['Machine Learning', 'Cloud Technologies', 'Microservices', 'DevOps', 'Leadership']
+    }
+    
+    # Count skill levels in matched skills
+    for skill in matched_skills:
+        skill_lower = skill.lower()
+        if any(basic_skill.lower() in skill_lower for basic_skill in skill_levels['basic']):
+            basic_skills += 1
+        if any(intermediate_skill.lower() in skill_lower for intermediate_skill in skill_levels['intermediate']):
+            intermediate_skills += 1
+        if any(advanced_skill.lower() in skill_lower for advanced_skill in skill_levels['advanced']):
+            advanced_skills += 1
+    
+    # Determine overall experience level
+    total_matched = len(matched_skills)
+    if total_matched == 0:
+        experience_level = 'Beginner'
+    elif basic_skills > intermediate_skills and basic_skills > advanced_skills:
+        experience_level = 'Beginner'
+    elif intermediate_skills > advanced_skills:
+        experience_level = 'Intermediate'
+    else:
+        experience_level = 'Advanced'
+    
+    # Generate personalized skill progression path
+    if experience_level == 'Beginner':
+        recommendations['skill_progression'] = [
+            'Start with fundamental skills in your target role',
+            'Focus on 2-3 core technical skills',
+            'Build your first project to apply learned skills',
+            'Join online communities for support and networking'
+        ]
+        recommendations['learning_resources'] = [
+            'FreeCodeCamp for foundational skills',
+            'Coursera/edX university courses',
+            'YouTube tutorials for hands-on learning',
+            'Documentation and official guides'
+        ]
+    elif experience_level == 'Intermediate':
+        recommendations['skill_progression'] = [
+            'Deepen expertise in 1-2 specialized areas',
+            'Work on complex projects showcasing your skills',
+            'Contribute to open-source projects',
+            'Prepare for industry certifications'
+        ]
+        recommendations['learning_resources'] = [
+            'Udemy advanced courses',
+            'Pluralsight for technical skills',
+            'Professional bootcamps',
+            'Industry conferences and webinars'
+        ]
+    else:  # Advanced
+        recommendations['skill_progression'] = [
+            'Become a thought leader in your specialization',
+            'Mentor others in the community',
+            'Publish technical content or research',
+            'Pursue advanced certifications and continuous learning'
+        ]
+        recommendations['learning_resources'] = [
+            'Research papers and advanced publications',
+            'Industry expert courses',
+            'Speaking at conferences',
+            'Advanced degree programs if relevant'
+        ]
+    
+    # Generate project suggestions based on missing skills
+    project_count = min(3, len(missing_skills))
+    if project_count > 0:
+        recommendations['project_suggestions'] = [
+            f'Project focusing on {missing_skills[i]}' for i in range(project_count)
+        ]
+    else:
+        recommendations['project_suggestions'] = ['Build a portfolio project showcasing your expertise']
+    
+    # Generate certification path
+    all_certifications = role_data.get('certifications', [])
+    if experience_level == 'Beginner':
+        recommendations['certification_path'] = all_certifications[:1] if all_certifications else ['Start with entry-level certifications']
+    elif experience_level == 'Intermediate':
+        recommendations['certification_path'] = all_certifications[:2] if len(all_certifications) >= 2 else all_certifications
+    else:
+        recommendations['certification_path'] = all_certifications[:3] if len(all_certifications) >= 3 else all_certifications
+    
+    return recommendations
+
+def generate_quantified_suggestions(text, keywords, predicted_roles):
+    """Generate quantifiable bullet point improvements using X-Y-Z formula."""
+    suggestions = []
+    text_lower = text.lower()
+    
+    # Extract current bullet points or experience descriptions
+    bullet_patterns = re.findall(r'[-•]\s*([^-\n]+)', text)
+    
+    # Generate improved versions for top 3 roles
+    for i, role_data in enumerate(predicted_roles[:3]):
+        role = role_data['role']
+        matched_skills = role_data['matched_skills']
+        
+        # Create X-Y-Z formula examples based on role
+        examples = generate_role_specific_examples(role, matched_skills)
+        suggestions.extend(examples[:2])  # 2 examples per role
+    
+    return suggestions[:6]  # Limit to 6 total suggestions
+
+def generate_role_specific_examples(role, matched_skills):
+    """Generate role-specific X-Y-Z formula examples with concrete, actionable suggestions."""
+    examples = []
+    
+    # Role-specific improvement examples with actual numbers and tools
+    role_examples = {
+        'Data Analyst': [
+            {
+                'weak_example': 'Responsible for data analysis tasks',
+                'strong_example': 'Analyzed 15+ datasets using Python and SQL, improving data accuracy by 25% and reducing processing time by 40%',
+                'role': role,
+                'formula_explanation': 'Concrete example: 15+ datasets (Achievement) + Python/SQL (Tools) + 25% accuracy improvement (Measurable Result)'
+            },
+            {
+                'weak_example': 'Created reports for management',
+                'strong_example': 'Created 12 automated weekly reports using Tableau and Power BI, reducing manual work by 8 hours per week and improving decision-making speed by 35%',
+                'role': role,
+                'formula_explanation': 'Specific metrics: 12 reports (Achievement) + Tableau/Power BI (Tools) + 8 hours saved + 35% faster decisions (Measurable Results)'
+            }
+        ],
+        'Software Engineer': [
+            {
+                'weak_example': 'Developed software applications',
+                'strong_example': 'Developed 3 new features using React and Node.js for a fintech application, increasing transaction processing speed by 45% and reducing server costs by ₹200K annually',
+                'role': role,
+                'formula_explanation': 'Measurable impact: 3 features (Achievement) + React/Node.js (Technology) + 45% speed increase + ₹200K cost savings (Results)'
+            },
+            {
+                'weak_example': 'Worked on bug fixes and maintenance',
+                'strong_example': 'Resolved 50+ critical bugs using Python and automated testing tools, improving system stability by 40% and reducing customer complaints by 60%',
+                'role': role,
+                'formula_explanation': 'Quantified results: 50+ bugs fixed (Achievement) + Python/testing tools (Method) + 40% stability + 60% fewer complaints (Results)'
+            }
+        ],
+        'Project Manager': [
+            {
+                'weak_example': 'Managed project teams',
+                'strong_example': 'Led 4 cross-functional projects using Agile methodology for BFSI clients, delivering all projects 15% under budget and 2 weeks ahead of schedule while maintaining 99% quality standards',
+                'role': role,
+                'formula_explanation': 'Project metrics: 4 projects (Achievement) + Agile methodology (Method) + 15% budget savings + 2 weeks early + 99% quality (Results)'
+            },
+            {
+                'weak_example': 'Coordinated team activities',
+                'strong_example': 'Managed 8 team members using JIRA and Slack for IT infrastructure projects, improving team productivity by 30% and reducing project delivery time by 25% while achieving 100% sprint completion rate',
+                'role': role,
+                'formula_explanation': 'Team impact: 8 team members (Scale) + JIRA/Slack (Tools) + 30% productivity + 25% faster delivery + 100% sprints (Results)'
+            }
+        ],
+        'HR Specialist': [
+            {
+                'weak_example': 'Handled recruitment processes',
+                'strong_example': 'Streamlined hiring process using Workday HRIS, reducing time-to-hire by 20 days and improving candidate satisfaction by 45%',
+                'role': role,
+                'formula_explanation': 'HR metrics: Streamlined process (Achievement) + Workday HRIS (Tool) + 20 days reduction (Result)'
+            },
+            {
+                'weak_example': 'Managed employee relations',
+                'strong_example': 'Implemented employee wellness program using HR analytics, increasing retention by 25% and reducing turnover costs by ₹150K annually',
+                'role': role,
+                'formula_explanation': 'Retention impact: Wellness program (Achievement) + HR analytics (Method) + 25% retention increase (Result)'
+            }
+        ],
+        'Marketing Specialist': [
+            {
+                'weak_example': 'Managed marketing campaigns',
+                'strong_example': 'Executed 8 digital marketing campaigns for e-commerce clients using Google Ads and Facebook Ads, generating 2,500+ qualified leads and increasing ROI by 60% while reducing CAC by 25%',
+                'role': role,
+                'formula_explanation': 'Campaign results: 8 campaigns (Achievement) + Google/Facebook Ads (Platforms) + 2,500 leads + 60% ROI + 25% lower CAC (Results)'
+            },
+            {
+                'weak_example': 'Created marketing content',
+                'strong_example': 'Optimized website content for BFSI sector using SEO tools and A/B testing, increasing organic traffic by 80% and conversion rate by 35% within 3 months',
+                'role': role,
+                'formula_explanation': 'SEO impact: BFSI content optimization (Achievement) + SEO tools/A/B testing (Method) + 80% traffic + 35% conversion + 3 months (Results)'
+            }
+        ],
+        'Sales Representative': [
+            {
+                'weak_example': 'Responsible for sales targets',
+                'strong_example': 'Exceeded quarterly sales targets by 35% for IT services in Mumbai region using Salesforce CRM and consultative selling, generating ₹2.5M in revenue and acquiring 15 new enterprise clients',
+                'role': role,
+                'formula_explanation': 'Sales achievement: 35% target exceed (Achievement) + Salesforce CRM/consultative selling (Method) + ₹2.5M revenue + 15 clients (Results)'
+            },
+            {
+                'weak_example': 'Managed client relationships',
+                'strong_example': 'Built and maintained 150+ client relationships in the SME sector using Salesforce CRM, increasing customer retention by 40% and upsell revenue by ₹500K annually',
+                'role': role,
+                'formula_explanation': 'Relationship metrics: 150+ SME clients (Achievement) + Salesforce CRM (Tool) + 40% retention + ₹500K upsell (Results)'
+            }
+        ],
+        'Business Analyst': [
+            {
+                'weak_example': 'Analyzed business processes',
+                'strong_example': 'Analyzed 12 business processes for manufacturing clients using data analytics and process mapping, identifying cost savings of ₹300K annually and improving operational efficiency by 25%',
+                'role': role,
+                'formula_explanation': 'Process impact: 12 manufacturing processes (Achievement) + Data analytics/mapping (Method) + ₹300K savings + 25% efficiency (Results)'
+            },
+            {
+                'weak_example': 'Created business requirements',
+                'strong_example': 'Documented 25+ business requirements for fintech applications using Visio and JIRA, reducing project delivery time by 30% and improving stakeholder satisfaction by 50% with zero rework',
+                'role': role,
+                'formula_explanation': 'Requirements impact: 25+ fintech requirements (Achievement) + Visio/JIRA (Tools) + 30% faster delivery + 50% satisfaction + 0% rework (Results)'
+            }
+        ]
+    }
+    
+    # Default examples for roles not specifically defined
+    default_examples = [
+        {
+            'weak_example': 'Responsible for general tasks',
+            'strong_example': 'Improved operational efficiency by 25% using process optimization and team collaboration, resulting in ₹100K cost savings',
+            'role': role,
+            'formula_explanation': 'General improvement: 25% efficiency increase (Achievement) + Process optimization (Method) + ₹100K savings (Result)'
+        },
+        {
+            'weak_example': 'Worked on various projects',
+            'strong_example': 'Completed 5 major projects using project management methodologies, delivering 100% on-time with 20% cost reduction',
+            'role': role,
+            'formula_explanation': 'Project success: 5 projects (Achievement) + Project management methodologies (Method) + 20% cost reduction (Result)'
+        }
+    ]
+    
+    # Get role-specific examples or use defaults
+    examples_to_use = role_examples.get(role, default_examples)
+    
+    # Return top 2 examples for the role
+    return examples_to_use[:2]
+
+def generate_tailoring_advice(predicted_roles, keywords):
+    """Generate role-specific tailoring advice."""
+    advice = []
+    
+    for role_data in predicted_roles[:3]:
+        role = role_data['role']
+        match_pct = role_data['match_percentage']
+        
+        if match_pct > 70:
+            advice.append(f'✅ Strong match for {role} ({match_pct}%) - Your resume aligns well with this role')
+        elif match_pct > 50:
+            advice.append(f'🔧 Good potential for {role} ({match_pct}%) - Add missing skills to improve match')
+        else:
+            advice.append(f'⚠️ Consider {role} ({match_pct}%) - Focus on relevant skills and experience')
+    
+    return advice
+
+def generate_ats_summary(text, keywords, predicted_roles):
+    """Generate ATS-optimized professional summary."""
+    if not predicted_roles:
+        return "Results-driven professional with expertise in various domains. Seeking opportunities to apply skills and contribute to organizational success."
+    
+    top_role = predicted_roles[0]['role']
+    matched_skills = predicted_roles[0]['matched_skills'][:5]  # Top 5 skills
+    
+    # Create industry-appropriate summary
+    industry_context = get_industry_context(top_role)
+    skills_text = ', '.join(matched_skills)
+    
+    summary = f"Results-driven {industry_context} with expertise in {skills_text}. "
+    
+    # Add quantified achievements if found in text
+    quantified_found = re.search(r'\d+\s*(%|million|thousand|k)', text.lower())
+    if quantified_found:
+        summary += "Demonstrated success in optimizing processes and driving measurable performance improvements. "
+    
+    summary += f"Seeking to leverage technical skills and experience to contribute to {top_role} opportunities."
+    
+    return summary
+
+def generate_ats_skills_section(keywords, predicted_roles):
+    """Generate ATS-optimized skills section."""
+    if not predicted_roles:
+        return "Skills: " + ', '.join(keywords[:10])
+    
+    # Categorize skills
+    technical_skills = []
+    soft_skills = []
+    tools_skills = []
+    
+    for role_data in predicted_roles:
+        matched_skills = role_data['matched_skills']
+        for skill in matched_skills:
+            if any(tech in skill.lower() for tech in ['programming', 'software', 'database', 'cloud', 'api']):
+                technical_skills.append(skill)
+            elif any(tool in skill.lower() for tool in ['excel', 'tableau', 'powerbi', 'jira', 'git']):
+                tools_skills.append(skill)
+            else:
+                soft_skills.append(skill)
+    
+    # Remove duplicates and limit
+    technical_skills = list(set(technical_skills))[:8]
+    soft_skills = list(set(soft_skills))[:6]
+    tools_skills = list(set(tools_skills))[:6]
+    
+    skills_text = "Technical Skills: " + ', '.join(technical_skills)
+    if tools_skills:
+        skills_text += " | Tools: " + ', '.join(tools_skills)
+    if soft_skills:
+        skills_text += " | Professional Skills: " + ', '.join(soft_skills)
+    
+    return skills_text
+
+def get_industry_context(role):
+    """Get industry context for role."""
+    context_map = {
+        'Data Analyst': 'data professional',
+        'Software Engineer': 'software developer',
+        'Project Manager': 'project management professional',
+        'HR Specialist': 'human resources professional',
+        'Marketing Specialist': 'marketing professional',
+        'Sales Representative': 'sales professional'
+    }
+    return context_map.get(role, 'professional')
+
+def generate_ats_explanation(score):
+    """Generate explanation of ATS scoring."""
+    if score >= 90:
+        level = "Excellent"
+        explanation = "Your resume is highly ATS-optimized with strong keyword density, quantified achievements, and proper structure."
+    elif score >= 80:
+        level = "Good"
+        explanation = "Your resume has a solid foundation but can be improved with more quantified achievements and keyword optimization."
+    elif score >= 70:
+        level = "Fair"
+        explanation = "Your resume needs improvement in keyword density, quantified results, and ATS-friendly formatting."
+    elif score >= 60:
+        level = "Poor"
+        explanation = "Your resume requires significant improvements in structure, keywords, and quantified achievements."
+    else:
+        level = "Very Poor"
+        explanation = "Your resume needs major improvements across all ATS criteria including keywords, structure, and achievements."
+    
+    return f"ATS Score: {score}/100 ({level}) - {explanation}"
+
+def generate_ai_feedback(ats_score, predicted_roles, keywords, text):
+    """Generate AI-powered executive summary and insights for the dashboard."""
+    feedback = {}
+    
+    # Generate executive summary
+    if predicted_roles and len(predicted_roles) > 0:
+        top_role = predicted_roles[0]['role']
+        match_percentage = predicted_roles[0]['match_percentage']
+        
+        # Create a comprehensive summary based on ATS score and job matches
+        if ats_score >= 90:
+            summary = f"Excellent work! Your resume is highly optimized for {top_role} roles with a {match_percentage}% match. " \
+                     f"You have strong keyword alignment and quantified achievements. To further enhance your prospects, " \
+                     f"consider tailoring your professional summary to highlight your expertise in {', '.join(predicted_roles[0]['matched_skills'][:3])}."
+        elif ats_score >= 80:
+            summary = f"Good foundation! Your resume shows strong potential for {top_role} roles with a {match_percentage}% match. " \
+                     f"Focus on adding more quantified achievements and incorporating industry-specific keywords like " \
+                     f"{', '.join(keywords[:3])} to boost your ATS compatibility."
+        elif ats_score >= 70:
+            summary = f"Fair match for {top_role} roles at {match_percentage}%. Your resume needs improvement in keyword density " \
+                     f"and quantified results. Strengthen your impact by adding metrics to your achievements and including " \
+                     f"skills such as {', '.join(predicted_roles[0].get('missing_skills', [])[:3])}."
+        elif ats_score >= 60:
+            summary = f"Needs improvement for {top_role} roles. Your resume has a {match_percentage}% match but requires " \
+                     f"significant enhancements in structure and keyword optimization. Focus on quantifying your achievements " \
+                     f"and adding missing skills like {', '.join(predicted_roles[0].get('missing_skills', [])[:3])}."
+        else:
+            summary = f"Significant improvements needed for {top_role} roles. With only a {match_percentage}% match, " \
+                     f"you should restructure your resume to include more industry keywords such as {', '.join(keywords[:5])} " \
+                     f"and quantify your professional achievements with specific metrics."
+    else:
+        # Fallback for when no roles are predicted or other cases
+        if ats_score >= 90:
+            summary = "Outstanding! Your resume demonstrates excellent structure and keyword optimization. " \
+                     "To maximize your opportunities, consider customizing your professional summary for specific roles " \
+                     "and adding quantified achievements to showcase your impact."
+        elif ats_score >= 80:
+            summary = "Great job! Your resume shows strong potential with good keyword usage and structure. " \
+                     "Enhance it further by adding more quantified achievements and industry-specific skills."
+        elif ats_score >= 70:
+            summary = "Good start! Your resume has a solid foundation but can be improved. " \
+                     "Focus on incorporating more industry keywords and quantifying your achievements with specific metrics."
+        elif ats_score >= 60:
+            summary = "Needs improvement. Your resume requires enhancements in keyword density and quantified results. " \
+                     "Add specific metrics to your achievements and incorporate relevant industry terms."
+        else:
+            summary = "Significant improvements needed. Restructure your resume to include quantified achievements, " \
+                     "industry keywords, and a clear professional summary tailored to your target roles."
+    
+    feedback['ai_executive_summary'] = summary
+    
+    # Identify top strength
+    if predicted_roles and len(predicted_roles) > 0:
+        top_role_data = predicted_roles[0]
+        matched_skills = top_role_data['matched_skills']
+        if matched_skills and len(matched_skills) > 0:
+            feedback['top_strength'] = f"Strong alignment with {top_role_data['role']} role through skills: {', '.join(matched_skills[:3])}"
+        else:
+            feedback['top_strength'] = f"Good potential for {top_role_data['role']} role"
+    else:
+        # Fallback strengths when no roles predicted
+        if len(keywords) >= 5:
+            feedback['top_strength'] = f"Solid keyword foundation with {len(keywords)} relevant terms including: {', '.join(keywords[:3])}"
+        elif len(keywords) > 0:
+            feedback['top_strength'] = f"Relevant keywords identified: {', '.join(keywords)}"
+        else:
+            feedback['top_strength'] = "Clear, well-structured format"
+    
+    # Identify key improvement area with more specific recommendations
+    if predicted_roles and len(predicted_roles) > 0:
+        top_role_data = predicted_roles[0]
+        missing_skills = top_role_data.get('missing_skills', [])
+        if missing_skills and len(missing_skills) > 0:
+            # Get top 3 missing skills
+            top_missing = missing_skills[:3]
+            feedback['key_improvement'] = f"Add skills: {', '.join(top_missing)} to increase {top_role_data['role']} match"
+        else:
+            feedback['key_improvement'] = f"Enhance {top_role_data['role']} alignment with quantified achievements"
+    else:
+        # Fallback improvements when no roles predicted
+        if len(keywords) == 0:
+            feedback['key_improvement'] = "Add industry-specific keywords to enhance ATS compatibility"
+        elif len(keywords) < 3:
+            feedback['key_improvement'] = "Expand keyword diversity to improve role matching"
+        elif ats_score < 70:
+            feedback['key_improvement'] = "Add quantified achievements with specific metrics to demonstrate impact"
+        else:
+            # For higher scores, suggest more advanced improvements
+            feedback['key_improvement'] = "Optimize keyword placement and add more quantified achievements"
+    
+    # Prepare job role match data for visualization
+    job_roles_data = []
+    if predicted_roles and len(predicted_roles) > 0:
+        for role_data in predicted_roles[:5]:  # Top 5 roles
+            job_roles_data.append({
+                'role': role_data['role'],
+                'match_percentage': role_data['match_percentage']
+            })
+    else:
+        # Provide some default data for visualization even when no matches
+        job_roles_data.append({
+            'role': 'Upload Resume',
+            'match_percentage': max(ats_score, 30)  # Use ATS score as a proxy
+        })
+    
+    feedback['job_roles_data'] = job_roles_data
+    
+    return feedback
+
+def calculate_resume_score(text, keywords):
+    """Legacy function - now calls the advanced analysis."""
+    return calculate_advanced_ats_score(text, keywords)
+
+def analyze_for_improvements(score, text, keywords, predicted_roles=None):
+    """Provides personalized feedback based on the resume score."""
+    feedback = []
+    text_lower = text.lower()
+    
+    # Add a general assessment based on score
+    if score >= 90:
+        feedback.append("✅ Excellent! Your resume is highly ATS-optimized.")
+    elif score >= 80:
+        feedback.append("✅ Good foundation! With minor improvements, your resume can achieve an excellent ATS score.")
+    elif score >= 70:
+        feedback.append("🔧 Fair score. Focus on keyword optimization and quantified achievements to improve.")
+    elif score >= 60:
+        feedback.append("⚠️ Needs improvement. Address structure, keywords, and achievements to enhance ATS compatibility.")
+    else:
+        feedback.append("❌ Low score. Significant improvements needed in keywords, structure, and quantified results.")
+    
+    # Keyword analysis
+    if len(keywords) < 3:
+        feedback.append("🔍 <strong>Keyword Deficiency:</strong> You have few relevant keywords. Add industry-specific terms from job descriptions.")
+    elif len(keywords) < 8:
+        feedback.append("🔍 <strong>Keyword Enhancement:</strong> Increase keyword density with role-specific skills and technologies.")
+    else:
+        feedback.append("✅ <strong>Keyword Rich:</strong> Good keyword variety. Ensure they're contextually placed throughout your resume.")
+    
+    # Quantified achievements check
+    quantified_matches = re.findall(r'\d+\s*(%|million|thousand|k|lakhs|x)', text_lower)
+    if not quantified_matches:
+        feedback.append("📊 <strong>Missing Metrics:</strong> Include numbers to quantify achievements (e.g., 'increased sales by 25%', 'managed 10+ team members').")
+    elif len(quantified_matches) < 3:
+        feedback.append("📊 <strong>Limited Metrics:</strong> Add more quantified results to demonstrate impact (aim for at least 3-5 quantified achievements).")
+    else:
+        feedback.append("✅ <strong>Quantified Results:</strong> Good use of metrics to show impact.")
+    
+    # Weak verbs check
+    weak_verbs = ["responsible for", "worked on", "assisted in", "helped", "involved in", "participated in"]
+    weak_verb_matches = [verb for verb in weak_verbs if verb in text_lower]
+    if weak_verb_matches:
+        feedback.append("💪 <strong>Weak Action Verbs:</strong> Replace phrases like 'responsible for' with stronger verbs (e.g., 'managed', 'developed', 'implemented', 'optimized').")
+    else:
+        feedback.append("✅ <strong>Strong Action Verbs:</strong> Effective use of powerful action verbs.")
+    
+    # Length check
+    word_count = len(re.findall(r'\w+', text))
+    if word_count < 200:
+        feedback.append("📄 <strong>Too Short:</strong> Resume is quite brief. Expand with detailed experiences, projects, and achievements.")
+    elif word_count < 300:
+        feedback.append("📄 <strong>Concise Content:</strong> Add more specific details to experiences and achievements.")
+    elif word_count > 800:
+        feedback.append("📄 <strong>Too Lengthy:</strong> Resume exceeds 2 pages. Prioritize most relevant experiences and trim verbose descriptions.")
+    else:
+        feedback.append("✅ <strong>Optimal Length:</strong> Good resume length for readability.")
+    
+    # Structure and formatting issues
+    if "objective" not in text_lower and "summary" not in text_lower:
+        feedback.append("📋 <strong>Missing Summary:</strong> Add a professional summary or career objective tailored to your target role.")
+    
+    if "skills" not in text_lower:
+        feedback.append("📋 <strong>Skills Section Missing:</strong> Include a dedicated skills section with technical and soft skills.")
+    
+    if "experience" not in text_lower and "employment" not in text_lower:
+        feedback.append("📋 <strong>Experience Section Missing:</strong> Add a work experience section with detailed role descriptions.")
+    
+    if "education" not in text_lower:
+        feedback.append("📋 <strong>Education Section Missing:</strong> Include your educational background and relevant coursework.")
+    
+    # Role-specific suggestions if predicted roles are provided
+    if predicted_roles and len(predicted_roles) > 0:
+        top_role = predicted_roles[0]['role']
+        matched_skills = predicted_roles[0]['matched_skills']
+        missing_skills = predicted_roles[0].get('missing_skills', [])
+        
+        feedback.append(f"🎯 <strong>Role Focus:</strong> Your resume is most aligned with '{top_role}' roles.")
+        
+        if missing_skills:
+            feedback.append(f"🎯 <strong>Skill Gaps:</strong> Consider adding these relevant skills for {top_role}: {', '.join(missing_skills[:5])}")
+    
+    # ATS-specific formatting issues
+    if re.search(r'\b(table|box|column)\b', text_lower):
+        feedback.append("📄 <strong>Formatting Issue:</strong> Avoid tables and text boxes which can confuse ATS systems.")
+    
+    if re.search(r'[★◆●■▲▼◆◇○◎●]', text):
+        feedback.append("📄 <strong>Formatting Issue:</strong> Remove special characters and symbols that may not be ATS-friendly.")
+    
+    # Clarity, spelling, and grammar issues
+    # Check for common spelling errors
+    common_misspellings = {
+        "recieve": "receive",
+        "seperate": "separate",
+        "definately": "definitely",
+        "occured": "occurred",
+        "accomodate": "accommodate",
+        "existance": "existence",
+        "maintainance": "maintenance",
+        "occurence": "occurrence",
+        "reccomend": "recommend",
+        "sucess": "success",
+        "tommorow": "tomorrow",
+        "untill": "until",
+        "wierd": "weird",
+        "begining": "beginning",
+        "enviroment": "environment"
+    }
+    
+    found_misspellings = []
+    for misspelled, correct in common_misspellings.items():
+        if misspelled in text_lower:
+            found_misspellings.append(f"'{misspelled}' should be '{correct}'")
+    
+    if found_misspellings:
+        feedback.append(f"🔤 <strong>Spelling Errors:</strong> Found potential spelling mistakes: {', '.join(found_misspellings[:3])}.")
+    
+    # Check for grammatical issues
+    # Sentence fragments
+    sentences = re.split(r'[.!?]+', text)
+    short_sentences = [s for s in sentences if len(s.strip()) > 0 and len(s.strip().split()) < 5]
+    if len(short_sentences) > len(sentences) * 0.3:  # More than 30% of sentences are very short
+        feedback.append("🔤 <strong>Clarity Issues:</strong> Many sentence fragments detected. Ensure complete thoughts in each sentence.")
+    
+    # Repeated words
+    words = re.findall(r'\b\w+\b', text_lower)
+    word_count = {}
+    for word in words:
+        if len(word) > 3:  # Only check longer words
+            word_count[word] = word_count.get(word, 0) + 1
+    
+    repeated_words = [word for word, count in word_count.items() if count > 5]
+    if repeated_words:
+        feedback.append(f"🔤 <strong>Repetition Issues:</strong> Overused words detected: {', '.join(repeated_words[:3])}. Use synonyms to improve variety.")
+    
+    # Check for passive voice indicators
+    passive_indicators = ["was ", "were ", "been ", "being ", "had been", "has been", "have been"]
+    passive_count = sum(1 for indicator in passive_indicators if indicator in text_lower)
+    if passive_count > 10:
+        feedback.append("🔤 <strong>Passive Voice:</strong> Excessive passive voice detected. Use active voice for stronger impact.")
+    
+    # Final encouragement if no major issues
+    if len([f for f in feedback if f.startswith(("✅", "📊", "💪", "📄", "📋", "🎯", "🔤"))]) == len(feedback):
+        feedback.append("🎉 <strong>Great Job!</strong> Your resume is well-structured. For continuous improvement, regularly update with new skills and achievements.")
+    
+    return feedback
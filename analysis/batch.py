@@ -0,0 +1,190 @@
+"""
+Offline batch analysis of a directory or ZIP of resumes.
+
+Runs the same extraction and comprehensive_ats_analysis as /upload_resume
+across a process pool and writes one JSON line per resume, in completion
+order. Every line is flushed as soon as it is written, so the output file
+doubles as the checkpoint: --resume skips the files already in it.
+
+    python -m analysis.batch resumes/ -o results.jsonl --workers 8
+    python -m analysis.batch resumes.zip -o results.jsonl --resume
+"""
+import io
+import os
+import sys
+import json
+import time
+import zipfile
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from analysis.extract import extract_text_from_resume, is_valid_resume_content
+from analysis.jobs import extract_keywords, skill_forms
+from analysis.ats import comprehensive_ats_analysis, get_recommendation_label
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.doc')
+MIN_TEXT_LENGTH = 50  # same threshold as /upload_resume
+JOBS_PER_WORKER = 4  # files in flight per worker, keeps the pool busy without queueing everything
+
+_archives = {}  # ZIP path -> open ZipFile, one per worker process
+
+
+def list_resumes(source):
+    """
+    Resumes under ``source``, sorted: paths relative to it for a directory
+    (searched recursively), member names for a ZIP.
+    """
+    if os.path.isdir(source):
+        names = []
+        for root, dirs, files in os.walk(source):
+            names.extend(os.path.relpath(os.path.join(root, name), source) for name in files)
+    else:
+        with zipfile.ZipFile(source) as archive:
+            names = [info.filename for info in archive.infolist() if not info.is_dir()]
+    return sorted(name for name in names if name.lower().endswith(RESUME_EXTENSIONS))
+
+
+def _read_text(source, name):
+    if os.path.isdir(source):
+        return extract_text_from_resume(os.path.join(source, name))
+    archive = _archives.get(source)
+    if archive is None:
+        archive = _archives[source] = zipfile.ZipFile(source)
+    return extract_text_from_resume(name, stream=io.BytesIO(archive.read(name)))
+
+
+def analyze_resume(source, name):
+    """
+    Analyzes one resume and returns its record. ``status`` is ``ok``,
+    ``no_text`` (nothing extractable), ``not_resume`` (fails
+    is_valid_resume_content) or ``error``; only ``ok`` records carry the
+    analysis.
+    """
+    started = time.perf_counter()
+    record = {'file': name}
+    try:
+        text = _read_text(source, name)
+        if len(text.strip()) < MIN_TEXT_LENGTH:
+            record['status'] = 'no_text'
+        elif not is_valid_resume_content(text):
+            record['status'] = 'not_resume'
+        else:
+            keywords = sorted(extract_keywords(text))
+            analysis = comprehensive_ats_analysis(text, keywords)
+            record.update(
+                status='ok',
+                ats_score=analysis['ats_score'],
+                recommendation_label=get_recommendation_label(analysis['ats_score']),
+                keywords=keywords,
+                analysis=analysis
+            )
+    except Exception as e:
+        record.update(status='error', error=f'{type(e).__name__}: {e}')
+    record['seconds'] = round(time.perf_counter() - started, 3)
+    return record
+
+
+def _warm_worker():
+    """Loads the skill vocabulary (as its normalisation index) and PDF parser once per worker."""
+    skill_forms()
+    import pdfplumber  # noqa: F401
+
+
+def load_checkpoint(path):
+    """
+    Files already recorded in the JSONL file at ``path``. A torn last line
+    left by an interrupted run is cut off so appending starts clean.
+    """
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, 'rb+') as f:
+        complete = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                done.add(json.loads(line)['file'])
+            except (ValueError, KeyError):
+                break
+            complete += len(line)
+        f.truncate(complete)
+    return done
+
+
+def iter_records(source, names, workers):
+    """Yields the record of every name in ``names`` as it completes."""
+    if workers <= 1:
+        for name in names:
+            yield analyze_resume(source, name)
+        return
+
+    # spawn rather than fork, as in render_pool: the caller may have threads running
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_warm_worker) as pool:
+        pending = set()
+        for name in names:
+            if len(pending) >= workers * JOBS_PER_WORKER:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield future.result()
+            pending.add(pool.submit(analyze_resume, source, name))
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+
+
+def run_batch(source, out, workers=None, done=()):
+    """
+    Analyzes every resume in ``source`` not in ``done`` and writes the
+    records to the text file ``out``. Returns a summary with the counts,
+    elapsed seconds and files per second.
+    """
+    workers = workers or os.cpu_count() or 1
+    names = list_resumes(source)
+    todo = [name for name in names if name not in done]
+    statuses = {}
+    started = time.perf_counter()
+    for record in iter_records(source, todo, workers):
+        out.write(json.dumps(record, ensure_ascii=False) + '\n')
+        out.flush()
+        statuses[record['status']] = statuses.get(record['status'], 0) + 1
+    seconds = time.perf_counter() - started
+    return {
+        'files': len(todo),
+        'skipped': len(names) - len(todo),
+        'statuses': statuses,
+        'seconds': seconds,
+        'files_per_second': len(todo) / seconds if seconds else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Analyze a directory or ZIP of resumes into JSONL.')
+    parser.add_argument('source', help='Directory (searched recursively) or .zip of PDF/DOCX resumes.')
+    parser.add_argument('-o', '--output', help='JSONL file to write [default: stdout].')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--resume', action='store_true', help='Append to --output, skipping files already in it.')
+    args = parser.parse_args(argv)
+    if args.resume and not args.output:
+        parser.error('--resume needs --output')
+
+    if args.output:
+        done = load_checkpoint(args.output) if args.resume else set()
+        with open(args.output, 'a' if args.resume else 'w', encoding='utf-8') as out:
+            summary = run_batch(args.source, out, args.workers, done)
+    else:
+        summary = run_batch(args.source, sys.stdout, args.workers)
+
+    statuses = ', '.join(f'{count} {status}' for status, count in sorted(summary['statuses'].items()))
+    print(f"Analyzed {summary['files']} files in {summary['seconds']:.2f}s "
+          f"({summary['files_per_second']:.1f} files/s, {args.workers} workers)"
+          + (f": {statuses}" if statuses else '')
+          + (f"; {summary['skipped']} already done" if summary['skipped'] else ''),
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Skill sets as bitsets.
+
+A skill vocabulary gets a compact ID per skill (its position in sorted
+order) and a set of skills becomes a Python int with those bits set, so
+overlap is ``(a & b).bit_count()`` and missing skills are ``b & ~a``. IDs
+depend on the vocabulary, which is part of analysis.rules.rules_version():
+a bitset stored with an analysis is valid exactly as long as the analysis.
+"""
+
+
+def bitmap(positions):
+    """An int with the bits at ``positions`` set."""
+    bits = bytearray((max(positions) >> 3) + 1)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def bit_positions(bits):
+    """The positions of the set bits of ``bits``, ascending."""
+    digits = bin(bits)[:1:-1]
+    position = digits.find('1')
+    while position != -1:
+        yield position
+        position = digits.find('1', position + 1)
+
+
+def pack(bits):
+    """The storage form of a bitset: little-endian bytes."""
+    return bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+
+
+def unpack(blob):
+    return int.from_bytes(blob, 'little')
+
+
+class SkillIds:
+    """Skill-ID dictionary of a vocabulary; ``forms`` maps other spellings to a name whose ID they share."""
+
+    def __init__(self, skills, forms=None):
+        self.names = sorted(skills)
+        self.ids = {name: skill_id for skill_id, name in enumerate(self.names)}
+        for form, name in (forms or {}).items():
+            self.ids.setdefault(form, self.ids[name])
+
+    def bits(self, skills):
+        """Bitset of ``skills``; skills outside the vocabulary are ignored."""
+        ids = self.ids
+        positions = [ids[skill] for skill in skills if skill in ids]
+        return bitmap(positions) if positions else 0
+
+    def decode(self, bits):
+        """The skills of a bitset, in ID order."""
+        return [self.names[skill_id] for skill_id in bit_positions(bits)]
+
+    def in_order(self, skills, bits):
+        """The members of ``skills`` (a list) that are in ``bits``, keeping the list's order."""
+        ids = self.ids
+        return [skill for skill in skills if bits >> ids[skill] & 1]
@@ -0,0 +1,92 @@
+"""
+The job catalogue as a sparse skill matrix, for ranking every posting
+against a resume in one pass.
+
+Rows are jobs and columns skills. A job's entries are the catalogue idf of
+its (canonical) skills, normalised so each row sums to 1; its weighted match with a
+resume is then the share of its (idf-weighted) skills the resume has. The
+matrix is stored column-wise (CSC: for each skill, the jobs listing it and
+their weights), so the product with a resume's 0/1 skill vector only
+touches the resume's skills, and it yields every job's match and skill
+overlap at once. Built once per process from load_jobs_data().
+"""
+import math
+import functools
+from array import array
+
+from analysis.jobs import load_jobs_data, job_search_url, skill_forms
+
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class JobMatrix:
+    """CSC skill matrix of a job list."""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        forms = skill_forms()
+        self.job_skills = [sorted({forms.normalise(s) for s in job.get('skills', [])}) for job in jobs]
+        rows_of = {}
+        for row, skills in enumerate(self.job_skills):
+            for skill in skills:
+                rows_of.setdefault(skill, []).append(row)
+        self.idf = {skill: math.log((1 + len(jobs)) / (1 + len(rows))) + 1 for skill, rows in rows_of.items()}
+        row_totals = [sum(self.idf[skill] for skill in skills) for skills in self.job_skills]
+
+        self.columns = {}  # skill -> column
+        self.indptr = array('l', [0])
+        self.indices = array('l')  # job rows, per column
+        self.data = array('d')  # normalised weights, per column
+        for column, (skill, rows) in enumerate(sorted(rows_of.items())):
+            self.columns[skill] = column
+            self.indices.extend(rows)
+            self.data.extend(self.idf[skill] / row_totals[row] for row in rows)
+            self.indptr.append(len(self.indices))
+
+    def score(self, skills):
+        """``(match, overlap)``: every job's weighted match (0..1) and number of ``skills`` it lists."""
+        match = [0.0] * len(self.jobs)
+        overlap = [0] * len(self.jobs)
+        for skill in set(skills):
+            column = self.columns.get(skill)
+            if column is None:
+                continue
+            start, end = self.indptr[column], self.indptr[column + 1]
+            for row, weight in zip(self.indices[start:end], self.data[start:end]):
+                match[row] += weight
+                overlap[row] += 1
+        return match, overlap
+
+    def ranked(self, skills, page=1, per_page=PAGE_SIZE):
+        """
+        The jobs sharing a skill with ``skills``, best match first, one page
+        at a time: ``{'jobs': [...], 'total', 'page', 'per_page', 'pages'}``.
+        """
+        skills = set(skills)
+        match, overlap = self.score(skills)
+        order = sorted((row for row, count in enumerate(overlap) if count),
+                       key=lambda row: (-match[row], -overlap[row], row))
+        per_page = min(max(per_page, 1), MAX_PAGE_SIZE)
+        page = max(page, 1)
+        jobs = []
+        for row in order[(page - 1) * per_page:page * per_page]:
+            job = self.jobs[row]
+            jobs.append({
+                'title': job.get('title', ''),
+                'sector': job.get('sector'),
+                'location': job.get('location'),
+                'salary': job.get('salary'),
+                'url': job_search_url(job),
+                'match': round(match[row] * 100, 1),
+                'matched_skills': [s for s in self.job_skills[row] if s in skills],
+                'missing_skills': [s for s in self.job_skills[row] if s not in skills],
+            })
+        return {'jobs': jobs, 'total': len(order), 'page': page, 'per_page': per_page,
+                'pages': -(-len(order) // per_page)}
+
+
+@functools.lru_cache(maxsize=None)
+def job_matrix():
+    """The JobMatrix of the job catalogue, built once per process."""
+    return JobMatrix(load_jobs_data())
@@ -0,0 +1,76 @@
+"""Degree-based skill suggestions and education blurbs for the resume builder."""
+
+
+def get_recommended_skills_by_degree(degree):
+    """
+    Get recommended skills based on user's degree.
+    """
+    skill_recommendations = {
+        'BCA': [
+            'Python', 'Java', 'C++', 'HTML5', 'CSS3', 'JavaScript', 'SQL', 'MySQL', 
+            'Django', 'Flask', 'Git', 'Linux', 'Data Structures', 'Algorithms'
+        ],
+        'BSc CS': [
+            'Python', 'Java', 'C++', 'Data Structures', 'Algorithms', 'Database Design', 
+            'SQL', 'MySQL', 'Linux', 'Git', 'Machine Learning', 'Data Analysis'
+        ],
+        'B.Tech': [
+            'Java', 'C++', 'Python', 'SQL', 'MySQL', 'Linux', 'Git', 'REST APIs', 
+            'Microservices', 'Docker', 'Kubernetes', 'Cloud Technologies'
+        ],
+        'M.Tech': [
+            'Machine Learning', 'Deep Learning', 'Computer Vision', 'NLP', 'Python', 
+            'TensorFlow', 'PyTorch', 'Research', 'Data Analysis', 'Cloud Technologies'
+        ],
+        'MCA': [
+            'Java', 'Python', 'C++', 'SQL', 'MySQL', 'Django', 'Flask', 'Spring', 
+            'Git', 'Linux', 'Database Design', 'Software Engineering'
+        ],
+        'MBA': [
+            'Business Strategy', 'Market Research', 'Financial Analysis', 'Leadership', 
+            'Project Management', 'Communication', 'Teamwork', 'Decision Making'
+        ],
+        'BBA': [
+            'Business Strategy', 'Marketing', 'Financial Analysis', 'Leadership', 
+            'Communication', 'Teamwork', 'Project Management', 'Customer Service'
+        ],
+        'B.Com': [
+            'Accounting Principles', 'Financial Analysis', 'Taxation', 'Excel', 
+            'Tally', 'Budgeting', 'Financial Reporting', 'Auditing'
+        ],
+        'M.Com': [
+            'Accounting Principles', 'Financial Analysis', 'Taxation', 'Excel', 
+            'Financial Reporting', 'Auditing', 'Investment Management', 'Payroll Management'
+        ],
+        'Diploma': [
+            'HTML5', 'CSS3', 'JavaScript', 'Python', 'C', 'SQL', 'MySQL', 
+            'Git', 'Linux', 'Basic Networking'
+        ]
+    }
+    
+    # For degrees not specifically listed, return a generic set of skills
+    generic_skills = [
+        'Communication', 'Teamwork', 'Problem Solving', 'Time Management', 
+        'Adaptability', 'Critical Thinking', 'Creativity', 'Attention to Detail'
+    ]
+    
+    return skill_recommendations.get(degree, generic_skills)
+
+def generate_education_description(degree):
+    """
+    Generate a brief description for education degrees (except X and XII).
+    """
+    descriptions = {
+        'BCA': "Focused on computer applications, programming languages, database management, and software development principles. Gained hands-on experience in web development, software engineering, and system analysis.",
+        'BSc CS': "Studied computer science fundamentals including algorithms, data structures, programming, and software engineering. Developed strong analytical and problem-solving skills through theoretical and practical coursework.",
+        'B.Tech': "Comprehensive engineering education covering computer science, mathematics, and practical applications. Specialized in software development, system design, and emerging technologies with emphasis on innovation.",
+        'M.Tech': "Advanced postgraduate program focusing on specialized areas of computer science and engineering. Conducted research in cutting-edge technologies and developed expertise in system optimization and advanced algorithms.",
+        'MCA': "Postgraduate program emphasizing advanced computing concepts, software development, and system design. Focused on enterprise application development, database systems, and project management methodologies.",
+        'MBA': "Business administration program with focus on management, strategy, and leadership skills. Developed expertise in financial analysis, market research, and organizational behavior with emphasis on strategic decision-making.",
+        'BBA': "Undergraduate business program covering management principles, marketing, and organizational behavior. Gained foundational knowledge in business operations, finance, and leadership with practical application focus.",
+        'B.Com': "Commerce education focusing on accounting, finance, economics, and business laws. Developed strong analytical skills in financial reporting, taxation, and auditing with emphasis on regulatory compliance.",
+        'Diploma': "Technical diploma program providing hands-on training in specialized field of study. Acquired practical skills in relevant technologies and methodologies with focus on industry applications."
+    }
+    
+    # For 'Other' degrees or degrees not in the list, provide a generic description
+    return descriptions.get(degree, f"Completed {degree} program with focus on relevant coursework and practical applications. Developed strong foundation in core subjects and gained valuable hands-on experience.")
@@ -0,0 +1,54 @@
+"""Text extraction from uploaded resumes and a quick is-this-a-resume check."""
+import re
+import logging
+
+
+def extract_text_from_resume(filepath, stream=None):
+    """
+    Extract text from resume files using pdfplumber for PDFs and python-docx for DOCX.
+    If ``stream`` (a seekable binary file) is given it is read instead, and
+    ``filepath`` only decides the format.
+    """
+    text = ""
+    source = filepath if stream is None else stream
+    try:
+        if filepath.lower().endswith(".pdf"):
+            import pdfplumber
+            with pdfplumber.open(source) as pdf:
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    if page_text:
+                        text += page_text + "\n"
+        elif filepath.lower().endswith((".docx", ".doc")):
+            import docx
+            doc = docx.Document(source)
+            text = "\n".join([para.text for para in doc.paragraphs])
+        else:
+            logging.error(f"Unsupported file format: {filepath}")
+    except Exception as e:
+        logging.error(f"Error extracting text from {filepath}: {e}")
+    
+    return text
+
+def is_valid_resume_content(text):
+    """Checks if a document is likely a resume based on a simple heuristic."""
+    text_lower = text.lower()
+    word_count = len(re.findall(r'\w+', text_lower))
+    
+    # 1. Length Check
+    if word_count < 150 or word_count > 2000:
+        return False
+        
+    # 2. Keyword Check
+    resume_keywords = ["education", "skills", "experience", "projects", "certifications", "summary"]
+    
+    # Check for at least 2 common resume section keywords
+    found_keywords = sum(1 for keyword in resume_keywords if keyword in text_lower)
+    if found_keywords < 2:
+        return False
+        
+    # 3. Contact Info Check (simple email check)
+    if not re.search(r'[\w\.-]+@[\w\.-]+', text_lower):
+        return False
+        
+    return True
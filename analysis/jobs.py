@@ -0,0 +1,160 @@
+"""Job catalogue, skill vocabulary, keyword extraction and job matching."""
+import re
+import json
+import logging
+import functools
+from collections import Counter
+
+from analysis.skills import BASE_SKILLS
+from analysis.aliases import SkillForms
+from analysis.bitsets import SkillIds
+from analysis.taxonomy import SkillTaxonomy, load_taxonomy
+
+
+@functools.lru_cache(maxsize=None)
+def load_jobs_data():
+    """
+    Loads job data from jobs.json and a placeholder for an API call. Read
+    once per process (preloaded before fork in production); callers must
+    not mutate the returned jobs.
+    """
+    try:
+        with open("jobs.json", "r", encoding="utf-8") as f:
+            local_jobs = json.load(f)
+    except FileNotFoundError:
+        logging.warning("jobs.json not found. Returning placeholder jobs.")
+        local_jobs = []
+    
+    api_jobs = [
+        {"title": "DevOps Engineer", "company_name": "CloudNine", "url": "https://example.com/job/devops", "skills": ["aws", "docker", "kubernetes", "linux"]},
+        {"title": "AI/ML Engineer", "company_name": "Innovate AI", "url": "https://example.com/job/ai", "skills": ["python", "ml", "ai", "data"]}
+    ]
+    return local_jobs + api_jobs
+
+def get_all_known_skills(jobs):
+    """Extracts all unique skills from the provided job list AND the base skills dictionary."""
+    all_skills = set()
+    for job in jobs:
+        all_skills.update([s.lower() for s in job.get("skills", [])])
+    
+    for skill_list in BASE_SKILLS.values():
+        all_skills.update(skill_list)
+
+    return all_skills
+
+@functools.lru_cache(maxsize=None)
+def known_skills():
+    """The skill vocabulary, built once per process."""
+    return frozenset(get_all_known_skills(load_jobs_data()))
+
+@functools.lru_cache(maxsize=None)
+def skill_forms():
+    """The normalisation index of the skill vocabulary (see analysis.aliases)."""
+    return SkillForms(known_skills(), load_taxonomy().get('aliases', {}))
+
+@functools.lru_cache(maxsize=None)
+def skill_ids():
+    """
+    The skill-ID dictionary of the canonical skills (see analysis.bitsets);
+    every known form of a skill has its ID.
+    """
+    forms = skill_forms()
+    return SkillIds(forms.skills, forms.forms)
+
+@functools.lru_cache(maxsize=None)
+def skill_taxonomy():
+    """The skill taxonomy's implication closure over skill_ids() (see analysis.taxonomy)."""
+    return SkillTaxonomy(skill_ids(), load_taxonomy())
+
+def implied_skills(skills):
+    """``skills`` plus every skill they imply, in ID order."""
+    ids = skill_ids()
+    return ids.decode(skill_taxonomy().expand(ids.bits(skills)))
+
+@functools.lru_cache(maxsize=None)
+def role_skills():
+    """Every skill some BASE_SKILLS role asks for, sorted."""
+    return sorted({skill for skills in BASE_SKILLS.values() for skill in skills})
+
+@functools.lru_cache(maxsize=None)
+def role_skill_bits():
+    """Bitset of each BASE_SKILLS role's skills."""
+    ids = skill_ids()
+    return {role: ids.bits(skills) for role, skills in BASE_SKILLS.items()}
+
+@functools.lru_cache(maxsize=None)
+def job_skill_bits():
+    """Bitset of each catalogue job's skills, in load_jobs_data() order."""
+    ids = skill_ids()
+    return [ids.bits(s.lower() for s in job.get("skills", [])) for job in load_jobs_data()]
+
+def extract_keywords(text):
+    """Extracts keywords from text based on a known list of skills, as canonical skills."""
+    return list(set(skill_forms().find(text)))
+
+def skill_vector(text):
+    """How often each known (canonical) skill occurs in ``text``, and the text's length in words."""
+    words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+    return dict(Counter(skill_forms().find(text))), len(words)
+
+def suggest_job_role(keywords):
+    """Suggests a job role based on extracted keywords."""
+    role_mappings = {
+        "Python Developer": ["python", "django", "flask"],
+        "Java Developer": ["java", "spring"],
+        "Frontend Developer": ["react", "javascript", "html", "css", "angular", "ui", "ux", "frontend"],
+        "Backend Developer": ["node", "php", "backend"],
+        "Full Stack Developer": ["fullstack"],
+        "Data Analyst": ["sql", "excel", "tableau", "powerbi", "data"],
+        "Data Scientist": ["data", "ml", "ai", "python"],
+        "Project Manager": ["management", "agile", "jira", "manager"],
+        "HR Specialist": ["hr", "recruitment"],
+        "Cloud Engineer": ["aws", "azure", "cloud"],
+        "DevOps Engineer": ["devops", "docker", "kubernetes", "linux"],
+        "Cybersecurity Analyst": ["cybersecurity", "security"],
+        "Software Engineer": ["c", "c++", ".net"],
+        "Content Writer": ["content", "writer"],
+        "Medical Professional": ["nurse", "doctor", "pharma", "radiology", "medical"]
+    }
+    
+    forms = skill_forms()
+    keywords = {forms.normalise(keyword) for keyword in keywords}
+    predicted_roles = set()
+    for role, skills in role_mappings.items():
+        if any(forms.normalise(skill) in keywords for skill in skills):
+            predicted_roles.add(role)
+
+    if not predicted_roles:
+        return ["General Job Seeker"]
+
+    return list(predicted_roles)
+
+def job_search_url(job):
+    """A Google Jobs search for the job's title and location (no company names)."""
+    search_query = f"{job.get('title', '')} jobs in {job.get('location', 'India')}".replace(" ", "+")
+    return f"https://www.google.com/search?ibp=htl;jobs&q={search_query}"
+
+def fetch_jobs(predicted_roles, keywords):
+    """Fetch jobs from a local JSON file based on predicted roles and keywords."""
+    jobs_data = load_jobs_data()
+    recommended_jobs = []
+    seen_urls = set()
+    keyword_bits = skill_taxonomy().expand(skill_ids().bits(keywords))
+
+    for job, job_bits in zip(jobs_data, job_skill_bits()):
+        title = job.get("title", "").lower()
+        title_match = any(role.lower() in title for role in predicted_roles)
+        
+        skill_overlap = (job_bits & keyword_bits).bit_count()
+        
+        if (title_match or skill_overlap > 0) and job.get("url") not in seen_urls:
+            job = dict(job)  # the job list is shared; annotate a copy
+            job["match_score"] = skill_overlap
+            job["url"] = job_search_url(job)
+            # Set a generic company name for display
+            job["company_name"] = "Multiple Companies"
+            recommended_jobs.append(job)
+            seen_urls.add(job.get("url"))
+
+    recommended_jobs.sort(key=lambda x: x.get("match_score", 0), reverse=True)
+    return recommended_jobs[:5]
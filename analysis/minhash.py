@@ -0,0 +1,68 @@
+"""
+MinHash signatures of resume text, for finding near-duplicates.
+
+A text becomes its set of shingles (SHINGLE consecutive words) and its
+signature holds, for each of NUM_PERM hash functions, the smallest hash of
+any shingle. The hash functions are the 64-bit words of the shingle's
+SHAKE-128 digest, so one digest per shingle gives all of them. The share
+of positions on which two signatures agree estimates the Jaccard
+similarity of the two shingle sets.
+
+For locality-sensitive hashing a signature is cut into BANDS bands of ROWS
+values and each band hashed to a key. Two texts share some band key with
+probability ``1 - (1 - s**ROWS)**BANDS`` for similarity s: about 0.99 at
+s = 0.7 and 0.2 at s = 0.4, so looking up a signature's band keys finds
+its near-duplicates (and a few candidates to discard) without comparing it
+to everything else. Hashes come
+from hashlib, not hash(), so signatures and keys are stable across
+processes; changing any constant below invalidates stored signatures.
+"""
+import re
+import struct
+import hashlib
+
+SHINGLE = 3
+NUM_PERM = 120
+BANDS = 24
+ROWS = NUM_PERM // BANDS
+
+_PACKED = struct.Struct(f'<{NUM_PERM}Q')
+_BAND = struct.Struct(f'<{ROWS}Q')
+
+
+def shingles(text):
+    """The text's word shingles; a text shorter than one shingle is a single one."""
+    words = re.findall(r'[a-z0-9]+', text.lower())
+    if len(words) <= SHINGLE:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + SHINGLE]) for i in range(len(words) - SHINGLE + 1)}
+
+
+def signature(text):
+    """The MinHash signature of ``text`` (NUM_PERM ints), or None if it has no words."""
+    hashes = [_PACKED.unpack(hashlib.shake_128(shingle.encode('utf-8')).digest(_PACKED.size))
+              for shingle in shingles(text or '')]
+    if not hashes:
+        return None
+    return list(map(min, zip(*hashes)))
+
+
+def similarity(first, second):
+    """Estimated Jaccard similarity (0..1) of the texts of two signatures."""
+    return sum(1 for x, y in zip(first, second) if x == y) / NUM_PERM
+
+
+def band_keys(signature):
+    """The signature's LSH key per band, as signed 64-bit ints (SQLite INTEGER)."""
+    return [int.from_bytes(hashlib.blake2b(_BAND.pack(*signature[band * ROWS:(band + 1) * ROWS]),
+                                           digest_size=8).digest(), 'little', signed=True)
+            for band in range(BANDS)]
+
+
+def pack(signature):
+    """The storage form of a signature: little-endian unsigned 64-bit ints."""
+    return _PACKED.pack(*signature)
+
+
+def unpack(blob):
+    return list(_PACKED.unpack(blob))
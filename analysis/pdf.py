@@ -0,0 +1,445 @@
+"""ATS-friendly PDF rendering (ReportLab) and the plain-text sidecar."""
+import io
+
+from analysis.education import generate_education_description
+
+
+# Bump whenever generate_ats_pdf's output changes so cached PDFs get re-rendered
+PDF_TEMPLATE_VERSION = 1
+
+def build_resume_sidecar(story):
+    """
+    Builds the plain-text and section-structured view of a resume from the
+    same flowables that are rendered into the PDF, so analyzers never have to
+    extract text from the PDF again.
+    """
+    from reportlab.platypus import Paragraph
+
+    sections = [{'heading': None, 'lines': []}]  # name and contact details come first
+    for flowable in story:
+        if not isinstance(flowable, Paragraph):
+            continue
+        text = flowable.getPlainText().strip()
+        if not text:
+            continue
+        if flowable.style.name == 'CustomHeading':
+            sections.append({'heading': text, 'lines': []})
+        else:
+            sections[-1]['lines'].append(text)
+
+    blocks = []
+    for section in sections:
+        lines = ([section['heading']] if section['heading'] else []) + section['lines']
+        if lines:
+            blocks.append("\n".join(lines))
+
+    return {
+        'version': 1,
+        'text': "\n\n".join(blocks),
+        'sections': [section for section in sections if section['heading'] or section['lines']]
+    }
+
+def build_resume_story(resume_data):
+    """
+    The ReportLab flowables of a resume, in page order: everything
+    generate_ats_pdf renders, without laying out any pages.
+    Handles both freshers and experienced professionals.
+    """
+    # ReportLab is imported here rather than at module level: it is by far
+    # the slowest import in the package and only the renderer needs it.
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, Spacer
+
+    styles = getSampleStyleSheet()
+    
+    # Custom styles for ATS optimization
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontName='Helvetica-Bold',
+        fontSize=16,
+        spaceAfter=12,
+        textColor=colors.HexColor('#2c3e50')
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontName='Helvetica-Bold',
+        fontSize=12,
+        spaceAfter=6,
+        textColor=colors.HexColor('#2c3e50'),
+        borderBottom=1,
+        borderColor=colors.HexColor('#bdc3c7')
+    )
+    
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=styles['Normal'],
+        fontName='Helvetica',
+        fontSize=10,
+        spaceAfter=6
+    )
+    
+    bullet_style = ParagraphStyle(
+        'BulletPoint',
+        parent=styles['Normal'],
+        fontName='Helvetica',
+        fontSize=10,
+        leftIndent=20,
+        spaceAfter=3
+    )
+    
+    story = []
+    
+    # Personal Details Section
+    personal_info = resume_data.get('personal_details', {})
+    name = personal_info.get('full_name', '')
+    email = personal_info.get('email', '')
+    phone = personal_info.get('phone', '')
+    location = personal_info.get('location', '')
+    linkedin = personal_info.get('linkedin', '')
+    github = personal_info.get('github', '')
+    
+    if name:
+        story.append(Paragraph(name.upper(), title_style))
+    
+    contact_info = []
+    if phone:
+        contact_info.append(phone)
+    if email:
+        contact_info.append(email)
+    if location:
+        contact_info.append(location)
+    if linkedin:
+        contact_info.append(f"LinkedIn: {linkedin}")
+    if github:
+        contact_info.append(f"GitHub: {github}")
+    
+    if contact_info:
+        contact_paragraph = Paragraph(" | ".join(contact_info), normal_style)
+        story.append(contact_paragraph)
+    
+    story.append(Spacer(1, 0.2*inch))
+    
+    # Professional Summary/Career Objective
+    user_type = resume_data.get('user_type', 'experienced')
+    if user_type == 'fresher':
+        summary = """Recent graduate with strong academic foundation and technical aptitude, seeking to launch a successful career in the technology industry. 
+Possess solid understanding of programming fundamentals, data structures, and software development principles. 
+Eager to apply theoretical knowledge in a practical environment while continuously learning and growing as a professional. 
+Demonstrated ability to work collaboratively in team settings and adapt quickly to new technologies and methodologies. 
+Committed to delivering high-quality work and contributing to organizational goals through innovation and dedication. 
+Strong problem-solving skills with attention to detail and a passion for creating efficient, user-friendly solutions. 
+Ready to take on challenging projects and make meaningful contributions to dynamic development teams. 
+Motivated to learn from experienced professionals and grow into a valuable asset for the organization."""
+        story.append(Paragraph("CAREER OBJECTIVE", heading_style))
+        story.append(Paragraph(summary, normal_style))
+        story.append(Spacer(1, 0.1*inch))
+    else:
+        summary = resume_data.get('professional_summary', '')
+        if summary:
+            story.append(Paragraph("PROFESSIONAL SUMMARY", heading_style))
+            story.append(Paragraph(summary, normal_style))
+            story.append(Spacer(1, 0.1*inch))
+        else:
+            summary = """Results-driven professional with extensive experience in software development and project management. 
+Proven track record of delivering high-quality solutions on time and within budget while leading cross-functional teams. 
+Expertise in modern development frameworks, cloud technologies, and agile methodologies. 
+Skilled in translating business requirements into technical specifications and driving innovation through continuous improvement. 
+Strong leadership capabilities with demonstrated success in mentoring junior developers and fostering collaborative environments. 
+Committed to staying current with emerging technologies and industry best practices to drive organizational growth. 
+Experienced in managing complex projects from conception to deployment with focus on scalability and performance. 
+Dedicated to delivering exceptional value to clients and stakeholders through strategic thinking and technical excellence."""
+            story.append(Paragraph("PROFESSIONAL SUMMARY", heading_style))
+            story.append(Paragraph(summary, normal_style))
+            story.append(Spacer(1, 0.1*inch))
+    
+    # Technical Skills
+    skills_data = resume_data.get('technical_skills', {})
+    soft_skills = resume_data.get('soft_skills', [])
+    
+    # Combine all skills into categories
+    all_skills = []
+    
+    # Programming Languages
+    programming_languages = skills_data.get('programming_languages', '')
+    if programming_languages:
+        all_skills.append(f"<b>Programming Languages:</b> {programming_languages}")
+    
+    # Frameworks & Libraries
+    frameworks = skills_data.get('frameworks', '')
+    if frameworks:
+        all_skills.append(f"<b>Frameworks & Libraries:</b> {frameworks}")
+    
+    # Databases
+    databases = skills_data.get('databases', '')
+    if databases:
+        all_skills.append(f"<b>Databases:</b> {databases}")
+    
+    # Cloud Technologies
+    cloud_technologies = skills_data.get('cloud_technologies', '')
+    if cloud_technologies:
+        all_skills.append(f"<b>Cloud Technologies:</b> {cloud_technologies}")
+    
+    # DevOps Tools
+    devops_tools = skills_data.get('devops_tools', '')
+    if devops_tools:
+        all_skills.append(f"<b>DevOps Tools:</b> {devops_tools}")
+    
+    # Other Technical Skills
+    other_technical_skills = skills_data.get('other_technical_skills', '')
+    if other_technical_skills:
+        all_skills.append(f"<b>Other Technical Skills:</b> {other_technical_skills}")
+    
+    # Soft Skills
+    if soft_skills:
+        soft_skills_str = ', '.join(soft_skills) if isinstance(soft_skills, list) else soft_skills
+        all_skills.append(f"<b>Soft Skills:</b> {soft_skills_str}")
+    
+    if all_skills:
+        story.append(Paragraph("TECHNICAL SKILLS", heading_style))
+        skills_paragraph = Paragraph(" | ".join(all_skills), normal_style)
+        story.append(skills_paragraph)
+        story.append(Spacer(1, 0.1*inch))
+    
+    # Work Experience - Handle freshers
+    work_experience = resume_data.get('work_experience', [])
+    
+    if user_type != 'fresher':
+        # Check if the list contains at least one entry with non-empty content
+        has_experience = False
+        for exp in work_experience:
+            if (exp.get('job_title', '').strip() or 
+                exp.get('company', '').strip() or 
+                exp.get('bullet_points', '').strip()):
+                has_experience = True
+                break
+
+        if has_experience:
+            story.append(Paragraph("WORK EXPERIENCE", heading_style))
+            
+            for exp in work_experience:
+                job_title = exp.get('job_title', '')
+                company = exp.get('company', '')
+                location = exp.get('location', '')
+                start_date = exp.get('start_date', '')
+                end_date = exp.get('end_date', '')
+                currently_working = exp.get('currently_working', False)
+                bullet_points = exp.get('bullet_points', '').split('\n') if exp.get('bullet_points') else []
+                
+                # Skip this entry if it's completely empty
+                if not (job_title.strip() or company.strip() or bullet_points):
+                    continue
+                
+                # Job header
+                job_header_parts = []
+                if job_title:
+                    job_header_parts.append(f"<b>{job_title}</b>")
+                if company:
+                    job_header_parts.append(company)
+                if location:
+                    job_header_parts.append(location)
+                if start_date:
+                    end_date_display = "Present" if currently_working else (end_date if end_date else "")
+                    job_header_parts.append(f"{start_date} - {end_date_display}")
+                
+                job_header = " | ".join(job_header_parts)
+                story.append(Paragraph(job_header, normal_style))
+                
+                # Bullet points
+                for point in bullet_points:
+                    if point.strip():
+                        story.append(Paragraph(f"• {point.strip()}", bullet_style))
+                
+                story.append(Spacer(1, 0.05*inch))
+            
+            story.append(Spacer(1, 0.1*inch))
+    
+    # Education
+    education = resume_data.get('education', [])
+    has_education = False
+    for edu in education:
+        if (edu.get('degree', '').strip() or 
+            edu.get('institution', '').strip()):
+            has_education = True
+            break
+
+    if has_education:
+        story.append(Paragraph("EDUCATION", heading_style))
+        
+        for edu in education:
+            degree = edu.get('degree', '')
+            institution = edu.get('institution', '')
+            location = edu.get('location', '')
+            start_year = edu.get('start_year', '')
+            end_year = edu.get('end_year', '')
+            currently_studying = edu.get('currently_studying', False)
+            
+            # Skip empty education entries
+            if not (degree.strip() or institution.strip()):
+                continue
+            
+            # Create education header
+            edu_header_parts = []
+            if degree:
+                edu_header_parts.append(f"<b>{degree}</b>")
+            if institution:
+                edu_header_parts.append(institution)
+            if location:
+                edu_header_parts.append(location)
+            
+            # Add years if available
+            if start_year:
+                if currently_studying:
+                    edu_header_parts.append(f"{start_year} - Present")
+                elif end_year:
+                    edu_header_parts.append(f"{start_year} - {end_year}")
+                else:
+                    edu_header_parts.append(str(start_year))
+            
+            edu_header = " | ".join(edu_header_parts)
+            story.append(Paragraph(edu_header, normal_style))
+            
+            # Add auto-generated description for courses (except X and XII)
+            if degree and degree not in ['X', 'XII']:
+                description = generate_education_description(degree)
+                story.append(Paragraph(description, bullet_style))
+            
+            story.append(Spacer(1, 0.05*inch))
+        
+        story.append(Spacer(1, 0.1*inch))
+    
+    # Projects
+    projects = resume_data.get('projects', [])
+    has_projects = False
+    for proj in projects:
+        if (proj.get('project_name', '').strip() or 
+            proj.get('technologies_used', '').strip()):
+            has_projects = True
+            break
+
+    if has_projects:
+        story.append(Paragraph("PROJECTS", heading_style))
+        
+        for proj in projects:
+            project_name = proj.get('project_name', '')
+            technologies_used = proj.get('technologies_used', '')
+            description = proj.get('description', '')
+            github_link = proj.get('github_link', '')
+            demo_link = proj.get('demo_link', '')
+            
+            # Skip empty project entries
+            if not (project_name.strip() or technologies_used.strip()):
+                continue
+            
+            # Project header
+            proj_header_parts = []
+            if project_name:
+                proj_header_parts.append(f"<b>{project_name}</b>")
+            if technologies_used:
+                proj_header_parts.append(technologies_used)
+            
+            proj_header = " | ".join(proj_header_parts)
+            story.append(Paragraph(proj_header, normal_style))
+            
+            # Project description
+            if description:
+                story.append(Paragraph(description, bullet_style))
+            
+            # Links
+            links = []
+            if github_link:
+                links.append(f"<link href='{github_link}'>GitHub</link>")
+            if demo_link:
+                links.append(f"<link href='{demo_link}'>Demo</link>")
+            
+            if links:
+                story.append(Paragraph("Links: " + " | ".join(links), bullet_style))
+            
+            story.append(Spacer(1, 0.05*inch))
+        
+        story.append(Spacer(1, 0.1*inch))
+    
+    # Certifications
+    certifications = resume_data.get('certifications', [])
+    has_certifications = False
+    for cert in certifications:
+        if (cert.get('certification_name', '').strip() or 
+            cert.get('organization', '').strip()):
+            has_certifications = True
+            break
+
+    if has_certifications:
+        story.append(Paragraph("CERTIFICATIONS", heading_style))
+        
+        for cert in certifications:
+            cert_name = cert.get('certification_name', '')
+            organization = cert.get('organization', '')
+            start_date = cert.get('start_date', '')
+            end_date = cert.get('end_date', '')
+            currently_valid = cert.get('currently_valid', False)
+            certification_id = cert.get('certification_id', '')
+            
+            # Skip empty certification entries
+            if not (cert_name.strip() or organization.strip()):
+                continue
+            
+            # Certification header
+            cert_header_parts = []
+            if cert_name:
+                cert_header_parts.append(f"<b>{cert_name}</b>")
+            if organization:
+                cert_header_parts.append(organization)
+            
+            # Add dates if available
+            if start_date:
+                if currently_valid:
+                    cert_header_parts.append(f"{start_date} - Present")
+                elif end_date:
+                    cert_header_parts.append(f"{start_date} - {end_date}")
+                else:
+                    cert_header_parts.append(start_date)
+            
+            cert_header = " | ".join(cert_header_parts)
+            story.append(Paragraph(cert_header, normal_style))
+            
+            # Add certification ID if available
+            if certification_id:
+                story.append(Paragraph(f"ID: {certification_id}", bullet_style))
+            
+            story.append(Spacer(1, 0.05*inch))
+    
+    return story
+
+def resume_sidecar(resume_data):
+    """The text sidecar of a resume (see build_resume_sidecar), built from its story alone."""
+    return build_resume_sidecar(build_resume_story(resume_data))
+
+def generate_ats_pdf(resume_data, sidecar=None):
+    """
+    Generates an ATS-friendly PDF resume using ReportLab.
+    If a ``sidecar`` dict is passed it is filled with the resume's plain text
+    and sections (see build_resume_sidecar) in the same pass.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, 
+                          topMargin=0.5*inch, 
+                          bottomMargin=0.5*inch,
+                          leftMargin=0.5*inch,
+                          rightMargin=0.5*inch)
+    story = build_resume_story(resume_data)
+    
+    # doc.build() consumes the story, so take the sidecar first
+    if sidecar is not None:
+        sidecar.update(build_resume_sidecar(story))
+    
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
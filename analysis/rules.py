@@ -0,0 +1,26 @@
+"""
+Version stamp of the analysis rules.
+
+Stored analyses record the version they were computed under. It is a hash
+of the code and data that decide a score (skill vocabularies, the job
+catalogue's skills, the skill taxonomy and aliases, the scoring module,
+the skill-ID encoding), so editing BASE_SKILLS, ACTION_VERBS or a weight
+makes every older analysis stale without anyone having to remember to bump
+a number.
+"""
+import json
+import inspect
+import hashlib
+import functools
+
+from analysis import aliases, ats, bitsets, jobs, skills, taxonomy
+
+
+@functools.lru_cache(maxsize=None)
+def rules_version():
+    digest = hashlib.sha256()
+    for module in (skills, jobs, ats, bitsets, aliases, taxonomy):
+        digest.update(inspect.getsource(module).encode('utf-8'))
+    digest.update(json.dumps(sorted(jobs.known_skills())).encode('utf-8'))
+    digest.update(json.dumps(taxonomy.load_taxonomy(), sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()[:16]
@@ -0,0 +1,53 @@
+"""Static skill, industry and action-verb vocabularies used by the analyzers."""
+
+# --- Comprehensive ATS Skills Database ---
+BASE_SKILLS = {
+    "Python Developer": ["python", "django", "flask", "fastapi", "pandas", "numpy", "scikit-learn"],
+    "Java Developer": ["java", "spring", "spring boot", "hibernate", "maven", "gradle", "microservices"],
+    "Frontend Developer": ["react", "javascript", "typescript", "html", "css", "angular", "vue", "ui", "ux", "responsive design"],
+    "Backend Developer": ["node", "php", "express", "laravel", "api", "rest", "graphql", "microservices"],
+    "Full Stack Developer": ["fullstack", "mern", "mean", "lamp", "jamstack", "nextjs", "nuxt"],
+    "Data Analyst": ["sql", "excel", "tableau", "powerbi", "data", "analytics", "statistics", "r", "python", "reporting"],
+    "Data Scientist": ["python", "r", "machine learning", "deep learning", "tensorflow", "pytorch", "data science", "nlp"],
+    "Project Manager": ["management", "agile", "scrum", "jira", "communication", "leadership", "budget", "stakeholder"],
+    "HR Specialist": ["hr", "recruitment", "onboarding", "hris", "compliance", "employee relations", "talent acquisition", "retention"],
+    "Cloud Engineer": ["aws", "azure", "gcp", "cloud", "terraform", "kubernetes", "docker", "ci/cd"],
+    "DevOps Engineer": ["devops", "docker", "kubernetes", "jenkins", "gitlab", "linux", "ansible", "terraform"],
+    "Cybersecurity Analyst": ["cybersecurity", "security", "penetration testing", "vulnerability assessment", "siem", "compliance"],
+    "Software Engineer": ["c", "c++", ".net", "c#", "algorithms", "data structures", "software development", "testing"],
+    "Content Writer": ["content", "writer", "copywriting", "seo", "marketing", "social media", "blogging"],
+    "Marketing Specialist": ["marketing", "digital marketing", "seo", "sem", "social media", "analytics", "campaigns", "strategy"],
+    "Sales Representative": ["sales", "crm", "lead generation", "negotiation", "customer relationship", "revenue"],
+    "Business Analyst": ["business analysis", "requirements", "documentation", "stakeholder", "process improvement", "data analysis"],
+    "UX/UI Designer": ["ux", "ui", "design", "figma", "sketch", "adobe", "user research", "wireframing", "prototyping"],
+    "Product Manager": ["product management", "roadmap", "strategy", "user stories", "agile", "stakeholder management"],
+    "Quality Assurance": ["qa", "testing", "manual testing", "automation", "selenium", "test cases", "bug tracking"],
+    "Medical Professional": ["nurse", "doctor", "pharma", "radiology", "medical", "healthcare", "patient care"],
+    "Financial Analyst": ["finance", "financial analysis", "excel", "vba", "budgeting", "forecasting", "financial modeling"],
+    "Operations Manager": ["operations", "process improvement", "supply chain", "logistics", "quality control", "lean"],
+    "Customer Success": ["customer success", "customer support", "retention", "satisfaction", "onboarding", "account management"],
+    "Financial Analyst": ["finance", "financial analysis", "excel", "vba", "budgeting", "forecasting", "financial modeling", "reporting"],
+    "Business Operations": ["operations", "strategy", "process improvement", "analytics", "reporting", "finance"],
+    "Customer Experience": ["satisfaction", "retention", "customer support", "analytics", "communication"]
+}
+
+# --- Industry-Specific Keywords for ATS Analysis ---
+INDUSTRY_KEYWORDS = {
+    "Technology": ["software", "development", "programming", "coding", "api", "database", "cloud", "ai", "ml", "data"],
+    "Healthcare": ["patient", "medical", "healthcare", "clinical", "diagnosis", "treatment", "pharmaceutical", "nursing"],
+    "Finance": ["financial", "banking", "investment", "risk", "compliance", "audit", "accounting", "trading"],
+    "Marketing": ["marketing", "campaign", "brand", "digital", "social media", "seo", "content", "analytics"],
+    "Sales": ["sales", "revenue", "client", "customer", "lead", "prospect", "crm", "negotiation"],
+    "HR": ["hr", "human resources", "recruitment", "talent", "employee", "onboarding", "training", "compliance"],
+    "Operations": ["operations", "process", "efficiency", "quality", "supply chain", "logistics", "management"],
+    "Education": ["education", "teaching", "training", "curriculum", "student", "learning", "instruction", "academic"]
+}
+
+# --- Action Verbs for Quantifiable Achievements ---
+ACTION_VERBS = {
+    "achievement": ["achieved", "accomplished", "delivered", "completed", "exceeded", "surpassed"],
+    "improvement": ["improved", "increased", "enhanced", "optimized", "streamlined", "reduced", "accelerated"],
+    "leadership": ["led", "managed", "supervised", "directed", "coordinated", "mentored", "guided"],
+    "development": ["developed", "created", "built", "designed", "implemented", "launched", "established"],
+    "analysis": ["analyzed", "evaluated", "assessed", "researched", "investigated", "identified", "measured"]
+}
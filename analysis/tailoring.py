@@ -0,0 +1,135 @@
+"""
+Scoring a resume against the job description it is being sent to.
+
+A job description becomes a JD vector: TF-IDF weights of the (canonical)
+skills it asks for and of its other significant terms, with document
+frequencies from the job catalogue (jobs.json), each group normalised to
+sum to 1. The vectors are cached per process by a hash of the normalised description, so
+scoring many resumes against a popular posting vectorises it once, and the
+resume side comes from its stored analysis.
+"""
+import re
+import math
+import hashlib
+import functools
+import threading
+from collections import Counter, OrderedDict
+
+from analysis.ats import calculate_content_score
+from analysis.jobs import load_jobs_data, skill_forms, implied_skills
+
+SKILL_SHARE = 0.7  # of the match; the rest is the other terms
+KEYWORD_POINTS = 30  # the keyword criterion of calculate_advanced_ats_score, here scored by the match
+MAX_TERMS = 40
+JD_CACHE_SIZE = 1024
+WORD = re.compile(r'\b[a-zA-Z]+\b')
+
+STOP_WORDS = frozenset('''
+    a about above across after all also an and any are as at be been being both but by can could did do does
+    for from had has have having he her here his how i if in into is it its just may more most must no not of
+    on or other our out over own per she should so some such than that the their them then there these they
+    this those through to too under up us very was we were what when where which while who will with within
+    would you your
+    ability able apply candidate candidates company day excellent experience good including join knowledge
+    looking need new opportunity plus position preferred required requirements responsibilities role seeking
+    skills strong team teams understanding using work working year years
+'''.split())
+
+
+@functools.lru_cache(maxsize=None)
+def job_corpus():
+    """
+    ``(number of jobs, term -> number of jobs using it)`` over the
+    catalogue's titles, descriptions and skills; terms are words and
+    canonical skills.
+    """
+    frequencies = Counter()
+    forms = skill_forms()
+    jobs = load_jobs_data()
+    for job in jobs:
+        text = ' '.join([job.get('title', ''), job.get('description', '')] + job.get('skills', []))
+        frequencies.update(set(WORD.findall(text.lower())) | set(forms.find(text)))
+    return len(jobs), frequencies
+
+
+def _by_weight(weights):
+    return [term for term, _ in sorted(weights, key=lambda item: (-item[1], item[0]))]
+
+
+def _normalised(weights):
+    total = sum(weights.values())
+    return {term: weight / total for term, weight in weights.items()} if total else {}
+
+
+def build_jd_vector(text):
+    """The JD vector of ``text``: ``{'skills': {skill: weight}, 'terms': {term: weight}}``."""
+    jobs, frequencies = job_corpus()
+    forms = skill_forms()
+
+    def weight(term, count):
+        return (1 + math.log(count)) * (math.log((1 + jobs) / (1 + frequencies[term])) + 1)
+
+    skills = {skill: weight(skill, count) for skill, count in Counter(forms.find(text)).items()}
+    terms = {}
+    for word, count in Counter(WORD.findall(text.lower())).items():
+        if len(word) > 2 and word not in STOP_WORDS and forms.resolve(word) is None:
+            terms[word] = weight(word, count)
+    terms = dict(sorted(terms.items(), key=lambda item: (-item[1], item[0]))[:MAX_TERMS])
+    return {'skills': _normalised(skills), 'terms': _normalised(terms)}
+
+
+def jd_key(text):
+    """Cache key of a job description: the hash of its lower-cased words."""
+    return hashlib.sha256(' '.join(text.lower().split()).encode('utf-8')).hexdigest()
+
+
+_vectors = OrderedDict()  # jd_key -> JD vector, least recently used first
+_vectors_lock = threading.Lock()
+
+
+def jd_vector(text):
+    """build_jd_vector(text), cached by jd_key(text). Callers must not mutate the result."""
+    key = jd_key(text)
+    with _vectors_lock:
+        vector = _vectors.get(key)
+        if vector is not None:
+            _vectors.move_to_end(key)
+            return vector
+    vector = build_jd_vector(text)
+    with _vectors_lock:
+        _vectors[key] = vector
+        if len(_vectors) > JD_CACHE_SIZE:
+            _vectors.popitem(last=False)
+    return vector
+
+
+def tailored_score(text, skills, jd, content_score=None):
+    """
+    Scores resume ``text`` (with ``skills``, an iterable of its known
+    skills) against JD vector ``jd``. ``ats_score`` is
+    calculate_advanced_ats_score with the keyword criterion measured
+    against the posting; pass the resume's stored ``content_score`` to skip
+    recomputing the rest. Skills implied by ``skills`` (see
+    analysis.taxonomy) count as had.
+    """
+    skills = set(skills)
+    skills.update(implied_skills(skills))
+    words = set(WORD.findall(text.lower()))
+    skill_match = sum(weight for skill, weight in jd['skills'].items() if skill in skills)
+    term_match = sum(weight for term, weight in jd['terms'].items() if term in words)
+    if jd['skills'] and jd['terms']:
+        match = SKILL_SHARE * skill_match + (1 - SKILL_SHARE) * term_match
+    else:
+        match = skill_match if jd['skills'] else term_match
+
+    if content_score is None:
+        content_score = calculate_content_score(text)
+    return {
+        'match': round(match * 100, 1),
+        'ats_score': max(0, min(100, int(KEYWORD_POINTS * match + content_score))),
+        'skill_match': round(skill_match * 100, 1),
+        'term_match': round(term_match * 100, 1),
+        'matched_skills': _by_weight((s, w) for s, w in jd['skills'].items() if s in skills),
+        'missing_skills': _by_weight((s, w) for s, w in jd['skills'].items() if s not in skills),
+        'missing_terms': _by_weight((t, w) for t, w in jd['terms'].items() if t not in words)[:10],
+    }
@@ -0,0 +1,72 @@
+"""
+Skill taxonomy: which skills imply which.
+
+skill_taxonomy.json has three kinds of edges: ``implies`` (django implies
+python), ``parents`` (mysql is a kind of sql, so it implies sql) and
+``aliases`` (ml and machine learning are the same skill, so each implies
+the other). The transitive closure is computed once, at load time, and kept
+per skill ID as a bitset of everything the skill implies, so applying the
+taxonomy to a skill set at match time is one OR per skill in it. Taxonomy
+skills outside the vocabulary only link others.
+"""
+import os
+import json
+import functools
+
+from analysis.bitsets import bit_positions
+
+TAXONOMY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'skill_taxonomy.json')
+
+
+@functools.lru_cache(maxsize=None)
+def load_taxonomy():
+    """The taxonomy data; read once per process, callers must not mutate it."""
+    with open(TAXONOMY_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def implication_edges(taxonomy):
+    """skill -> the skills it directly implies."""
+    edges = {}
+    for skill, implied in taxonomy.get('implies', {}).items():
+        edges.setdefault(skill, set()).update(implied)
+    for skill, parent in taxonomy.get('parents', {}).items():
+        edges.setdefault(skill, set()).add(parent)
+    for alias, skill in taxonomy.get('aliases', {}).items():
+        edges.setdefault(alias, set()).add(skill)
+        edges.setdefault(skill, set()).add(alias)
+    return edges
+
+
+def transitive_closure(edges):
+    """skill -> every skill reachable from it, itself included."""
+    closure = {}
+    for start in edges:
+        reached = {start}
+        pending = [start]
+        while pending:
+            for skill in edges.get(pending.pop(), ()):
+                if skill not in reached:
+                    reached.add(skill)
+                    pending.append(skill)
+        closure[start] = reached
+    return closure
+
+
+class SkillTaxonomy:
+    """The implication closure of a taxonomy over a skill-ID dictionary."""
+
+    def __init__(self, ids, taxonomy):
+        self.implied = [1 << skill_id for skill_id in range(len(ids.names))]  # skill ID -> bitset
+        for skill, reached in transitive_closure(implication_edges(taxonomy)).items():
+            if skill in ids.ids:
+                # |=: forms of one skill share its ID
+                self.implied[ids.ids[skill]] |= ids.bits(reached)
+
+    def expand(self, bits):
+        """``bits`` plus every skill they imply."""
+        implied = self.implied
+        expanded = bits
+        for skill_id in bit_positions(bits):
+            expanded |= implied[skill_id]
+        return expanded
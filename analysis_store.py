@@ -0,0 +1,102 @@
+"""
+Stored resume analyses (resume_analyses, migration v008).
+
+A stored analysis is reused while its rules_version matches the running
+code (analysis.rules.rules_version()). Older ones are recomputed on the
+next read, or ahead of time by the backfill job (backfill.py). Storing an
+uploaded resume's analysis also (re)indexes its skill vector for reverse
+search. The resume's skills are stored as a bitset too (skill_bits,
+migration v010), next to the skill-ID dictionary of the rules version.
+"""
+import storage_codec
+from analysis import calculate_content_score, comprehensive_ats_analysis, extract_keywords, skill_vector
+from analysis.bitsets import pack, unpack
+from analysis.jobs import skill_ids
+from reverse_search import index_resume
+from analysis.rules import rules_version
+
+UPLOADED = 'uploaded'
+GENERATED = 'generated'
+
+
+def analyze_text(text):
+    """
+    The stored form of an analysis: the keywords, skill vector (see
+    skill_vector), keyword-independent ATS points (for scoring against job
+    descriptions) and comprehensive_ats_analysis of ``text``. Empty text gets
+    an empty result (``analysis`` is None) so it isn't retried on every read.
+    """
+    if not text:
+        return {'keywords': [], 'skills': {}, 'length': 0, 'content_score': 0, 'analysis': None}
+    keywords = extract_keywords(text)
+    skills, length = skill_vector(text)
+    return {'keywords': keywords, 'skills': skills, 'length': length,
+            'content_score': calculate_content_score(text),
+            'analysis': comprehensive_ats_analysis(text, keywords)}
+
+
+def load_analysis(cursor, source, resume_id):
+    """The stored analysis of a resume if it is current, else None."""
+    row = cursor.execute(
+        'SELECT rules_version, result FROM resume_analyses WHERE source = ? AND resume_id = ?',
+        (source, resume_id)
+    ).fetchone()
+    if row is None or row[0] != rules_version():
+        return None
+    return storage_codec.decode(row[1])
+
+
+def load_skill_bits(cursor, source, resume_id):
+    """The resume's skills as a bitset (see analysis.bitsets) if its stored analysis is current, else None."""
+    row = cursor.execute(
+        'SELECT rules_version, skill_bits FROM resume_analyses WHERE source = ? AND resume_id = ?',
+        (source, resume_id)
+    ).fetchone()
+    if row is None or row[0] != rules_version() or row[1] is None:
+        return None
+    return unpack(row[1])
+
+
+def store_skill_dictionary(cursor, version):
+    """Saves the skill-ID dictionary of rules ``version`` unless it is already stored."""
+    if cursor.execute('SELECT 1 FROM skill_dictionary WHERE rules_version = ? LIMIT 1', (version,)).fetchone():
+        return
+    dialect = cursor.connection.dialect
+    cursor.executemany(dialect.upsert(
+        'skill_dictionary', ['rules_version', 'skill_id', 'skill'], key=['rules_version', 'skill_id'],
+        update={'skill': dialect.excluded('skill')}
+    ), [(version, skill_id, skill) for skill_id, skill in enumerate(skill_ids().names)])
+
+
+def store_analysis(cursor, source, resume_id, result, version=None):
+    """Saves ``result`` (see analyze_text) as the resume's analysis. The caller commits."""
+    dialect = cursor.connection.dialect
+    analysis = result['analysis']
+    version = version or rules_version()
+    store_skill_dictionary(cursor, version)
+    cursor.execute(dialect.upsert(
+        'resume_analyses', ['source', 'resume_id', 'rules_version', 'ats_score', 'skill_bits', 'result'],
+        key=['source', 'resume_id'],
+        update={
+            'rules_version': dialect.excluded('rules_version'),
+            'ats_score': dialect.excluded('ats_score'),
+            'skill_bits': dialect.excluded('skill_bits'),
+            'result': dialect.excluded('result'),
+            'analyzed_at': 'CURRENT_TIMESTAMP'
+        }
+    ), (source, resume_id, version, analysis['ats_score'] if analysis else None,
+        pack(skill_ids().bits(result['keywords'])), storage_codec.encode(result)))
+    if source == UPLOADED:
+        index_resume(cursor, resume_id, result['skills'], result['length'])
+
+
+def current_analysis(cursor, source, resume_id, get_text):
+    """
+    The resume's analysis: the stored one if current, otherwise computed
+    from ``get_text()`` and stored. The caller commits.
+    """
+    result = load_analysis(cursor, source, resume_id)
+    if result is None:
+        result = analyze_text(get_text())
+        store_analysis(cursor, source, resume_id, result)
+    return result
@@ -1,2042 +1,76 @@
 import os
-import sqlite3
+import gc
 import secrets
+import tempfile
 from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, send_file
-from flask_babel import Babel, gettext, get_locale
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, session, jsonify, send_file
 import json
+import base64
 import logging
-from collections import Counter
-import pdfplumber  
-import docx
+import zipfile
+import click
+import queue
+import threading
+from collections import Counter, deque
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import re
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
 import io
+import time
+from render_pool import RenderPool, RenderPoolBusy, RenderTimeout, render_resume_pdf
+from pdf_cache import PdfCache, resume_cache_key
+from metrics_stream import MetricsBroadcaster, sse_event
+from audit_writer import AuditWriter, utc_timestamp
+from retention import CHUNK_SIZE as RETENTION_CHUNK_SIZE, enable_incremental_vacuum, run_retention
+from backfill import CHUNK_SIZE as BACKFILL_CHUNK_SIZE, DUTY_CYCLE as BACKFILL_DUTY_CYCLE, backfill_analyses
+from sessions import DatabaseSessionInterface
+import db
+import storage_codec
+import analysis_store
+import reverse_search
+import near_duplicates
+from db import get_db
+from migrations import run_migrations
+from analysis import (
+    PDF_TEMPLATE_VERSION, extract_text_from_resume, fetch_jobs, generate_ats_pdf, get_recommendation_label,
+    is_valid_resume_content, jd_key, jd_vector, job_matrix, load_jobs_data, resume_sidecar, skill_forms, skill_ids,
+    skill_taxonomy, tailored_score
+)
+from analysis.catalogue import PAGE_SIZE as JOB_PAGE_SIZE
+from analysis.jobs import job_skill_bits, role_skill_bits
+from analysis.minhash import signature as minhash_signature
 
 # Set up basic logging
 logging.basicConfig(level=logging.INFO)
 
-# --- Comprehensive ATS Skills Database ---
-BASE_SKILLS = {
-    "Python Developer": ["python", "django", "flask", "fastapi", "pandas", "numpy", "scikit-learn"],
-    "Java Developer": ["java", "spring", "spring boot", "hibernate", "maven", "gradle", "microservices"],
-    "Frontend Developer": ["react", "javascript", "typescript", "html", "css", "angular", "vue", "ui", "ux", "responsive design"],
-    "Backend Developer": ["node", "php", "express", "laravel", "api", "rest", "graphql", "microservices"],
-    "Full Stack Developer": ["fullstack", "mern", "mean", "lamp", "jamstack", "nextjs", "nuxt"],
-    "Data Analyst": ["sql", "excel", "tableau", "powerbi", "data", "analytics", "statistics", "r", "python", "reporting"],
-    "Data Scientist": ["python", "r", "machine learning", "deep learning", "tensorflow", "pytorch", "data science", "nlp"],
-    "Project Manager": ["management", "agile", "scrum", "jira", "communication", "leadership", "budget", "stakeholder"],
-    "HR Specialist": ["hr", "recruitment", "onboarding", "hris", "compliance", "employee relations", "talent acquisition", "retention"],
-    "Cloud Engineer": ["aws", "azure", "gcp", "cloud", "terraform", "kubernetes", "docker", "ci/cd"],
-    "DevOps Engineer": ["devops", "docker", "kubernetes", "jenkins", "gitlab", "linux", "ansible", "terraform"],
-    "Cybersecurity Analyst": ["cybersecurity", "security", "penetration testing", "vulnerability assessment", "siem", "compliance"],
-    "Software Engineer": ["c", "c++", ".net", "c#", "algorithms", "data structures", "software development", "testing"],
-    "Content Writer": ["content", "writer", "copywriting", "seo", "marketing", "social media", "blogging"],
-    "Marketing Specialist": ["marketing", "digital marketing", "seo", "sem", "social media", "analytics", "campaigns", "strategy"],
-    "Sales Representative": ["sales", "crm", "lead generation", "negotiation", "customer relationship", "revenue"],
-    "Business Analyst": ["business analysis", "requirements", "documentation", "stakeholder", "process improvement", "data analysis"],
-    "UX/UI Designer": ["ux", "ui", "design", "figma", "sketch", "adobe", "user research", "wireframing", "prototyping"],
-    "Product Manager": ["product management", "roadmap", "strategy", "user stories", "agile", "stakeholder management"],
-    "Quality Assurance": ["qa", "testing", "manual testing", "automation", "selenium", "test cases", "bug tracking"],
-    "Medical Professional": ["nurse", "doctor", "pharma", "radiology", "medical", "healthcare", "patient care"],
-    "Financial Analyst": ["finance", "financial analysis", "excel", "vba", "budgeting", "forecasting", "financial modeling"],
-    "Operations Manager": ["operations", "process improvement", "supply chain", "logistics", "quality control", "lean"],
-    "Customer Success": ["customer success", "customer support", "retention", "satisfaction", "onboarding", "account management"],
-    "Financial Analyst": ["finance", "financial analysis", "excel", "vba", "budgeting", "forecasting", "financial modeling", "reporting"],
-    "Business Operations": ["operations", "strategy", "process improvement", "analytics", "reporting", "finance"],
-    "Customer Experience": ["satisfaction", "retention", "customer support", "analytics", "communication"]
-}
-
-# --- Industry-Specific Keywords for ATS Analysis ---
-INDUSTRY_KEYWORDS = {
-    "Technology": ["software", "development", "programming", "coding", "api", "database", "cloud", "ai", "ml", "data"],
-    "Healthcare": ["patient", "medical", "healthcare", "clinical", "diagnosis", "treatment", "pharmaceutical", "nursing"],
-    "Finance": ["financial", "banking", "investment", "risk", "compliance", "audit", "accounting", "trading"],
-    "Marketing": ["marketing", "campaign", "brand", "digital", "social media", "seo", "content", "analytics"],
-    "Sales": ["sales", "revenue", "client", "customer", "lead", "prospect", "crm", "negotiation"],
-    "HR": ["hr", "human resources", "recruitment", "talent", "employee", "onboarding", "training", "compliance"],
-    "Operations": ["operations", "process", "efficiency", "quality", "supply chain", "logistics", "management"],
-    "Education": ["education", "teaching", "training", "curriculum", "student", "learning", "instruction", "academic"]
-}
-
-# --- Action Verbs for Quantifiable Achievements ---
-ACTION_VERBS = {
-    "achievement": ["achieved", "accomplished", "delivered", "completed", "exceeded", "surpassed"],
-    "improvement": ["improved", "increased", "enhanced", "optimized", "streamlined", "reduced", "accelerated"],
-    "leadership": ["led", "managed", "supervised", "directed", "coordinated", "mentored", "guided"],
-    "development": ["developed", "created", "built", "designed", "implemented", "launched", "established"],
-    "analysis": ["analyzed", "evaluated", "assessed", "researched", "investigated", "identified", "measured"]
-}
-
-# --- Utility Functions ---
-
-def extract_text_from_resume(filepath):
-    """Extract text from resume files using pdfplumber for PDFs and python-docx for DOCX"""
-    text = ""
-    try:
-        if filepath.lower().endswith(".pdf"):
-            with pdfplumber.open(filepath) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        elif filepath.lower().endswith((".docx", ".doc")):
-            doc = docx.Document(filepath)
-            text = "\n".join([para.text for para in doc.paragraphs])
-        else:
-            logging.error(f"Unsupported file format: {filepath}")
-    except Exception as e:
-        logging.error(f"Error extracting text from {filepath}: {e}")
-    
-    return text
-
-def load_jobs_data():
-    """Loads job data from jobs.json and a placeholder for an API call."""
-    try:
-        with open("jobs.json", "r", encoding="utf-8") as f:
-            local_jobs = json.load(f)
-    except FileNotFoundError:
-        logging.warning("jobs.json not found. Returning placeholder jobs.")
-        local_jobs = []
-    
-    api_jobs = [
-        {"title": "DevOps Engineer", "company_name": "CloudNine", "url": "https://example.com/job/devops", "skills": ["aws", "docker", "kubernetes", "linux"]},
-        {"title": "AI/ML Engineer", "company_name": "Innovate AI", "url": "https://example.com/job/ai", "skills": ["python", "ml", "ai", "data"]}
-    ]
-    return local_jobs + api_jobs
-
-def get_all_known_skills(jobs):
-    """Extracts all unique skills from the provided job list AND the base skills dictionary."""
-    all_skills = set()
-    for job in jobs:
-        all_skills.update([s.lower() for s in job.get("skills", [])])
-    
-    for skill_list in BASE_SKILLS.values():
-        all_skills.update(skill_list)
-
-    return all_skills
-
-def extract_keywords(text):
-    """Extracts keywords from text based on a known list of skills."""
-    all_known_skills = get_all_known_skills(load_jobs_data())
-    words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-    keywords = [w for w in words if w in all_known_skills]
-    return list(set(keywords))
-
-def suggest_job_role(keywords):
-    """Suggests a job role based on extracted keywords."""
-    role_mappings = {
-        "Python Developer": ["python", "django", "flask"],
-        "Java Developer": ["java", "spring"],
-        "Frontend Developer": ["react", "javascript", "html", "css", "angular", "ui", "ux", "frontend"],
-        "Backend Developer": ["node", "php", "backend"],
-        "Full Stack Developer": ["fullstack"],
-        "Data Analyst": ["sql", "excel", "tableau", "powerbi", "data"],
-        "Data Scientist": ["data", "ml", "ai", "python"],
-        "Project Manager": ["management", "agile", "jira", "manager"],
-        "HR Specialist": ["hr", "recruitment"],
-        "Cloud Engineer": ["aws", "azure", "cloud"],
-        "DevOps Engineer": ["devops", "docker", "kubernetes", "linux"],
-        "Cybersecurity Analyst": ["cybersecurity", "security"],
-        "Software Engineer": ["c", "c++", ".net"],
-        "Content Writer": ["content", "writer"],
-        "Medical Professional": ["nurse", "doctor", "pharma", "radiology", "medical"]
-    }
-    
-    predicted_roles = set()
-    for role, skills in role_mappings.items():
-        if any(skill in keywords for skill in skills):
-            predicted_roles.add(role)
-
-    if not predicted_roles:
-        return ["General Job Seeker"]
-
-    return list(predicted_roles)
-
-def fetch_jobs(predicted_roles, keywords):
-    """Fetch jobs from a local JSON file based on predicted roles and keywords."""
-    jobs_data = load_jobs_data()
-    recommended_jobs = []
-    seen_urls = set()
-
-    for job in jobs_data:
-        title = job.get("title", "").lower()
-        title_match = any(role.lower() in title for role in predicted_roles)
-        
-        job_skills = {s.lower() for s in job.get("skills", [])}
-        skill_overlap = len(job_skills.intersection(set(keywords)))
-        
-        if (title_match or skill_overlap > 0) and job.get("url") not in seen_urls:
-            job["match_score"] = skill_overlap
-            # Generate search URLs for actual job sites using only job titles (no company names)
-            job_title = job.get("title", "")
-            location = job.get("location", "India")
-            # Create Google Jobs search URL with job title only
-            search_query = f"{job_title} jobs in {location}".replace(" ", "+")
-            job["url"] = f"https://www.google.com/search?ibp=htl;jobs&q={search_query}"
-            # Set a generic company name for display
-            job["company_name"] = "Multiple Companies"
-            recommended_jobs.append(job)
-            seen_urls.add(job.get("url"))
-
-    recommended_jobs.sort(key=lambda x: x.get("match_score", 0), reverse=True)
-    return recommended_jobs[:5]
-
-def get_recommendation_label(score):
-    if score > 85:
-        return "Great 🌟"
-    elif score > 70:
-        return "Good ✅"
-    elif score > 50:
-        return "Can be Better 🔧"
-    elif score > 30:
-        return "Bad ⚠️"
-    else:
-        return "Flop ❌"
-
-def comprehensive_ats_analysis(text, keywords):
-    """Comprehensive ATS analysis with detailed feedback and suggestions."""
-    analysis = {
-        'ats_score': 0,
-        'job_matches': [],
-        'keyword_analysis': {},
-        'skill_gaps': {},
-        'improvements': [],
-        'quantified_suggestions': [],
-        'summary_suggestions': '',
-        'skills_suggestions': '',
-        'ats_explanation': ''
-    }
-    
-    # 1. Advanced ATS Score Calculation (0-100)
-    ats_score = calculate_advanced_ats_score(text, keywords)
-    analysis['ats_score'] = ats_score
-    
-    # 2. Job Role Prediction with Match Percentages
-    predicted_roles = predict_job_roles_with_scores(keywords, text)
-    analysis['job_matches'] = predicted_roles
-    
-    # 3. Keyword & Skill Match Analysis
-    keyword_analysis = analyze_keyword_matches(keywords, predicted_roles)
-    analysis['keyword_analysis'] = keyword_analysis
-    
-    # 4. Skill Gap Analysis by Role
-    skill_gaps = analyze_skill_gaps(keywords, predicted_roles)
-    analysis['skill_gaps'] = skill_gaps
-    
-    # 5. Quantifiable Bullet Point Improvements
-    quantified_suggestions = generate_quantified_suggestions(text, keywords, predicted_roles)
-    analysis['quantified_suggestions'] = quantified_suggestions
-    
-    # 6. Detailed Improvement Suggestions (Enhanced)
-    detailed_improvements = analyze_for_improvements(ats_score, text, keywords, predicted_roles)
-    analysis['improvements'] = detailed_improvements
-    
-    # 7. ATS-Optimized Summary and Skills
-    summary_suggestions = generate_ats_summary(text, keywords, predicted_roles)
-    skills_suggestions = generate_ats_skills_section(keywords, predicted_roles)
-    analysis['summary_suggestions'] = summary_suggestions
-    analysis['skills_suggestions'] = skills_suggestions
-    
-    # 8. ATS Explanation
-    analysis['ats_explanation'] = generate_ats_explanation(ats_score)
-    
-    # 9. AI Feedback Generator
-    ai_feedback = generate_ai_feedback(ats_score, predicted_roles, keywords, text)
-    analysis.update(ai_feedback)
-    
-    return analysis
-
-def calculate_advanced_ats_score(text, keywords):
-    """Advanced ATS score calculation with detailed criteria."""
-    score = 0
-    text_lower = text.lower()
-    word_count = len(re.findall(r'\w+', text))
-    
-    # 1. Keyword Density & Relevance (Max 30 points)
-    keyword_score = min(30, len(keywords) * 3)
-    score += keyword_score
-    
-    # 2. Quantified Achievements (Max 25 points)
-    quantified_patterns = [
-        r'\d+\s*(%|percent|million|thousand|k|lakhs|x|\$|\£|\€)',
-        r'\d+\s*(years?|months?|days?)\s+of',
-        r'increased|decreased|improved|reduced|saved|generated|achieved',
-        r'\d+\s*(times?|fold|people|users|customers|clients)'
-    ]
-    quantified_count = sum(len(re.findall(pattern, text_lower)) for pattern in quantified_patterns)
-    quantified_score = min(25, quantified_count * 2)
-    score += quantified_score
-    
-    # 3. Action Verbs Usage (Max 15 points)
-    action_verb_count = sum(len(re.findall(f'\\b{verb}\\b', text_lower)) 
-                           for verb_list in ACTION_VERBS.values() 
-                           for verb in verb_list)
-    action_score = min(15, action_verb_count * 1.5)
-    score += action_score
-    
-    # 4. Resume Structure & Length (Max 15 points)
-    structure_score = 0
-    if 400 <= word_count <= 1000:
-        structure_score = 15
-    elif 300 <= word_count < 400 or 1000 < word_count <= 1500:
-        structure_score = 10
-    elif 200 <= word_count < 300 or 1500 < word_count <= 2000:
-        structure_score = 5
-    score += structure_score
-    
-    # 5. Contact Information & Professional Elements (Max 10 points)
-    contact_score = 0
-    if re.search(r'[\w\.-]+@[\w\.-]+', text_lower):
-        contact_score += 3
-    if re.search(r'\+?[\d\s\-\(\)]{10,}', text_lower):
-        contact_score += 2
-    if any(section in text_lower for section in ['experience', 'education', 'skills', 'summary']):
-        contact_score += 5
-    score += contact_score
-    
-    # 6. Industry-Specific Keywords (Max 5 points)
-    industry_keyword_count = sum(len(re.findall(f'\\b{kw}\\b', text_lower)) 
-                                for kw_list in INDUSTRY_KEYWORDS.values() 
-                                for kw in kw_list)
-    industry_score = min(5, industry_keyword_count * 0.5)
-    score += industry_score
-    
-    return max(0, min(100, int(score)))
-
-def predict_job_roles_with_scores(keywords, text):
-    """Predict job roles with match percentages based on skills and content."""
-    text_lower = text.lower()
-    role_matches = []
-    
-    # Weight factors for different aspects
-    SKILL_WEIGHT = 0.6
-    INDUSTRY_WEIGHT = 0.2
-    EXPERIENCE_WEIGHT = 0.15
-    CONTEXT_WEIGHT = 0.05
-    
-    for role, skills in BASE_SKILLS.items():
-        # Calculate skill overlap with weighted scoring
-        exact_matches = sum(1 for skill in skills if skill in keywords)
-        partial_matches = sum(1 for skill in skills if skill.lower() in text_lower and skill not in keywords)
-        
-        # Weight exact matches more heavily than partial matches
-        skill_score = (exact_matches * 2 + partial_matches) / (len(skills) * 2) * 100
-        skill_match_percentage = skill_score * SKILL_WEIGHT
-        
-        # Boost score for industry-specific keywords
-        industry_boost = 0
-        for industry, industry_kw in INDUSTRY_KEYWORDS.items():
-            industry_matches = sum(1 for kw in industry_kw if kw in text_lower)
-            industry_boost += industry_matches * 3  # Increased boost
-        
-        industry_score = min(20, industry_boost) * INDUSTRY_WEIGHT
-        
-        # Experience level detection
-        experience_score = 0
-        experience_indicators = {
-            'entry': ['intern', 'internship', 'junior', 'fresher', 'recent graduate'],
-            'mid': ['senior', 'lead', 'manager', 'specialist', 'professional'],
-            'senior': ['director', 'head', 'principal', 'chief', 'executive']
-        }
-        
-        # Detect experience level from text
-        for level, indicators in experience_indicators.items():
-            if any(indicator in text_lower for indicator in indicators):
-                if level == 'entry':
-                    experience_score = 5
-                elif level == 'mid':
-                    experience_score = 10
-                elif level == 'senior':
-                    experience_score = 15
-                break
-        
-        experience_score *= EXPERIENCE_WEIGHT
-        
-        # Context-based scoring (education, projects, etc.)
-        context_score = 0
-        if role == 'Data Analyst':
-            context_indicators = ['data', 'analysis', 'statistics', 'report', 'dashboard', 'visualization', 'reporting']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'Software Engineer':
-            context_indicators = ['software', 'development', 'programming', 'code', 'application', 'system']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'Project Manager':
-            context_indicators = ['project', 'management', 'planning', 'coordination', 'team', 'delivery']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'HR Specialist':
-            context_indicators = ['human resources', 'recruitment', 'employee', 'benefits', 'training', 'retention']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'Marketing Specialist':
-            context_indicators = ['marketing', 'campaign', 'brand', 'advertising', 'promotion', 'seo', 'strategy']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'Sales Representative':
-            context_indicators = ['sales', 'client', 'customer', 'revenue', 'quota', 'prospect']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'Business Analyst':
-            context_indicators = ['business', 'requirement', 'process', 'analysis', 'stakeholder', 'solution']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'Financial Analyst':
-            context_indicators = ['finance', 'financial', 'analysis', 'reporting', 'excel', 'budgeting', 'forecasting']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'Operations Manager':
-            context_indicators = ['operations', 'process', 'improvement', 'supply chain', 'logistics', 'quality']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'Customer Success':
-            context_indicators = ['customer', 'success', 'retention', 'satisfaction', 'support', 'account']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'Business Operations':
-            context_indicators = ['business', 'operations', 'strategy', 'process', 'analytics', 'reporting']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        elif role == 'Customer Experience':
-            context_indicators = ['customer', 'experience', 'satisfaction', 'retention', 'support', 'communication']
-            context_matches = sum(1 for indicator in context_indicators if indicator in text_lower)
-            context_score = min(10, context_matches * 2)
-        
-        context_score *= CONTEXT_WEIGHT
-        
-        # Calculate final match percentage with better distribution
-        final_score = skill_match_percentage + industry_score + experience_score + context_score
-        final_score = min(100, final_score)
-        
-        # Only include roles with reasonable match (lowered threshold for better inclusivity)
-        if final_score > 15:
-            matched_skills = [skill for skill in skills if skill in keywords or skill.lower() in text_lower]
-            missing_skills = [skill for skill in skills if skill not in keywords and skill.lower() not in text_lower]
-            
-            role_matches.append({
-                'role': role,
-                'match_percentage': round(final_score, 1),
-                'matched_skills': matched_skills,
-                'missing_skills': missing_skills,
-                'skill_score': round(skill_match_percentage, 1),
-                'industry_score': round(industry_score, 1),
-                'experience_score': round(experience_score, 1),
-                'context_score': round(context_score, 1)
-            })
-    
-    # Sort by match percentage and return top matches
-    role_matches.sort(key=lambda x: x['match_percentage'], reverse=True)
-    return role_matches[:5]
-
-def analyze_keyword_matches(keywords, predicted_roles):
-    """Analyze keyword matches and missing keywords by role."""
-    analysis = {}
-    
-    for role_data in predicted_roles:
-        role = role_data['role']
-        matched = role_data['matched_skills']
-        missing = role_data['missing_skills'][:5]  # Top 5 missing skills
-        
-        analysis[role] = {
-            'found_keywords': matched,
-            'missing_keywords': missing,
-            'keyword_density': len(matched),
-            'improvement_needed': missing[:3] if missing else []
-        }
-    
-    return analysis
-
-def analyze_skill_gaps(keywords, predicted_roles):
-    """Comprehensive skill gap analysis with detailed recommendations for 100% job match."""
-    gaps = {}
-    
-    for role_data in predicted_roles:
-        role = role_data['role']
-        missing_skills = role_data['missing_skills']
-        matched_skills = role_data['matched_skills']
-        match_percentage = role_data['match_percentage']
-        
-        # Get comprehensive skill recommendations for the role
-        skill_recommendations = get_comprehensive_skill_recommendations(role, matched_skills, missing_skills)
-        
-        # Include gap severity information
-        gap_analysis = skill_recommendations['gap_analysis']
-        gap_severity = gap_analysis.get('gap_severity', {})
-        
-        gaps[role] = {
-            'match_percentage': match_percentage,
-            'current_skills': matched_skills,
-            'critical_gaps': missing_skills[:5],
-            'gap_severity': gap_severity,
-            'recommended_skills': skill_recommendations['recommended_skills'],
-            'learning_path': skill_recommendations['learning_path'],
-            'certifications': skill_recommendations['certifications'],
-            'projects': skill_recommendations['projects'],
-            'tools_platforms': skill_recommendations['tools_platforms'],
-            'soft_skills': skill_recommendations['soft_skills'],
-            'recommended_courses': skill_recommendations.get('recommended_courses', []),
-            'priority_level': 'High' if match_percentage > 70 else 'Medium' if match_percentage > 50 else 'Low',
-            'gap_analysis': gap_analysis,
-            'action_plan': skill_recommendations['action_plan']
-        }
-    
-    return gaps
-
-def get_comprehensive_skill_recommendations(role, matched_skills, missing_skills):
-    """Get comprehensive skill recommendations to achieve 100% job match."""
-    
-    # Course provider URLs for popular platforms
-    COURSE_PROVIDERS = {
-        'Udemy': 'https://www.udemy.com',
-        'Coursera': 'https://www.coursera.org',
-        'edX': 'https://www.edx.org',
-        'LinkedIn Learning': 'https://www.linkedin.com/learning',
-        'Pluralsight': 'https://www.pluralsight.com',
-        'Skillshare': 'https://www.skillshare.com'
-    }
-    
-    # Skill to course provider mapping
-    SKILL_COURSE_MAPPING = {
-        # Programming Languages
-        'Python': {'provider': 'Udemy', 'search_query': 'python programming'},
-        'Java': {'provider': 'Udemy', 'search_query': 'java programming'},
-        'JavaScript': {'provider': 'Udemy', 'search_query': 'javascript course'},
-        'C++': {'provider': 'Udemy', 'search_query': 'c++ programming'},
-        'C#': {'provider': 'Udemy', 'search_query': 'c sharp programming'},
-        'R': {'provider': 'Udemy', 'search_query': 'r programming'},
-        'SQL': {'provider': 'Udemy', 'search_query': 'sql course'},
-        'Go': {'provider': 'Udemy', 'search_query': 'go programming'},
-        'Rust': {'provider': 'Udemy', 'search_query': 'rust programming'},
-        
-        # Web Development Frameworks
-        'React': {'provider': 'Udemy', 'search_query': 'react js'},
-        'Angular': {'provider': 'Udemy', 'search_query': 'angular'},
-        'Vue.js': {'provider': 'Udemy', 'search_query': 'vue js'},
-        'Django': {'provider': 'Udemy', 'search_query': 'django python'},
-        'Flask': {'provider': 'Udemy', 'search_query': 'flask python'},
-        'Spring Boot': {'provider': 'Udemy', 'search_query': 'spring boot'},
-        'Node.js': {'provider': 'Udemy', 'search_query': 'node js'},
-        
-        # Data Analysis & Visualization Tools
-        'Excel': {'provider': 'Udemy', 'search_query': 'excel advanced'},
-        'Tableau': {'provider': 'Udemy', 'search_query': 'tableau'},
-        'Power BI': {'provider': 'Udemy', 'search_query': 'power bi'},
-        'Google Analytics': {'provider': 'Udemy', 'search_query': 'google analytics'},
-        'Jupyter Notebook': {'provider': 'Coursera', 'search_query': 'jupyter notebook'},
-        'Pandas': {'provider': 'Udemy', 'search_query': 'pandas python'},
-        'NumPy': {'provider': 'Udemy', 'search_query': 'numpy python'},
-        
-        # Databases
-        'MySQL': {'provider': 'Udemy', 'search_query': 'mysql database'},
-        'PostgreSQL': {'provider': 'Udemy', 'search_query': 'postgresql'},
-        'MongoDB': {'provider': 'Udemy', 'search_query': 'mongodb'},
-        'SQL Server': {'provider': 'Udemy', 'search_query': 'sql server'},
-        'Oracle': {'provider': 'Udemy', 'search_query': 'oracle database'},
-        'Redis': {'provider': 'Udemy', 'search_query': 'redis'},
-        'Elasticsearch': {'provider': 'Udemy', 'search_query': 'elasticsearch'},
-        
-        # Cloud Platforms
-        'AWS': {'provider': 'Udemy', 'search_query': 'aws certified'},
-        'Azure': {'provider': 'Udemy', 'search_query': 'microsoft azure'},
-        'Google Cloud': {'provider': 'Coursera', 'search_query': 'google cloud platform'},
-        
-        # DevOps Tools
-        'Git': {'provider': 'Udemy', 'search_query': 'git github'},
-        'Docker': {'provider': 'Udemy', 'search_query': 'docker'},
-        'Kubernetes': {'provider': 'Udemy', 'search_query': 'kubernetes'},
-        'Jenkins': {'provider': 'Udemy', 'search_query': 'jenkins'},
-        
-        # Project Management Tools
-        'JIRA': {'provider': 'Udemy', 'search_query': 'jira'},
-        'Asana': {'provider': 'Udemy', 'search_query': 'asana project management'},
-        'Trello': {'provider': 'Udemy', 'search_query': 'trello'},
-        'Microsoft Project': {'provider': 'Udemy', 'search_query': 'microsoft project'},
-        
-        # Marketing Tools
-        'SEO': {'provider': 'Udemy', 'search_query': 'seo'},
-        'Google Ads': {'provider': 'Udemy', 'search_query': 'google ads'},
-        'Facebook Ads': {'provider': 'Udemy', 'search_query': 'facebook ads'},
-        'HubSpot': {'provider': 'Udemy', 'search_query': 'hubspot'},
-        'Mailchimp': {'provider': 'Udemy', 'search_query': 'mailchimp'},
-        
-        # Design Tools
-        'Canva': {'provider': 'Skillshare', 'search_query': 'canva'},
-        'Figma': {'provider': 'Udemy', 'search_query': 'figma'},
-        'Adobe Creative Suite': {'provider': 'LinkedIn Learning', 'search_query': 'adobe creative suite'},
-        
-        # Soft Skills
-        'Communication': {'provider': 'Udemy', 'search_query': 'communication skills'},
-        'Leadership': {'provider': 'Udemy', 'search_query': 'leadership'},
-        'Problem Solving': {'provider': 'Udemy', 'search_query': 'problem solving'},
-        'Team Collaboration': {'provider': 'Udemy', 'search_query': 'team collaboration'},
-        'Time Management': {'provider': 'Udemy', 'search_query': 'time management'},
-        'Critical Thinking': {'provider': 'Udemy', 'search_query': 'critical thinking'},
-        'Negotiation': {'provider': 'Udemy', 'search_query': 'negotiation skills'},
-        
-        # General fallback
-        'default': {'provider': 'Udemy', 'search_query': ''}
-    }
-    
-    # Comprehensive skill databases for each role
-    role_skill_database = {
-        'Data Analyst': {
-            'technical_skills': {
-                'programming': ['Python', 'R', 'SQL', 'JavaScript', 'VBA'],
-                'tools': ['Excel', 'Tableau', 'Power BI', 'Google Analytics', 'Jupyter Notebook', 'Pandas', 'NumPy'],
-                'databases': ['MySQL', 'PostgreSQL', 'MongoDB', 'SQL Server', 'Oracle'],
-                'statistics': ['Statistical Analysis', 'A/B Testing', 'Regression Analysis', 'Data Visualization']
-            },
-            'soft_skills': ['Analytical Thinking', 'Problem Solving', 'Communication', 'Attention to Detail', 'Critical Thinking'],
-            'certifications': ['Google Data Analytics Certificate', 'Microsoft Power BI Certification', 'Tableau Desktop Specialist', 'AWS Certified Data Analytics'],
-            'projects': ['Sales Dashboard', 'Customer Segmentation Analysis', 'Predictive Analytics Model', 'Business Intelligence Report'],
-            'learning_path': [
-                'Week 1-2: Master Excel advanced functions and pivot tables',
-                'Week 3-4: Learn SQL fundamentals and practice queries',
-                'Week 5-8: Complete Python for Data Analysis course',
-                'Week 9-12: Build 2-3 data visualization projects using Tableau/Power BI'
-            ]
-        },
-        'Software Engineer': {
-            'technical_skills': {
-                'programming': ['Python', 'Java', 'JavaScript', 'C++', 'C#', 'Go', 'Rust'],
-                'frameworks': ['React', 'Angular', 'Vue.js', 'Django', 'Flask', 'Spring Boot', 'Node.js'],
-                'tools': ['Git', 'Docker', 'Kubernetes', 'Jenkins', 'AWS', 'Azure', 'Linux'],
-                'databases': ['MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Elasticsearch']
-            },
-            'soft_skills': ['Problem Solving', 'Team Collaboration', 'Code Review', 'Technical Writing', 'Agile Development'],
-            'certifications': ['AWS Certified Developer', 'Google Cloud Professional Developer', 'Microsoft Azure Developer', 'Oracle Java Certification'],
-            'projects': ['Full-Stack Web Application', 'REST API Development', 'Microservices Architecture', 'Mobile App Development'],
-            'learning_path': [
-                'Week 1-4: Master one programming language (Python/Java)',
-                'Week 5-8: Learn web development frameworks (React/Django)',
-                'Week 9-12: Build 2-3 full-stack projects with database integration',
-                'Week 13-16: Learn cloud platforms and DevOps tools'
-            ]
-        },
-        'Project Manager': {
-            'technical_skills': {
-                'methodologies': ['Agile', 'Scrum', 'Kanban', 'Waterfall', 'Lean', 'Six Sigma'],
-                'tools': ['JIRA', 'Asana', 'Trello', 'Microsoft Project', 'Confluence', 'Slack'],
-                'analytics': ['Project Analytics', 'Risk Management', 'Budget Planning', 'Resource Allocation']
-            },
-            'soft_skills': ['Leadership', 'Communication', 'Negotiation', 'Time Management', 'Stakeholder Management', 'Conflict Resolution'],
-            'certifications': ['PMP (Project Management Professional)', 'Certified ScrumMaster (CSM)', 'PRINCE2', 'Agile Certified Practitioner'],
-            'projects': ['Software Development Project', 'Marketing Campaign Management', 'Process Improvement Initiative', 'Team Restructuring Project'],
-            'learning_path': [
-                'Week 1-2: Master project management fundamentals and methodologies',
-                'Week 3-4: Learn Agile/Scrum frameworks and tools',
-                'Week 5-8: Practice with project management software (JIRA, Asana)',
-                'Week 9-12: Lead a small project and document lessons learned'
-            ]
-        },
-        'HR Specialist': {
-            'technical_skills': {
-                'systems': ['Workday', 'BambooHR', 'ADP', 'SuccessFactors', 'Taleo', 'HRIS'],
-                'analytics': ['HR Analytics', 'Recruitment Metrics', 'Employee Engagement Analysis', 'Performance Management'],
-                'compliance': ['Labor Law', 'Employment Regulations', 'Diversity & Inclusion', 'Workplace Safety']
-            },
-            'soft_skills': ['Interpersonal Skills', 'Empathy', 'Confidentiality', 'Cultural Awareness', 'Conflict Resolution', 'Coaching'],
-            'certifications': ['SHRM-CP', 'PHR (Professional in Human Resources)', 'CIPD', 'HR Analytics Certificate'],
-            'projects': ['Employee Onboarding Program', 'Performance Review System', 'Diversity Initiative', 'Training Program Development'],
-            'learning_path': [
-                'Week 1-2: Master HR fundamentals and employment law',
-                'Week 3-4: Learn HRIS systems and recruitment tools',
-                'Week 5-8: Develop skills in employee relations and performance management',
-                'Week 9-12: Create HR policies and procedures documentation'
-            ]
-        },
-        'Marketing Specialist': {
-            'technical_skills': {
-                'digital_marketing': ['SEO', 'SEM', 'Google Ads', 'Facebook Ads', 'Email Marketing', 'Content Marketing'],
-                'analytics': ['Google Analytics', 'Facebook Analytics', 'HubSpot', 'Mailchimp', 'Hootsuite'],
-                'design': ['Canva', 'Adobe Creative Suite', 'Figma', 'Video Editing', 'Graphic Design']
-            },
-            'soft_skills': ['Creativity', 'Communication', 'Strategic Thinking', 'Brand Management', 'Customer Focus', 'Data Interpretation'],
-            'certifications': ['Google Ads Certification', 'Facebook Blueprint', 'HubSpot Content Marketing', 'Google Analytics Certification'],
-            'projects': ['Digital Marketing Campaign', 'Brand Awareness Strategy', 'Lead Generation Campaign', 'Social Media Strategy'],
-            'learning_path': [
-                'Week 1-2: Master digital marketing fundamentals and platforms',
-                'Week 3-4: Learn SEO/SEM and paid advertising strategies',
-                'Week 5-8: Develop content creation and social media skills',
-                'Week 9-12: Execute a complete marketing campaign and measure results'
-            ]
-        },
-        'Sales Representative': {
-            'technical_skills': {
-                'crm': ['Salesforce', 'HubSpot', 'Pipedrive', 'Zoho CRM', 'Microsoft Dynamics'],
-                'tools': ['LinkedIn Sales Navigator', 'ZoomInfo', 'Calendly', 'DocuSign', 'Sales Analytics'],
-                'platforms': ['B2B Sales', 'B2C Sales', 'E-commerce', 'Lead Generation', 'Sales Automation']
-            },
-            'soft_skills': ['Persuasion', 'Active Listening', 'Relationship Building', 'Negotiation', 'Resilience', 'Goal Orientation'],
-            'certifications': ['Salesforce Certified Sales Cloud Consultant', 'HubSpot Sales Software', 'Challenger Sale Methodology', 'SPIN Selling'],
-            'projects': ['Sales Territory Development', 'Customer Acquisition Campaign', 'Sales Process Optimization', 'Client Retention Program'],
-            'learning_path': [
-                'Week 1-2: Master sales fundamentals and CRM systems',
-                'Week 3-4: Learn prospecting and lead generation techniques',
-                'Week 5-8: Develop negotiation and closing skills',
-                'Week 9-12: Build a sales pipeline and track performance metrics'
-            ]
-        },
-        'Business Analyst': {
-            'technical_skills': {
-                'analysis': ['Requirements Gathering', 'Process Mapping', 'Data Analysis', 'Business Process Modeling'],
-                'tools': ['Visio', 'Lucidchart', 'JIRA', 'Confluence', 'Power BI', 'Tableau'],
-                'methodologies': ['Agile', 'Waterfall', 'Six Sigma', 'Lean', 'BPMN']
-            },
-            'soft_skills': ['Critical Thinking', 'Communication', 'Stakeholder Management', 'Problem Solving', 'Documentation', 'Presentation Skills'],
-            'certifications': ['CBAP (Certified Business Analysis Professional)', 'PMI-PBA', 'Agile Analysis Certification', 'Six Sigma Green Belt'],
-            'projects': ['Business Process Improvement', 'Requirements Documentation', 'System Implementation', 'Data Analysis Project'],
-            'learning_path': [
-                'Week 1-2: Master business analysis fundamentals and methodologies',
-                'Week 3-4: Learn requirements gathering and documentation techniques',
-                'Week 5-8: Develop skills in process mapping and data analysis',
-                'Week 9-12: Complete a business analysis project from start to finish'
-            ]
-        }
-    }
-    
-    # Get role-specific recommendations
-    role_data = role_skill_database.get(role, {
-        'technical_skills': {'general': ['Problem Solving', 'Analytical Thinking', 'Communication']},
-        'soft_skills': ['Communication', 'Teamwork', 'Adaptability'],
-        'certifications': ['Industry-specific certifications'],
-        'projects': ['Relevant project experience'],
-        'learning_path': ['Focus on role-specific skills and experience']
-    })
-    
-    # Analyze gaps and create recommendations
-    gap_analysis = analyze_specific_gaps(role, matched_skills, missing_skills, role_data)
-    action_plan = create_action_plan(role, gap_analysis, role_data)
-    
-    # Generate course links for recommended skills
-    recommended_courses = generate_course_links(missing_skills, SKILL_COURSE_MAPPING, COURSE_PROVIDERS)
-    
-    return {
-        'recommended_skills': get_priority_skills(role_data, missing_skills),
-        'learning_path': role_data.get('learning_path', ['Focus on role-specific skills']),
-        'certifications': role_data.get('certifications', ['Industry certifications']),
-        'projects': role_data.get('projects', ['Relevant projects']),
-        'tools_platforms': get_tools_platforms(role_data),
-        'soft_skills': role_data.get('soft_skills', ['Communication', 'Teamwork']),
-        'gap_analysis': gap_analysis,
-        'action_plan': action_plan,
-        'recommended_courses': recommended_courses
-    }
-
-def analyze_specific_gaps(role, matched_skills, missing_skills, role_data):
-    """Analyze specific skill gaps with detailed explanations."""
-    analysis = {
-        'critical_gaps': [],
-        'moderate_gaps': [],
-        'nice_to_have': [],
-        'strengths': matched_skills,
-        'recommendations': [],
-        'gap_severity': {}
-    }
-    
-    # Categorize missing skills by importance and frequency
-    all_required_skills = []
-    skill_frequency = {}
-    
-    # Build comprehensive skill list with frequency
-    for category, skills in role_data.get('technical_skills', {}).items():
-        for skill in skills:
-            all_required_skills.append(skill)
-            skill_frequency[skill] = skill_frequency.get(skill, 0) + 1
-    
-    # Sort skills by frequency (more frequent = more critical)
-    sorted_skills = sorted(skill_frequency.items(), key=lambda x: x[1], reverse=True)
-    critical_skills = [skill[0] for skill in sorted_skills[:10]]
-    moderate_skills = [skill[0] for skill in sorted_skills[10:25]]
-    
-    # Categorize missing skills with severity levels
-    for skill in missing_skills:
-        skill_lower = skill.lower()
-        found_critical = False
-        found_moderate = False
-        
-        # Check if skill is in critical list
-        for critical_skill in critical_skills:
-            if skill_lower == critical_skill.lower():
-                analysis['critical_gaps'].append(skill)
-                analysis['gap_severity'][skill] = 'High'
-                found_critical = True
-                break
-        
-        # Check if skill is in moderate list
-        if not found_critical:
-            for moderate_skill in moderate_skills:
-                if skill_lower == moderate_skill.lower():
-                    analysis['moderate_gaps'].append(skill)
-                    analysis['gap_severity'][skill] = 'Medium'
-                    found_moderate = True
-                    break
-        
-        # If not found in either, it's nice to have
-        if not found_critical and not found_moderate:
-            analysis['nice_to_have'].append(skill)
-            analysis['gap_severity'][skill] = 'Low'
-    
-    # Generate specific recommendations with severity levels
-    if analysis['critical_gaps']:
-        critical_list = ', '.join(analysis['critical_gaps'][:5])
-        analysis['recommendations'].append(f"🔴 Priority 1 (High): Master {critical_list} - These are essential for {role} roles")
-    
-    if analysis['moderate_gaps']:
-        moderate_list = ', '.join(analysis['moderate_gaps'][:5])
-        analysis['recommendations'].append(f"🟡 Priority 2 (Medium): Learn {moderate_list} - These will significantly improve your competitiveness")
-    
-    if analysis['nice_to_have']:
-        nice_list = ', '.join(analysis['nice_to_have'][:5])
-        analysis['recommendations'].append(f"🟢 Priority 3 (Low): Consider {nice_list} - These are supplementary skills for advanced positions")
-    
-    return analysis
-
-def create_action_plan(role, gap_analysis, role_data):
-    """Create a detailed action plan to achieve 100% job match."""
-    action_plan = {
-        'immediate_actions': [],
-        'short_term_goals': [],
-        'long_term_goals': [],
-        'timeline': '12-16 weeks to achieve 100% job match potential'
-    }
-    
-    # Immediate actions (Week 1-2)
-    if gap_analysis['critical_gaps']:
-        action_plan['immediate_actions'].append(f"Start learning {gap_analysis['critical_gaps'][0]} - highest priority skill")
-        action_plan['immediate_actions'].append("Update resume with current skills and quantify achievements")
-        action_plan['immediate_actions'].append("Begin building a portfolio project showcasing your skills")
-    
-    # Short-term goals (Week 3-8)
-    action_plan['short_term_goals'].append("Complete 2-3 online courses in critical skills")
-    action_plan['short_term_goals'].append("Build 1-2 portfolio projects demonstrating expertise")
-    action_plan['short_term_goals'].append("Obtain 1 industry-relevant certification")
-    
-    # Long-term goals (Week 9-16)
-    action_plan['long_term_goals'].append("Master all critical skills for the role")
-    action_plan['long_term_goals'].append("Complete 3-4 portfolio projects")
-    action_plan['long_term_goals'].append("Achieve 2-3 professional certifications")
-    action_plan['long_term_goals'].append("Network with professionals in the field")
-    
-    return action_plan
-
-def generate_course_links(missing_skills, skill_course_mapping, course_providers):
-    """Generate course links for missing skills using popular course providers like Udemy."""
-    course_links = []
-    
-    for skill in missing_skills[:10]:  # Limit to top 10 missing skills
-        # Find course mapping for the skill
-        skill_info = skill_course_mapping.get(skill, skill_course_mapping.get('default', {}))
-        
-        # Get provider and search query
-        provider = skill_info.get('provider', 'Udemy')
-        search_query = skill_info.get('search_query', skill.lower().replace(' ', '+'))
-        
-        # Get provider URL
-        provider_url = course_providers.get(provider, course_providers['Udemy'])
-        
-        # Generate search URL
-        if provider == 'Udemy':
-            search_url = f"{provider_url}/courses/search/?q={search_query}"
-        elif provider == 'Coursera':
-            search_url = f"{provider_url}/search?query={search_query}"
-        elif provider == 'edX':
-            search_url = f"{provider_url}/search?q={search_query}"
-        elif provider == 'LinkedIn Learning':
-            search_url = f"{provider_url}/search?keywords={search_query}"
-        elif provider == 'Pluralsight':
-            search_url = f"{provider_url}/search?q={search_query}"
-        elif provider == 'Skillshare':
-            search_url = f"{provider_url}/search/projects/?query={search_query}"
-        else:
-            # Default to Udemy if provider is unknown
-            search_url = f"{course_providers['Udemy']}/courses/search/?q={search_query}"
-        
-        course_links.append({
-            'skill': skill,
-            'provider': provider,
-            'url': search_url
-        })
-    
-    return course_links
-
-def get_priority_skills(role_data, missing_skills):
-    """Get prioritized skill recommendations."""
-    priority_skills = []
-    
-    # Add critical missing skills first
-    for category, skills in role_data.get('technical_skills', {}).items():
-        for skill in skills[:5]:  # Top 5 skills per category
-            if skill.lower() in [s.lower() for s in missing_skills]:
-                priority_skills.append(skill)
-    
-    return priority_skills[:10]  # Top 10 priority skills
-
-def get_tools_platforms(role_data):
-    """Get recommended tools and platforms."""
-    tools = []
-    for category, skills in role_data.get('technical_skills', {}).items():
-        if 'tools' in category.lower() or 'platforms' in category.lower():
-            tools.extend(skills)
-    return tools[:8]  # Top 8 tools/platforms
-
-def personalize_recommendations(role_data, matched_skills, missing_skills):
-    """Create personalized recommendations based on user's current skills."""
-    recommendations = {
-        'skill_progression': [],
-        'learning_resources': [],
-        'project_suggestions': [],
-        'certification_path': []
-    }
-    
-    # Determine user's experience level based on matched skills
-    basic_skills = 0
-    intermediate_skills = 0
-    advanced_skills = 0
-    
-    # Define skill levels for different categories
-    skill_levels = {
-        'basic': ['Excel', 'SQL', 'HTML', 'CSS', 'JavaScript Basics', 'Python Basics'],
-        'intermediate': ['Python', 'Java', 'React', 'Tableau', 'Power BI', 'Agile', 'Scrum'],
-        'advanced': ['Machine Learning', 'Cloud Technologies', 'Microservices', 'DevOps', 'Leadership']
-    }
-    
-    # Count skill levels in matched skills
-    for skill in matched_skills:
-        skill_lower = skill.lower()
-        if any(basic_skill.lower() in skill_lower for basic_skill in skill_levels['basic']):
-            basic_skills += 1
-        if any(intermediate_skill.lower() in skill_lower for intermediate_skill in skill_levels['intermediate']):
-            intermediate_skills += 1
-        if any(advanced_skill.lower() in skill_lower for advanced_skill in skill_levels['advanced']):
-            advanced_skills += 1
-    
-    # Determine overall experience level
-    total_matched = len(matched_skills)
-    if total_matched == 0:
-        experience_level = 'Beginner'
-    elif basic_skills > intermediate_skills and basic_skills > advanced_skills:
-        experience_level = 'Beginner'
-    elif intermediate_skills > advanced_skills:
-        experience_level = 'Intermediate'
-    else:
-        experience_level = 'Advanced'
-    
-    # Generate personalized skill progression path
-    if experience_level == 'Beginner':
-        recommendations['skill_progression'] = [
-            'Start with fundamental skills in your target role',
-            'Focus on 2-3 core technical skills',
-            'Build your first project to apply learned skills',
-            'Join online communities for support and networking'
-        ]
-        recommendations['learning_resources'] = [
-            'FreeCodeCamp for foundational skills',
-            'Coursera/edX university courses',
-            'YouTube tutorials for hands-on learning',
-            'Documentation and official guides'
-        ]
-    elif experience_level == 'Intermediate':
-        recommendations['skill_progression'] = [
-            'Deepen expertise in 1-2 specialized areas',
-            'Work on complex projects showcasing your skills',
-            'Contribute to open-source projects',
-            'Prepare for industry certifications'
-        ]
-        recommendations['learning_resources'] = [
-            'Udemy advanced courses',
-            'Pluralsight for technical skills',
-            'Professional bootcamps',
-            'Industry conferences and webinars'
-        ]
-    else:  # Advanced
-        recommendations['skill_progression'] = [
-            'Become a thought leader in your specialization',
-            'Mentor others in the community',
-            'Publish technical content or research',
-            'Pursue advanced certifications and continuous learning'
-        ]
-        recommendations['learning_resources'] = [
-            'Research papers and advanced publications',
-            'Industry expert courses',
-            'Speaking at conferences',
-            'Advanced degree programs if relevant'
-        ]
-    
-    # Generate project suggestions based on missing skills
-    project_count = min(3, len(missing_skills))
-    if project_count > 0:
-        recommendations['project_suggestions'] = [
-            f'Project focusing on {missing_skills[i]}' for i in range(project_count)
-        ]
-    else:
-        recommendations['project_suggestions'] = ['Build a portfolio project showcasing your expertise']
-    
-    # Generate certification path
-    all_certifications = role_data.get('certifications', [])
-    if experience_level == 'Beginner':
-        recommendations['certification_path'] = all_certifications[:1] if all_certifications else ['Start with entry-level certifications']
-    elif experience_level == 'Intermediate':
-        recommendations['certification_path'] = all_certifications[:2] if len(all_certifications) >= 2 else all_certifications
-    else:
-        recommendations['certification_path'] = all_certifications[:3] if len(all_certifications) >= 3 else all_certifications
-    
-    return recommendations
-
-def generate_quantified_suggestions(text, keywords, predicted_roles):
-    """Generate quantifiable bullet point improvements using X-Y-Z formula."""
-    suggestions = []
-    text_lower = text.lower()
-    
-    # Extract current bullet points or experience descriptions
-    bullet_patterns = re.findall(r'[-•]\s*([^-\n]+)', text)
-    
-    # Generate improved versions for top 3 roles
-    for i, role_data in enumerate(predicted_roles[:3]):
-        role = role_data['role']
-        matched_skills = role_data['matched_skills']
-        
-        # Create X-Y-Z formula examples based on role
-        examples = generate_role_specific_examples(role, matched_skills)
-        suggestions.extend(examples[:2])  # 2 examples per role
-    
-    return suggestions[:6]  # Limit to 6 total suggestions
-
-def generate_role_specific_examples(role, matched_skills):
-    """Generate role-specific X-Y-Z formula examples with concrete, actionable suggestions."""
-    examples = []
-    
-    # Role-specific improvement examples with actual numbers and tools
-    role_examples = {
-        'Data Analyst': [
-            {
-                'weak_example': 'Responsible for data analysis tasks',
-                'strong_example': 'Analyzed 15+ datasets using Python and SQL, improving data accuracy by 25% and reducing processing time by 40%',
-                'role': role,
-                'formula_explanation': 'Concrete example: 15+ datasets (Achievement) + Python/SQL (Tools) + 25% accuracy improvement (Measurable Result)'
-            },
-            {
-                'weak_example': 'Created reports for management',
-                'strong_example': 'Created 12 automated weekly reports using Tableau and Power BI, reducing manual work by 8 hours per week and improving decision-making speed by 35%',
-                'role': role,
-                'formula_explanation': 'Specific metrics: 12 reports (Achievement) + Tableau/Power BI (Tools) + 8 hours saved + 35% faster decisions (Measurable Results)'
-            }
-        ],
-        'Software Engineer': [
-            {
-                'weak_example': 'Developed software applications',
-                'strong_example': 'Developed 3 new features using React and Node.js for a fintech application, increasing transaction processing speed by 45% and reducing server costs by ₹200K annually',
-                'role': role,
-                'formula_explanation': 'Measurable impact: 3 features (Achievement) + React/Node.js (Technology) + 45% speed increase + ₹200K cost savings (Results)'
-            },
-            {
-                'weak_example': 'Worked on bug fixes and maintenance',
-                'strong_example': 'Resolved 50+ critical bugs using Python and automated testing tools, improving system stability by 40% and reducing customer complaints by 60%',
-                'role': role,
-                'formula_explanation': 'Quantified results: 50+ bugs fixed (Achievement) + Python/testing tools (Method) + 40% stability + 60% fewer complaints (Results)'
-            }
-        ],
-        'Project Manager': [
-            {
-                'weak_example': 'Managed project teams',
-                'strong_example': 'Led 4 cross-functional projects using Agile methodology for BFSI clients, delivering all projects 15% under budget and 2 weeks ahead of schedule while maintaining 99% quality standards',
-                'role': role,
-                'formula_explanation': 'Project metrics: 4 projects (Achievement) + Agile methodology (Method) + 15% budget savings + 2 weeks early + 99% quality (Results)'
-            },
-            {
-                'weak_example': 'Coordinated team activities',
-                'strong_example': 'Managed 8 team members using JIRA and Slack for IT infrastructure projects, improving team productivity by 30% and reducing project delivery time by 25% while achieving 100% sprint completion rate',
-                'role': role,
-                'formula_explanation': 'Team impact: 8 team members (Scale) + JIRA/Slack (Tools) + 30% productivity + 25% faster delivery + 100% sprints (Results)'
-            }
-        ],
-        'HR Specialist': [
-            {
-                'weak_example': 'Handled recruitment processes',
-                'strong_example': 'Streamlined hiring process using Workday HRIS, reducing time-to-hire by 20 days and improving candidate satisfaction by 45%',
-                'role': role,
-                'formula_explanation': 'HR metrics: Streamlined process (Achievement) + Workday HRIS (Tool) + 20 days reduction (Result)'
-            },
-            {
-                'weak_example': 'Managed employee relations',
-                'strong_example': 'Implemented employee wellness program using HR analytics, increasing retention by 25% and reducing turnover costs by ₹150K annually',
-                'role': role,
-                'formula_explanation': 'Retention impact: Wellness program (Achievement) + HR analytics (Method) + 25% retention increase (Result)'
-            }
-        ],
-        'Marketing Specialist': [
-            {
-                'weak_example': 'Managed marketing campaigns',
-                'strong_example': 'Executed 8 digital marketing campaigns for e-commerce clients using Google Ads and Facebook Ads, generating 2,500+ qualified leads and increasing ROI by 60% while reducing CAC by 25%',
-                'role': role,
-                'formula_explanation': 'Campaign results: 8 campaigns (Achievement) + Google/Facebook Ads (Platforms) + 2,500 leads + 60% ROI + 25% lower CAC (Results)'
-            },
-            {
-                'weak_example': 'Created marketing content',
-                'strong_example': 'Optimized website content for BFSI sector using SEO tools and A/B testing, increasing organic traffic by 80% and conversion rate by 35% within 3 months',
-                'role': role,
-                'formula_explanation': 'SEO impact: BFSI content optimization (Achievement) + SEO tools/A/B testing (Method) + 80% traffic + 35% conversion + 3 months (Results)'
-            }
-        ],
-        'Sales Representative': [
-            {
-                'weak_example': 'Responsible for sales targets',
-                'strong_example': 'Exceeded quarterly sales targets by 35% for IT services in Mumbai region using Salesforce CRM and consultative selling, generating ₹2.5M in revenue and acquiring 15 new enterprise clients',
-                'role': role,
-                'formula_explanation': 'Sales achievement: 35% target exceed (Achievement) + Salesforce CRM/consultative selling (Method) + ₹2.5M revenue + 15 clients (Results)'
-            },
-            {
-                'weak_example': 'Managed client relationships',
-                'strong_example': 'Built and maintained 150+ client relationships in the SME sector using Salesforce CRM, increasing customer retention by 40% and upsell revenue by ₹500K annually',
-                'role': role,
-                'formula_explanation': 'Relationship metrics: 150+ SME clients (Achievement) + Salesforce CRM (Tool) + 40% retention + ₹500K upsell (Results)'
-            }
-        ],
-        'Business Analyst': [
-            {
-                'weak_example': 'Analyzed business processes',
-                'strong_example': 'Analyzed 12 business processes for manufacturing clients using data analytics and process mapping, identifying cost savings of ₹300K annually and improving operational efficiency by 25%',
-                'role': role,
-                'formula_explanation': 'Process impact: 12 manufacturing processes (Achievement) + Data analytics/mapping (Method) + ₹300K savings + 25% efficiency (Results)'
-            },
-            {
-                'weak_example': 'Created business requirements',
-                'strong_example': 'Documented 25+ business requirements for fintech applications using Visio and JIRA, reducing project delivery time by 30% and improving stakeholder satisfaction by 50% with zero rework',
-                'role': role,
-                'formula_explanation': 'Requirements impact: 25+ fintech requirements (Achievement) + Visio/JIRA (Tools) + 30% faster delivery + 50% satisfaction + 0% rework (Results)'
-            }
-        ]
-    }
-    
-    # Default examples for roles not specifically defined
-    default_examples = [
-        {
-            'weak_example': 'Responsible for general tasks',
-            'strong_example': 'Improved operational efficiency by 25% using process optimization and team collaboration, resulting in ₹100K cost savings',
-            'role': role,
-            'formula_explanation': 'General improvement: 25% efficiency increase (Achievement) + Process optimization (Method) + ₹100K savings (Result)'
-        },
-        {
-            'weak_example': 'Worked on various projects',
-            'strong_example': 'Completed 5 major projects using project management methodologies, delivering 100% on-time with 20% cost reduction',
-            'role': role,
-            'formula_explanation': 'Project success: 5 projects (Achievement) + Project management methodologies (Method) + 20% cost reduction (Result)'
-        }
-    ]
-    
-    # Get role-specific examples or use defaults
-    examples_to_use = role_examples.get(role, default_examples)
-    
-    # Return top 2 examples for the role
-    return examples_to_use[:2]
-
-def generate_tailoring_advice(predicted_roles, keywords):
-    """Generate role-specific tailoring advice."""
-    advice = []
-    
-    for role_data in predicted_roles[:3]:
-        role = role_data['role']
-        match_pct = role_data['match_percentage']
-        
-        if match_pct > 70:
-            advice.append(f'✅ Strong match for {role} ({match_pct}%) - Your resume aligns well with this role')
-        elif match_pct > 50:
-            advice.append(f'🔧 Good potential for {role} ({match_pct}%) - Add missing skills to improve match')
-        else:
-            advice.append(f'⚠️ Consider {role} ({match_pct}%) - Focus on relevant skills and experience')
-    
-    return advice
-
-def generate_ats_summary(text, keywords, predicted_roles):
-    """Generate ATS-optimized professional summary."""
-    if not predicted_roles:
-        return "Results-driven professional with expertise in various domains. Seeking opportunities to apply skills and contribute to organizational success."
-    
-    top_role = predicted_roles[0]['role']
-    matched_skills = predicted_roles[0]['matched_skills'][:5]  # Top 5 skills
-    
-    # Create industry-appropriate summary
-    industry_context = get_industry_context(top_role)
-    skills_text = ', '.join(matched_skills)
-    
-    summary = f"Results-driven {industry_context} with expertise in {skills_text}. "
-    
-    # Add quantified achievements if found in text
-    quantified_found = re.search(r'\d+\s*(%|million|thousand|k)', text.lower())
-    if quantified_found:
-        summary += "Demonstrated success in optimizing processes and driving measurable performance improvements. "
-    
-    summary += f"Seeking to leverage technical skills and experience to contribute to {top_role} opportunities."
-    
-    return summary
-
-def generate_ats_skills_section(keywords, predicted_roles):
-    """Generate ATS-optimized skills section."""
-    if not predicted_roles:
-        return "Skills: " + ', '.join(keywords[:10])
-    
-    # Categorize skills
-    technical_skills = []
-    soft_skills = []
-    tools_skills = []
-    
-    for role_data in predicted_roles:
-        matched_skills = role_data['matched_skills']
-        for skill in matched_skills:
-            if any(tech in skill.lower() for tech in ['programming', 'software', 'database', 'cloud', 'api']):
-                technical_skills.append(skill)
-            elif any(tool in skill.lower() for tool in ['excel', 'tableau', 'powerbi', 'jira', 'git']):
-                tools_skills.append(skill)
-            else:
-                soft_skills.append(skill)
-    
-    # Remove duplicates and limit
-    technical_skills = list(set(technical_skills))[:8]
-    soft_skills = list(set(soft_skills))[:6]
-    tools_skills = list(set(tools_skills))[:6]
-    
-    skills_text = "Technical Skills: " + ', '.join(technical_skills)
-    if tools_skills:
-        skills_text += " | Tools: " + ', '.join(tools_skills)
-    if soft_skills:
-        skills_text += " | Professional Skills: " + ', '.join(soft_skills)
-    
-    return skills_text
-
-def get_industry_context(role):
-    """Get industry context for role."""
-    context_map = {
-        'Data Analyst': 'data professional',
-        'Software Engineer': 'software developer',
-        'Project Manager': 'project management professional',
-        'HR Specialist': 'human resources professional',
-        'Marketing Specialist': 'marketing professional',
-        'Sales Representative': 'sales professional'
-    }
-    return context_map.get(role, 'professional')
-
-def generate_ats_explanation(score):
-    """Generate explanation of ATS scoring."""
-    if score >= 90:
-        level = "Excellent"
-        explanation = "Your resume is highly ATS-optimized with strong keyword density, quantified achievements, and proper structure."
-    elif score >= 80:
-        level = "Good"
-        explanation = "Your resume has a solid foundation but can be improved with more quantified achievements and keyword optimization."
-    elif score >= 70:
-        level = "Fair"
-        explanation = "Your resume needs improvement in keyword density, quantified results, and ATS-friendly formatting."
-    elif score >= 60:
-        level = "Poor"
-        explanation = "Your resume requires significant improvements in structure, keywords, and quantified achievements."
-    else:
-        level = "Very Poor"
-        explanation = "Your resume needs major improvements across all ATS criteria including keywords, structure, and achievements."
-    
-    return f"ATS Score: {score}/100 ({level}) - {explanation}"
-
-def generate_ai_feedback(ats_score, predicted_roles, keywords, text):
-    """Generate AI-powered executive summary and insights for the dashboard."""
-    feedback = {}
-    
-    # Generate executive summary
-    if predicted_roles and len(predicted_roles) > 0:
-        top_role = predicted_roles[0]['role']
-        match_percentage = predicted_roles[0]['match_percentage']
-        
-        # Create a comprehensive summary based on ATS score and job matches
-        if ats_score >= 90:
-            summary = f"Excellent work! Your resume is highly optimized for {top_role} roles with a {match_percentage}% match. " \
-                     f"You have strong keyword alignment and quantified achievements. To further enhance your prospects, " \
-                     f"consider tailoring your professional summary to highlight your expertise in {', '.join(predicted_roles[0]['matched_skills'][:3])}."
-        elif ats_score >= 80:
-            summary = f"Good foundation! Your resume shows strong potential for {top_role} roles with a {match_percentage}% match. " \
-                     f"Focus on adding more quantified achievements and incorporating industry-specific keywords like " \
-                     f"{', '.join(keywords[:3])} to boost your ATS compatibility."
-        elif ats_score >= 70:
-            summary = f"Fair match for {top_role} roles at {match_percentage}%. Your resume needs improvement in keyword density " \
-                     f"and quantified results. Strengthen your impact by adding metrics to your achievements and including " \
-                     f"skills such as {', '.join(predicted_roles[0].get('missing_skills', [])[:3])}."
-        elif ats_score >= 60:
-            summary = f"Needs improvement for {top_role} roles. Your resume has a {match_percentage}% match but requires " \
-                     f"significant enhancements in structure and keyword optimization. Focus on quantifying your achievements " \
-                     f"and adding missing skills like {', '.join(predicted_roles[0].get('missing_skills', [])[:3])}."
-        else:
-            summary = f"Significant improvements needed for {top_role} roles. With only a {match_percentage}% match, " \
-                     f"you should restructure your resume to include more industry keywords such as {', '.join(keywords[:5])} " \
-                     f"and quantify your professional achievements with specific metrics."
-    else:
-        # Fallback for when no roles are predicted or other cases
-        if ats_score >= 90:
-            summary = "Outstanding! Your resume demonstrates excellent structure and keyword optimization. " \
-                     "To maximize your opportunities, consider customizing your professional summary for specific roles " \
-                     "and adding quantified achievements to showcase your impact."
-        elif ats_score >= 80:
-            summary = "Great job! Your resume shows strong potential with good keyword usage and structure. " \
-                     "Enhance it further by adding more quantified achievements and industry-specific skills."
-        elif ats_score >= 70:
-            summary = "Good start! Your resume has a solid foundation but can be improved. " \
-                     "Focus on incorporating more industry keywords and quantifying your achievements with specific metrics."
-        elif ats_score >= 60:
-            summary = "Needs improvement. Your resume requires enhancements in keyword density and quantified results. " \
-                     "Add specific metrics to your achievements and incorporate relevant industry terms."
-        else:
-            summary = "Significant improvements needed. Restructure your resume to include quantified achievements, " \
-                     "industry keywords, and a clear professional summary tailored to your target roles."
-    
-    feedback['ai_executive_summary'] = summary
-    
-    # Identify top strength
-    if predicted_roles and len(predicted_roles) > 0:
-        top_role_data = predicted_roles[0]
-        matched_skills = top_role_data['matched_skills']
-        if matched_skills and len(matched_skills) > 0:
-            feedback['top_strength'] = f"Strong alignment with {top_role_data['role']} role through skills: {', '.join(matched_skills[:3])}"
-        else:
-            feedback['top_strength'] = f"Good potential for {top_role_data['role']} role"
-    else:
-        # Fallback strengths when no roles predicted
-        if len(keywords) >= 5:
-            feedback['top_strength'] = f"Solid keyword foundation with {len(keywords)} relevant terms including: {', '.join(keywords[:3])}"
-        elif len(keywords) > 0:
-            feedback['top_strength'] = f"Relevant keywords identified: {', '.join(keywords)}"
-        else:
-            feedback['top_strength'] = "Clear, well-structured format"
-    
-    # Identify key improvement area with more specific recommendations
-    if predicted_roles and len(predicted_roles) > 0:
-        top_role_data = predicted_roles[0]
-        missing_skills = top_role_data.get('missing_skills', [])
-        if missing_skills and len(missing_skills) > 0:
-            # Get top 3 missing skills
-            top_missing = missing_skills[:3]
-            feedback['key_improvement'] = f"Add skills: {', '.join(top_missing)} to increase {top_role_data['role']} match"
-        else:
-            feedback['key_improvement'] = f"Enhance {top_role_data['role']} alignment with quantified achievements"
-    else:
-        # Fallback improvements when no roles predicted
-        if len(keywords) == 0:
-            feedback['key_improvement'] = "Add industry-specific keywords to enhance ATS compatibility"
-        elif len(keywords) < 3:
-            feedback['key_improvement'] = "Expand keyword diversity to improve role matching"
-        elif ats_score < 70:
-            feedback['key_improvement'] = "Add quantified achievements with specific metrics to demonstrate impact"
-        else:
-            # For higher scores, suggest more advanced improvements
-            feedback['key_improvement'] = "Optimize keyword placement and add more quantified achievements"
-    
-    # Prepare job role match data for visualization
-    job_roles_data = []
-    if predicted_roles and len(predicted_roles) > 0:
-        for role_data in predicted_roles[:5]:  # Top 5 roles
-            job_roles_data.append({
-                'role': role_data['role'],
-                'match_percentage': role_data['match_percentage']
-            })
-    else:
-        # Provide some default data for visualization even when no matches
-        job_roles_data.append({
-            'role': 'Upload Resume',
-            'match_percentage': max(ats_score, 30)  # Use ATS score as a proxy
-        })
-    
-    feedback['job_roles_data'] = job_roles_data
-    
-    return feedback
-
-def calculate_resume_score(text, keywords):
-    """Legacy function - now calls the advanced analysis."""
-    return calculate_advanced_ats_score(text, keywords)
-
-def analyze_for_improvements(score, text, keywords, predicted_roles=None):
-    """Provides personalized feedback based on the resume score."""
-    feedback = []
-    text_lower = text.lower()
-    
-    # Add a general assessment based on score
-    if score >= 90:
-        feedback.append("✅ Excellent! Your resume is highly ATS-optimized.")
-    elif score >= 80:
-        feedback.append("✅ Good foundation! With minor improvements, your resume can achieve an excellent ATS score.")
-    elif score >= 70:
-        feedback.append("🔧 Fair score. Focus on keyword optimization and quantified achievements to improve.")
-    elif score >= 60:
-        feedback.append("⚠️ Needs improvement. Address structure, keywords, and achievements to enhance ATS compatibility.")
-    else:
-        feedback.append("❌ Low score. Significant improvements needed in keywords, structure, and quantified results.")
-    
-    # Keyword analysis
-    if len(keywords) < 3:
-        feedback.append("🔍 <strong>Keyword Deficiency:</strong> You have few relevant keywords. Add industry-specific terms from job descriptions.")
-    elif len(keywords) < 8:
-        feedback.append("🔍 <strong>Keyword Enhancement:</strong> Increase keyword density with role-specific skills and technologies.")
-    else:
-        feedback.append("✅ <strong>Keyword Rich:</strong> Good keyword variety. Ensure they're contextually placed throughout your resume.")
-    
-    # Quantified achievements check
-    quantified_matches = re.findall(r'\d+\s*(%|million|thousand|k|lakhs|x)', text_lower)
-    if not quantified_matches:
-        feedback.append("📊 <strong>Missing Metrics:</strong> Include numbers to quantify achievements (e.g., 'increased sales by 25%', 'managed 10+ team members').")
-    elif len(quantified_matches) < 3:
-        feedback.append("📊 <strong>Limited Metrics:</strong> Add more quantified results to demonstrate impact (aim for at least 3-5 quantified achievements).")
-    else:
-        feedback.append("✅ <strong>Quantified Results:</strong> Good use of metrics to show impact.")
-    
-    # Weak verbs check
-    weak_verbs = ["responsible for", "worked on", "assisted in", "helped", "involved in", "participated in"]
-    weak_verb_matches = [verb for verb in weak_verbs if verb in text_lower]
-    if weak_verb_matches:
-        feedback.append("💪 <strong>Weak Action Verbs:</strong> Replace phrases like 'responsible for' with stronger verbs (e.g., 'managed', 'developed', 'implemented', 'optimized').")
-    else:
-        feedback.append("✅ <strong>Strong Action Verbs:</strong> Effective use of powerful action verbs.")
-    
-    # Length check
-    word_count = len(re.findall(r'\w+', text))
-    if word_count < 200:
-        feedback.append("📄 <strong>Too Short:</strong> Resume is quite brief. Expand with detailed experiences, projects, and achievements.")
-    elif word_count < 300:
-        feedback.append("📄 <strong>Concise Content:</strong> Add more specific details to experiences and achievements.")
-    elif word_count > 800:
-        feedback.append("📄 <strong>Too Lengthy:</strong> Resume exceeds 2 pages. Prioritize most relevant experiences and trim verbose descriptions.")
-    else:
-        feedback.append("✅ <strong>Optimal Length:</strong> Good resume length for readability.")
-    
-    # Structure and formatting issues
-    if "objective" not in text_lower and "summary" not in text_lower:
-        feedback.append("📋 <strong>Missing Summary:</strong> Add a professional summary or career objective tailored to your target role.")
-    
-    if "skills" not in text_lower:
-        feedback.append("📋 <strong>Skills Section Missing:</strong> Include a dedicated skills section with technical and soft skills.")
-    
-    if "experience" not in text_lower and "employment" not in text_lower:
-        feedback.append("📋 <strong>Experience Section Missing:</strong> Add a work experience section with detailed role descriptions.")
-    
-    if "education" not in text_lower:
-        feedback.append("📋 <strong>Education Section Missing:</strong> Include your educational background and relevant coursework.")
-    
-    # Role-specific suggestions if predicted roles are provided
-    if predicted_roles and len(predicted_roles) > 0:
-        top_role = predicted_roles[0]['role']
-        matched_skills = predicted_roles[0]['matched_skills']
-        missing_skills = predicted_roles[0].get('missing_skills', [])
-        
-        feedback.append(f"🎯 <strong>Role Focus:</strong> Your resume is most aligned with '{top_role}' roles.")
-        
-        if missing_skills:
-            feedback.append(f"🎯 <strong>Skill Gaps:</strong> Consider adding these relevant skills for {top_role}: {', '.join(missing_skills[:5])}")
-    
-    # ATS-specific formatting issues
-    if re.search(r'\b(table|box|column)\b', text_lower):
-        feedback.append("📄 <strong>Formatting Issue:</strong> Avoid tables and text boxes which can confuse ATS systems.")
-    
-    if re.search(r'[★◆●■▲▼◆◇○◎●]', text):
-        feedback.append("📄 <strong>Formatting Issue:</strong> Remove special characters and symbols that may not be ATS-friendly.")
-    
-    # Clarity, spelling, and grammar issues
-    # Check for common spelling errors
-    common_misspellings = {
-        "recieve": "receive",
-        "seperate": "separate",
-        "definately": "definitely",
-        "occured": "occurred",
-        "accomodate": "accommodate",
-        "existance": "existence",
-        "maintainance": "maintenance",
-        "occurence": "occurrence",
-        "reccomend": "recommend",
-        "sucess": "success",
-        "tommorow": "tomorrow",
-        "untill": "until",
-        "wierd": "weird",
-        "begining": "beginning",
-        "enviroment": "environment"
-    }
-    
-    found_misspellings = []
-    for misspelled, correct in common_misspellings.items():
-        if misspelled in text_lower:
-            found_misspellings.append(f"'{misspelled}' should be '{correct}'")
-    
-    if found_misspellings:
-        feedback.append(f"🔤 <strong>Spelling Errors:</strong> Found potential spelling mistakes: {', '.join(found_misspellings[:3])}.")
-    
-    # Check for grammatical issues
-    # Sentence fragments
-    sentences = re.split(r'[.!?]+', text)
-    short_sentences = [s for s in sentences if len(s.strip()) > 0 and len(s.strip().split()) < 5]
-    if len(short_sentences) > len(sentences) * 0.3:  # More than 30% of sentences are very short
-        feedback.append("🔤 <strong>Clarity Issues:</strong> Many sentence fragments detected. Ensure complete thoughts in each sentence.")
-    
-    # Repeated words
-    words = re.findall(r'\b\w+\b', text_lower)
-    word_count = {}
-    for word in words:
-        if len(word) > 3:  # Only check longer words
-            word_count[word] = word_count.get(word, 0) + 1
-    
-    repeated_words = [word for word, count in word_count.items() if count > 5]
-    if repeated_words:
-        feedback.append(f"🔤 <strong>Repetition Issues:</strong> Overused words detected: {', '.join(repeated_words[:3])}. Use synonyms to improve variety.")
-    
-    # Check for passive voice indicators
-    passive_indicators = ["was ", "were ", "been ", "being ", "had been", "has been", "have been"]
-    passive_count = sum(1 for indicator in passive_indicators if indicator in text_lower)
-    if passive_count > 10:
-        feedback.append("🔤 <strong>Passive Voice:</strong> Excessive passive voice detected. Use active voice for stronger impact.")
-    
-    # Final encouragement if no major issues
-    if len([f for f in feedback if f.startswith(("✅", "📊", "💪", "📄", "📋", "🎯", "🔤"))]) == len(feedback):
-        feedback.append("🎉 <strong>Great Job!</strong> Your resume is well-structured. For continuous improvement, regularly update with new skills and achievements.")
-    
-    return feedback
-
-
-def is_valid_resume_content(text):
-    """Checks if a document is likely a resume based on a simple heuristic."""
-    text_lower = text.lower()
-    word_count = len(re.findall(r'\w+', text_lower))
-    
-    # 1. Length Check
-    if word_count < 150 or word_count > 2000:
-        return False
-        
-    # 2. Keyword Check
-    resume_keywords = ["education", "skills", "experience", "projects", "certifications", "summary"]
-    
-    # Check for at least 2 common resume section keywords
-    found_keywords = sum(1 for keyword in resume_keywords if keyword in text_lower)
-    if found_keywords < 2:
-        return False
-        
-    # 3. Contact Info Check (simple email check)
-    if not re.search(r'[\w\.-]+@[\w\.-]+', text_lower):
-        return False
-        
-    return True
-
-def generate_ats_pdf(resume_data):
-    """
-    Generates an ATS-friendly PDF resume using ReportLab.
-    Handles both freshers and experienced professionals.
-    """
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, 
-                          topMargin=0.5*inch, 
-                          bottomMargin=0.5*inch,
-                          leftMargin=0.5*inch,
-                          rightMargin=0.5*inch)
-    
-    styles = getSampleStyleSheet()
-    
-    # Custom styles for ATS optimization
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontName='Helvetica-Bold',
-        fontSize=16,
-        spaceAfter=12,
-        textColor=colors.HexColor('#2c3e50')
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontName='Helvetica-Bold',
-        fontSize=12,
-        spaceAfter=6,
-        textColor=colors.HexColor('#2c3e50'),
-        borderBottom=1,
-        borderColor=colors.HexColor('#bdc3c7')
-    )
-    
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontName='Helvetica',
-        fontSize=10,
-        spaceAfter=6
-    )
-    
-    bullet_style = ParagraphStyle(
-        'BulletPoint',
-        parent=styles['Normal'],
-        fontName='Helvetica',
-        fontSize=10,
-        leftIndent=20,
-        spaceAfter=3
-    )
-    
-    story = []
-    
-    # Personal Details Section
-    personal_info = resume_data.get('personal_details', {})
-    name = personal_info.get('full_name', '')
-    email = personal_info.get('email', '')
-    phone = personal_info.get('phone', '')
-    location = personal_info.get('location', '')
-    linkedin = personal_info.get('linkedin', '')
-    github = personal_info.get('github', '')
-    
-    if name:
-        story.append(Paragraph(name.upper(), title_style))
-    
-    contact_info = []
-    if phone:
-        contact_info.append(phone)
-    if email:
-        contact_info.append(email)
-    if location:
-        contact_info.append(location)
-    if linkedin:
-        contact_info.append(f"LinkedIn: {linkedin}")
-    if github:
-        contact_info.append(f"GitHub: {github}")
-    
-    if contact_info:
-        contact_paragraph = Paragraph(" | ".join(contact_info), normal_style)
-        story.append(contact_paragraph)
-    
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Professional Summary/Career Objective
-    user_type = resume_data.get('user_type', 'experienced')
-    if user_type == 'fresher':
-        summary = """Recent graduate with strong academic foundation and technical aptitude, seeking to launch a successful career in the technology industry. 
-Possess solid understanding of programming fundamentals, data structures, and software development principles. 
-Eager to apply theoretical knowledge in a practical environment while continuously learning and growing as a professional. 
-Demonstrated ability to work collaboratively in team settings and adapt quickly to new technologies and methodologies. 
-Committed to delivering high-quality work and contributing to organizational goals through innovation and dedication. 
-Strong problem-solving skills with attention to detail and a passion for creating efficient, user-friendly solutions. 
-Ready to take on challenging projects and make meaningful contributions to dynamic development teams. 
-Motivated to learn from experienced professionals and grow into a valuable asset for the organization."""
-        story.append(Paragraph("CAREER OBJECTIVE", heading_style))
-        story.append(Paragraph(summary, normal_style))
-        story.append(Spacer(1, 0.1*inch))
-    else:
-        summary = resume_data.get('professional_summary', '')
-        if summary:
-            story.append(Paragraph("PROFESSIONAL SUMMARY", heading_style))
-            story.append(Paragraph(summary, normal_style))
-            story.append(Spacer(1, 0.1*inch))
-        else:
-            summary = """Results-driven professional with extensive experience in software development and project management. 
-Proven track record of delivering high-quality solutions on time and within budget while leading cross-functional teams. 
-Expertise in modern development frameworks, cloud technologies, and agile methodologies. 
-Skilled in translating business requirements into technical specifications and driving innovation through continuous improvement. 
-Strong leadership capabilities with demonstrated success in mentoring junior developers and fostering collaborative environments. 
-Committed to staying current with emerging technologies and industry best practices to drive organizational growth. 
-Experienced in managing complex projects from conception to deployment with focus on scalability and performance. 
-Dedicated to delivering exceptional value to clients and stakeholders through strategic thinking and technical excellence."""
-            story.append(Paragraph("PROFESSIONAL SUMMARY", heading_style))
-            story.append(Paragraph(summary, normal_style))
-            story.append(Spacer(1, 0.1*inch))
-    
-    # Technical Skills
-    skills_data = resume_data.get('technical_skills', {})
-    soft_skills = resume_data.get('soft_skills', [])
-    
-    # Combine all skills into categories
-    all_skills = []
-    
-    # Programming Languages
-    programming_languages = skills_data.get('programming_languages', '')
-    if programming_languages:
-        all_skills.append(f"<b>Programming Languages:</b> {programming_languages}")
-    
-    # Frameworks & Libraries
-    frameworks = skills_data.get('frameworks', '')
-    if frameworks:
-        all_skills.append(f"<b>Frameworks & Libraries:</b> {frameworks}")
-    
-    # Databases
-    databases = skills_data.get('databases', '')
-    if databases:
-        all_skills.append(f"<b>Databases:</b> {databases}")
-    
-    # Cloud Technologies
-    cloud_technologies = skills_data.get('cloud_technologies', '')
-    if cloud_technologies:
-        all_skills.append(f"<b>Cloud Technologies:</b> {cloud_technologies}")
-    
-    # DevOps Tools
-    devops_tools = skills_data.get('devops_tools', '')
-    if devops_tools:
-        all_skills.append(f"<b>DevOps Tools:</b> {devops_tools}")
-    
-    # Other Technical Skills
-    other_technical_skills = skills_data.get('other_technical_skills', '')
-    if other_technical_skills:
-        all_skills.append(f"<b>Other Technical Skills:</b> {other_technical_skills}")
-    
-    # Soft Skills
-    if soft_skills:
-        soft_skills_str = ', '.join(soft_skills) if isinstance(soft_skills, list) else soft_skills
-        all_skills.append(f"<b>Soft Skills:</b> {soft_skills_str}")
-    
-    if all_skills:
-        story.append(Paragraph("TECHNICAL SKILLS", heading_style))
-        skills_paragraph = Paragraph(" | ".join(all_skills), normal_style)
-        story.append(skills_paragraph)
-        story.append(Spacer(1, 0.1*inch))
-    
-    # Work Experience - Handle freshers
-    work_experience = resume_data.get('work_experience', [])
-    
-    if user_type != 'fresher':
-        # Check if the list contains at least one entry with non-empty content
-        has_experience = False
-        for exp in work_experience:
-            if (exp.get('job_title', '').strip() or 
-                exp.get('company', '').strip() or 
-                exp.get('bullet_points', '').strip()):
-                has_experience = True
-                break
-
-        if has_experience:
-            story.append(Paragraph("WORK EXPERIENCE", heading_style))
-            
-            for exp in work_experience:
-                job_title = exp.get('job_title', '')
-                company = exp.get('company', '')
-                location = exp.get('location', '')
-                start_date = exp.get('start_date', '')
-                end_date = exp.get('end_date', '')
-                currently_working = exp.get('currently_working', False)
-                bullet_points = exp.get('bullet_points', '').split('\n') if exp.get('bullet_points') else []
-                
-                # Skip this entry if it's completely empty
-                if not (job_title.strip() or company.strip() or bullet_points):
-                    continue
-                
-                # Job header
-                job_header_parts = []
-                if job_title:
-                    job_header_parts.append(f"<b>{job_title}</b>")
-                if company:
-                    job_header_parts.append(company)
-                if location:
-                    job_header_parts.append(location)
-                if start_date:
-                    end_date_display = "Present" if currently_working else (end_date if end_date else "")
-                    job_header_parts.append(f"{start_date} - {end_date_display}")
-                
-                job_header = " | ".join(job_header_parts)
-                story.append(Paragraph(job_header, normal_style))
-                
-                # Bullet points
-                for point in bullet_points:
-                    if point.strip():
-                        story.append(Paragraph(f"• {point.strip()}", bullet_style))
-                
-                story.append(Spacer(1, 0.05*inch))
-            
-            story.append(Spacer(1, 0.1*inch))
-    
-    # Education
-    education = resume_data.get('education', [])
-    has_education = False
-    for edu in education:
-        if (edu.get('degree', '').strip() or 
-            edu.get('institution', '').strip()):
-            has_education = True
-            break
-
-    if has_education:
-        story.append(Paragraph("EDUCATION", heading_style))
-        
-        for edu in education:
-            degree = edu.get('degree', '')
-            institution = edu.get('institution', '')
-            location = edu.get('location', '')
-            start_year = edu.get('start_year', '')
-            end_year = edu.get('end_year', '')
-            currently_studying = edu.get('currently_studying', False)
-            
-            # Skip empty education entries
-            if not (degree.strip() or institution.strip()):
-                continue
-            
-            # Create education header
-            edu_header_parts = []
-            if degree:
-                edu_header_parts.append(f"<b>{degree}</b>")
-            if institution:
-                edu_header_parts.append(institution)
-            if location:
-                edu_header_parts.append(location)
-            
-            # Add years if available
-            if start_year:
-                if currently_studying:
-                    edu_header_parts.append(f"{start_year} - Present")
-                elif end_year:
-                    edu_header_parts.append(f"{start_year} - {end_year}")
-                else:
-                    edu_header_parts.append(str(start_year))
-            
-            edu_header = " | ".join(edu_header_parts)
-            story.append(Paragraph(edu_header, normal_style))
-            
-            # Add auto-generated description for courses (except X and XII)
-            if degree and degree not in ['X', 'XII']:
-                description = generate_education_description(degree)
-                story.append(Paragraph(description, bullet_style))
-            
-            story.append(Spacer(1, 0.05*inch))
-        
-        story.append(Spacer(1, 0.1*inch))
-    
-    # Projects
-    projects = resume_data.get('projects', [])
-    has_projects = False
-    for proj in projects:
-        if (proj.get('project_name', '').strip() or 
-            proj.get('technologies_used', '').strip()):
-            has_projects = True
-            break
-
-    if has_projects:
-        story.append(Paragraph("PROJECTS", heading_style))
-        
-        for proj in projects:
-            project_name = proj.get('project_name', '')
-            technologies_used = proj.get('technologies_used', '')
-            description = proj.get('description', '')
-            github_link = proj.get('github_link', '')
-            demo_link = proj.get('demo_link', '')
-            
-            # Skip empty project entries
-            if not (project_name.strip() or technologies_used.strip()):
-                continue
-            
-            # Project header
-            proj_header_parts = []
-            if project_name:
-                proj_header_parts.append(f"<b>{project_name}</b>")
-            if technologies_used:
-                proj_header_parts.append(technologies_used)
-            
-            proj_header = " | ".join(proj_header_parts)
-            story.append(Paragraph(proj_header, normal_style))
-            
-            # Project description
-            if description:
-                story.append(Paragraph(description, bullet_style))
-            
-            # Links
-            links = []
-            if github_link:
-                links.append(f"<link href='{github_link}'>GitHub</link>")
-            if demo_link:
-                links.append(f"<link href='{demo_link}'>Demo</link>")
-            
-            if links:
-                story.append(Paragraph("Links: " + " | ".join(links), bullet_style))
-            
-            story.append(Spacer(1, 0.05*inch))
-        
-        story.append(Spacer(1, 0.1*inch))
-    
-    # Certifications
-    certifications = resume_data.get('certifications', [])
-    has_certifications = False
-    for cert in certifications:
-        if (cert.get('certification_name', '').strip() or 
-            cert.get('organization', '').strip()):
-            has_certifications = True
-            break
-
-    if has_certifications:
-        story.append(Paragraph("CERTIFICATIONS", heading_style))
-        
-        for cert in certifications:
-            cert_name = cert.get('certification_name', '')
-            organization = cert.get('organization', '')
-            start_date = cert.get('start_date', '')
-            end_date = cert.get('end_date', '')
-            currently_valid = cert.get('currently_valid', False)
-            certification_id = cert.get('certification_id', '')
-            
-            # Skip empty certification entries
-            if not (cert_name.strip() or organization.strip()):
-                continue
-            
-            # Certification header
-            cert_header_parts = []
-            if cert_name:
-                cert_header_parts.append(f"<b>{cert_name}</b>")
-            if organization:
-                cert_header_parts.append(organization)
-            
-            # Add dates if available
-            if start_date:
-                if currently_valid:
-                    cert_header_parts.append(f"{start_date} - Present")
-                elif end_date:
-                    cert_header_parts.append(f"{start_date} - {end_date}")
-                else:
-                    cert_header_parts.append(start_date)
-            
-            cert_header = " | ".join(cert_header_parts)
-            story.append(Paragraph(cert_header, normal_style))
-            
-            # Add certification ID if available
-            if certification_id:
-                story.append(Paragraph(f"ID: {certification_id}", bullet_style))
-            
-            story.append(Spacer(1, 0.05*inch))
-    
-    doc.build(story)
-    buffer.seek(0)
-    return buffer
-
-def get_recommended_skills_by_degree(degree):
-    """
-    Get recommended skills based on user's degree.
-    """
-    skill_recommendations = {
-        'BCA': [
-            'Python', 'Java', 'C++', 'HTML5', 'CSS3', 'JavaScript', 'SQL', 'MySQL', 
-            'Django', 'Flask', 'Git', 'Linux', 'Data Structures', 'Algorithms'
-        ],
-        'BSc CS': [
-            'Python', 'Java', 'C++', 'Data Structures', 'Algorithms', 'Database Design', 
-            'SQL', 'MySQL', 'Linux', 'Git', 'Machine Learning', 'Data Analysis'
-        ],
-        'B.Tech': [
-            'Java', 'C++', 'Python', 'SQL', 'MySQL', 'Linux', 'Git', 'REST APIs', 
-            'Microservices', 'Docker', 'Kubernetes', 'Cloud Technologies'
-        ],
-        'M.Tech': [
-            'Machine Learning', 'Deep Learning', 'Computer Vision', 'NLP', 'Python', 
-            'TensorFlow', 'PyTorch', 'Research', 'Data Analysis', 'Cloud Technologies'
-        ],
-        'MCA': [
-            'Java', 'Python', 'C++', 'SQL', 'MySQL', 'Django', 'Flask', 'Spring', 
-            'Git', 'Linux', 'Database Design', 'Software Engineering'
-        ],
-        'MBA': [
-            'Business Strategy', 'Market Research', 'Financial Analysis', 'Leadership', 
-            'Project Management', 'Communication', 'Teamwork', 'Decision Making'
-        ],
-        'BBA': [
-            'Business Strategy', 'Marketing', 'Financial Analysis', 'Leadership', 
-            'Communication', 'Teamwork', 'Project Management', 'Customer Service'
-        ],
-        'B.Com': [
-            'Accounting Principles', 'Financial Analysis', 'Taxation', 'Excel', 
-            'Tally', 'Budgeting', 'Financial Reporting', 'Auditing'
-        ],
-        'M.Com': [
-            'Accounting Principles', 'Financial Analysis', 'Taxation', 'Excel', 
-            'Financial Reporting', 'Auditing', 'Investment Management', 'Payroll Management'
-        ],
-        'Diploma': [
-            'HTML5', 'CSS3', 'JavaScript', 'Python', 'C', 'SQL', 'MySQL', 
-            'Git', 'Linux', 'Basic Networking'
-        ]
-    }
-    
-    # For degrees not specifically listed, return a generic set of skills
-    generic_skills = [
-        'Communication', 'Teamwork', 'Problem Solving', 'Time Management', 
-        'Adaptability', 'Critical Thinking', 'Creativity', 'Attention to Detail'
-    ]
-    
-    return skill_recommendations.get(degree, generic_skills)
-
-def generate_education_description(degree):
-    """
-    Generate a brief description for education degrees (except X and XII).
-    """
-    descriptions = {
-        'BCA': "Focused on computer applications, programming languages, database management, and software development principles. Gained hands-on experience in web development, software engineering, and system analysis.",
-        'BSc CS': "Studied computer science fundamentals including algorithms, data structures, programming, and software engineering. Developed strong analytical and problem-solving skills through theoretical and practical coursework.",
-        'B.Tech': "Comprehensive engineering education covering computer science, mathematics, and practical applications. Specialized in software development, system design, and emerging technologies with emphasis on innovation.",
-        'M.Tech': "Advanced postgraduate program focusing on specialized areas of computer science and engineering. Conducted research in cutting-edge technologies and developed expertise in system optimization and advanced algorithms.",
-        'MCA': "Postgraduate program emphasizing advanced computing concepts, software development, and system design. Focused on enterprise application development, database systems, and project management methodologies.",
-        'MBA': "Business administration program with focus on management, strategy, and leadership skills. Developed expertise in financial analysis, market research, and organizational behavior with emphasis on strategic decision-making.",
-        'BBA': "Undergraduate business program covering management principles, marketing, and organizational behavior. Gained foundational knowledge in business operations, finance, and leadership with practical application focus.",
-        'B.Com': "Commerce education focusing on accounting, finance, economics, and business laws. Developed strong analytical skills in financial reporting, taxation, and auditing with emphasis on regulatory compliance.",
-        'Diploma': "Technical diploma program providing hands-on training in specialized field of study. Acquired practical skills in relevant technologies and methodologies with focus on industry applications."
-    }
-    
-    # For 'Other' degrees or degrees not in the list, provide a generic description
-    return descriptions.get(degree, f"Completed {degree} program with focus on relevant coursework and practical applications. Developed strong foundation in core subjects and gained valuable hands-on experience.")
+# --- Utility Functions ---
 
 def log_login(user_id):
-    """Logs a user's login event in the logins table."""
-    conn = sqlite3.connect('rezumai.db')
-    cursor = conn.cursor()
-    cursor.execute('INSERT INTO logins (user_id) VALUES (?)', (user_id,))
-    conn.commit()
-    conn.close()
+    """Queues a user's login event for the logins table."""
+    audit_writer.submit('INSERT INTO logins (user_id, login_time) VALUES (?, ?)', (user_id, utc_timestamp()))
 
 def log_resume_download(user_id, resume_id):
-    """Logs a resume download event."""
-    try:
-        conn = sqlite3.connect('rezumai.db')
-        conn.execute('PRAGMA foreign_keys=ON')  # Ensure foreign keys are enabled
-        cursor = conn.cursor()
-        
-        # First, verify that the user and resume exist
-        cursor.execute('SELECT id FROM users WHERE id = ?', (user_id,))
-        user_exists = cursor.fetchone()
-        
-        cursor.execute('SELECT id FROM generated_resumes WHERE id = ?', (resume_id,))
-        resume_exists = cursor.fetchone()
-        
-        if not user_exists:
-            print(f"Warning: User ID {user_id} does not exist")
-            conn.close()
-            return
-            
-        if not resume_exists:
-            print(f"Warning: Resume ID {resume_id} does not exist")
-            conn.close()
-            return
-            
-        # Check if the resume belongs to the user
-        cursor.execute('SELECT id FROM generated_resumes WHERE id = ? AND user_id = ?', (resume_id, user_id))
-        ownership_valid = cursor.fetchone()
-        
-        if not ownership_valid:
-            print(f"Warning: Resume {resume_id} does not belong to user {user_id}")
-            conn.close()
-            return
-        
-        # Insert the download record
-        cursor.execute('INSERT INTO resume_downloads (user_id, resume_id) VALUES (?, ?)', (user_id, resume_id))
-        conn.commit()
-        print(f"Successfully logged download: user_id={user_id}, resume_id={resume_id}")
-        conn.close()
-    except sqlite3.IntegrityError as e:
-        print(f"Integrity error logging resume download: {e}")
-        # Try to continue without logging
-        pass
-    except Exception as e:
-        print(f"Error logging resume download: {e}")
-        # If there's an error, we still want to continue with the download
-        pass
+    """
+    Queues a resume download event. The ownership check is part of the
+    insert itself: a resume that doesn't exist or belongs to someone else
+    inserts nothing.
+    """
+    audit_writer.submit('''
+        INSERT INTO resume_downloads (user_id, resume_id, downloaded_at)
+        SELECT user_id, id, ? FROM generated_resumes WHERE id = ? AND user_id = ?
+    ''', (utc_timestamp(), resume_id, user_id))
 
 def init_db():
-    """Initializes the database schema if tables do not already exist."""
-    conn = sqlite3.connect('rezumai.db')
-    conn.execute('PRAGMA foreign_keys=ON')  # Enable foreign key constraints
+    """Creates the base tables if they do not exist, then applies pending migrations."""
+    conn = db.connect(app.config['DATABASE'])
     cursor = conn.cursor()
+    d = conn.dialect  # column types that differ between SQLite and server databases
 
-    cursor.execute('''
+    cursor.execute(f'''
         CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            email TEXT UNIQUE NOT NULL,
+            id {d.autoincrement_key},
+            email VARCHAR(255) UNIQUE NOT NULL,
             name TEXT NOT NULL,
             password_hash TEXT NOT NULL,
             security_question TEXT NOT NULL,
@@ -2045,19 +79,19 @@ def init_db():
             is_admin BOOLEAN DEFAULT FALSE
         )
     ''')
-    cursor.execute('''
+    cursor.execute(f'''
         CREATE TABLE IF NOT EXISTS uploaded_resumes (
-            resume_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id {d.autoincrement_key},
             user_id INTEGER,
             filename TEXT NOT NULL,
-            filepath TEXT NOT NULL,
+            filepath VARCHAR(512) NOT NULL,
             uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (user_id) REFERENCES users (id)
         )
     ''')
-    cursor.execute('''
+    cursor.execute(f'''
         CREATE TABLE IF NOT EXISTS feedback (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id {d.autoincrement_key},
             user_id INTEGER,
             rating INTEGER NOT NULL CHECK (rating >= 1 AND rating <= 5),
             suggestion TEXT,
@@ -2067,9 +101,9 @@ def init_db():
             FOREIGN KEY (user_id) REFERENCES users (id)
         )
     ''')
-    cursor.execute('''
+    cursor.execute(f'''
         CREATE TABLE IF NOT EXISTS logins (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id {d.autoincrement_key},
             user_id INTEGER,
             login_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (user_id) REFERENCES users (id)
@@ -2077,20 +111,20 @@ def init_db():
     ''')
     
     # NEW TABLES FOR RESUME GENERATOR
-    cursor.execute('''
+    cursor.execute(f'''
         CREATE TABLE IF NOT EXISTS generated_resumes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id {d.autoincrement_key},
             user_id INTEGER,
-            resume_data TEXT NOT NULL, -- JSON format storing all resume data
+            resume_data {d.blob} NOT NULL, -- JSON document, encoded by storage_codec
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (user_id) REFERENCES users (id)
         )
     ''')
     
-    cursor.execute('''
+    cursor.execute(f'''
         CREATE TABLE IF NOT EXISTS resume_downloads (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id {d.autoincrement_key},
             user_id INTEGER,
             resume_id INTEGER,
             downloaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -2099,6 +133,10 @@ def init_db():
         )
     ''')
     
+    # Later schema changes (columns, indexes, ...) are versioned migrations
+    conn.commit()
+    run_migrations(conn)
+    
     # Check for and create the admin user if it doesn't exist
     cursor.execute('SELECT email FROM users WHERE email = ?', ('admin@rezum.ai',))
     if not cursor.fetchone():
@@ -2115,16 +153,257 @@ def init_db():
 # --- Flask App Initialization ---
 
 app = Flask(__name__)
-app.config['SECRET_KEY'] = secrets.token_hex(16)
 
-def get_db_connection():
-    """Create and return a database connection with row factory."""
-    conn = sqlite3.connect('rezumai.db')
-    conn.row_factory = sqlite3.Row  # This enables name-based access to columns
-    return conn
+def load_secret_key(instance_path):
+    """
+    SECRET_KEY from the environment, otherwise from ``instance/secret_key``,
+    generated on first use. Every worker and every restart must sign
+    sessions with the same key.
+    """
+    key = os.environ.get('SECRET_KEY')
+    if key:
+        return key
+    path = os.path.join(instance_path, 'secret_key')
+    if not os.path.exists(path):
+        os.makedirs(instance_path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=instance_path)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(secrets.token_hex(32))
+            os.link(tmp_path, path)  # atomic; fails if another worker got there first
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp_path)
+    with open(path, 'r') as f:
+        return f.read().strip()
+
+app.config['SECRET_KEY'] = load_secret_key(app.instance_path)
+
+app.config['DATABASE'] = os.environ.get('DATABASE_URL', db.DEFAULT_DATABASE)  # SQLite path or postgresql:// / mysql:// URL
+db.init_app(app)
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# PDF rendering runs in a separate process pool so it doesn't block request workers
+app.config['PDF_RENDER_WORKERS'] = os.cpu_count() or 1
+app.config['PDF_RENDER_QUEUE_SIZE'] = 2 * app.config['PDF_RENDER_WORKERS']
+app.config['PDF_RENDER_TIMEOUT'] = 30  # seconds per job
+pdf_render_pool = RenderPool(
+    workers=app.config['PDF_RENDER_WORKERS'],
+    queue_size=app.config['PDF_RENDER_QUEUE_SIZE'],
+    timeout=app.config['PDF_RENDER_TIMEOUT']
+)
+app.config['PDF_CACHE_FOLDER'] = 'pdf_cache'
+pdf_cache = PdfCache(app.config['PDF_CACHE_FOLDER'])
+
+# Login and download events are written in batches off the request path
+app.config['AUDIT_FLUSH_INTERVAL_MS'] = 50
+app.config['AUDIT_BATCH_SIZE'] = 200
+audit_writer = AuditWriter(
+    get_path=lambda: app.config['DATABASE'],
+    flush_interval_ms=app.config['AUDIT_FLUSH_INTERVAL_MS'],
+    batch_size=app.config['AUDIT_BATCH_SIZE']
+)
+
+# Live admin metrics: one shared watcher thread feeds every open dashboard
+app.config['METRICS_POLL_INTERVAL'] = 1.0  # seconds between data_version checks
+app.config['METRICS_KEEPALIVE'] = 15  # seconds between SSE keep-alive comments
+metrics_broadcaster = MetricsBroadcaster(
+    connect=lambda: db.connect(app.config['DATABASE']),
+    load_metrics=lambda conn: admin_metrics_payload(load_admin_metrics(conn.cursor())),
+    interval=app.config['METRICS_POLL_INTERVAL']
+)
+
+def render_resume_pdf_cached(resume_data):
+    """
+    Returns (BytesIO with the resume PDF, text sidecar), rendering it on the
+    pool only if it isn't cached yet.
+    """
+    key = resume_cache_key(resume_data, PDF_TEMPLATE_VERSION)
+    cached = pdf_cache.get(key)
+    if cached is None:
+        pdf_buffer, sidecar = pdf_render_pool.render(resume_data)
+        pdf_cache.put(key, pdf_buffer.getvalue(), sidecar)
+        return pdf_buffer, sidecar
+    pdf_bytes, sidecar = cached
+    return io.BytesIO(pdf_bytes), sidecar
+
+TEMPLATE_LABELS = {'classic': 'Classic Template', 'modern': 'Modern Template'}
+
+def resume_type_columns(resume_data):
+    """(template_type, user_type) as stored in their indexed generated_resumes columns."""
+    def normalize(value):
+        if value is None:
+            return None
+        return str(value).strip().lower() or None
+    return normalize(resume_data.get('template_type')), normalize(resume_data.get('user_type'))
+
+def store_resume_sidecar(cursor, resume_id, sidecar):
+    """Saves a resume's text sidecar on its generated_resumes row."""
+    cursor.execute(
+        'UPDATE generated_resumes SET resume_text = ?, resume_sections = ? WHERE id = ?',
+        (sidecar['text'], storage_codec.encode(sidecar['sections']), resume_id)
+    )
+
+def get_generated_resume_text(cursor, resume_id, resume_data, resume_text):
+    """
+    Returns the plain text of a generated resume, using the stored sidecar.
+    Rows saved before sidecars existed get one built from the resume's story
+    (no page layout, so nothing for the render pool) and stored on first use.
+    """
+    if resume_text:
+        return resume_text
+    sidecar = resume_sidecar(resume_data)
+    store_resume_sidecar(cursor, resume_id, sidecar)
+    return sidecar['text']
+
+def get_uploaded_resume_text(cursor, resume_id, filepath, resume_text):
+    """
+    Returns the text of an uploaded resume from its cached column, extracting
+    it from the file (and caching it) for rows uploaded before the cache.
+    """
+    if resume_text:
+        return resume_text
+    text = extract_text_from_resume(filepath)
+    if text:
+        cursor.execute('UPDATE uploaded_resumes SET resume_text = ? WHERE resume_id = ?', (text, resume_id))
+        near_duplicates.index_signature(cursor, resume_id, minhash_signature(text))
+    return text
+
+class _ZipChunkWriter:
+    """Write-only sink for zipfile that hands back whatever was written since the last drain."""
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def _write_export_entry(archive, name, key, job):
+    """Add one rendered (or cached) PDF to the export archive."""
+    if isinstance(job, tuple):
+        pdf_bytes, sidecar = job
+    else:
+        try:
+            pdf_bytes, sidecar = job.result(timeout=pdf_render_pool.timeout)
+        except FutureTimeoutError:
+            # A job that already started keeps its pool slot until it finishes
+            job.cancel()
+            logging.error(f"Skipping {name} in export: render exceeded {pdf_render_pool.timeout}s timeout")
+            return
+        except Exception as e:
+            logging.error(f"Skipping {name} in export: {e}")
+            return
+        pdf_cache.put(key, pdf_bytes, sidecar)
+    archive.writestr(name, pdf_bytes)
+
+def iter_resume_export_zip(force=False):
+    """
+    Yields a ZIP archive of every generated resume, chunk by chunk.
+    Uncached resumes are rendered in parallel on the render pool with at most
+    one job per worker in flight, so memory stays constant and interactive
+    requests keep their queue slots. ``force`` re-renders cached PDFs too.
+    """
+    sink = _ZipChunkWriter()
+    window = deque()
+    conn = db.connect(app.config['DATABASE'])
+    try:
+        with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            rows = conn.execute('SELECT id, user_id, resume_data FROM generated_resumes ORDER BY id')
+            for resume_id, user_id, resume_json in rows:
+                try:
+                    resume_data = storage_codec.decode(resume_json)
+                except (TypeError, ValueError):
+                    logging.error(f"Skipping resume {resume_id} in export: invalid resume data")
+                    continue
+                key = resume_cache_key(resume_data, PDF_TEMPLATE_VERSION)
+                job = None if force else pdf_cache.get(key)
+                if job is None:
+                    job = pdf_render_pool.submit(render_resume_pdf, resume_data, block=True)
+                window.append((f'resume_{resume_id}_user_{user_id}.pdf', key, job))
+                if len(window) >= pdf_render_pool.workers:
+                    _write_export_entry(archive, *window.popleft())
+                    yield sink.drain()
+            while window:
+                _write_export_entry(archive, *window.popleft())
+                yield sink.drain()
+        # central directory is written when the archive closes
+        yield sink.drain()
+    finally:
+        conn.close()
+
+@app.cli.command('export-resumes')
+@click.option('--output', '-o', default='resumes_export.zip', show_default=True, help='Path of the ZIP file to write.')
+@click.option('--force', is_flag=True, help='Re-render every PDF instead of reusing cached ones.')
+def export_resumes_command(output, force):
+    """Render every generated resume into a single ZIP archive."""
+    with open(output, 'wb') as f:
+        for chunk in iter_resume_export_zip(force=force):
+            f.write(chunk)
+    pdf_render_pool.shutdown()
+    click.echo(f"Exported resumes to {output}")
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create the tables and apply pending migrations (run once per deploy)."""
+    init_db()
+    click.echo(f"Database {app.config['DATABASE']} is up to date")
+
+@app.cli.command('rescore-resumes')
+@click.option('--workers', type=int, default=max(1, (os.cpu_count() or 1) // 2), show_default=True,
+              help='Worker processes (run at lower CPU priority).')
+@click.option('--chunk-size', type=int, default=BACKFILL_CHUNK_SIZE, show_default=True, help='Resumes committed per transaction.')
+@click.option('--duty-cycle', type=click.FloatRange(0.05, 1.0), default=BACKFILL_DUTY_CYCLE, show_default=True,
+              help='Share of time spent working; the job sleeps for the rest between chunks.')
+def rescore_resumes_command(workers, chunk_size, duty_cycle):
+    """Re-score stored resumes whose analysis predates the current analysis rules (resumable)."""
+    conn = db.connect(app.config['DATABASE'])
+    try:
+        results = backfill_analyses(conn, workers=workers, chunk_size=chunk_size, duty_cycle=duty_cycle)
+    finally:
+        conn.close()
+    for source, count in results.items():
+        click.echo(f"{source}: re-scored {count} resumes")
+
+app.config['EVENT_RETENTION_DAYS'] = 180
+app.config['EVENT_ARCHIVE_FOLDER'] = None  # e.g. 'archive' to keep purged events as .jsonl.gz
+
+@app.cli.command('purge-events')
+@click.option('--days', type=int, default=None, help='Keep this many days of raw events [default: EVENT_RETENTION_DAYS].')
+@click.option('--archive-dir', default=None, help='Write purged rows here as .jsonl.gz [default: EVENT_ARCHIVE_FOLDER].')
+@click.option('--chunk-size', type=int, default=RETENTION_CHUNK_SIZE, show_default=True, help='Rows deleted per transaction.')
+def purge_events_command(days, archive_dir, chunk_size):
+    """Delete old login/download events (their daily rollups are kept) and reclaim the space."""
+    days = app.config['EVENT_RETENTION_DAYS'] if days is None else days
+    archive_dir = archive_dir or app.config['EVENT_ARCHIVE_FOLDER']
+    audit_writer.flush()
+    conn = db.connect(app.config['DATABASE'])
+    try:
+        results = run_retention(conn, days, chunk_size=chunk_size, archive_dir=archive_dir)
+    finally:
+        conn.close()
+    for table, deleted in results.items():
+        click.echo(f"{table}: purged {deleted} rows older than {days} days")
+
+@app.cli.command('enable-incremental-vacuum')
+def enable_incremental_vacuum_command():
+    """One-off: rebuild the database with incremental auto_vacuum (blocks writers while it runs)."""
+    conn = db.connect(app.config['DATABASE'])
+    try:
+        converted = enable_incremental_vacuum(conn)
+    finally:
+        conn.close()
+    click.echo("Converted to incremental auto_vacuum" if converted else "Already using incremental auto_vacuum")
+
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 # i18n configuration
@@ -2132,15 +411,29 @@ app.config['BABEL_DEFAULT_LOCALE'] = 'en'
 app.config['BABEL_DEFAULT_TIMEZONE'] = 'UTC'
 app.config['BABEL_TRANSLATION_DIRECTORIES'] = 'translations'
 SUPPORTED_LANGUAGES = {'en': 'English'}
-babel = Babel()
+babel = None  # set up by init_babel(); only template rendering needs it
+_babel_lock = threading.Lock()
 
 def select_locale() -> str:
     return session.get('lang', 'en')
 
-babel.init_app(app, locale_selector=select_locale)
+def init_babel():
+    """Sets up Flask-Babel and exposes gettext and get_locale to Jinja (once)."""
+    global babel
+    with _babel_lock:
+        if babel is None:
+            from flask_babel import Babel, gettext, get_locale
+            instance = Babel(app, locale_selector=select_locale)
+            # after init_app, which installs Jinja's own `_`
+            app.jinja_env.globals.update(_=gettext, get_locale=get_locale)
+            babel = instance
+
+@app.before_request
+def ensure_babel():
+    if babel is None:
+        init_babel()
 
-# Expose gettext and get_locale to Jinja
-app.jinja_env.globals.update(_=gettext, get_locale=get_locale, SUPPORTED_LANGUAGES=SUPPORTED_LANGUAGES)
+app.jinja_env.globals.update(SUPPORTED_LANGUAGES=SUPPORTED_LANGUAGES)
 
 SECURITY_QUESTIONS = [
     "What is your favorite color?",
@@ -2181,11 +474,10 @@ def login():
     if request.method == 'POST':
         email = request.form['email']
         password = request.form['password']
-        conn = sqlite3.connect('rezumai.db')
+        conn = get_db()
         cursor = conn.cursor()
         cursor.execute('SELECT id, name, password_hash, is_admin FROM users WHERE email = ?', (email,))
         user = cursor.fetchone()
-        conn.close()
         if user and check_password_hash(user[2], password):
             session['user_id'] = user[0]
             session['user_email'] = email
@@ -2232,7 +524,7 @@ def register():
         if not security_answer or len(security_answer) < 2:
             flash('Please provide a valid security answer.', 'danger')
             return render_template('register.html', security_questions=SECURITY_QUESTIONS)
-        conn = sqlite3.connect('rezumai.db')
+        conn = get_db()
         cursor = conn.cursor()
         
         password_hash = generate_password_hash(password)
@@ -2245,13 +537,11 @@ def register():
             ''', (email, name, password_hash, security_question, security_answer_hash))
             
             conn.commit()
-            conn.close()
             flash('Registration successful! Please login.', 'success')
             return redirect(url_for('login'))
             
-        except sqlite3.IntegrityError:
+        except db.IntegrityError:
             conn.rollback()
-            conn.close()
             flash('Email already registered! Please use a different email or log in.', 'danger')
             return render_template('register.html', security_questions=SECURITY_QUESTIONS)
             
@@ -2263,11 +553,10 @@ def forgot_password():
         step = request.form.get('step', '1')
         if step == '1':
             email = request.form['email']
-            conn = sqlite3.connect('rezumai.db')
+            conn = get_db()
             cursor = conn.cursor()
             cursor.execute('SELECT email, security_question FROM users WHERE email = ?', (email,))
             user = cursor.fetchone()
-            conn.close()
             if user:
                 session['reset_email'] = email
                 return render_template('forgot_password.html', step=2, security_question=user[1], email=email)
@@ -2276,11 +565,10 @@ def forgot_password():
         elif step == '2':
             email = session.get('reset_email')
             security_answer = request.form['security_answer']
-            conn = sqlite3.connect('rezumai.db')
+            conn = get_db()
             cursor = conn.cursor()
             cursor.execute('SELECT security_answer_hash FROM users WHERE email = ?', (email,))
             user = cursor.fetchone()
-            conn.close()
             if user and check_password_hash(user[0], security_answer.lower()):
                 return render_template('forgot_password.html', step=3, email=email)
             else:
@@ -2293,12 +581,11 @@ def forgot_password():
             if new_password != confirm_password:
                 flash('Passwords do not match!', 'danger')
                 return render_template('forgot_password.html', step=3, email=email)
-            conn = sqlite3.connect('rezumai.db')
+            conn = get_db()
             cursor = conn.cursor()
             new_password_hash = generate_password_hash(new_password)
             cursor.execute('UPDATE users SET password_hash = ? WHERE email = ?', (new_password_hash, email))
             conn.commit()
-            conn.close()
             session.pop('reset_email', None)
             flash('Password updated successfully! Please login.', 'success')
             return redirect(url_for('login'))
@@ -2321,21 +608,25 @@ def save_resume():
                 return jsonify({'success': False, 'message': 'Invalid data format. Please send JSON data.'})
         
         # Save to database
-        conn = get_db_connection()
+        conn = get_db()
         cursor = conn.cursor()
         
         # Insert or update resume
-        cursor.execute('''
-            INSERT INTO generated_resumes (user_id, resume_data)
-            VALUES (?, ?)
-            ON CONFLICT(id) DO UPDATE SET 
-                resume_data = excluded.resume_data,
-                updated_at = CURRENT_TIMESTAMP
-        ''', (session['user_id'], json.dumps(resume_data)))
+        dialect = conn.dialect
+        cursor.execute(dialect.upsert(
+            'generated_resumes',
+            ['user_id', 'resume_data', 'template_type', 'user_type'],
+            key=['id'],
+            update={
+                'resume_data': dialect.excluded('resume_data'),
+                'template_type': dialect.excluded('template_type'),
+                'user_type': dialect.excluded('user_type'),
+                'updated_at': 'CURRENT_TIMESTAMP'
+            }
+        ), (session['user_id'], storage_codec.encode(resume_data), *resume_type_columns(resume_data)))
         
         resume_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'resume_id': resume_id, 'message': 'Resume saved successfully!'})
     except Exception as e:
@@ -2358,21 +649,28 @@ def generate_resume_pdf():
                 return jsonify({'success': False, 'message': 'Invalid data format. Please send JSON data.'})
         
         # Generate PDF
-        pdf_buffer = generate_ats_pdf(resume_data)
+        try:
+            pdf_buffer, sidecar = render_resume_pdf_cached(resume_data)
+        except RenderPoolBusy as e:
+            response = jsonify({'success': False, 'message': str(e)})
+            response.headers['Retry-After'] = str(e.retry_after)
+            return response, 503
+        except RenderTimeout as e:
+            return jsonify({'success': False, 'message': str(e)}), 504
         
         # Save to database
-        conn = get_db_connection()
+        conn = get_db()
         cursor = conn.cursor()
         
-        # Insert resume data
+        # Insert resume data along with its text sidecar
         cursor.execute('''
-            INSERT INTO generated_resumes (user_id, resume_data)
-            VALUES (?, ?)
-        ''', (session['user_id'], json.dumps(resume_data)))
+            INSERT INTO generated_resumes (user_id, resume_data, template_type, user_type, resume_text, resume_sections)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (session['user_id'], storage_codec.encode(resume_data), *resume_type_columns(resume_data),
+              sidecar['text'], storage_codec.encode(sidecar['sections'])))
         
         resume_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
         # Return PDF
         pdf_buffer.seek(0)
@@ -2393,25 +691,33 @@ def download_resume_pdf(resume_id):
     
     try:
         # Get resume data from database
-        conn = get_db_connection()
+        conn = get_db()
         cursor = conn.cursor()
         
         cursor.execute('''
-            SELECT resume_data FROM generated_resumes 
+            SELECT resume_data, resume_text FROM generated_resumes 
             WHERE id = ? AND user_id = ?
         ''', (resume_id, session['user_id']))
         
         result = cursor.fetchone()
-        conn.close()
         
         if not result:
             flash('Resume not found.', 'danger')
             return redirect(url_for('dashboard'))
         
-        resume_data = json.loads(result['resume_data'])
+        resume_data = storage_codec.decode(result['resume_data'])
         
         # Generate PDF
-        pdf_buffer = generate_ats_pdf(resume_data)
+        try:
+            pdf_buffer, sidecar = render_resume_pdf_cached(resume_data)
+        except (RenderPoolBusy, RenderTimeout) as e:
+            flash(str(e), 'warning')
+            return redirect(url_for('dashboard'))
+        
+        # Backfill the sidecar for resumes saved before it existed
+        if not result['resume_text']:
+            store_resume_sidecar(cursor, resume_id, sidecar)
+            conn.commit()
         
         # Log download with error handling
         try:
@@ -2445,54 +751,44 @@ def chat():
     
     # Get user's latest resume analysis for context
     user_id = session['user_id']
-    conn = sqlite3.connect('rezumai.db')
+    conn = get_db()
     cursor = conn.cursor()
     
     # Get latest uploaded resume analysis
-    cursor.execute('SELECT filepath, uploaded_at FROM uploaded_resumes WHERE user_id = ? ORDER BY uploaded_at DESC LIMIT 1', (user_id,))
+    cursor.execute('SELECT resume_id, filepath, uploaded_at, resume_text FROM uploaded_resumes WHERE user_id = ? ORDER BY uploaded_at DESC LIMIT 1', (user_id,))
     last_resume = cursor.fetchone()
     
     # Also check for generated resumes if no uploaded resume
-    cursor.execute('SELECT id, resume_data, created_at FROM generated_resumes WHERE user_id = ? ORDER BY created_at DESC LIMIT 1', (user_id,))
+    cursor.execute('SELECT id, resume_data, created_at, resume_text FROM generated_resumes WHERE user_id = ? ORDER BY created_at DESC LIMIT 1', (user_id,))
     generated_resume = cursor.fetchone()
     
     context = ""
     if last_resume:
-        text = extract_text_from_resume(last_resume[0])
-        if text:
-            keywords = extract_keywords(text)
-            analysis = comprehensive_ats_analysis(text, keywords)
+        # Stored analysis, recomputed only when the analysis rules have changed
+        resume_id, filepath, _, resume_text = last_resume
+        analysis = analysis_store.current_analysis(
+            cursor, analysis_store.UPLOADED, resume_id,
+            lambda: get_uploaded_resume_text(cursor, resume_id, filepath, resume_text)
+        )['analysis']
+        conn.commit()
+        if analysis:
             context = f"User's resume analysis: ATS score of {analysis['ats_score']}. Top job matches: {', '.join([match['role'] for match in analysis['job_matches'][:3]])}"
     elif generated_resume:
         # Analyze generated resume
         try:
-            resume_data = json.loads(generated_resume[1])
-            # Generate a temporary PDF for analysis
-            pdf_buffer = generate_ats_pdf(resume_data)
-            pdf_buffer.seek(0)
-            
-            # Save temporarily to extract text
-            import tempfile
-            import os
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                tmp_file.write(pdf_buffer.getvalue())
-                tmp_filepath = tmp_file.name
-            
-            # Extract text from the generated PDF
-            text = extract_text_from_resume(tmp_filepath)
-            
-            # Clean up temporary file
-            os.unlink(tmp_filepath)
+            # Use the text sidecar stored with the resume instead of parsing its PDF
+            analysis = analysis_store.current_analysis(
+                cursor, analysis_store.GENERATED, generated_resume[0],
+                lambda: get_generated_resume_text(cursor, generated_resume[0], storage_codec.decode(generated_resume[1]), generated_resume[3])
+            )['analysis']
+            conn.commit()
             
-            if text:
-                keywords = extract_keywords(text)
-                analysis = comprehensive_ats_analysis(text, keywords)
+            if analysis:
                 context = f"User's resume analysis: ATS score of {analysis['ats_score']}. Top job matches: {', '.join([match['role'] for match in analysis['job_matches'][:3]])}"
         except Exception as e:
             print(f"Error analyzing generated resume: {e}")
             pass
     
-    conn.close()
     
     # Generate AI response based on message and context
     response = generate_ai_response(message, context)
@@ -2500,44 +796,127 @@ def chat():
     return jsonify({'success': True, 'response': response})
 
 
+def load_user_resume(cursor, user_id, resume_id=None):
+    """
+    ``(source, id, text)`` of one of the user's uploaded resumes, by default
+    the latest one, falling back to the latest generated resume; None if
+    there is no such resume.
+    """
+    if resume_id is not None:
+        cursor.execute('SELECT resume_id, filepath, resume_text FROM uploaded_resumes WHERE resume_id = ? AND user_id = ?',
+                       (resume_id, user_id))
+    else:
+        cursor.execute('SELECT resume_id, filepath, resume_text FROM uploaded_resumes WHERE user_id = ? ORDER BY uploaded_at DESC LIMIT 1',
+                       (user_id,))
+    uploaded = cursor.fetchone()
+    if uploaded:
+        return analysis_store.UPLOADED, uploaded[0], get_uploaded_resume_text(cursor, uploaded[0], uploaded[1], uploaded[2])
+    if resume_id is not None:
+        return None
+    cursor.execute('SELECT id, resume_data, resume_text FROM generated_resumes WHERE user_id = ? ORDER BY created_at DESC LIMIT 1',
+                   (user_id,))
+    generated = cursor.fetchone()
+    if generated:
+        return analysis_store.GENERATED, generated[0], get_generated_resume_text(
+            cursor, generated[0], storage_codec.decode(generated[1]), generated[2])
+    return None
+
+
+@app.route('/tailored_score', methods=['POST'])
+def tailored_ats_score():
+    """
+    Scores the user's resume against a job description:
+    {"job_description": ..., "resume_id": optional uploaded resume, else the latest one}
+    """
+    if 'user_id' not in session:
+        return jsonify({'success': False, 'message': 'Please log in first'}), 401
+
+    data = request.get_json(silent=True) or {}
+    job_description = str(data.get('job_description') or '').strip()
+    if not job_description:
+        return jsonify({'success': False, 'message': 'Please provide a job description'}), 400
+
+    conn = get_db()
+    cursor = conn.cursor()
+    resume = load_user_resume(cursor, session['user_id'], data.get('resume_id'))
+    if resume is None:
+        return jsonify({'success': False, 'message': 'Resume not found'}), 404
+    source, resume_id, text = resume
+    if not text:
+        return jsonify({'success': False, 'message': 'Could not read any text from this resume'}), 400
+
+    result = analysis_store.current_analysis(cursor, source, resume_id, lambda: text)
+    conn.commit()
+    score = tailored_score(text, result['skills'], jd_vector(job_description), result['content_score'])
+    return jsonify({'success': True, 'resume': {'source': source, 'id': resume_id},
+                    'jd_key': jd_key(job_description), **score})
+
+
+@app.route('/jobs/matches')
+def job_matches():
+    """Every catalogue job sharing a skill with the user's resume, best match first: ?page=&per_page=&resume_id="""
+    if 'user_id' not in session:
+        return jsonify({'success': False, 'message': 'Please log in first'}), 401
+
+    conn = get_db()
+    cursor = conn.cursor()
+    resume = load_user_resume(cursor, session['user_id'], request.args.get('resume_id', type=int))
+    if resume is None:
+        return jsonify({'success': False, 'message': 'Resume not found'}), 404
+    source, resume_id, text = resume
+    # The stored skill bitset spares decoding the whole stored analysis
+    skill_bits = analysis_store.load_skill_bits(cursor, source, resume_id)
+    if skill_bits is None:
+        skills = analysis_store.current_analysis(cursor, source, resume_id, lambda: text)['skills']
+        conn.commit()
+        skill_bits = skill_ids().bits(skills)
+    skills = skill_ids().decode(skill_taxonomy().expand(skill_bits))
+
+    ranked = job_matrix().ranked(skills, page=request.args.get('page', 1, type=int),
+                                 per_page=request.args.get('per_page', JOB_PAGE_SIZE, type=int))
+    return jsonify({'success': True, 'resume': {'source': source, 'id': resume_id}, **ranked})
+
+
 @app.route('/dashboard')
 def dashboard():
     if 'user_id' not in session or session.get('is_admin'):
         return redirect(url_for('login'))
 
     user_id = session['user_id']
-    conn = sqlite3.connect('rezumai.db')
+    conn = get_db()
     cursor = conn.cursor()
 
     cursor.execute('SELECT rating, suggestion, admin_reply, created_at, replied_at FROM feedback WHERE user_id = ? ORDER BY created_at DESC', (user_id,))
     user_feedback = cursor.fetchall()
     
-    cursor.execute('SELECT filepath, uploaded_at FROM uploaded_resumes WHERE user_id = ? ORDER BY uploaded_at DESC LIMIT 1', (user_id,))
+    cursor.execute('SELECT resume_id, filepath, uploaded_at, resume_text FROM uploaded_resumes WHERE user_id = ? ORDER BY uploaded_at DESC LIMIT 1', (user_id,))
     last_resume = cursor.fetchone()
 
     # Get latest generated resume data
-    cursor.execute('SELECT id, resume_data, created_at FROM generated_resumes WHERE user_id = ? ORDER BY created_at DESC LIMIT 1', (user_id,))
+    cursor.execute('SELECT id, resume_data, created_at, resume_text FROM generated_resumes WHERE user_id = ? ORDER BY created_at DESC LIMIT 1', (user_id,))
     latest_resume = cursor.fetchone()
     
     generated_resume_data = None
     if latest_resume:
-        resume_id, resume_json, created_at = latest_resume
+        resume_id, resume_json, created_at, resume_text = latest_resume
         generated_resume_data = {
             'id': resume_id,
-            'data': json.loads(resume_json),
+            'data': storage_codec.decode(resume_json),
             'created_at': created_at
         }
 
     last_analysis = None
     if last_resume:
-        filepath = last_resume[0]
-        uploaded_at = last_resume[1]
-        text = extract_text_from_resume(filepath)
-        if text:  # Only analyze if text extraction was successful
-            keywords = extract_keywords(text)
-            
-            # Use comprehensive ATS analysis
-            comprehensive_analysis = comprehensive_ats_analysis(text, keywords)
+        upload_id, filepath, uploaded_at, upload_text = last_resume
+        # Stored comprehensive ATS analysis, recomputed only when the analysis rules have changed
+        stored = analysis_store.current_analysis(
+            cursor, analysis_store.UPLOADED, upload_id,
+            lambda: get_uploaded_resume_text(cursor, upload_id, filepath, upload_text)
+        )
+        conn.commit()
+        if stored['analysis']:  # Only analyze if text extraction was successful
+            keywords = stored['keywords']
+            comprehensive_analysis = stored['analysis']
             
             # Get jobs for top predicted roles
             top_roles = [match['role'] for match in comprehensive_analysis['job_matches'][:3]]
@@ -2568,28 +947,16 @@ def dashboard():
     elif generated_resume_data:  # If no uploaded resume, but there's a generated one
         # Analyze the generated resume data
         try:
-            # Generate a temporary PDF for analysis
-            pdf_buffer = generate_ats_pdf(generated_resume_data['data'])
-            pdf_buffer.seek(0)
-            
-            # Save temporarily to extract text
-            import tempfile
-            import os
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                tmp_file.write(pdf_buffer.getvalue())
-                tmp_filepath = tmp_file.name
-            
-            # Extract text from the generated PDF
-            text = extract_text_from_resume(tmp_filepath)
-            
-            # Clean up temporary file
-            os.unlink(tmp_filepath)
+            # Stored analysis of the text sidecar saved with the resume (no PDF parsing)
+            stored = analysis_store.current_analysis(
+                cursor, analysis_store.GENERATED, generated_resume_data['id'],
+                lambda: get_generated_resume_text(cursor, generated_resume_data['id'], generated_resume_data['data'], resume_text)
+            )
+            conn.commit()
             
-            if text:  # Only analyze if text extraction was successful
-                keywords = extract_keywords(text)
-                
-                # Use comprehensive ATS analysis
-                comprehensive_analysis = comprehensive_ats_analysis(text, keywords)
+            if stored['analysis']:  # Only analyze if text extraction was successful
+                keywords = stored['keywords']
+                comprehensive_analysis = stored['analysis']
                 
                 # Get jobs for top predicted roles
                 top_roles = [match['role'] for match in comprehensive_analysis['job_matches'][:3]]
@@ -2621,7 +988,6 @@ def dashboard():
             print(f"Error analyzing generated resume: {e}")
             pass  # Continue without analysis if there's an error
 
-    conn.close()
 
     return render_template(
         'dashboard.html',
@@ -2630,270 +996,445 @@ def dashboard():
         generated_resume=generated_resume_data
     )
 
+ADMIN_CHART_DAYS = 30
+
+def load_admin_metrics(cursor):
+    """
+    Reads the admin KPIs and chart series from the rollup tables that triggers
+    keep up to date (migration v003), so the cost depends on the number of
+    days shown, not on how many rows the raw tables hold.
+    """
+    cursor.execute('SELECT metric, value FROM metric_totals')
+    totals = {row[0]: row[1] for row in cursor.fetchall()}
+    
+    series = {'logins': ([], []), 'uploads': ([], []), 'downloads': ([], [])}
+    cursor.execute(f"""
+        SELECT metric, day, value FROM metric_daily
+        WHERE metric IN ('logins', 'uploads', 'downloads')
+          AND day >= {cursor.connection.dialect.days_ago(ADMIN_CHART_DAYS)} AND value > 0
+        ORDER BY metric, day
+    """)
+    for metric, day, value in cursor.fetchall():
+        series[metric][0].append(day)
+        series[metric][1].append(value)
+    
+    total_feedback = totals.get('feedback', 0)
+    ratings = [(rating, totals.get(f'rating_{rating}', 0)) for rating in range(1, 6)]
+    ratings = [(rating, count) for rating, count in ratings if count > 0]
+    
+    return {
+        'total_users': totals.get('users', 0),
+        'total_uploads': totals.get('uploads', 0),
+        'total_generated_resumes': totals.get('generated_resumes', 0),
+        'total_downloads': totals.get('downloads', 0),
+        'total_feedback': total_feedback,
+        'replied_feedback': totals.get('feedback_replied', 0),
+        'avg_rating': totals.get('rating_sum', 0) / total_feedback if total_feedback else 0,
+        'login_labels': series['logins'][0],
+        'login_counts': series['logins'][1],
+        'upload_labels': series['uploads'][0],
+        'upload_counts': series['uploads'][1],
+        'download_labels': series['downloads'][0],
+        'download_counts': series['downloads'][1],
+        'rating_labels': [f"{rating} Stars" for rating, _ in ratings],
+        'rating_counts': [count for _, count in ratings]
+    }
+
+def admin_metrics_payload(metrics):
+    """Shape shared by /admin_metrics and the live stream."""
+    return {
+        'kpis': {
+            'total_users': metrics['total_users'],
+            'total_uploads': metrics['total_uploads'],
+            'total_generated_resumes': metrics['total_generated_resumes'],
+            'avg_rating': round(metrics['avg_rating'], 2),
+            'total_downloads': metrics['total_downloads']
+        },
+        'login_labels': metrics['login_labels'],
+        'login_counts': metrics['login_counts'],
+        'upload_labels': metrics['upload_labels'],
+        'upload_counts': metrics['upload_counts'],
+        'rating_labels': metrics['rating_labels'],
+        'rating_counts': metrics['rating_counts'],
+        'download_labels': metrics['download_labels'],
+        'download_counts': metrics['download_counts']
+    }
+
 @app.route('/admin')
 def admin_dashboard():
     if 'user_id' not in session or not session.get('is_admin'):
         return redirect(url_for('login'))
     
-    conn = sqlite3.connect('rezumai.db')
+    conn = get_db()
     cursor = conn.cursor()
     
-    # Enhanced KPIs with more detailed metrics
-    cursor.execute('SELECT COUNT(*) FROM users WHERE is_admin = FALSE')
-    total_users = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM uploaded_resumes')
-    total_uploads = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM generated_resumes')
-    total_generated_resumes = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM resume_downloads')
-    total_downloads = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT AVG(CAST(rating AS FLOAT)) FROM feedback')
-    avg_rating_result = cursor.fetchone()[0]
-    avg_rating = round(avg_rating_result, 1) if avg_rating_result else 0
-    
-    cursor.execute('SELECT COUNT(*) FROM feedback')
-    total_feedback = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM feedback WHERE admin_reply IS NOT NULL')
-    replied_feedback = cursor.fetchone()[0]
-    
-    # Enhanced queries for recent activity tables with more details
-    cursor.execute('''
-        SELECT u.email, u.name, l.login_time FROM logins l 
-        JOIN users u ON l.user_id = u.id
-        ORDER BY l.login_time DESC LIMIT 15
-    ''')
-    recent_logins = cursor.fetchall()
-    
-    cursor.execute('''
-        SELECT r.filename, u.email, r.uploaded_at 
-        FROM uploaded_resumes r 
-        JOIN users u ON r.user_id = u.id 
-        ORDER BY r.uploaded_at DESC LIMIT 15
-    ''')
-    recent_uploads = cursor.fetchall()
-    
-    cursor.execute('''
-        SELECT f.id, u.name, f.rating, f.suggestion, f.admin_reply, f.created_at 
-        FROM feedback f 
-        JOIN users u ON f.user_id = u.id
-        ORDER BY f.created_at DESC
-    ''')
-    all_feedback = cursor.fetchall()
-
-    # --- Enhanced Queries for chart data with better time ranges ---
+    # KPIs and chart series come from the rollup tables (see load_admin_metrics)
+    metrics = load_admin_metrics(cursor)
     
-    # Last 30 days of logins
-    cursor.execute("""
-        SELECT DATE(login_time) as login_date, COUNT(*) 
-        FROM logins 
-        WHERE login_time >= date('now', '-30 days')
-        GROUP BY DATE(login_time) 
-        ORDER BY login_date
-    """)
-    daily_logins_data = cursor.fetchall()
-    login_labels = [row[0] for row in daily_logins_data]
-    login_counts = [row[1] for row in daily_logins_data]
-
-    # Last 30 days of uploads
-    cursor.execute("""
-        SELECT DATE(uploaded_at) as upload_date, COUNT(*) 
-        FROM uploaded_resumes 
-        WHERE uploaded_at >= date('now', '-30 days')
-        GROUP BY DATE(uploaded_at) 
-        ORDER BY upload_date
-    """)
-    daily_uploads_data = cursor.fetchall()
-    upload_labels = [row[0] for row in daily_uploads_data]
-    upload_counts = [row[1] for row in daily_uploads_data]
+    # Only the first page of each table; the rest is fetched from the paginated endpoints
+    recent_logins, _ = load_activity_page(cursor, 'logins', limit=15)
+    recent_uploads, _ = load_activity_page(cursor, 'uploads', limit=15)
+    all_feedback, feedback_next_cursor = load_feedback_page(cursor)
 
-    # Feedback distribution
-    cursor.execute("SELECT rating, COUNT(*) FROM feedback GROUP BY rating ORDER BY rating")
-    feedback_ratings_data = cursor.fetchall()
-    rating_labels = [f"{row[0]} Stars" for row in feedback_ratings_data]
-    rating_counts = [row[1] for row in feedback_ratings_data]
-
-    # Last 30 days of downloads
-    cursor.execute("""
-        SELECT DATE(downloaded_at) as download_date, COUNT(*) 
-        FROM resume_downloads 
-        WHERE downloaded_at >= date('now', '-30 days')
-        GROUP BY DATE(downloaded_at) 
-        ORDER BY download_date
-    """)
-    daily_downloads_data = cursor.fetchall()
-    download_labels = [row[0] for row in daily_downloads_data]
-    download_counts = [row[1] for row in daily_downloads_data]
-    
-    # Additional analytics for better insights
     # User engagement metrics
-    cursor.execute("""
-        SELECT COUNT(DISTINCT user_id) as active_users 
-        FROM logins 
-        WHERE login_time >= date('now', '-7 days')
+    cursor.execute(f"""
+        SELECT COUNT(DISTINCT user_id) FROM daily_active_users
+        WHERE day >= {conn.dialect.days_ago(7)}
     """)
     weekly_active_users = cursor.fetchone()[0] or 0
     
-    cursor.execute("""
-        SELECT COUNT(DISTINCT user_id) as monthly_active_users 
-        FROM logins 
-        WHERE login_time >= date('now', '-30 days')
+    cursor.execute(f"""
+        SELECT COUNT(DISTINCT user_id) FROM daily_active_users
+        WHERE day >= {conn.dialect.days_ago(30)}
     """)
     monthly_active_users = cursor.fetchone()[0] or 0
     
-    # Resume quality metrics
-    cursor.execute("""
-        SELECT COUNT(*) as high_quality_resumes
-        FROM uploaded_resumes ur
-        JOIN users u ON ur.user_id = u.id
-        WHERE ur.filepath IS NOT NULL
-    """)
-    high_quality_resumes = cursor.fetchone()[0] or 0
+    # Resume quality metrics: filepath is NOT NULL, so every upload counts (also any whose user is gone)
+    high_quality_resumes = metrics['total_uploads']
     
     # Top users by resume downloads
     cursor.execute("""
-        SELECT u.name, COUNT(rd.id) as download_count
-        FROM resume_downloads rd
-        JOIN generated_resumes gr ON rd.resume_id = gr.id
-        JOIN users u ON gr.user_id = u.id
-        GROUP BY u.id, u.name
-        ORDER BY download_count DESC
+        SELECT u.name, t.downloads as download_count
+        FROM user_download_totals t
+        JOIN users u ON t.user_id = u.id
+        ORDER BY t.downloads DESC
         LIMIT 5
     """)
     top_users_by_downloads = cursor.fetchall()
     
-    # Resume template usage
+    # Resume template usage (answered from idx_generated_resumes_template)
     cursor.execute("""
-        SELECT 
-            CASE 
-                WHEN resume_data LIKE '%Modern%' THEN 'Modern Template'
-                WHEN resume_data LIKE '%Classic%' THEN 'Classic Template'
-                ELSE 'Other/Custom'
-            END as template_type,
-            COUNT(*) as count
+        SELECT template_type, COUNT(*) as count
         FROM generated_resumes
         GROUP BY template_type
-        ORDER BY count DESC
     """)
-    template_usage = cursor.fetchall()
+    usage = Counter()
+    for template_type, count in cursor.fetchall():
+        usage[TEMPLATE_LABELS.get(template_type, 'Other/Custom')] += count
+    template_usage = usage.most_common()
 
-    conn.close()
 
     return render_template('admin_dashboard.html',
-                           total_users=total_users,
-                           total_uploads=total_uploads,
-                           total_generated_resumes=total_generated_resumes,
-                           avg_rating=avg_rating,
-                           total_downloads=total_downloads,
-                           total_feedback=total_feedback,
-                           replied_feedback=replied_feedback,
+                           total_users=metrics['total_users'],
+                           total_uploads=metrics['total_uploads'],
+                           total_generated_resumes=metrics['total_generated_resumes'],
+                           avg_rating=round(metrics['avg_rating'], 1),
+                           total_downloads=metrics['total_downloads'],
+                           total_feedback=metrics['total_feedback'],
+                           replied_feedback=metrics['replied_feedback'],
                            recent_logins=recent_logins,
                            recent_uploads=recent_uploads,
                            all_feedback=all_feedback,
-                           login_labels=json.dumps(login_labels),
-                           login_counts=json.dumps(login_counts),
-                           upload_labels=json.dumps(upload_labels),
-                           upload_counts=json.dumps(upload_counts),
-                           rating_labels=json.dumps(rating_labels),
-                           rating_counts=json.dumps(rating_counts),
-                           download_labels=json.dumps(download_labels),
-                           download_counts=json.dumps(download_counts),
+                           feedback_next_cursor=feedback_next_cursor,
+                           login_labels=json.dumps(metrics['login_labels']),
+                           login_counts=json.dumps(metrics['login_counts']),
+                           upload_labels=json.dumps(metrics['upload_labels']),
+                           upload_counts=json.dumps(metrics['upload_counts']),
+                           rating_labels=json.dumps(metrics['rating_labels']),
+                           rating_counts=json.dumps(metrics['rating_counts']),
+                           download_labels=json.dumps(metrics['download_labels']),
+                           download_counts=json.dumps(metrics['download_counts']),
                            weekly_active_users=weekly_active_users,
                            monthly_active_users=monthly_active_users,
                            high_quality_resumes=high_quality_resumes,
                            top_users_by_downloads=top_users_by_downloads,
                            template_usage=template_usage)
 
+ADMIN_PAGE_SIZE = 20
+ADMIN_MAX_PAGE_SIZE = 100
+
+def encode_page_cursor(sort_value, row_id):
+    """
+    Opaque keyset cursor for the row a page ended on. The sort value (a
+    timestamp) is kept in the text form SQLite stores and compares it in,
+    which the server backends accept when it is bound back.
+    """
+    raw = json.dumps([db.sqlite_value(sort_value), row_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_page_cursor(token):
+    """Returns (sort_value, row_id) from a cursor, raising ValueError if it is malformed."""
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError('Invalid cursor') from e
+    if not isinstance(sort_value, str) or not isinstance(row_id, int):
+        raise ValueError('Invalid cursor')
+    return sort_value, row_id
+
+def _keyset_page(cursor, sql, where, params, sort_column, id_column, after, limit):
+    """
+    Runs one page of ``sql`` newest first. ``after`` is a decoded cursor;
+    rows strictly older than it are returned, so paging stays stable while
+    new rows arrive. Returns (rows, next_cursor or None).
+    """
+    where, params = list(where), list(params)
+    if after is not None:
+        where.append(f'({sort_column}, {id_column}) < (?, ?)')
+        params.extend(after)
+    if where:
+        sql += ' WHERE ' + ' AND '.join(where)
+    sql += f' ORDER BY {sort_column} DESC, {id_column} DESC LIMIT ?'
+    cursor.execute(sql, (*params, limit + 1))
+    rows = cursor.fetchall()
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], encode_page_cursor(last[sort_column.split('.')[-1]], last[id_column.split('.')[-1]])
+
+def load_feedback_page(cursor, rating=None, replied=None, after=None, limit=ADMIN_PAGE_SIZE):
+    """One page of feedback, newest first, optionally filtered by rating and replied status."""
+    where, params = [], []
+    if rating is not None:
+        where.append('f.rating = ?')
+        params.append(rating)
+    if replied is not None:
+        # same expression as idx_feedback_replied_created
+        where.append('(f.admin_reply IS NOT NULL) = ?')
+        params.append(bool(replied))  # a bool, not 0/1: PostgreSQL has no boolean = integer
+    return _keyset_page(cursor, '''
+        SELECT f.id, u.name, f.rating, f.suggestion, f.admin_reply, f.created_at
+        FROM feedback f
+        JOIN users u ON f.user_id = u.id
+    ''', where, params, 'f.created_at', 'f.id', after, limit)
+
+ACTIVITY_QUERIES = {
+    'logins': ('''
+        SELECT u.email, u.name, l.login_time, l.id FROM logins l
+        JOIN users u ON l.user_id = u.id
+    ''', 'l.login_time', 'l.id'),
+    'uploads': ('''
+        SELECT r.filename, u.email, r.uploaded_at, r.resume_id FROM uploaded_resumes r
+        JOIN users u ON r.user_id = u.id
+    ''', 'r.uploaded_at', 'r.resume_id'),
+}
+
+def load_activity_page(cursor, kind, after=None, limit=ADMIN_PAGE_SIZE):
+    """One page of recent logins or uploads, newest first."""
+    sql, sort_column, id_column = ACTIVITY_QUERIES[kind]
+    return _keyset_page(cursor, sql, [], [], sort_column, id_column, after, limit)
+
+def _page_args():
+    """Parses the shared ``cursor`` and ``limit`` query arguments."""
+    token = request.args.get('cursor')
+    after = decode_page_cursor(token) if token else None
+    limit = request.args.get('limit', ADMIN_PAGE_SIZE, type=int)
+    return after, min(max(limit, 1), ADMIN_MAX_PAGE_SIZE)
+
+@app.route('/admin/feedback')
+def admin_feedback_page():
+    """Keyset-paginated feedback: ?cursor=&limit=&rating=1..5&replied=true|false"""
+    if 'user_id' not in session or not session.get('is_admin'):
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 401
+
+    rating = request.args.get('rating') or None
+    if rating is not None:
+        if rating not in ('1', '2', '3', '4', '5'):
+            return jsonify({'success': False, 'message': 'rating must be an integer from 1 to 5'}), 400
+        rating = int(rating)
+    replied = request.args.get('replied')
+    if replied not in (None, '', 'true', 'false'):
+        return jsonify({'success': False, 'message': 'replied must be true or false'}), 400
+    try:
+        after, limit = _page_args()
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+
+    rows, next_cursor = load_feedback_page(
+        get_db().cursor(),
+        rating=rating,
+        replied=None if not replied else replied == 'true',
+        after=after,
+        limit=limit
+    )
+    return jsonify({'success': True, 'data': {
+        'items': [{
+            'id': row['id'],
+            'name': row['name'],
+            'rating': row['rating'],
+            'suggestion': row['suggestion'],
+            'admin_reply': row['admin_reply'],
+            'created_at': row['created_at']
+        } for row in rows],
+        'next_cursor': next_cursor
+    }})
+
+@app.route('/admin/activity/<kind>')
+def admin_activity_page(kind):
+    """Keyset-paginated recent logins or uploads: ?cursor=&limit="""
+    if 'user_id' not in session or not session.get('is_admin'):
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 401
+    if kind not in ACTIVITY_QUERIES:
+        return jsonify({'success': False, 'message': 'Unknown activity type'}), 404
+    try:
+        after, limit = _page_args()
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+
+    rows, next_cursor = load_activity_page(get_db().cursor(), kind, after=after, limit=limit)
+    if kind == 'logins':
+        items = [{'email': row['email'], 'name': row['name'], 'time': row['login_time']} for row in rows]
+    else:
+        items = [{'filename': row['filename'], 'email': row['email'], 'time': row['uploaded_at']} for row in rows]
+    return jsonify({'success': True, 'data': {'items': items, 'next_cursor': next_cursor}})
+
+@app.route('/admin/export_resumes')
+def export_resumes():
+    if 'user_id' not in session or not session.get('is_admin'):
+        return redirect(url_for('login'))
+
+    force = request.args.get('force') == '1'
+    filename = f"resumes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    return Response(
+        iter_resume_export_zip(force=force),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
 # Live metrics endpoint for admin dashboard auto-refresh
 @app.route('/admin_metrics')
 def admin_metrics():
     if 'user_id' not in session or not session.get('is_admin'):
         return jsonify({'success': False, 'message': 'Unauthorized'}), 401
 
-    conn = sqlite3.connect('rezumai.db')
+    conn = get_db()
     cursor = conn.cursor()
 
-    # Enhanced KPIs
-    cursor.execute('SELECT COUNT(*) FROM users WHERE is_admin = FALSE')
-    total_users = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM uploaded_resumes')
-    total_uploads = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM generated_resumes')
-    total_generated_resumes = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM resume_downloads')
-    total_downloads = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT AVG(CAST(rating AS FLOAT)) FROM feedback')
-    avg_rating_result = cursor.fetchone()[0]
-    avg_rating = round(avg_rating_result, 2) if avg_rating_result else 0
+    return jsonify({
+        'success': True,
+        'data': admin_metrics_payload(load_admin_metrics(cursor))
+    })
 
-    # Charts with last 30 days data
-    cursor.execute("""
-        SELECT DATE(login_time) as d, COUNT(*) 
-        FROM logins 
-        WHERE login_time >= date('now', '-30 days')
-        GROUP BY d 
-        ORDER BY d
-    """)
-    daily_logins_data = cursor.fetchall()
-    login_labels = [row[0] for row in daily_logins_data]
-    login_counts = [row[1] for row in daily_logins_data]
+REVERSE_SEARCH_K = 10
+REVERSE_SEARCH_MAX_K = 100
 
-    cursor.execute("""
-        SELECT DATE(uploaded_at) as d, COUNT(*) 
-        FROM uploaded_resumes 
-        WHERE uploaded_at >= date('now', '-30 days')
-        GROUP BY d 
-        ORDER BY d
-    """)
-    daily_uploads_data = cursor.fetchall()
-    upload_labels = [row[0] for row in daily_uploads_data]
-    upload_counts = [row[1] for row in daily_uploads_data]
+@app.route('/admin/reverse_search', methods=['POST'])
+def admin_reverse_search():
+    """Top-k uploaded resumes for a job description: {"job_description": ..., "k": 10}"""
+    if 'user_id' not in session or not session.get('is_admin'):
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 401
 
-    cursor.execute("SELECT rating, COUNT(*) FROM feedback GROUP BY rating ORDER BY rating")
-    feedback_ratings_data = cursor.fetchall()
-    rating_labels = [f"{row[0]} Stars" for row in feedback_ratings_data]
-    rating_counts = [row[1] for row in feedback_ratings_data]
+    data = request.get_json(silent=True) or {}
+    job_description = str(data.get('job_description') or '').strip()
+    if not job_description:
+        return jsonify({'success': False, 'message': 'Please provide a job description'}), 400
+    try:
+        k = min(max(int(data.get('k', REVERSE_SEARCH_K)), 1), REVERSE_SEARCH_MAX_K)
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'message': 'k must be a number'}), 400
+
+    started = time.perf_counter()
+    cursor = get_db().cursor()
+    index = reverse_search.get_index(app.config['DATABASE'])
+    ranked, skills = reverse_search.rank_resumes(cursor, index, job_description, limit=k)
+
+    results = []
+    if ranked:
+        ids = [resume_id for resume_id, _, _ in ranked]
+        placeholders = ', '.join('?' * len(ids))
+        cursor.execute(f'''
+            SELECT r.resume_id, r.filename, r.uploaded_at, u.name, u.email
+            FROM uploaded_resumes r LEFT JOIN users u ON u.id = r.user_id
+            WHERE r.resume_id IN ({placeholders})
+        ''', ids)
+        resumes = {row[0]: row for row in cursor.fetchall()}
+        matched = {}
+        if skills:
+            cursor.execute(f'''
+                SELECT resume_id, skill FROM resume_skill_postings
+                WHERE resume_id IN ({placeholders}) AND skill IN ({', '.join('?' * len(skills))})
+            ''', ids + skills)
+            for resume_id, skill in cursor.fetchall():
+                matched.setdefault(resume_id, []).append(skill)
+        for resume_id, score, _ in ranked:
+            row = resumes.get(resume_id)
+            if row is None:
+                continue
+            results.append({
+                'resume_id': resume_id,
+                'filename': row[1],
+                'uploaded_at': row[2],
+                'user': {'name': row[3], 'email': row[4]},
+                'score': round(score * 100, 1),
+                'matched_skills': sorted(matched.get(resume_id, []))
+            })
 
-    cursor.execute("""
-        SELECT DATE(downloaded_at) as d, COUNT(*) 
-        FROM resume_downloads 
-        WHERE downloaded_at >= date('now', '-30 days')
-        GROUP BY d 
-        ORDER BY d
-    """)
-    daily_downloads_data = cursor.fetchall()
-    download_labels = [row[0] for row in daily_downloads_data]
-    download_counts = [row[1] for row in daily_downloads_data]
+    return jsonify({
+        'success': True,
+        'skills': skills,
+        'results': results,
+        'took_ms': round((time.perf_counter() - started) * 1000, 1)
+    })
 
-    conn.close()
+DUPLICATE_CLUSTERS_LIMIT = 50
+DUPLICATE_CLUSTERS_MAX_LIMIT = 200
+
+@app.route('/admin/duplicates')
+def admin_duplicate_clusters():
+    """Clusters of near-duplicate uploaded resumes, largest first: ?limit="""
+    if 'user_id' not in session or not session.get('is_admin'):
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 401
+
+    limit = min(max(request.args.get('limit', DUPLICATE_CLUSTERS_LIMIT, type=int), 1), DUPLICATE_CLUSTERS_MAX_LIMIT)
+    started = time.perf_counter()
+    cursor = get_db().cursor()
+    clusters = near_duplicates.duplicate_clusters(cursor)
+
+    resumes = {}
+    ids = [resume_id for members in clusters[:limit] for resume_id in members]
+    if ids:
+        cursor.execute(f'''
+            SELECT r.resume_id, r.filename, r.uploaded_at, u.name, u.email, a.ats_score
+            FROM uploaded_resumes r
+            LEFT JOIN users u ON u.id = r.user_id
+            LEFT JOIN resume_analyses a ON a.source = 'uploaded' AND a.resume_id = r.resume_id
+            WHERE r.resume_id IN ({', '.join('?' * len(ids))})
+        ''', ids)
+        resumes = {row[0]: row for row in cursor.fetchall()}
 
     return jsonify({
         'success': True,
-        'data': {
-            'kpis': {
-                'total_users': total_users,
-                'total_uploads': total_uploads,
-                'total_generated_resumes': total_generated_resumes,
-                'avg_rating': avg_rating,
-                'total_downloads': total_downloads
-            },
-            'login_labels': login_labels,
-            'login_counts': login_counts,
-            'upload_labels': upload_labels,
-            'upload_counts': upload_counts,
-            'rating_labels': rating_labels,
-            'rating_counts': rating_counts,
-            'download_labels': download_labels,
-            'download_counts': download_counts
-        }
+        'total': len(clusters),
+        'clusters': [{
+            'size': len(members),
+            'resumes': [{
+                'resume_id': resume_id,
+                'filename': resumes[resume_id][1],
+                'uploaded_at': resumes[resume_id][2],
+                'user': {'name': resumes[resume_id][3], 'email': resumes[resume_id][4]},
+                'ats_score': resumes[resume_id][5]
+            } for resume_id in members if resume_id in resumes]
+        } for members in clusters[:limit]],
+        'took_ms': round((time.perf_counter() - started) * 1000, 1)
+    })
+
+@app.route('/admin_metrics/stream')
+def admin_metrics_stream():
+    """
+    Server-sent events: a full metrics snapshot on connect, then only the
+    keys that changed. The queries run once in metrics_broadcaster no
+    matter how many admins are connected.
+    """
+    if 'user_id' not in session or not session.get('is_admin'):
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 401
+
+    keepalive = app.config['METRICS_KEEPALIVE']
+
+    def events():
+        updates = metrics_broadcaster.subscribe()
+        try:
+            yield 'retry: 5000\n\n'
+            while True:
+                try:
+                    yield sse_event(updates.get(timeout=keepalive))
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+        finally:
+            metrics_broadcaster.unsubscribe(updates)
+
+    return Response(events(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # don't let a reverse proxy buffer the stream
     })
 
 @app.route('/resume_builder')
@@ -2902,7 +1443,7 @@ def resume_builder():
         return redirect(url_for('login'))
     
     # Get user's existing resume data if any
-    conn = get_db_connection()
+    conn = get_db()
     cursor = conn.cursor()
     
     # Check if user has any saved resumes
@@ -2935,7 +1476,6 @@ def resume_builder():
             else:
                 resume_data[f"{section['section_type']}s"].append(section_data)
     
-    conn.close()
     
     return render_template('resume_builder.html', 
                          resume=resume_data,
@@ -2974,23 +1514,51 @@ def upload_resume():
         return jsonify({'success': False, 'message': 'This document does not appear to be a resume. Please upload a valid resume document.'})
 
 
-    keywords = extract_keywords(text)
+    conn = get_db()
+    c = conn.cursor()
+    signature = minhash_signature(text)
+
+    # A near-duplicate of one of the user's earlier uploads: reuse its analysis if
+    # the text is the same, and report what changed since it either way
+    previous_upload = None
+    previous = near_duplicates.find_duplicates(c, signature, user_id=user_id, limit=1) if signature else []
+    stored = None
+    if previous:
+        previous_id, similarity = previous[0]
+        previous_filename, previous_text = c.execute(
+            'SELECT filename, resume_text FROM uploaded_resumes WHERE resume_id = ?', (previous_id,)
+        ).fetchone()
+        previous_analysis = analysis_store.current_analysis(
+            c, analysis_store.UPLOADED, previous_id, lambda: previous_text)
+        identical = previous_text == text
+        stored = previous_analysis if identical else analysis_store.analyze_text(text)
+        previous_upload = {
+            'resume_id': previous_id,
+            'filename': previous_filename,
+            'similarity': round(similarity * 100, 1),
+            'identical': identical,
+            **near_duplicates.compare_analyses(previous_analysis, stored)
+        }
 
     # Use comprehensive ATS analysis
-    comprehensive_analysis = comprehensive_ats_analysis(text, keywords)
+    if stored is None:
+        stored = analysis_store.analyze_text(text)
+    keywords = stored['keywords']
+    comprehensive_analysis = stored['analysis']
     
     # Get jobs for top predicted roles
     top_roles = [match['role'] for match in comprehensive_analysis['job_matches'][:3]]
     recommended_jobs = fetch_jobs(top_roles, keywords)
 
-    conn = sqlite3.connect('rezumai.db')
-    c = conn.cursor()
+    # Keep the extracted text and the analysis so the dashboard doesn't redo them
     c.execute(
-        "INSERT INTO uploaded_resumes (user_id, filename, filepath) VALUES (?, ?, ?)",
-        (user_id, filename, save_path)
+        "INSERT INTO uploaded_resumes (user_id, filename, filepath, resume_text) VALUES (?, ?, ?, ?)",
+        (user_id, filename, save_path, text)
     )
+    resume_id = c.lastrowid
+    analysis_store.store_analysis(c, analysis_store.UPLOADED, resume_id, stored)
+    near_duplicates.index_signature(c, resume_id, signature)
     conn.commit()
-    conn.close()
 
     return jsonify({
         "success": True,
@@ -3009,7 +1577,8 @@ def upload_resume():
         "quantified_suggestions": comprehensive_analysis['quantified_suggestions'],
         "summary_suggestions": comprehensive_analysis['summary_suggestions'],
         "skills_suggestions": comprehensive_analysis['skills_suggestions'],
-        "ats_explanation": comprehensive_analysis['ats_explanation']
+        "ats_explanation": comprehensive_analysis['ats_explanation'],
+        "previous_upload": previous_upload
     })
 
 @app.route('/submit_feedback', methods=['POST'])
@@ -3018,12 +1587,11 @@ def submit_feedback():
         return redirect(url_for('login'))
     rating = int(request.form['rating'])
     suggestion = request.form.get('suggestion', '')
-    conn = sqlite3.connect('rezumai.db')
+    conn = get_db()
     cursor = conn.cursor()
     cursor.execute('INSERT INTO feedback (user_id, rating, suggestion) VALUES (?, ?, ?)',
                    (session['user_id'], rating, suggestion))
     conn.commit()
-    conn.close()
     flash('Thank you for your feedback!', 'success')
     return redirect(url_for('dashboard'))
 
@@ -3033,12 +1601,11 @@ def reply_feedback():
         return redirect(url_for('login'))
     feedback_id = request.form['feedback_id']
     admin_reply = request.form['admin_reply']
-    conn = sqlite3.connect('rezumai.db')
+    conn = get_db()
     cursor = conn.cursor()
     cursor.execute('UPDATE feedback SET admin_reply = ?, replied_at = CURRENT_TIMESTAMP WHERE id = ?',
                    (admin_reply, feedback_id))
     conn.commit()
-    conn.close()
     flash('Reply sent successfully!', 'success')
     return redirect(url_for('admin_dashboard'))
 
@@ -3371,6 +1938,49 @@ def add_no_cache_headers(response):
         pass
     return response
 
+def preload_analysis_state():
+    """Loads the read-only analysis data (job index, skill forms, taxonomy and bitsets, job skill matrix) up front."""
+    load_jobs_data()
+    skill_forms()
+    skill_taxonomy()
+    role_skill_bits()
+    job_skill_bits()
+    job_matrix()
+
+def preload_search_index():
+    """Loads the reverse-search skill index so the workers start with it."""
+    database = app.config['DATABASE']
+    index = reverse_search.get_index(database)
+    conn = db.connect(database)
+    try:
+        with index.lock:
+            index.refresh(conn.cursor())
+    finally:
+        conn.close()
+
+def create_app(config=None):
+    """
+    Production entry point (see wsgi.py / gunicorn.conf.py). With
+    gunicorn's preload_app this runs once in the master: the database is
+    initialised a single time and the analysis data is loaded before the
+    workers fork, so they share it copy-on-write. Sessions are kept
+    server-side so any worker can serve any request.
+    """
+    if config:
+        app.config.update(config)
+    app.session_interface = DatabaseSessionInterface()
+    if app.config.get('INIT_DB_ON_START', True):
+        init_db()
+    init_babel()
+    preload_analysis_state()
+    preload_search_index()
+    # The upload parsers are imported lazily for CLI/test start-up; in the
+    # master they are imported up front so the workers share them.
+    import pdfplumber, docx  # noqa: F401
+    gc.collect()
+    gc.freeze()  # keep the GC from touching (and un-sharing) preloaded objects in the workers
+    return app
+
 if __name__ == '__main__':
     init_db()
     app.run(debug=True)
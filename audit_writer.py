@@ -0,0 +1,153 @@
+import os
+import time
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime, timezone
+
+import db
+
+FLUSH_INTERVAL_MS = 50
+BATCH_SIZE = 200
+MAX_PENDING = 10000
+ENQUEUE_TIMEOUT = 1.0  # seconds a request waits for room before the event is dropped
+
+_STOP = object()
+
+
+def utc_timestamp():
+    """Current time in SQLite's CURRENT_TIMESTAMP format."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+class AuditWriter:
+    """
+    Write-behind queue for append-only audit rows (logins, downloads).
+
+    Requests only enqueue ``(sql, params)``; a background thread groups
+    pending events by statement and writes them with ``executemany`` in one
+    transaction every ``flush_interval_ms`` or ``batch_size`` events,
+    whichever comes first, so a login or download never waits on a commit.
+    Events carry their own timestamp, taken at enqueue time. Pending events
+    are flushed at interpreter exit.
+    """
+
+    def __init__(self, get_path, flush_interval_ms=FLUSH_INTERVAL_MS, batch_size=BATCH_SIZE,
+                 max_pending=MAX_PENDING):
+        self._get_path = get_path
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = batch_size
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._conn = None
+        self._conn_path = None
+        atexit.register(self.close)
+
+    def _ensure_thread(self):
+        # Also restarts the writer in a forked child, which inherits no threads
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._conn = None
+                self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+                self._thread.start()
+
+    def submit(self, sql, params):
+        """Queues one insert. Never raises; a full queue drops the event with an error log."""
+        self._ensure_thread()
+        try:
+            self._queue.put((sql, params), timeout=ENQUEUE_TIMEOUT)
+        except queue.Full:
+            logging.error(f"Audit queue full, dropping {_table(sql)} event {params}")
+
+    def flush(self):
+        """Blocks until every event queued so far has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Writes pending events and stops the background thread."""
+        thread = self._thread
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            self._queue.put(_STOP)
+            thread.join(timeout=10)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connection(self):
+        path = self._get_path()
+        if self._conn is None or self._conn_path != path:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = db.connect(path)
+            self._conn_path = path
+        return self._conn
+
+    def _write(self, batch):
+        groups = {}
+        for sql, params in batch:
+            groups.setdefault(sql, []).append(params)
+        conn = self._connection()
+        try:
+            with conn:
+                for sql, rows in groups.items():
+                    written = conn.executemany(sql, rows).rowcount
+                    if written < len(rows):
+                        logging.warning(f"Skipped {len(rows) - written} {_table(sql)} events with no matching row")
+        except db.IntegrityError:
+            # One bad event (e.g. a deleted user) must not cost the whole batch
+            for sql, params in batch:
+                try:
+                    with conn:
+                        conn.execute(sql, params)
+                except db.IntegrityError as e:
+                    logging.warning(f"Dropping {_table(sql)} event {params}: {e}")
+
+    def _run(self):
+        stop = False
+        while not stop:
+            batch = []
+            item = self._queue.get()
+            taken = 1
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                taken += 1
+            if stop:
+                # close() was called: write everything still queued
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if item is not _STOP:
+                        batch.append(item)
+            try:
+                if batch:
+                    self._write(batch)
+            except Exception as e:
+                logging.error(f"Audit writer lost {len(batch)} events: {e}")
+            for _ in range(taken):
+                self._queue.task_done()
+
+
+def _table(sql):
+    """Target table of an INSERT statement, for log messages."""
+    return sql.split()[2]
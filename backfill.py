@@ -0,0 +1,145 @@
+"""
+Backfill job that re-scores every stored resume after the analysis rules
+change (analysis.rules.rules_version()).
+
+Uploaded and generated resumes whose stored analysis is missing or stale
+are processed in id order, a chunk at a time, across a process pool. A
+chunk's results and its checkpoint (the last id done for that source and
+rules version, in backfill_checkpoints) are committed together in one
+short transaction, so an interrupted run picks up where it stopped and a
+new rules version starts from the beginning. Text extracted earlier is
+reused; text extracted now is cached for next time (and, for uploads,
+indexed for near-duplicate search).
+
+To leave room for interactive traffic the workers run at a lower CPU
+priority, and after each chunk the job sleeps long enough to keep its
+duty cycle at ``duty_cycle``.
+"""
+import os
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import storage_codec
+from analysis import extract_text_from_resume, resume_sidecar
+from analysis.minhash import signature
+from analysis.rules import rules_version
+from analysis_store import UPLOADED, GENERATED, analyze_text, store_analysis
+from near_duplicates import index_signature
+
+CHUNK_SIZE = 50
+DUTY_CYCLE = 0.5  # share of wall time spent working; the rest is spent sleeping between chunks
+WORKER_NICENESS = 10
+
+# source -> rows (id, cached text, what to extract text from) past a checkpoint whose analysis isn't current
+PENDING_ROWS = {
+    UPLOADED: '''
+        SELECT r.resume_id, r.resume_text, r.filepath FROM uploaded_resumes r
+        LEFT JOIN resume_analyses a ON a.source = 'uploaded' AND a.resume_id = r.resume_id
+        WHERE r.resume_id > ? AND (a.rules_version IS NULL OR a.rules_version != ?)
+        ORDER BY r.resume_id LIMIT ?
+    ''',
+    GENERATED: '''
+        SELECT g.id, g.resume_text, g.resume_data FROM generated_resumes g
+        LEFT JOIN resume_analyses a ON a.source = 'generated' AND a.resume_id = g.id
+        WHERE g.id > ? AND (a.rules_version IS NULL OR a.rules_version != ?)
+        ORDER BY g.id LIMIT ?
+    ''',
+}
+
+
+def rescore(task):
+    """
+    Worker entry point. Returns ``(resume_id, extracted, result)`` where
+    ``extracted`` is the newly extracted text (a sidecar dict for generated
+    resumes) or None when the cached text was used.
+    """
+    source, resume_id, text, payload = task
+    extracted = None
+    if not text:
+        if source == UPLOADED:
+            text = extracted = extract_text_from_resume(payload) or None
+        else:
+            extracted = resume_sidecar(storage_codec.decode(payload))
+            text = extracted['text']
+    return resume_id, extracted, analyze_text(text)
+
+
+def _lower_priority():
+    if hasattr(os, 'nice'):
+        os.nice(WORKER_NICENESS)
+
+
+def load_checkpoint(cursor, job, version):
+    """Last id done by ``job`` under rules ``version`` (0 if none)."""
+    row = cursor.execute('SELECT rules_version, last_id FROM backfill_checkpoints WHERE job = ?', (job,)).fetchone()
+    return row[1] if row is not None and row[0] == version else 0
+
+
+def save_checkpoint(cursor, job, version, last_id):
+    dialect = cursor.connection.dialect
+    cursor.execute(dialect.upsert(
+        'backfill_checkpoints', ['job', 'rules_version', 'last_id'], key=['job'],
+        update={
+            'rules_version': dialect.excluded('rules_version'),
+            'last_id': dialect.excluded('last_id'),
+            'updated_at': 'CURRENT_TIMESTAMP'
+        }
+    ), (job, version, last_id))
+
+
+def _store_results(cursor, source, version, results):
+    for resume_id, extracted, result in results:
+        if extracted is not None:
+            if source == UPLOADED:
+                cursor.execute('UPDATE uploaded_resumes SET resume_text = ? WHERE resume_id = ?', (extracted, resume_id))
+                index_signature(cursor, resume_id, signature(extracted))
+            else:
+                cursor.execute(
+                    'UPDATE generated_resumes SET resume_text = ?, resume_sections = ? WHERE id = ?',
+                    (extracted['text'], storage_codec.encode(extracted['sections']), resume_id)
+                )
+        store_analysis(cursor, source, resume_id, result, version)
+
+
+def backfill_analyses(conn, workers=1, chunk_size=CHUNK_SIZE, duty_cycle=DUTY_CYCLE):
+    """
+    Re-scores every uploaded and generated resume whose analysis is not
+    current. Returns ``{source: resumes re-scored}``.
+    """
+    version = rules_version()
+    cursor = conn.cursor()
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=_lower_priority)
+    run = pool.map if pool else map
+
+    results = {}
+    try:
+        for source, sql in PENDING_ROWS.items():
+            job = f'analyses:{source}'
+            last_id = load_checkpoint(cursor, job, version)
+            results[source] = 0
+            while True:
+                rows = cursor.execute(sql, (last_id, version, chunk_size)).fetchall()
+                conn.commit()  # don't hold a read snapshot while the chunk is scored
+                if not rows:
+                    break
+                started = time.perf_counter()
+                chunk = list(run(rescore, [(source, row[0], row[1], row[2]) for row in rows]))
+                last_id = rows[-1][0]
+                _store_results(cursor, source, version, chunk)
+                save_checkpoint(cursor, job, version, last_id)
+                conn.commit()
+                results[source] += len(chunk)
+                logging.info(f"Re-scored {results[source]} {source} resumes (up to id {last_id})")
+                if len(rows) < chunk_size:
+                    break
+                elapsed = time.perf_counter() - started
+                time.sleep(elapsed * (1 - duty_cycle) / duty_cycle)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return results
@@ -0,0 +1,93 @@
+"""
+Concurrent write benchmark: legacy per-call connections vs the db.py layer.
+
+Each thread inserts login rows the way log_login does. The legacy run opens
+a default sqlite3 connection (rollback journal, synchronous=FULL) for every
+insert; the tuned run borrows WAL connections from db.ConnectionPool.
+
+    python bench_db_writes.py --threads 8 --writes 500
+"""
+import os
+import time
+import sqlite3
+import argparse
+import tempfile
+import threading
+
+import db
+
+SCHEMA = '''
+    CREATE TABLE logins (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        login_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+
+def legacy_write(path, user_id):
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute('INSERT INTO logins (user_id) VALUES (?)', (user_id,))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def run(label, threads, writes, make_writer):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        setup = sqlite3.connect(path)
+        setup.execute(SCHEMA)
+        setup.commit()
+        setup.close()
+
+        write = make_writer(path)
+        errors = []
+
+        def worker(user_id):
+            for _ in range(writes):
+                try:
+                    write(user_id)
+                except sqlite3.OperationalError as e:
+                    errors.append(e)
+
+        pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        start = time.perf_counter()
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        total = threads * writes - len(errors)
+        print(f"{label:7} {total} writes in {elapsed:.2f}s  ({total / elapsed:.0f} writes/s, {len(errors)} locked errors)")
+        return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--writes', type=int, default=300)
+    args = parser.parse_args()
+
+    legacy = run('legacy', args.threads, args.writes, lambda path: lambda uid: legacy_write(path, uid))
+
+    def make_pooled(path):
+        pool = db.ConnectionPool(path, size=args.threads)
+
+        def write(user_id):
+            conn = pool.acquire()
+            try:
+                conn.execute('INSERT INTO logins (user_id) VALUES (?)', (user_id,))
+                conn.commit()
+            finally:
+                pool.release(conn)
+        return write
+
+    tuned = run('pooled', args.threads, args.writes, make_pooled)
+    print(f"speed-up: {tuned / legacy:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Throughput benchmark for concurrent PDF generation.
+
+Renders the same resume N times, first serially in this process and then
+through the RenderPool, and prints PDFs/second for each.
+
+    python bench_pdf_render.py --jobs 64 --workers 4
+"""
+import os
+import time
+import argparse
+from concurrent.futures import wait
+
+from render_pool import RenderPool, render_resume_pdf
+
+SAMPLE_RESUME = {
+    "user_type": "experienced",
+    "template_type": "classic",
+    "personal_details": {
+        "full_name": "John Doe",
+        "email": "john.doe@example.com",
+        "phone": "+1 234 567 8900",
+        "location": "New York, NY",
+        "linkedin": "https://linkedin.com/in/johndoe",
+        "github": "https://github.com/johndoe"
+    },
+    "education": [
+        {"degree": "B.Tech", "institution": "ABC University", "location": "New York, NY",
+         "start_year": "2015", "end_year": "2019", "currently_studying": False}
+    ],
+    "technical_skills": {
+        "programming_languages": "Python, JavaScript, Java",
+        "frameworks": "Django, React, Spring",
+        "databases": "MySQL, PostgreSQL, MongoDB",
+        "cloud_technologies": "AWS, Docker, Kubernetes",
+        "devops_tools": "Git, Jenkins, Terraform"
+    },
+    "soft_skills": ["Communication", "Teamwork", "Problem Solving"],
+    "work_experience": [
+        {"job_title": "Software Engineer", "company": "Tech Corp", "location": "San Francisco, CA",
+         "start_date": "2019-07", "end_date": "2023-05", "currently_working": False,
+         "bullet_points": "Developed scalable web applications using Python and Django\n"
+                          "Implemented RESTful APIs for mobile applications\n"
+                          "Collaborated with cross-functional teams"}
+    ] * 4,
+    "projects": [
+        {"project_name": "E-commerce Platform", "technologies_used": "Python, Django, React",
+         "description": "A full-stack e-commerce platform with payment integration"}
+    ] * 3,
+    "certifications": [
+        {"certification_name": "AWS Certified Solutions Architect", "organization": "Amazon Web Services",
+         "start_date": "2020-03", "currently_valid": True}
+    ]
+}
+
+
+def bench_serial(jobs):
+    start = time.perf_counter()
+    for _ in range(jobs):
+        render_resume_pdf(SAMPLE_RESUME)
+    return time.perf_counter() - start
+
+
+def bench_pool(jobs, workers):
+    pool = RenderPool(workers=workers, queue_size=jobs, timeout=120)
+    try:
+        # warm up every worker so process start-up isn't counted
+        wait([pool.submit(render_resume_pdf, SAMPLE_RESUME) for _ in range(workers)])
+        start = time.perf_counter()
+        wait([pool.submit(render_resume_pdf, SAMPLE_RESUME) for _ in range(jobs)])
+        return time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=48)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    serial = bench_serial(args.jobs)
+    print(f"serial:            {args.jobs} PDFs in {serial:.2f}s  ({args.jobs / serial:.1f} PDFs/s)")
+
+    pooled = bench_pool(args.jobs, args.workers)
+    print(f"pool ({args.workers} workers): {args.jobs} PDFs in {pooled:.2f}s  ({args.jobs / pooled:.1f} PDFs/s)")
+    print(f"speed-up: {serial / pooled:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
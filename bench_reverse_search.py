@@ -0,0 +1,106 @@
+"""
+Latency benchmark for reverse search (reverse_search.py).
+
+Builds a synthetic corpus of N uploaded resumes (known skills plus filler
+words, both Zipf-distributed) in a temporary database, then times loading
+the in-memory skill index and ranking the corpus against random job
+descriptions.
+
+    python bench_reverse_search.py --resumes 100000 --queries 50
+"""
+import os
+import time
+import random
+import argparse
+import tempfile
+import itertools
+from collections import Counter
+
+import db
+import app as rezumai
+import reverse_search
+from analysis import skill_ids
+
+WORDS_PER_RESUME = 300
+SKILL_SHARE = 0.08
+FILLER_WORDS = 20000
+
+
+def zipf_weights(n):
+    return list(itertools.accumulate(1 / (rank + 1) for rank in range(n)))
+
+
+def build_corpus(conn, resumes, rng):
+    skills = list(skill_ids().names)
+    rng.shuffle(skills)
+    filler = [f'word{i}' for i in range(FILLER_WORDS)]
+    skill_weights, filler_weights = zipf_weights(len(skills)), zipf_weights(len(filler))
+    n_skills = int(WORDS_PER_RESUME * SKILL_SHARE)
+
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO users (email, name, password_hash, security_question, security_answer_hash) "
+                   "VALUES ('bench@example.com', 'Bench', '', '', '')")
+    for resume_id in range(1, resumes + 1):
+        words = (rng.choices(skills, cum_weights=skill_weights, k=n_skills)
+                 + rng.choices(filler, cum_weights=filler_weights, k=WORDS_PER_RESUME - n_skills))
+        rng.shuffle(words)
+        cursor.execute('INSERT INTO uploaded_resumes (resume_id, user_id, filename, filepath, resume_text) '
+                       "VALUES (?, 1, 'cv.pdf', '', ?)", (resume_id, ' '.join(words)))
+        skill_counts = Counter(w for w in words if w in skill_ids().ids)
+        reverse_search.index_resume(cursor, resume_id, skill_counts, len(words))
+        if resume_id % 10000 == 0:
+            conn.commit()
+    conn.commit()
+    return skills, filler, skill_weights, filler_weights
+
+
+def job_description(rng, skills, filler, skill_weights, filler_weights):
+    words = (rng.choices(skills, cum_weights=skill_weights, k=8)
+             + rng.choices(filler, cum_weights=filler_weights, k=80)
+             + rng.sample(filler[500:5000], 5))
+    return ' '.join(words)
+
+
+def percentile(samples, share):
+    return sorted(samples)[min(int(len(samples) * share), len(samples) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('-k', type=int, default=10)
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        rezumai.app.config['DATABASE'] = path
+        rezumai.init_db()
+        conn = db.connect(path)
+        try:
+            start = time.perf_counter()
+            vocabulary = build_corpus(conn, args.resumes, rng)
+            print(f"built {args.resumes} resumes in {time.perf_counter() - start:.1f}s")
+
+            index = reverse_search.SkillIndex()
+            start = time.perf_counter()
+            with index.lock:
+                index.refresh(conn.cursor())
+            postings = sum(len(skill.seqs) for skill in index.postings.values())
+            print(f"index load: {(time.perf_counter() - start) * 1000:.0f} ms ({postings} postings)")
+
+            latencies = []
+            for _ in range(args.queries):
+                text = job_description(rng, *vocabulary)
+                start = time.perf_counter()
+                reverse_search.rank_resumes(conn.cursor(), index, text, limit=args.k)
+                latencies.append((time.perf_counter() - start) * 1000)
+            print(f"query: p50 {percentile(latencies, 0.5):.1f} ms  p95 {percentile(latencies, 0.95):.1f} ms  "
+                  f"max {max(latencies):.1f} ms")
+        finally:
+            conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Microbenchmark: set-based vs bitset skill overlap.
+
+Times the skill matching of predict_job_roles_with_scores (exact and
+partial matches plus matched/missing lists per role) and fetch_jobs (overlap
+with every catalogue job) for one resume, first with the set/list code they
+used before analysis.bitsets and then with the bitset versions.
+
+    python bench_skill_bitsets.py --resume CV_John_Doe.pdf --repeat 2000
+"""
+import time
+import argparse
+
+from analysis import extract_text_from_resume, extract_keywords, load_jobs_data
+from analysis.skills import BASE_SKILLS
+from analysis.jobs import skill_forms, skill_ids, role_skills, role_skill_bits, job_skill_bits
+
+
+def match_with_sets(keywords, text_lower, jobs):
+    # keywords are canonical skills (see analysis.aliases); compare the role and job skills in that form
+    canonical = skill_forms().normalise
+    keywords = set(keywords)
+    roles = {}
+    for role, skills in BASE_SKILLS.items():
+        exact = sum(1 for skill in skills if canonical(skill) in keywords)
+        partial = sum(1 for skill in skills if skill in text_lower and canonical(skill) not in keywords)
+        matched = [skill for skill in skills if canonical(skill) in keywords or skill in text_lower]
+        missing = [skill for skill in skills if canonical(skill) not in keywords and skill not in text_lower]
+        roles[role] = (exact, partial, matched, missing)
+    overlaps = [len({canonical(s) for s in job.get('skills', [])}.intersection(keywords)) for job in jobs]
+    return roles, overlaps
+
+
+def match_with_bitsets(keywords, text_lower, jobs):
+    ids = skill_ids()
+    role_bits = role_skill_bits()
+    keyword_bits = ids.bits(keywords)
+    text_bits = ids.bits(skill for skill in role_skills() if skill in text_lower)
+    found_bits = keyword_bits | text_bits
+    roles = {}
+    for role, skills in BASE_SKILLS.items():
+        bits = role_bits[role]
+        roles[role] = ((bits & keyword_bits).bit_count(), (bits & text_bits & ~keyword_bits).bit_count(),
+                       ids.in_order(skills, bits & found_bits), ids.in_order(skills, bits & ~found_bits))
+    overlaps = [(job_bits & keyword_bits).bit_count() for job_bits in job_skill_bits()]
+    return roles, overlaps
+
+
+def timed(function, args, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function(*args)
+    return (time.perf_counter() - start) / repeat * 1e6, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resume', default='CV_John_Doe.pdf')
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    text = extract_text_from_resume(args.resume)
+    keywords = extract_keywords(text)
+    inputs = (keywords, text.lower(), load_jobs_data())
+    match_with_bitsets(*inputs)  # build the dictionaries outside the timing
+
+    sets_us, expected = timed(match_with_sets, inputs, args.repeat)
+    bits_us, result = timed(match_with_bitsets, inputs, args.repeat)
+    assert result == expected
+    print(f"sets    {sets_us:8.1f} us/resume")
+    print(f"bitsets {bits_us:8.1f} us/resume  ({sets_us / bits_us:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Fixtures for the tests that run against a database server as well as SQLite."""
+import os
+import uuid
+from urllib.parse import urlsplit
+
+import pytest
+
+import db
+
+SERVER_URL = os.environ.get('REZUMAI_TEST_DATABASE_URL')
+
+
+@pytest.fixture(scope='session')
+def server_url(tmp_path_factory):
+    """
+    REZUMAI_TEST_DATABASE_URL (postgresql://... or mysql://...), else a
+    throwaway local PostgreSQL started with pgserver.
+    """
+    if SERVER_URL:
+        yield SERVER_URL
+        return
+    pytest.importorskip('psycopg2')
+    pgserver = pytest.importorskip('pgserver')
+    server = pgserver.get_server(str(tmp_path_factory.mktemp('postgres')), cleanup_mode='stop')
+    yield server.get_uri()
+    server.cleanup()
+
+
+@pytest.fixture
+def server_database(server_url):
+    """URL of a new, empty database on the test server, dropped afterwards."""
+    name = f'rezumai_test_{uuid.uuid4().hex[:8]}'
+    admin = db.connect_server(server_url)
+    if admin.dialect.name == 'postgresql':
+        admin._raw.autocommit = True  # CREATE/DROP DATABASE cannot run in a transaction
+    admin.execute(f'CREATE DATABASE {name}')
+    yield urlsplit(server_url)._replace(path=f'/{name}').geturl()
+    # FORCE: the app's connection pool may still hold connections to it
+    admin.execute(f'DROP DATABASE {name}' + (' WITH (FORCE)' if admin.dialect.name == 'postgresql' else ''))
+    admin.close()
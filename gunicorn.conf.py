@@ -0,0 +1,13 @@
+"""Gunicorn settings for the production profile: gunicorn -c gunicorn.conf.py wsgi:app"""
+import os
+import multiprocessing
+
+bind = os.environ.get('BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))  # each open admin metrics stream holds a thread
+timeout = 60
+
+# Import wsgi:app (create_app: DB init, preloaded analysis data) once in the
+# master, then fork; workers share that memory copy-on-write.
+preload_app = True
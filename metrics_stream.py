@@ -0,0 +1,128 @@
+import json
+import time
+import queue
+import logging
+import threading
+
+SUBSCRIBER_QUEUE_SIZE = 16
+
+
+def diff_metrics(old, new):
+    """
+    Keys of ``new`` that differ from ``old``. Nested dicts (the KPIs) are
+    diffed per key; a chart's labels and counts always travel together
+    because the client replaces both at once.
+    """
+    delta = {}
+    for key, value in new.items():
+        previous = old.get(key)
+        if isinstance(value, dict):
+            changed = {k: v for k, v in value.items() if (previous or {}).get(k) != v}
+            if changed:
+                delta[key] = changed
+        elif previous != value:
+            delta[key] = value
+    for key in list(delta):
+        for a, b in (('_labels', '_counts'), ('_counts', '_labels')):
+            if key.endswith(a):
+                partner = key[:-len(a)] + b
+                if partner in new:
+                    delta.setdefault(partner, new[partner])
+    return delta
+
+
+class MetricsBroadcaster:
+    """
+    One background thread that watches the database and fans metric updates
+    out to every connected admin, so the query cost does not grow with the
+    number of open dashboards.
+
+    The thread only polls the dialect's commit counter (``PRAGMA
+    data_version`` on SQLite; no table reads), which changes whenever
+    another connection commits. Metrics are recomputed
+    once per change, or every ``refresh_every`` seconds so date windows
+    still roll over on a quiet database, and only the changed keys are
+    pushed to subscribers.
+    """
+
+    def __init__(self, connect, load_metrics, interval=1.0, refresh_every=300):
+        self._connect = connect
+        self._load_metrics = load_metrics
+        self.interval = interval
+        self.refresh_every = refresh_every
+        self._subscribers = set()
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread = None
+
+    def subscribe(self):
+        """Register a listener; its queue starts with a full snapshot once one is available."""
+        q = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            if self._snapshot is not None:
+                q.put_nowait(self._snapshot)
+            self._subscribers.add(q)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='metrics-broadcaster', daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+        return q
+
+    def unsubscribe(self, q):
+        with self._lock:
+            self._subscribers.discard(q)
+
+    def _publish(self, snapshot, delta):
+        with self._lock:
+            self._snapshot = snapshot
+            subscribers = list(self._subscribers)
+        for q in subscribers:
+            try:
+                q.put_nowait(delta)
+            except queue.Full:
+                # Slow client: drop its backlog and resync it with a full snapshot
+                while True:
+                    try:
+                        q.get_nowait()
+                    except queue.Empty:
+                        break
+                q.put_nowait(snapshot)
+
+    def _run(self):
+        conn = None
+        data_version = None
+        refreshed_at = 0
+        while True:
+            with self._lock:
+                while not self._subscribers:
+                    # Nobody is watching: drop the connection and sleep until someone subscribes
+                    if conn is not None:
+                        conn.close()
+                        conn, data_version = None, None
+                    self._wakeup.wait()
+            try:
+                if conn is None:
+                    conn = self._connect()
+                version = conn.execute(conn.dialect.data_version()).fetchone()[0]
+                now = time.monotonic()
+                changed = version != data_version or now - refreshed_at >= self.refresh_every
+                if changed:
+                    data_version, refreshed_at = version, now
+                    snapshot = self._load_metrics(conn)
+                conn.rollback()  # end the read (and a server's stats snapshot) so the next poll sees new commits
+                if changed:
+                    previous = self._snapshot
+                    delta = snapshot if previous is None else diff_metrics(previous, snapshot)
+                    if delta:
+                        self._publish(snapshot, delta)
+            except Exception as e:
+                logging.error(f"Metrics broadcaster error: {e}")
+                if conn is not None:
+                    conn.close()
+                conn, data_version = None, None
+            time.sleep(self.interval)
+
+
+def sse_event(data, event='metrics'):
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
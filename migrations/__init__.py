@@ -0,0 +1 @@
+from migrations.runner import run_migrations, current_version
@@ -0,0 +1,85 @@
+"""
+Versioned schema migrations.
+
+Each migration is a module in this package named ``vNNN_description.py``
+with a ``VERSION`` number and an ``upgrade(conn)`` function. Pending
+migrations run in version order, each in its own transaction, and are
+recorded in the ``schema_version`` table. Migrations must use
+``conn.execute`` (not ``executescript``, which commits implicitly).
+"""
+import re
+import logging
+import pkgutil
+import importlib
+
+MIGRATION_MODULE = re.compile(r'^v(\d{3})_\w+$')
+
+
+def discover_migrations():
+    """Returns the migration modules of this package sorted by version."""
+    package = importlib.import_module('migrations')
+    migrations = []
+    for module_info in pkgutil.iter_modules(package.__path__):
+        if not MIGRATION_MODULE.match(module_info.name):
+            continue
+        module = importlib.import_module(f'migrations.{module_info.name}')
+        migrations.append(module)
+    migrations.sort(key=lambda module: module.VERSION)
+    versions = [module.VERSION for module in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"Duplicate migration versions: {versions}")
+    return migrations
+
+
+def _ensure_version_table(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+
+def current_version(conn):
+    """Highest applied migration version, 0 for a fresh database."""
+    _ensure_version_table(conn)
+    return conn.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version').fetchone()[0]
+
+
+def run_migrations(conn):
+    """Applies every pending migration in order. Returns the versions applied."""
+    if conn.in_transaction:
+        conn.commit()
+    applied_version = current_version(conn)
+    applied = []
+    for module in discover_migrations():
+        if module.VERSION <= applied_version:
+            continue
+        name = module.__name__.rsplit('.', 1)[-1]
+        if conn.dialect.name == 'sqlite':
+            # Server drivers open the transaction on the first statement (PostgreSQL DDL is
+            # transactional; MySQL commits DDL implicitly, which is why migrations are re-runnable)
+            conn.execute('BEGIN')
+        try:
+            module.upgrade(conn)
+            conn.execute('INSERT INTO schema_version (version, name) VALUES (?, ?)', (module.VERSION, name))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            logging.error(f"Migration {name} failed; schema left at version {applied_version}")
+            raise
+        logging.info(f"Applied migration {name}")
+        applied_version = module.VERSION
+        applied.append(module.VERSION)
+    return applied
+
+
+if __name__ == "__main__":
+    import db
+    conn = db.connect()
+    try:
+        applied = run_migrations(conn)
+        print(f"Applied migrations: {applied}" if applied else "Database schema is up to date")
+    finally:
+        conn.close()
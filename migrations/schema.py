@@ -0,0 +1,38 @@
+"""
+DDL helpers for migrations, written once for every backend through the
+connection's dialect (db.Dialect). Index helpers check the catalog first,
+so they are idempotent on MySQL too, which has no IF [NOT] EXISTS for
+indexes and commits DDL as it goes.
+"""
+
+
+def columns(conn, table):
+    """The column names of ``table``."""
+    return {row[0] for row in conn.execute(conn.dialect.columns_query(table))}
+
+
+def indexes(conn, table):
+    """The index names of ``table``."""
+    return {row[0] for row in conn.execute(conn.dialect.indexes_query(table))}
+
+
+def add_column(conn, table, column, definition):
+    if column not in columns(conn, table):
+        conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+
+
+def create_index(conn, name, table, keys):
+    """Creates index ``name`` on ``table`` over ``keys`` (SQL key list) unless it exists."""
+    if name not in indexes(conn, table):
+        conn.execute(f'CREATE INDEX {name} ON {table} ({keys})')
+
+
+def drop_index(conn, name, table):
+    if name in indexes(conn, table):
+        conn.execute(conn.dialect.drop_index(name, table))
+
+
+def create_trigger(conn, name, event, table, body, when=None):
+    """(Re)creates a row trigger; see db.Dialect.create_trigger."""
+    for sql in conn.dialect.create_trigger(name, event, table, body, when):
+        conn.execute(sql)
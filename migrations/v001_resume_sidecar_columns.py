@@ -0,0 +1,9 @@
+"""Text sidecar columns on generated_resumes (plain text + section JSON from the PDF pass)."""
+from migrations.schema import add_column
+
+VERSION = 1
+
+
+def upgrade(conn):
+    add_column(conn, 'generated_resumes', 'resume_text', 'TEXT')
+    add_column(conn, 'generated_resumes', 'resume_sections', conn.dialect.blob)  # storage_codec (v005)
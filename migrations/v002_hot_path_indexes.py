@@ -0,0 +1,26 @@
+"""
+Indexes for the queries run on every page view.
+
+- dashboard/chat: latest upload and latest generated resume per user
+  (WHERE user_id = ? ORDER BY ... DESC LIMIT 1)
+- admin charts and activity tables: 30-day ranges and newest-first lists
+  over logins, uploaded_resumes and resume_downloads
+"""
+from migrations.schema import create_index, drop_index
+
+VERSION = 2
+
+
+def upgrade(conn):
+    # Covers the whole dashboard lookup (filepath, uploaded_at) without touching the table
+    create_index(conn, 'idx_uploaded_resumes_user_latest', 'uploaded_resumes', 'user_id, uploaded_at DESC, filepath')
+    # Superseded by the index above; some databases have it from manual tuning
+    drop_index(conn, 'idx_resumes_user_id', 'uploaded_resumes')
+    create_index(conn, 'idx_resumes_uploaded_at', 'uploaded_resumes', 'uploaded_at')
+
+    create_index(conn, 'idx_generated_resumes_user_latest', 'generated_resumes', 'user_id, created_at DESC')
+
+    # Date-range scans read only the indexed columns (COUNT, COUNT DISTINCT user_id)
+    create_index(conn, 'idx_logins_time_user', 'logins', 'login_time, user_id')
+    create_index(conn, 'idx_resume_downloads_time', 'resume_downloads', 'downloaded_at')
+    create_index(conn, 'idx_resume_downloads_resume', 'resume_downloads', 'resume_id')
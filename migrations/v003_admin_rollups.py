@@ -0,0 +1,148 @@
+"""
+Rollup tables behind the admin dashboard, maintained by triggers.
+
+- metric_totals: running KPI counters (users, uploads, downloads, feedback, ...)
+- metric_daily: per-day counts for the login / upload / download charts
+- daily_active_users: one row per user per day they logged in
+- user_download_totals: downloads per resume owner, for "top users"
+
+logins and resume_downloads are event logs, so only their inserts are
+counted; old raw events can be purged without changing the history.
+Entity tables (users, uploaded/generated resumes, feedback) also count
+deletes.
+"""
+from migrations.schema import create_index, create_trigger
+
+VERSION = 3
+
+
+def _bump(d, metric_sql, delta):
+    return d.upsert('metric_totals', ['metric', 'value'], ['metric'], {'value': f'metric_totals.value + ({delta})'},
+                    rows=f'VALUES ({metric_sql}, {delta})') + ';'
+
+
+def _bump_day(d, metric, day_sql, delta):
+    return d.upsert('metric_daily', ['metric', 'day', 'value'], ['metric', 'day'],
+                    {'value': f'metric_daily.value + ({delta})'}, rows=f"VALUES ('{metric}', {day_sql}, {delta})") + ';'
+
+
+def triggers(d):
+    """The rollup triggers in dialect ``d``: name -> (event, table, when, body)."""
+    replied = 'CASE WHEN {}.admin_reply IS NULL THEN 0 ELSE 1 END'
+    return {
+        'trg_users_insert_rollup': ('INSERT', 'users', 'NEW.is_admin = FALSE', _bump(d, "'users'", 1)),
+        'trg_users_delete_rollup': ('DELETE', 'users', 'OLD.is_admin = FALSE', _bump(d, "'users'", -1)),
+        'trg_users_admin_flag_rollup': (
+            'UPDATE OF is_admin', 'users', d.is_distinct('OLD.is_admin = FALSE', 'NEW.is_admin = FALSE'),
+            _bump(d, "'users'", 'CASE WHEN NEW.is_admin = FALSE THEN 1 ELSE -1 END')),
+
+        'trg_uploaded_resumes_insert_rollup': ('INSERT', 'uploaded_resumes', None,
+                                               _bump(d, "'uploads'", 1) +
+                                               _bump_day(d, 'uploads', d.day('NEW.uploaded_at'), 1)),
+        'trg_uploaded_resumes_delete_rollup': ('DELETE', 'uploaded_resumes', None,
+                                               _bump(d, "'uploads'", -1) +
+                                               _bump_day(d, 'uploads', d.day('OLD.uploaded_at'), -1)),
+
+        'trg_generated_resumes_insert_rollup': ('INSERT', 'generated_resumes', None,
+                                                _bump(d, "'generated_resumes'", 1)),
+        'trg_generated_resumes_delete_rollup': ('DELETE', 'generated_resumes', None,
+                                                _bump(d, "'generated_resumes'", -1)),
+
+        'trg_logins_insert_rollup': ('INSERT', 'logins', None,
+                                     _bump(d, "'logins'", 1) + _bump_day(d, 'logins', d.day('NEW.login_time'), 1)),
+        'trg_logins_active_user_rollup': ('INSERT', 'logins', 'NEW.user_id IS NOT NULL', d.insert_ignore(
+            'daily_active_users', ['day', 'user_id'], rows=f"VALUES ({d.day('NEW.login_time')}, NEW.user_id)") + ';'),
+
+        'trg_resume_downloads_insert_rollup': ('INSERT', 'resume_downloads', None,
+                                               _bump(d, "'downloads'", 1) +
+                                               _bump_day(d, 'downloads', d.day('NEW.downloaded_at'), 1) +
+                                               d.upsert('user_download_totals', ['user_id', 'downloads'], ['user_id'],
+                                                        {'downloads': 'user_download_totals.downloads + 1'},
+                                                        rows='SELECT user_id, 1 FROM generated_resumes '
+                                                             'WHERE id = NEW.resume_id AND user_id IS NOT NULL') + ';'),
+
+        'trg_feedback_insert_rollup': ('INSERT', 'feedback', None,
+                                       _bump(d, "'feedback'", 1) +
+                                       _bump(d, "'rating_sum'", 'NEW.rating') +
+                                       _bump(d, d.concat("'rating_'", 'NEW.rating'), 1) +
+                                       _bump(d, "'feedback_replied'", replied.format('NEW'))),
+        'trg_feedback_delete_rollup': ('DELETE', 'feedback', None,
+                                       _bump(d, "'feedback'", -1) +
+                                       _bump(d, "'rating_sum'", '-OLD.rating') +
+                                       _bump(d, d.concat("'rating_'", 'OLD.rating'), -1) +
+                                       _bump(d, "'feedback_replied'", f"-{replied.format('OLD')}")),
+        'trg_feedback_reply_rollup': ('UPDATE OF admin_reply', 'feedback',
+                                      '(OLD.admin_reply IS NULL) != (NEW.admin_reply IS NULL)',
+                                      _bump(d, "'feedback_replied'",
+                                            'CASE WHEN NEW.admin_reply IS NULL THEN -1 ELSE 1 END')),
+    }
+
+
+def upgrade(conn):
+    d = conn.dialect
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS metric_totals (
+            metric VARCHAR(64) PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        ){d.without_rowid}
+    ''')
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS metric_daily (
+            metric VARCHAR(64) NOT NULL,
+            day VARCHAR(10) NOT NULL,
+            value INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (metric, day)
+        ){d.without_rowid}
+    ''')
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS daily_active_users (
+            day VARCHAR(10) NOT NULL,
+            user_id INTEGER NOT NULL,
+            PRIMARY KEY (day, user_id)
+        ){d.without_rowid}
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS user_download_totals (
+            user_id INTEGER PRIMARY KEY,
+            downloads INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    create_index(conn, 'idx_user_download_totals_downloads', 'user_download_totals', 'downloads')
+
+    # Backfill from the raw tables
+    conn.execute('DELETE FROM metric_totals')
+    conn.execute('DELETE FROM metric_daily')
+    conn.execute('DELETE FROM daily_active_users')
+    conn.execute('DELETE FROM user_download_totals')
+    conn.execute(f'''
+        INSERT INTO metric_totals (metric, value)
+        SELECT 'users', COUNT(*) FROM users WHERE is_admin = FALSE
+        UNION ALL SELECT 'uploads', COUNT(*) FROM uploaded_resumes
+        UNION ALL SELECT 'generated_resumes', COUNT(*) FROM generated_resumes
+        UNION ALL SELECT 'logins', COUNT(*) FROM logins
+        UNION ALL SELECT 'downloads', COUNT(*) FROM resume_downloads
+        UNION ALL SELECT 'feedback', COUNT(*) FROM feedback
+        UNION ALL SELECT 'feedback_replied', COUNT(*) FROM feedback WHERE admin_reply IS NOT NULL
+        UNION ALL SELECT 'rating_sum', COALESCE(SUM(rating), 0) FROM feedback
+        UNION ALL SELECT {d.concat("'rating_'", 'rating')}, COUNT(*) FROM feedback GROUP BY rating
+    ''')
+    login_day, upload_day, download_day = d.day('login_time'), d.day('uploaded_at'), d.day('downloaded_at')
+    conn.execute(f'''
+        INSERT INTO metric_daily (metric, day, value)
+        SELECT 'logins', {login_day}, COUNT(*) FROM logins GROUP BY {login_day}
+        UNION ALL SELECT 'uploads', {upload_day}, COUNT(*) FROM uploaded_resumes GROUP BY {upload_day}
+        UNION ALL SELECT 'downloads', {download_day}, COUNT(*) FROM resume_downloads GROUP BY {download_day}
+    ''')
+    conn.execute(d.insert_ignore('daily_active_users', ['day', 'user_id'], rows=f'''
+        SELECT DISTINCT {login_day}, user_id FROM logins WHERE user_id IS NOT NULL
+    '''))
+    conn.execute('''
+        INSERT INTO user_download_totals (user_id, downloads)
+        SELECT gr.user_id, COUNT(*) FROM resume_downloads rd
+        JOIN generated_resumes gr ON rd.resume_id = gr.id
+        WHERE gr.user_id IS NOT NULL
+        GROUP BY gr.user_id
+    ''')
+
+    for name, (event, table, when, body) in triggers(d).items():
+        create_trigger(conn, name, event, table, body, when)
@@ -0,0 +1,44 @@
+"""
+Promote template_type and user_type out of the generated_resumes JSON blob
+into real indexed columns, so the admin template-usage chart is a GROUP BY
+over an index instead of LIKE '%Modern%' over every resume_data.
+
+Plain columns rather than JSON1 generated columns: resume_data is not
+guaranteed to stay plain JSON, so the app writes these itself. The insert
+trigger fills them for writers that don't (app_clean.py, scripts). The
+backfill and the trigger read the JSON with SQLite's JSON1; on a server
+database only the app fills the columns.
+"""
+from migrations.schema import add_column, create_index
+
+VERSION = 4
+
+COLUMNS = ('template_type', 'user_type')
+
+
+def upgrade(conn):
+    for column in COLUMNS:
+        add_column(conn, 'generated_resumes', column, 'VARCHAR(64)')
+    create_index(conn, 'idx_generated_resumes_template', 'generated_resumes', 'template_type')
+    create_index(conn, 'idx_generated_resumes_user_type', 'generated_resumes', 'user_type')
+    if conn.dialect.name != 'sqlite':
+        return
+
+    conn.execute('''
+        UPDATE generated_resumes
+        SET template_type = lower(json_extract(resume_data, '$.template_type')),
+            user_type = lower(json_extract(resume_data, '$.user_type'))
+        WHERE json_valid(resume_data)
+    ''')
+
+    conn.execute('DROP TRIGGER IF EXISTS trg_generated_resumes_type_columns')
+    conn.execute('''
+        CREATE TRIGGER trg_generated_resumes_type_columns
+        AFTER INSERT ON generated_resumes
+        WHEN NEW.template_type IS NULL AND json_valid(NEW.resume_data) BEGIN
+            UPDATE generated_resumes
+            SET template_type = lower(json_extract(NEW.resume_data, '$.template_type')),
+                user_type = COALESCE(NEW.user_type, lower(json_extract(NEW.resume_data, '$.user_type')))
+            WHERE id = NEW.id;
+        END
+    ''')
@@ -0,0 +1,56 @@
+"""
+Re-encode generated_resumes.resume_data and resume_sections with
+storage_codec (compressed compact JSON) and log the bytes saved.
+
+Rows are converted in id-ordered batches; already-encoded values are left
+alone, so the upgrade is safe to re-run. The freed pages go on SQLite's
+freelist and are reused by later writes; a VACUUM returns them to the OS.
+"""
+import logging
+
+from storage_codec import decode, encode, is_encoded
+
+VERSION = 5
+
+BATCH_SIZE = 500
+COLUMNS = ('resume_data', 'resume_sections')
+
+
+def _size(value):
+    if value is None:
+        return 0
+    return len(value.encode('utf-8')) if isinstance(value, str) else len(value)
+
+
+def upgrade(conn):
+    before = after = rows = 0
+    last_id = 0
+    while True:
+        batch = conn.execute(f'''
+            SELECT id, {', '.join(COLUMNS)} FROM generated_resumes
+            WHERE id > ? ORDER BY id LIMIT ?
+        ''', (last_id, BATCH_SIZE)).fetchall()
+        if not batch:
+            break
+        for row in batch:
+            last_id = row[0]
+            updates = {}
+            for column, value in zip(COLUMNS, row[1:]):
+                if value is None or is_encoded(value):
+                    continue
+                try:
+                    encoded = encode(decode(value))
+                except ValueError:
+                    logging.warning(f"generated_resumes {row[0]}: {column} is not valid JSON, left as is")
+                    continue
+                before += _size(value)
+                after += len(encoded)
+                updates[column] = encoded
+            if updates:
+                assignments = ', '.join(f'{column} = ?' for column in updates)
+                conn.execute(f'UPDATE generated_resumes SET {assignments} WHERE id = ?', (*updates.values(), row[0]))
+                rows += 1
+
+    if rows:
+        logging.info(f"Re-encoded {rows} generated resumes: {before} -> {after} bytes "
+                     f"({before - after} bytes saved, {100 * (before - after) / before:.0f}%)")
@@ -0,0 +1,26 @@
+"""
+Indexes for the keyset-paginated admin feedback and activity endpoints.
+
+Every page is ``ORDER BY created_at DESC, id DESC`` with a
+``(created_at, id) < (?, ?)`` cursor, so each filter combination gets an
+index that yields rows in that order without a sort:
+
+- all feedback: (created_at, id)
+- by rating: (rating, created_at, id)
+- by replied/pending: ((admin_reply IS NOT NULL), created_at, id)
+- logins: (login_time), whose implicit rowid suffix is the id
+
+idx_logins_time_user (v002) served the raw active-user scans, which now
+read daily_active_users (v003), so it is replaced by the narrower index.
+"""
+from migrations.schema import create_index, drop_index
+
+VERSION = 6
+
+
+def upgrade(conn):
+    create_index(conn, 'idx_feedback_created', 'feedback', 'created_at, id')
+    create_index(conn, 'idx_feedback_rating_created', 'feedback', 'rating, created_at, id')
+    create_index(conn, 'idx_feedback_replied_created', 'feedback', '(admin_reply IS NOT NULL), created_at, id')
+    create_index(conn, 'idx_logins_time', 'logins', 'login_time')
+    drop_index(conn, 'idx_logins_time_user', 'logins')
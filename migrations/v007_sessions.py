@@ -0,0 +1,18 @@
+"""
+Server-side session store shared by all worker processes (sessions.py).
+expires_at is a Unix timestamp; expired rows are purged lazily on write.
+"""
+from migrations.schema import create_index
+
+VERSION = 7
+
+
+def upgrade(conn):
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS sessions (
+            id VARCHAR(64) PRIMARY KEY,
+            data TEXT NOT NULL,
+            expires_at BIGINT NOT NULL
+        ){conn.dialect.without_rowid}
+    ''')
+    create_index(conn, 'idx_sessions_expires_at', 'sessions', 'expires_at')
@@ -0,0 +1,37 @@
+"""
+Stored resume analyses and the cache they are computed from.
+
+resume_analyses keeps the latest analysis of every uploaded and generated
+resume with the rules_version it was computed under (analysis_store.py);
+uploaded_resumes.resume_text caches the text extracted from the upload so
+re-scoring doesn't parse the file again. backfill_checkpoints records how
+far a backfill job got (backfill.py).
+"""
+from migrations.schema import add_column
+
+VERSION = 8
+
+
+def upgrade(conn):
+    d = conn.dialect
+    add_column(conn, 'uploaded_resumes', 'resume_text', 'TEXT')
+
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS resume_analyses (
+            source VARCHAR(16) NOT NULL,
+            resume_id INTEGER NOT NULL,
+            rules_version VARCHAR(64) NOT NULL,
+            ats_score INTEGER,
+            result {d.blob} NOT NULL,
+            analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (source, resume_id)
+        ){d.without_rowid}
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+            job VARCHAR(64) PRIMARY KEY,
+            rules_version VARCHAR(64) NOT NULL,
+            last_id INTEGER NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
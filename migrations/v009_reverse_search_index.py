@@ -0,0 +1,79 @@
+"""
+Indexes over uploaded resumes for reverse search (reverse_search.py).
+
+resume_fts is an FTS5 index over uploaded_resumes.resume_text (external
+content, kept in sync by triggers). resume_skill_postings holds the term
+frequency of every known skill in every indexed resume and
+resume_skill_docs its length in words; both are written with the resume's
+analysis (analysis_store.py), so stored uploaded analyses are dropped here
+and rebuilt, with their skill vectors, on the next read or by
+``flask rescore-resumes``. resume_skill_docs.seq grows with every
+(re)indexed resume so searchers can pick up changes incrementally. FTS5 is
+SQLite's, so server databases only get the skill indexes.
+"""
+from migrations.schema import create_index
+
+VERSION = 9
+
+
+def upgrade(conn):
+    d = conn.dialect
+    if d.full_text_search:
+        _create_fts(conn)
+
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS resume_skill_docs (
+            seq {d.autoincrement_key},
+            resume_id INTEGER NOT NULL UNIQUE,
+            length INTEGER NOT NULL
+        )
+    ''')
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS resume_skill_postings (
+            skill VARCHAR(255) NOT NULL,
+            resume_id INTEGER NOT NULL,
+            tf INTEGER NOT NULL,
+            PRIMARY KEY (skill, resume_id)
+        ){d.without_rowid}
+    ''')
+    create_index(conn, 'idx_resume_skill_postings_resume', 'resume_skill_postings', 'resume_id')
+    conn.execute("DELETE FROM resume_analyses WHERE source = 'uploaded'")
+
+
+def _create_fts(conn):
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS resume_fts USING fts5(
+            resume_text, content='uploaded_resumes', content_rowid='resume_id'
+        )
+    ''')
+    conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS resume_fts_vocab USING fts5vocab(resume_fts, 'row')")
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_uploaded_resumes_fts_insert
+        AFTER INSERT ON uploaded_resumes WHEN NEW.resume_text IS NOT NULL
+        BEGIN
+            INSERT INTO resume_fts (rowid, resume_text) VALUES (NEW.resume_id, NEW.resume_text);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_uploaded_resumes_fts_update
+        AFTER UPDATE OF resume_text ON uploaded_resumes
+        BEGIN
+            INSERT INTO resume_fts (resume_fts, rowid, resume_text)
+            SELECT 'delete', OLD.resume_id, OLD.resume_text WHERE OLD.resume_text IS NOT NULL;
+            INSERT INTO resume_fts (rowid, resume_text)
+            SELECT NEW.resume_id, NEW.resume_text WHERE NEW.resume_text IS NOT NULL;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_uploaded_resumes_fts_delete
+        AFTER DELETE ON uploaded_resumes WHEN OLD.resume_text IS NOT NULL
+        BEGIN
+            INSERT INTO resume_fts (resume_fts, rowid, resume_text) VALUES ('delete', OLD.resume_id, OLD.resume_text);
+        END
+    ''')
+    # Not 'rebuild': that would also index the rows without text, which the triggers never delete
+    conn.execute('''
+        INSERT INTO resume_fts (rowid, resume_text)
+        SELECT resume_id, resume_text FROM uploaded_resumes WHERE resume_text IS NOT NULL
+    ''')
+
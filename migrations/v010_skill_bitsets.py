@@ -0,0 +1,24 @@
+"""
+Skill sets stored as bitsets (analysis.bitsets).
+
+resume_analyses.skill_bits holds the resume's skills as a little-endian
+bitset over the skill-ID dictionary of its rules_version, which is kept in
+skill_dictionary so stored bitsets can be decoded without the code that
+wrote them. Existing analyses get theirs when they are next recomputed.
+"""
+from migrations.schema import add_column
+
+VERSION = 10
+
+
+def upgrade(conn):
+    add_column(conn, 'resume_analyses', 'skill_bits', conn.dialect.blob)
+
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS skill_dictionary (
+            rules_version VARCHAR(64) NOT NULL,
+            skill_id INTEGER NOT NULL,
+            skill TEXT NOT NULL,
+            PRIMARY KEY (rules_version, skill_id)
+        ){conn.dialect.without_rowid}
+    ''')
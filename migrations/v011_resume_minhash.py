@@ -0,0 +1,70 @@
+"""
+MinHash signatures of uploaded resumes and their LSH band keys, for finding
+near-duplicates (near_duplicates.py, analysis.minhash).
+
+resume_signatures holds each uploaded resume's signature and
+resume_lsh_buckets its key in every band, keyed by (band, bucket) so the
+resumes sharing one are a primary-key lookup. New uploads are indexed when
+their text is extracted; triggers drop a resume's rows when it is deleted
+or its text changes. Resumes already stored with their text are indexed
+here in id-ordered batches, skipping any that already are, so the upgrade
+is safe to re-run; the rest are indexed once their text is extracted
+(backfill.py or first use).
+"""
+import logging
+
+from analysis.minhash import band_keys, pack, signature
+from migrations.schema import create_index, create_trigger
+
+VERSION = 11
+
+BATCH_SIZE = 500
+
+
+def upgrade(conn):
+    d = conn.dialect
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS resume_signatures (
+            resume_id INTEGER PRIMARY KEY,
+            signature {d.blob} NOT NULL
+        )
+    ''')
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS resume_lsh_buckets (
+            band INTEGER NOT NULL,
+            bucket BIGINT NOT NULL,
+            resume_id INTEGER NOT NULL,
+            PRIMARY KEY (band, bucket, resume_id)
+        ){d.without_rowid}
+    ''')
+    create_index(conn, 'idx_resume_lsh_buckets_resume', 'resume_lsh_buckets', 'resume_id')
+    for name, event in (('delete', 'DELETE'), ('text_update', 'UPDATE OF resume_text')):
+        create_trigger(conn, f'trg_uploaded_resumes_minhash_{name}', event, 'uploaded_resumes', '''
+            DELETE FROM resume_lsh_buckets WHERE resume_id = OLD.resume_id;
+            DELETE FROM resume_signatures WHERE resume_id = OLD.resume_id;
+        ''')
+
+    indexed = 0
+    last_id = 0
+    while True:
+        batch = conn.execute('''
+            SELECT r.resume_id, r.resume_text FROM uploaded_resumes r
+            LEFT JOIN resume_signatures s ON s.resume_id = r.resume_id
+            WHERE r.resume_id > ? AND r.resume_text IS NOT NULL AND s.resume_id IS NULL
+            ORDER BY r.resume_id LIMIT ?
+        ''', (last_id, BATCH_SIZE)).fetchall()
+        if not batch:
+            break
+        for resume_id, text in batch:
+            last_id = resume_id
+            minhash = signature(text)
+            if minhash is None:
+                continue
+            conn.execute('INSERT INTO resume_signatures (resume_id, signature) VALUES (?, ?)', (resume_id, pack(minhash)))
+            for band, bucket in enumerate(band_keys(minhash)):
+                conn.execute('INSERT INTO resume_lsh_buckets (band, bucket, resume_id) VALUES (?, ?, ?)',
+                             (band, bucket, resume_id))
+            indexed += 1
+
+    if indexed:
+        logging.info(f"Indexed the MinHash signatures of {indexed} uploaded resumes")
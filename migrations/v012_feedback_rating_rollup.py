@@ -0,0 +1,27 @@
+"""
+Keeps the feedback rating rollups (v003) right when a rating is edited.
+
+v003 counted feedback inserts and deletes but not ``UPDATE OF rating``, so
+an edited rating left rating_sum and the per-star counts on the old value.
+The trigger below moves them; the upgrade first recounts both from the
+feedback table, correcting any drift so far.
+"""
+from migrations.schema import create_trigger
+from migrations.v003_admin_rollups import _bump
+
+VERSION = 12
+
+
+def upgrade(conn):
+    d = conn.dialect
+    conn.execute("DELETE FROM metric_totals WHERE metric = 'rating_sum' OR metric LIKE 'rating!_%' ESCAPE '!'")
+    conn.execute(f'''
+        INSERT INTO metric_totals (metric, value)
+        SELECT 'rating_sum', COALESCE(SUM(rating), 0) FROM feedback
+        UNION ALL SELECT {d.concat("'rating_'", 'rating')}, COUNT(*) FROM feedback GROUP BY rating
+    ''')
+    create_trigger(conn, 'trg_feedback_rating_rollup', 'UPDATE OF rating', 'feedback',
+                   _bump(d, "'rating_sum'", 'NEW.rating - OLD.rating') +
+                   _bump(d, d.concat("'rating_'", 'OLD.rating'), -1) +
+                   _bump(d, d.concat("'rating_'", 'NEW.rating'), 1),
+                   when='OLD.rating != NEW.rating')
@@ -0,0 +1,32 @@
+"""
+Drops deleted uploads from reverse search (v009).
+
+v009's FTS5 trigger removed a deleted upload's text, but its skill
+postings and resume_skill_docs row stayed, so searchers kept ranking it.
+The trigger below deletes the postings and replaces the docs row with a
+tombstone (length -1, reverse_search.DELETED) under a new seq, which is
+how searchers see the delete on their next incremental refresh. Uploads
+deleted before this migration get the same treatment here.
+"""
+from migrations.schema import create_trigger
+
+VERSION = 13
+
+DELETED = -1
+
+
+def upgrade(conn):
+    create_trigger(conn, 'trg_uploaded_resumes_skill_index_delete', 'DELETE', 'uploaded_resumes', f'''
+        DELETE FROM resume_skill_postings WHERE resume_id = OLD.resume_id;
+        DELETE FROM resume_skill_docs WHERE resume_id = OLD.resume_id;
+        INSERT INTO resume_skill_docs (resume_id, length) VALUES (OLD.resume_id, {DELETED});
+    ''')
+
+    orphans = [row[0] for row in conn.execute('''
+        SELECT resume_id FROM resume_skill_docs
+        WHERE length != ? AND resume_id NOT IN (SELECT resume_id FROM uploaded_resumes)
+    ''', (DELETED,))]
+    conn.execute('DELETE FROM resume_skill_postings WHERE resume_id NOT IN (SELECT resume_id FROM uploaded_resumes)')
+    conn.executemany('DELETE FROM resume_skill_docs WHERE resume_id = ?', [(resume_id,) for resume_id in orphans])
+    conn.executemany('INSERT INTO resume_skill_docs (resume_id, length) VALUES (?, ?)',
+                     [(resume_id, DELETED) for resume_id in orphans])
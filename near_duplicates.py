@@ -0,0 +1,110 @@
+"""
+Near-duplicate uploaded resumes.
+
+Every uploaded resume's MinHash signature (analysis.minhash) is stored in
+resume_signatures, and its band keys in resume_lsh_buckets (migration
+v011), when its text is extracted. A signature's candidates are the
+resumes sharing one of its band keys, found with a primary-key lookup per
+band however large the corpus, and the candidates whose estimated
+similarity reaches DUPLICATE_SIMILARITY are its near-duplicates. Duplicate
+clusters are built the same way, from the buckets holding more than one
+resume, so the corpus is never compared pairwise.
+"""
+from itertools import groupby
+from operator import itemgetter
+
+from analysis.minhash import BANDS, band_keys, pack, similarity, unpack
+
+DUPLICATE_SIMILARITY = 0.7
+
+
+def index_signature(cursor, resume_id, signature):
+    """(Re)indexes an uploaded resume's signature; None (no text) just drops the old one. The caller commits."""
+    cursor.execute('DELETE FROM resume_lsh_buckets WHERE resume_id = ?', (resume_id,))
+    cursor.execute('DELETE FROM resume_signatures WHERE resume_id = ?', (resume_id,))
+    if signature is None:
+        return
+    cursor.execute('INSERT INTO resume_signatures (resume_id, signature) VALUES (?, ?)', (resume_id, pack(signature)))
+    cursor.executemany('INSERT INTO resume_lsh_buckets (band, bucket, resume_id) VALUES (?, ?, ?)',
+                       [(band, bucket, resume_id) for band, bucket in enumerate(band_keys(signature))])
+
+
+def find_duplicates(cursor, signature, user_id=None, limit=10):
+    """
+    The uploaded resumes (only ``user_id``'s, if given) that are
+    near-duplicates of ``signature``, most similar first:
+    ``[(resume_id, similarity)]``.
+    """
+    bands = ' OR '.join(['(b.band = ? AND b.bucket = ?)'] * BANDS)
+    params = [value for band, bucket in enumerate(band_keys(signature)) for value in (band, bucket)]
+    owner = ''
+    if user_id is not None:
+        owner = 'JOIN uploaded_resumes r ON r.resume_id = b.resume_id AND r.user_id = ?'
+        params.insert(0, user_id)
+    candidates = cursor.execute(f'''
+        SELECT s.resume_id, s.signature FROM resume_signatures s
+        WHERE s.resume_id IN (SELECT b.resume_id FROM resume_lsh_buckets b {owner} WHERE {bands})
+    ''', params).fetchall()
+
+    duplicates = []
+    for resume_id, blob in candidates:
+        score = similarity(signature, unpack(blob))
+        if score >= DUPLICATE_SIMILARITY:
+            duplicates.append((resume_id, score))
+    duplicates.sort(key=lambda item: (-item[1], -item[0]))
+    return duplicates[:limit]
+
+
+def duplicate_clusters(cursor):
+    """
+    The groups of uploaded resumes linked by near-duplicate pairs, largest
+    first: ``[[resume_id, ...]]``, each ascending.
+    """
+    # Only the shared buckets hold candidate pairs: the database finds them in one pass over the primary
+    # key and returns just their members, not a row per bucket of every resume
+    buckets = cursor.execute('''
+        SELECT b.band, b.bucket, b.resume_id FROM (
+            SELECT band, bucket FROM resume_lsh_buckets GROUP BY band, bucket HAVING COUNT(*) > 1
+        ) s JOIN resume_lsh_buckets b ON b.band = s.band AND b.bucket = s.bucket
+        ORDER BY b.band, b.bucket
+    ''')
+    shared = [[row[2] for row in group] for _, group in groupby(buckets, itemgetter(0, 1))]
+
+    signatures = {}
+    parent = {}  # union-find forest of the resumes in shared buckets
+
+    def signature_of(resume_id):
+        if resume_id not in signatures:
+            row = cursor.execute('SELECT signature FROM resume_signatures WHERE resume_id = ?', (resume_id,)).fetchone()
+            signatures[resume_id] = unpack(row[0])
+        return signatures[resume_id]
+
+    def find(resume_id):
+        parent.setdefault(resume_id, resume_id)
+        while parent[resume_id] != resume_id:
+            parent[resume_id] = parent[parent[resume_id]]
+            resume_id = parent[resume_id]
+        return resume_id
+
+    for members in shared:
+        for i, first in enumerate(members):
+            for second in members[i + 1:]:
+                if find(first) != find(second) and \
+                        similarity(signature_of(first), signature_of(second)) >= DUPLICATE_SIMILARITY:
+                    parent[find(first)] = find(second)
+
+    clusters = {}
+    for resume_id in parent:
+        clusters.setdefault(find(resume_id), []).append(resume_id)
+    return sorted((sorted(members) for members in clusters.values() if len(members) > 1),
+                  key=lambda members: (-len(members), members[0]))
+
+
+def compare_analyses(previous, current):
+    """What changed between two stored analyses (see analysis_store.analyze_text) of a resume."""
+    before, after = set(previous['keywords']), set(current['keywords'])
+    change = {'added_keywords': sorted(after - before), 'removed_keywords': sorted(before - after),
+              'ats_score_change': None}
+    if previous['analysis'] and current['analysis']:
+        change['ats_score_change'] = current['analysis']['ats_score'] - previous['analysis']['ats_score']
+    return change
@@ -0,0 +1,52 @@
+import os
+import json
+import hashlib
+import tempfile
+
+
+def resume_cache_key(resume_data, template_version):
+    """Content hash of a resume; identical data + template renders identical PDFs."""
+    canonical = json.dumps(resume_data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    digest = hashlib.sha256(f"v{template_version}:{canonical}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _write_atomic(path, data):
+    """Write to a temp file and rename so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class PdfCache:
+    """Content-addressed on-disk cache of rendered resume PDFs and their text sidecars."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key, ext):
+        # two-level fan-out keeps directories small
+        return os.path.join(self.directory, key[:2], f"{key}.{ext}")
+
+    def get(self, key):
+        """Return ``(pdf_bytes, sidecar)`` for a cached render, or None."""
+        try:
+            with open(self._path(key, 'pdf'), 'rb') as f:
+                pdf_bytes = f.read()
+            with open(self._path(key, 'json'), 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        return pdf_bytes, sidecar
+
+    def put(self, key, pdf_bytes, sidecar):
+        # sidecar first: get() only trusts an entry once its PDF exists
+        _write_atomic(self._path(key, 'json'), json.dumps(sidecar).encode('utf-8'))
+        _write_atomic(self._path(key, 'pdf'), pdf_bytes)
@@ -0,0 +1,138 @@
+import io
+import math
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+
+class RenderPoolBusy(Exception):
+    """Raised when the render queue is full and the job cannot be accepted."""
+
+    def __init__(self, retry_after):
+        self.retry_after = retry_after
+        super().__init__(f"Server busy, please retry in {retry_after} s.")
+
+
+class RenderTimeout(Exception):
+    """Raised when a render job does not finish within the per-job timeout."""
+
+
+def render_resume_pdf(resume_data):
+    """Worker entry point: render a resume and return ``(pdf_bytes, sidecar)``."""
+    from analysis.pdf import generate_ats_pdf
+    sidecar = {}
+    pdf_bytes = generate_ats_pdf(resume_data, sidecar=sidecar).getvalue()
+    return pdf_bytes, sidecar
+
+
+def _timed_call(fn, *args):
+    """Worker side of RenderPool.submit: ``(seconds fn ran, fn(*args))``, excluding time spent queued."""
+    started = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - started, result
+
+
+def _warm_worker():
+    """Import the renderer once per worker so the first job doesn't pay for it."""
+    import analysis.pdf  # noqa: F401  (no Flask app or DB set-up in the workers)
+    import reportlab.platypus  # noqa: F401  (generate_ats_pdf imports it lazily)
+
+
+class RenderPool:
+    """
+    Dedicated process pool for CPU-bound ReportLab rendering.
+
+    At most ``workers + queue_size`` jobs are accepted at a time; anything
+    beyond that is rejected immediately with ``RenderPoolBusy`` so request
+    workers never pile up behind the renderer.
+    """
+
+    def __init__(self, workers=None, queue_size=None, timeout=30):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.queue_size = self.workers * 2 if queue_size is None else max(0, queue_size)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._pending = 0
+        self._avg_seconds = 1.0  # running estimate of a single render (not its queue wait), used for Retry-After
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn rather than fork: the web server is multi-threaded
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_warm_worker
+                )
+            return self._executor
+
+    def retry_after(self):
+        """Seconds a rejected client should wait before retrying."""
+        with self._lock:
+            backlog = self._pending / self.workers
+            return max(1, math.ceil(backlog * self._avg_seconds))
+
+    def _job_done(self, job, future):
+        """Settle the caller's ``future`` from the worker's ``job`` and free its slot."""
+        elapsed = None
+        if job.cancelled():
+            future.cancel()
+        elif job.exception() is not None:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(job.exception())
+        else:
+            elapsed, result = job.result()
+            if future.set_running_or_notify_cancel():
+                future.set_result(result)
+        with self._lock:
+            self._pending -= 1
+            if elapsed is not None:
+                self._avg_seconds = 0.8 * self._avg_seconds + 0.2 * elapsed
+        self._slots.release()
+
+    def submit(self, fn, *args, block=False):
+        """
+        Queue ``fn(*args)`` on the pool. Raises RenderPoolBusy if the pool is
+        full, unless ``block`` is set, in which case it waits for a free slot.
+        Cancelling the returned future cancels the job if it hasn't started.
+        """
+        if not self._slots.acquire(blocking=block):
+            raise RenderPoolBusy(self.retry_after())
+        # Counted before the job exists, so its done callback can never run first
+        with self._lock:
+            self._pending += 1
+        try:
+            job = self._get_executor().submit(_timed_call, fn, *args)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            self._slots.release()
+            raise
+        future = Future()
+        future.add_done_callback(lambda f: f.cancelled() and job.cancel())
+        job.add_done_callback(lambda job: self._job_done(job, future))
+        return future
+
+    def render(self, resume_data):
+        """Render a resume in the pool and return ``(BytesIO with the PDF, sidecar)``."""
+        future = self.submit(render_resume_pdf, resume_data)
+        try:
+            pdf_bytes, sidecar = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # A job that already started can't be interrupted; it keeps its
+            # slot until it finishes so the pool stays bounded.
+            future.cancel()
+            logging.warning(f"PDF render exceeded {self.timeout}s timeout")
+            raise RenderTimeout(f"Resume rendering took longer than {self.timeout} seconds.")
+        return io.BytesIO(pdf_bytes), sidecar
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
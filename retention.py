@@ -0,0 +1,157 @@
+"""
+Retention for the append-only event tables (logins, resume_downloads).
+
+Their daily aggregates live in metric_daily / daily_active_users (kept
+current by the v003 triggers, which only count inserts), so raw events
+past the retention window can be deleted without changing any dashboard
+number. Deletes run in small chunks, each its own short transaction, so
+request threads can keep writing in between; freed pages are handed back
+with an incremental vacuum, likewise in bounded steps.
+"""
+import os
+import gzip
+import json
+import time
+import logging
+
+CHUNK_SIZE = 1000
+CHUNK_PAUSE = 0.01  # seconds between chunks, lets waiting writers in
+
+# table -> timestamp column
+EVENT_TABLES = {'logins': 'login_time', 'resume_downloads': 'downloaded_at'}
+
+AUTO_VACUUM_INCREMENTAL = 2
+VACUUM_STEP_PAGES = 256  # pages freed per incremental_vacuum step, each its own short write
+
+
+def rollup_statements(dialect, table):
+    """The statements that fill ``table``'s missing daily aggregates for its events before a cutoff (``?``)."""
+    day = dialect.day(EVENT_TABLES[table])
+    if table == 'logins':
+        return (
+            dialect.insert_ignore('metric_daily', ['metric', 'day', 'value'], f'''
+                SELECT 'logins', {day}, COUNT(*) FROM logins
+                WHERE login_time < ? GROUP BY {day}'''),
+            dialect.insert_ignore('daily_active_users', ['day', 'user_id'], f'''
+                SELECT DISTINCT {day}, user_id FROM logins
+                WHERE login_time < ? AND user_id IS NOT NULL'''),
+        )
+    return (
+        dialect.insert_ignore('metric_daily', ['metric', 'day', 'value'], f'''
+            SELECT 'downloads', {day}, COUNT(*) FROM resume_downloads
+            WHERE downloaded_at < ? GROUP BY {day}'''),
+    )
+
+
+def retention_cutoff(conn, days):
+    """Timestamp (CURRENT_TIMESTAMP format, UTC) before which events are purged."""
+    return conn.execute(f'SELECT {conn.dialect.timestamp_days_ago(days)}').fetchone()[0]
+
+
+def enable_incremental_vacuum(conn):
+    """
+    One-off maintenance (``flask enable-incremental-vacuum``): switches an
+    existing database to auto_vacuum=INCREMENTAL. The mode only takes effect
+    after a full VACUUM, which rebuilds the file and holds the write lock
+    until it is done, so run it in a maintenance window. Databases created
+    by init_db are incremental from the start. Returns True if the
+    conversion was done now.
+    """
+    if conn.execute('PRAGMA auto_vacuum').fetchone()[0] == AUTO_VACUUM_INCREMENTAL:
+        return False
+    if conn.in_transaction:
+        conn.commit()
+    logging.info("Enabling incremental auto_vacuum (full VACUUM)")
+    conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+    conn.execute('VACUUM')
+    return True
+
+
+def reclaim_space(conn, step_pages=VACUUM_STEP_PAGES):
+    """
+    Returns the freelist's pages to the OS, ``step_pages`` at a time with a
+    pause in between, so writers only ever wait for one short step. Without
+    auto_vacuum=INCREMENTAL the pages stay on the freelist, where later
+    writes reuse them. Server databases reclaim space themselves (autovacuum,
+    InnoDB purge), so there this does nothing. Returns the pages freed.
+    """
+    if conn.dialect.name != 'sqlite':
+        return 0
+    if conn.execute('PRAGMA auto_vacuum').fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+        logging.info("auto_vacuum is not INCREMENTAL; run `flask enable-incremental-vacuum` once to shrink the file")
+        return 0
+    if conn.in_transaction:
+        conn.commit()
+    freed = 0
+    pending = conn.execute('PRAGMA freelist_count').fetchone()[0]
+    while pending:
+        conn.execute(f'PRAGMA incremental_vacuum({int(step_pages)})').fetchall()  # one row per page freed
+        remaining = conn.execute('PRAGMA freelist_count').fetchone()[0]
+        if remaining >= pending:
+            break
+        freed += pending - remaining
+        pending = remaining
+        time.sleep(CHUNK_PAUSE)
+    conn.execute('PRAGMA wal_checkpoint(PASSIVE)')
+    return freed
+
+
+def purge_events(conn, table, cutoff, chunk_size=CHUNK_SIZE, archive=None):
+    """
+    Deletes rows of ``table`` older than ``cutoff``, oldest first, in chunks
+    of ``chunk_size``. With ``archive`` (a text file object) each row is
+    written as a JSON line before it is deleted. Returns the rows deleted.
+    """
+    time_column = EVENT_TABLES[table]
+    if conn.in_transaction:
+        conn.commit()
+
+    with conn:
+        for sql in rollup_statements(conn.dialect, table):
+            conn.execute(sql, (cutoff,))
+
+    deleted = 0
+    while True:
+        with conn:
+            rows = conn.execute(
+                f'SELECT * FROM {table} WHERE {time_column} < ? ORDER BY {time_column}, id LIMIT ?',
+                (cutoff, chunk_size)
+            ).fetchall()
+            if not rows:
+                break
+            if archive is not None:
+                for row in rows:
+                    archive.write(json.dumps(dict(row), default=str) + '\n')
+            ids = [row['id'] for row in rows]
+            conn.execute(f'DELETE FROM {table} WHERE id IN ({",".join("?" * len(ids))})', ids)
+        deleted += len(rows)
+        if len(rows) < chunk_size:
+            break
+        time.sleep(CHUNK_PAUSE)
+    return deleted
+
+
+def run_retention(conn, days, chunk_size=CHUNK_SIZE, archive_dir=None):
+    """
+    Purges every event table past the retention window, optionally archiving
+    to ``archive_dir/<table>-<timestamp>.jsonl.gz``, then reclaims the freed
+    pages. Returns ``{table: rows deleted}``.
+    """
+    cutoff = retention_cutoff(conn, days)
+    stamp = time.strftime('%Y%m%d-%H%M%S')
+
+    results = {}
+    for table in EVENT_TABLES:
+        if archive_dir:
+            os.makedirs(archive_dir, exist_ok=True)
+            path = os.path.join(archive_dir, f'{table}-{stamp}.jsonl.gz')
+            with gzip.open(path, 'wt', encoding='utf-8') as archive:
+                results[table] = purge_events(conn, table, cutoff, chunk_size, archive)
+            if not results[table]:
+                os.unlink(path)
+        else:
+            results[table] = purge_events(conn, table, cutoff, chunk_size)
+        logging.info(f"Purged {results[table]} {table} rows older than {cutoff}")
+
+    reclaim_space(conn)
+    return results
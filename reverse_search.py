@@ -0,0 +1,277 @@
+"""
+Reverse search: rank every uploaded resume against a job description.
+
+Two indexes back it (migration v009). Skill postings give the term
+frequency of each known skill in each resume and resume_skill_docs its
+length; they are written with the resume's stored analysis
+(analysis_store.py). resume_fts is an FTS5 index over the extracted text,
+kept in sync with uploaded_resumes.resume_text by triggers. Deleting an
+upload drops its postings and leaves a tombstone docs row (v013).
+
+A resume's score mixes the share of the job description's skills it has
+with BM25 over those skills and the description's distinctive non-skill
+words, normalised to 0..1. The skill part comes from a per-process copy of
+the postings (SkillIndex), refreshed incrementally before every search; the
+word part from FTS5. Resumes are scored a skill-count level at a time, most
+skills first, into a heap of the best k, and the search stops at the first
+level that cannot beat the heap, so common skills don't mean scoring the
+whole corpus. FTS5 is SQLite's: on a server database (no resume_fts) the
+score is the skill part alone.
+"""
+import re
+import math
+import heapq
+import threading
+from array import array
+from bisect import bisect_left
+from operator import itemgetter
+from itertools import accumulate, groupby
+
+from analysis import extract_keywords, skill_forms
+from analysis.bitsets import bitmap, bit_positions
+
+K1 = 1.2  # BM25 parameters, the same as FTS5's bm25()
+B = 0.75
+OVERLAP_WEIGHT = 0.6  # the rest of the score is BM25
+MAX_TEXT_TERMS = 5
+MAX_TEXT_TERM_SHARE = 0.02  # words in more resumes than this are too common to search for
+MAX_QUERY_WORDS = 100
+DEAD_SHARE = 0.25  # reload once this many resumes per live one have been re-indexed since the last load
+DELETED = -1  # resume_skill_docs.length of a deleted upload's tombstone (migration v013)
+
+# (skill, seq, BM25 term weight) of the resumes indexed in a seq range, given (K1 + 1, K1 * (1 - B), K1 * B / avgdl)
+POSTINGS_WEIGHTS = '''
+    SELECT p.skill, d.seq, p.tf * ? / (p.tf + ? + ? * d.length)
+    FROM {join} WHERE d.resume_id = p.resume_id AND d.seq > ? AND d.seq <= ? ORDER BY {order}
+'''
+POSTINGS_BY_SKILL = POSTINGS_WEIGHTS.format(join='resume_skill_postings p CROSS JOIN resume_skill_docs d', order='p.skill')
+NEW_POSTINGS = POSTINGS_WEIGHTS.format(join='resume_skill_docs d, resume_skill_postings p', order='p.skill, d.seq')
+
+
+def index_resume(cursor, resume_id, skills, length):
+    """(Re)indexes an uploaded resume's skill vector ``skills`` (skill -> count). The caller commits."""
+    cursor.execute('DELETE FROM resume_skill_postings WHERE resume_id = ?', (resume_id,))
+    cursor.execute('DELETE FROM resume_skill_docs WHERE resume_id = ?', (resume_id,))
+    cursor.execute('INSERT INTO resume_skill_docs (resume_id, length) VALUES (?, ?)', (resume_id, length))
+    cursor.executemany('INSERT INTO resume_skill_postings (skill, resume_id, tf) VALUES (?, ?, ?)',
+                       [(skill, resume_id, tf) for skill, tf in skills.items()])
+
+
+def idf(docs, df):
+    """BM25 inverse document frequency, clamped positive as in FTS5."""
+    return max(math.log((docs - df + 0.5) / (df + 0.5)), 1e-6)
+
+
+class Postings:
+    """One skill's postings: resume seqs (ascending), their BM25 term weights, and the seqs as a bitmap."""
+    __slots__ = ('seqs', 'weights', 'bits', 'max_weight')
+
+    def __init__(self):
+        self.seqs = array('q')
+        self.weights = array('d')
+        self.bits = 0
+        self.max_weight = 0.0
+
+    def extend(self, pairs):
+        pairs.sort()
+        self.seqs.extend(seq for seq, _ in pairs)
+        self.weights.extend(weight for _, weight in pairs)
+        self.bits |= bitmap([seq for seq, _ in pairs])
+        self.max_weight = max(self.max_weight, max(weight for _, weight in pairs))
+
+
+class SkillIndex:
+    """
+    One database's skill postings in memory, keyed by resume_skill_docs.seq,
+    with the term weight ``tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avgdl))``
+    precomputed, plus the words too common (see MAX_TEXT_TERM_SHARE) to be
+    worth an FTS5 lookup.
+
+    A re-indexed resume gets a new seq, and a deleted one a tombstone seq
+    that never goes live; either way its old seq is dropped from
+    ``live``. The stale postings stay until enough pile up to reload
+    everything, which also refreshes avgdl. Call refresh and top holding
+    ``lock``.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.postings = {}  # skill -> Postings
+        self.docs = {}  # live seq -> resume_id
+        self.seq_of = {}  # resume_id -> live seq
+        self.live = 0  # bitmap of the live seqs
+        self.seq = 0
+        self.avgdl = 1.0
+        self.dead = 0  # re-indexed seqs whose postings are still loaded
+        self.common_terms = frozenset()
+        self._terms_docs = 0  # len(docs) when common_terms was read
+
+    def refresh(self, cursor):
+        """Picks up resumes (re)indexed since the last refresh."""
+        if self.dead > DEAD_SHARE * len(self.docs):
+            self._reset()
+        rows = cursor.execute('SELECT seq, resume_id, length FROM resume_skill_docs WHERE seq > ? ORDER BY seq',
+                              (self.seq,)).fetchall()
+        if rows:
+            self._add(cursor, rows)
+        if self.docs and len(self.docs) >= 2 * self._terms_docs and cursor.connection.dialect.full_text_search:
+            self._terms_docs = len(self.docs)
+            self.common_terms = frozenset(row[0] for row in cursor.execute(
+                'SELECT term FROM resume_fts_vocab WHERE doc > ?', (MAX_TEXT_TERM_SHARE * self._terms_docs,)))
+
+    def _add(self, cursor, rows):
+        first = self.seq
+        if not self.docs:
+            lengths = [row[2] for row in rows if row[2] != DELETED]
+            self.avgdl = max(sum(lengths) / len(lengths), 1.0) if lengths else 1.0
+            # Postings in primary key order, so they arrive grouped by skill
+            query = POSTINGS_BY_SKILL
+        else:
+            query = NEW_POSTINGS
+        for seq, resume_id, length in rows:
+            old = self.seq_of.pop(resume_id, None)
+            if old is not None:
+                del self.docs[old]
+                self.dead += 1
+            if length != DELETED:
+                self.docs[seq] = resume_id
+                self.seq_of[resume_id] = seq
+        self.seq = rows[-1][0]
+        self.live = bitmap(list(self.docs)) if self.docs else 0
+
+        weights = cursor.execute(query, (K1 + 1, K1 * (1 - B), K1 * B / self.avgdl, first, self.seq))
+        for skill, group in groupby(weights, itemgetter(0)):
+            postings = self.postings.get(skill)
+            if postings is None:
+                postings = self.postings[skill] = Postings()
+            postings.extend([(seq, weight) for _, seq, weight in group])
+
+    def top(self, skills, text_scores, text_idf, limit):
+        """
+        The ``limit`` best resumes for ``skills`` plus FTS5 ``text_scores``
+        (resume_id -> BM25 over words whose idfs sum to ``text_idf``):
+        ``[(score, resume_id, matched skill count)]``, best first.
+        """
+        docs = len(self.docs)
+        lists = sorted((self.postings[skill] for skill in skills if skill in self.postings),
+                       key=lambda postings: len(postings.seqs))
+        idfs = [idf(docs, len(postings.seqs)) for postings in lists]
+        ceiling = (sum(idfs) + text_idf) * (K1 + 1)
+        if not ceiling:
+            return []
+        overlap = OVERLAP_WEIGHT / len(skills) if skills else 0.0
+        relevance = (1 - OVERLAP_WEIGHT) / ceiling
+        terms = [(postings.seqs, postings.weights, len(postings.seqs), weight * relevance)
+                 for postings, weight in zip(lists, idfs)]
+
+        def score(seq):
+            hits, total = 0, 0.0
+            for seqs, weights, size, weight in terms:
+                i = bisect_left(seqs, seq)
+                if i < size and seqs[i] == seq:
+                    hits += 1
+                    total += weight * weights[i]
+            return overlap * hits + total, hits
+
+        heap = []
+
+        def offer(entry):
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        for resume_id, text_score in text_scores.items():
+            seq = self.seq_of.get(resume_id)
+            skill_score, hits = score(seq) if seq is not None else (0.0, 0)
+            offer((skill_score + relevance * text_score, resume_id, hits))
+
+        # Bit-sliced count of each resume's matching skills: slices[j] holds bit j of the count
+        slices = []
+        for postings in lists:
+            carry = postings.bits
+            for j, bits in enumerate(slices):
+                slices[j], carry = bits ^ carry, bits & carry
+                if not carry:
+                    break
+            if carry:
+                slices.append(carry)
+
+        # The most a resume with c matching skills can score (its word part is already counted above)
+        bounds = [0.0] + list(accumulate(sorted((weight * postings.max_weight
+                                                 for postings, (_, _, _, weight) in zip(lists, terms)), reverse=True)))
+        for count in range(len(lists), 0, -1):
+            if len(heap) == limit and heap[0][0] >= overlap * count + bounds[count]:
+                break
+            level = self.live
+            for j, bits in enumerate(slices):
+                level &= bits if count >> j & 1 else ~bits
+            for seq in bit_positions(level):
+                resume_id = self.docs[seq]
+                if resume_id not in text_scores:
+                    skill_score, hits = score(seq)
+                    offer((skill_score, resume_id, hits))
+        return sorted(heap, reverse=True)
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(database):
+    """The process's SkillIndex of ``database`` (a DATABASE setting)."""
+    with _indexes_lock:
+        index = _indexes.get(database)
+        if index is None:
+            index = _indexes[database] = SkillIndex()
+        return index
+
+
+def text_terms(cursor, job_description, skills, common_terms, docs):
+    """
+    The job description's most distinctive non-skill words that some
+    resume contains, with their document frequencies: ``[(term, df)]``.
+    """
+    if not cursor.connection.dialect.full_text_search:
+        return []
+    forms = skill_forms()
+    words = sorted((w for w in set(re.findall(r'[a-z0-9]+', job_description.lower()))
+                    if len(w) > 2 and forms.resolve(w) is None and w not in skills and w not in common_terms),
+                   key=lambda w: (-len(w), w))[:MAX_QUERY_WORDS]
+    limit = max(MAX_TEXT_TERM_SHARE * docs, 1)
+    terms = []
+    for word in words:
+        row = cursor.execute('SELECT doc FROM resume_fts_vocab WHERE term = ?', (word,)).fetchone()
+        if row is not None and row[0] <= limit:
+            terms.append((row[0], word))
+    return [(term, df) for df, term in sorted(terms)[:MAX_TEXT_TERMS]]
+
+
+def search_text(cursor, terms):
+    """FTS5 BM25 score (higher is better) of every resume matching any of ``terms``."""
+    if not terms:
+        return {}
+    query = ' OR '.join(f'"{term}"' for term, _ in terms)
+    return {resume_id: -score for resume_id, score in cursor.execute(
+        'SELECT rowid, bm25(resume_fts) FROM resume_fts WHERE resume_fts MATCH ?', (query,))}
+
+
+def rank_resumes(cursor, index, job_description, limit=10):
+    """
+    The ``limit`` uploaded resumes that best match ``job_description``,
+    best first: ``[(resume_id, score, matched skill count)]`` with ``score``
+    in 0..1, and the job's skills.
+    """
+    skills = sorted(set(extract_keywords(job_description)))
+    with index.lock:
+        index.refresh(cursor)
+        common_terms, docs = index.common_terms, len(index.docs)
+
+    terms = text_terms(cursor, job_description, skills, common_terms, docs)
+    text_scores = search_text(cursor, terms)
+    with index.lock:
+        top = index.top(skills, text_scores, sum(idf(docs, df) for _, df in terms), limit)
+    return [(resume_id, min(score, 1.0), hits) for score, resume_id, hits in top], skills
@@ -0,0 +1,100 @@
+import time
+import random
+import secrets
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SessionInterface
+from itsdangerous import BadSignature, Signer
+
+import db
+
+PURGE_PROBABILITY = 0.01  # share of session writes that also delete expired rows
+IDENTITY_KEYS = ('user_id', 'is_admin')  # a change to these (login, logout, promotion) gets a new session id
+
+
+class ServerSession(SecureCookieSession):
+    """Session whose data lives in the database; the cookie only carries its signed id."""
+    sid = None
+    identity = (None, None)  # IDENTITY_KEYS as loaded
+
+    def current_identity(self):
+        return tuple(self.get(key) for key in IDENTITY_KEYS)
+
+
+class DatabaseSessionInterface(SessionInterface):
+    """
+    Server-side sessions in the ``sessions`` table (migration v007), so every
+    worker process sees the same session and a cookie can be revoked by
+    deleting its row. Rows are only written when the session changes.
+    When the logged-in identity changes the session gets a fresh id and the
+    old row is deleted, so an id planted before login (session fixation) is
+    worthless afterwards.
+    """
+    session_class = ServerSession
+    serializer = TaggedJSONSerializer()
+    salt = 'rezumai-session'
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt=self.salt)
+
+    def open_session(self, app, request):
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = self._signer(app).unsign(cookie).decode('ascii')
+            except BadSignature:
+                sid = None
+            if sid:
+                with db.pooled_connection() as conn:
+                    row = conn.execute('SELECT data FROM sessions WHERE id = ? AND expires_at > ?',
+                                       (sid, int(time.time()))).fetchone()
+                if row is not None:
+                    session = self.session_class(self.serializer.loads(row[0]))
+                    session.sid = sid
+                    session.identity = session.current_identity()
+                    return session
+        return self.session_class()
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if session.modified and session.sid:
+                with db.pooled_connection() as conn:
+                    conn.execute('DELETE FROM sessions WHERE id = ?', (session.sid,))
+                    conn.commit()
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        if not self.should_set_cookie(app, session):
+            return
+
+        old_sid = session.sid
+        if old_sid is None or session.current_identity() != session.identity:
+            session.sid = secrets.token_urlsafe(32)
+        now = int(time.time())
+        expires_at = now + int(app.permanent_session_lifetime.total_seconds())
+        with db.pooled_connection() as conn:
+            dialect = conn.dialect
+            if old_sid is not None and old_sid != session.sid:
+                conn.execute('DELETE FROM sessions WHERE id = ?', (old_sid,))
+            conn.execute(dialect.upsert(
+                'sessions', ['id', 'data', 'expires_at'], key=['id'],
+                update={'data': dialect.excluded('data'), 'expires_at': dialect.excluded('expires_at')}
+            ), (session.sid, self.serializer.dumps(dict(session)), expires_at))
+            if random.random() < PURGE_PROBABILITY:
+                conn.execute('DELETE FROM sessions WHERE expires_at <= ?', (now,))
+            conn.commit()
+
+        response.set_cookie(
+            name,
+            self._signer(app).sign(session.sid).decode('ascii'),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
@@ -0,0 +1,48 @@
+"""
+Versioned encoding for JSON documents stored in the database.
+
+Encoded values are BLOBs: a 3-byte header (``RZ`` + format version)
+followed by the payload. Format 1 is zlib-compressed compact JSON.
+Anything without the header is a legacy ``json.dumps`` row and is parsed
+as plain JSON, so old rows keep working until they are re-encoded.
+"""
+import json
+import zlib
+
+MAGIC = b'RZ'
+FORMAT_ZLIB_JSON = 1
+CURRENT_FORMAT = FORMAT_ZLIB_JSON
+COMPRESSION_LEVEL = 6
+
+
+class CodecError(ValueError):
+    """Raised for a stored value with an unknown header or a corrupt payload."""
+
+
+def encode(value):
+    """Serialize ``value`` for storage in the current format."""
+    payload = json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return MAGIC + bytes([CURRENT_FORMAT]) + zlib.compress(payload, COMPRESSION_LEVEL)
+
+
+def is_encoded(stored):
+    return isinstance(stored, (bytes, memoryview)) and bytes(stored[:2]) == MAGIC
+
+
+def decode(stored):
+    """Inverse of encode(); also accepts legacy JSON text. None stays None."""
+    if stored is None:
+        return None
+    if not is_encoded(stored):
+        if isinstance(stored, (bytes, memoryview)):
+            stored = bytes(stored).decode('utf-8')
+        return json.loads(stored)
+
+    stored = bytes(stored)
+    version = stored[2] if len(stored) > 2 else None
+    if version != FORMAT_ZLIB_JSON:
+        raise CodecError(f"Unknown storage format: {version}")
+    try:
+        return json.loads(zlib.decompress(stored[3:]).decode('utf-8'))
+    except (zlib.error, UnicodeDecodeError, ValueError) as e:
+        raise CodecError(f"Corrupt stored value: {e}") from e
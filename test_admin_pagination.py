@@ -0,0 +1,73 @@
+import pytest
+
+import db
+import app as rezumai
+
+
+@pytest.fixture(params=['sqlite', 'server'])
+def client(request, tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db') if request.param == 'sqlite' else request.getfixturevalue('server_database')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    conn = db.connect(path)
+    # 25 rows sharing a handful of timestamps, so pages must break ties on id
+    for i in range(25):
+        conn.execute('''
+            INSERT INTO feedback (user_id, rating, suggestion, admin_reply, created_at)
+            VALUES (1, ?, ?, ?, ?)
+        ''', (i % 5 + 1, f'suggestion {i}', 'thanks' if i % 2 else None, f'2024-01-0{i % 3 + 1} 10:00:00'))
+    conn.commit()
+    conn.close()
+
+    client = rezumai.app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+        session['is_admin'] = True
+    return client
+
+
+def fetch_all(client, query=''):
+    ids, cursor = [], None
+    while True:
+        url = f'/admin/feedback?limit=7{query}' + (f'&cursor={cursor}' if cursor else '')
+        data = client.get(url).get_json()['data']
+        ids.extend(item['id'] for item in data['items'])
+        cursor = data['next_cursor']
+        if not cursor:
+            return ids
+
+
+def test_pages_cover_every_row_once_in_order(client):
+    ids = fetch_all(client)
+    assert len(ids) == len(set(ids)) == 25
+    conn = db.connect(rezumai.app.config['DATABASE'])
+    expected = [row[0] for row in conn.execute('SELECT id FROM feedback ORDER BY created_at DESC, id DESC')]
+    conn.close()
+    assert ids == expected
+
+
+@pytest.mark.parametrize('query, count', [('&rating=5', 5), ('&replied=true', 12), ('&replied=false', 13),
+                                          ('&rating=1&replied=false', 3)])
+def test_filters(client, query, count):
+    assert len(fetch_all(client, query)) == count
+
+
+def test_bad_arguments_rejected(client):
+    assert client.get('/admin/feedback?cursor=not-a-cursor').status_code == 400
+    assert client.get('/admin/feedback?replied=maybe').status_code == 400
+    for rating in ('abc', '0', '6', '2.5'):
+        assert client.get(f'/admin/feedback?rating={rating}').status_code == 400
+    assert client.get('/admin/feedback?rating=').status_code == 200
+    assert client.get('/admin/activity/nope').status_code == 404
+
+
+def test_requires_admin():
+    client = rezumai.app.test_client()
+    assert client.get('/admin/feedback').status_code == 401
+    assert client.get('/admin/activity/logins').status_code == 401
+
+
+def test_cursor_keeps_timestamps_as_text():
+    from datetime import datetime
+    token = rezumai.encode_page_cursor(datetime(2024, 1, 2, 3, 4, 5, 600), 7)
+    assert rezumai.decode_page_cursor(token) == ('2024-01-02 03:04:05.000600', 7)
@@ -0,0 +1,88 @@
+import pytest
+
+import db
+import app as rezumai
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    conn = db.connect(path)
+    yield conn
+    conn.close()
+
+
+def seed(conn):
+    for i in range(1, 4):
+        conn.execute('''
+            INSERT INTO users (email, name, password_hash, security_question, security_answer_hash)
+            VALUES (?, ?, 'x', 'q', 'a')
+        ''', (f'user{i}@example.com', f'User {i}'))
+    users = [row[0] for row in conn.execute('SELECT id FROM users WHERE is_admin = FALSE ORDER BY id')]
+    for day, user_id in [('-1 days', users[0]), ('-1 days', users[0]), ('-2 days', users[1]), ('-40 days', users[2])]:
+        conn.execute("INSERT INTO logins (user_id, login_time) VALUES (?, datetime('now', ?))", (user_id, day))
+    for downloads, user_id in enumerate(users[:2], start=1):
+        conn.execute("INSERT INTO uploaded_resumes (user_id, filename, filepath) VALUES (?, 'cv.pdf', 'uploads/cv.pdf')", (user_id,))
+        cur = conn.execute("INSERT INTO generated_resumes (user_id, resume_data) VALUES (?, '{}')", (user_id,))
+        for _ in range(downloads):
+            conn.execute('INSERT INTO resume_downloads (user_id, resume_id) VALUES (?, ?)', (user_id, cur.lastrowid))
+    for user_id, rating in [(users[0], 5), (users[1], 3), (users[2], 5)]:
+        conn.execute('INSERT INTO feedback (user_id, rating, suggestion) VALUES (?, ?, ?)', (user_id, rating, 'ok'))
+    conn.execute("UPDATE feedback SET admin_reply = 'thanks' WHERE rating = 3")
+    conn.commit()
+    return users
+
+
+def test_rollups_match_raw_aggregates(conn):
+    seed(conn)
+    metrics = rezumai.load_admin_metrics(conn.cursor())
+
+    def scalar(sql):
+        return conn.execute(sql).fetchone()[0]
+
+    assert metrics['total_users'] == scalar('SELECT COUNT(*) FROM users WHERE is_admin = FALSE')
+    assert metrics['total_uploads'] == scalar('SELECT COUNT(*) FROM uploaded_resumes')
+    assert metrics['total_generated_resumes'] == scalar('SELECT COUNT(*) FROM generated_resumes')
+    assert metrics['total_downloads'] == scalar('SELECT COUNT(*) FROM resume_downloads')
+    assert metrics['total_feedback'] == scalar('SELECT COUNT(*) FROM feedback')
+    assert metrics['replied_feedback'] == scalar('SELECT COUNT(*) FROM feedback WHERE admin_reply IS NOT NULL')
+    assert metrics['avg_rating'] == pytest.approx(scalar('SELECT AVG(rating) FROM feedback'))
+    assert metrics['rating_labels'] == ['3 Stars', '5 Stars']
+    assert metrics['rating_counts'] == [1, 2]
+
+    raw_logins = conn.execute('''
+        SELECT DATE(login_time), COUNT(*) FROM logins
+        WHERE login_time >= datetime('now', '-30 days')
+        GROUP BY DATE(login_time) ORDER BY DATE(login_time)
+    ''').fetchall()
+    assert list(zip(metrics['login_labels'], metrics['login_counts'])) == [tuple(row) for row in raw_logins]
+    assert sum(metrics['download_counts']) == metrics['total_downloads']
+
+
+def test_rollups_follow_deletes_and_replies(conn):
+    users = seed(conn)
+    conn.execute("UPDATE feedback SET admin_reply = NULL WHERE rating = 3")
+    conn.execute('DELETE FROM feedback WHERE rating = 5 AND user_id = ?', (users[0],))
+    conn.execute('DELETE FROM resume_downloads')
+    conn.execute('DELETE FROM uploaded_resumes WHERE user_id = ?', (users[0],))
+    conn.execute('UPDATE users SET is_admin = TRUE WHERE id = ?', (users[2],))
+    conn.commit()
+
+    metrics = rezumai.load_admin_metrics(conn.cursor())
+    assert metrics['total_users'] == 2
+    assert metrics['total_uploads'] == 1
+    assert metrics['total_feedback'] == 2
+    assert metrics['replied_feedback'] == 0
+    assert metrics['avg_rating'] == pytest.approx(4)
+    # downloads are an event log: purging raw rows keeps the history
+    assert metrics['total_downloads'] == 3
+
+
+def test_daily_active_users_rollup(conn):
+    users = seed(conn)
+    weekly = conn.execute("SELECT COUNT(DISTINCT user_id) FROM daily_active_users WHERE day >= date('now', '-7 days')").fetchone()[0]
+    assert weekly == 2
+    top = conn.execute('SELECT user_id, downloads FROM user_download_totals ORDER BY downloads DESC').fetchall()
+    assert [tuple(row) for row in top] == [(users[1], 2), (users[0], 1)]
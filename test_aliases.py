@@ -0,0 +1,43 @@
+from analysis import extract_keywords, skill_forms, skill_ids, skill_vector
+from analysis.aliases import SkillForms, skill_key
+from analysis.ats import generate_course_links, get_priority_skills
+
+VOCABULARY = {'power bi', 'powerbi', 'node', 'node.js', 'ci/cd', 'c', 'c++', '.net', 'machine learning', 'ml', 'data'}
+ALIASES = {'ml': 'machine learning', 'node.js': 'node', 'artificial intelligence': 'ai'}
+
+
+def test_surface_forms_resolve_to_one_skill():
+    assert skill_key(' Power-BI ') == skill_key('powerbi') == 'powerbi'
+    assert skill_key('.NET') == '.net' and skill_key('C++') == 'c++'
+    forms = SkillForms(VOCABULARY, ALIASES)
+    assert forms.resolve('PowerBI') == forms.resolve('Power BI') == 'power bi'
+    assert forms.resolve('NodeJS') == forms.resolve('Node.js') == forms.resolve('node') == 'node'
+    assert forms.resolve('CI-CD') == 'ci/cd' and forms.resolve('ML') == 'machine learning'
+    # aliases of skills outside the vocabulary are dropped
+    assert forms.resolve('artificial intelligence') is None
+    assert forms.normalise('Jupyter Notebook') == 'jupyter notebook'
+    assert len(forms.skills) == 8
+
+
+def test_matcher_finds_punctuated_and_multi_word_forms():
+    forms = SkillForms(VOCABULARY, ALIASES)
+    text = 'Power BI and PowerBI dashboards; Node.js, C++ and .NET services; CI/CD; data, machine learning (ML).'
+    assert sorted(forms.find(text)) == sorted(['power bi', 'power bi', 'node', 'c++', '.net', 'ci/cd', 'data',
+                                               'machine learning', 'machine learning'])
+    # only separators join words: no "data" + "ml" across a comma, no power bi across a word that isn't bi
+    assert forms.find('power bind, ci, cd') == []
+
+
+def test_analyzers_use_canonical_skills():
+    text = 'Reporting in PowerBI and Power BI, services in NodeJS, pipelines in CI-CD.'
+    assert {'power bi', 'node', 'ci/cd'} <= set(extract_keywords(text))
+    assert skill_vector(text)[0]['power bi'] == 2
+    ids = skill_ids()
+    assert ids.bits(['powerbi']) == ids.bits(['power bi']) and ids.decode(ids.bits(['node.js'])) == ['node']
+
+    canonical = skill_forms().normalise
+    assert canonical('Power BI') == canonical('powerbi')
+    mapping = {'Power BI': {'provider': 'Udemy', 'search_query': 'power bi'}, 'default': {'provider': 'Udemy'}}
+    assert generate_course_links(['powerbi'], mapping, {'Udemy': 'https://udemy'})[0]['url'].endswith('q=power bi')
+    role_data = {'technical_skills': {'tools': ['Excel', 'Power BI', 'Node.js']}}
+    assert get_priority_skills(role_data, ['powerbi', 'node']) == ['Power BI', 'Node.js']
@@ -0,0 +1,70 @@
+import os
+import re
+import ast
+import sys
+import subprocess
+
+import analysis
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_analysis_imports_without_flask_or_database():
+    modules = ('flask', 'flask_babel', 'db', 'sqlite3', 'app', 'pdfplumber', 'docx', 'reportlab')
+    result = subprocess.run(
+        [sys.executable, '-c', f'import sys, analysis; print(",".join(m for m in {modules!r} if m in sys.modules))'],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
+
+
+def test_both_apps_share_the_engine():
+    import app as rezumai
+    assert rezumai.extract_text_from_resume is analysis.extract_text_from_resume
+    assert rezumai.generate_ats_pdf is analysis.generate_ats_pdf
+
+    # app_clean.py registers a duplicate endpoint and cannot be imported, so read its imports instead
+    with open(os.path.join(ROOT, 'app_clean.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    imported = {alias.name for node in tree.body if isinstance(node, ast.ImportFrom) and node.module == 'analysis'
+                for alias in node.names}
+    defined = {node.name for node in ast.walk(tree) if isinstance(node, (ast.FunctionDef, ast.ClassDef))}
+    assert {'extract_text_from_resume', 'generate_ats_pdf', 'comprehensive_ats_analysis', 'extract_keywords'} <= imported
+    assert all(callable(getattr(analysis, name)) for name in imported)
+    assert not imported & defined  # no local copy shadows the engine
+
+
+def test_analyze_uploaded_resume():
+    text = analysis.extract_text_from_resume(os.path.join(ROOT, 'CV_John_Doe.pdf'))
+    assert analysis.is_valid_resume_content(text)
+
+    keywords = analysis.extract_keywords(text)
+    assert {'python', 'react', 'docker'} <= set(keywords)
+
+    result = analysis.comprehensive_ats_analysis(text, keywords)
+    assert 0 < result['ats_score'] <= 100
+    assert result['job_matches'] and result['improvements']
+
+
+def test_resume_sidecar_matches_the_rendered_pdf():
+    import pdfplumber
+    from bench_pdf_render import SAMPLE_RESUME
+
+    sidecar = {}
+    pdf = analysis.generate_ats_pdf(SAMPLE_RESUME, sidecar=sidecar)
+    # Built from the story alone, without laying out pages, it is the same sidecar
+    assert analysis.resume_sidecar(SAMPLE_RESUME) == sidecar
+
+    headings = [section['heading'] for section in sidecar['sections']]
+    assert headings[0] is None and sidecar['sections'][0]['lines'][0] == 'JOHN DOE'
+    assert {'TECHNICAL SKILLS', 'WORK EXPERIENCE', 'EDUCATION'} <= set(headings)
+    assert sidecar['text'] == '\n\n'.join(
+        '\n'.join(([section['heading']] if section['heading'] else []) + section['lines'])
+        for section in sidecar['sections'])
+
+    def words(text):
+        return ' '.join(re.findall(r'\w+', text))
+
+    with pdfplumber.open(pdf) as document:
+        rendered = words(' '.join(page.extract_text() or '' for page in document.pages))
+    for line in sidecar['text'].splitlines():
+        assert words(line) in rendered
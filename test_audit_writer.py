@@ -0,0 +1,67 @@
+import pytest
+
+import db
+import app as rezumai
+from audit_writer import AuditWriter
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    return path
+
+
+@pytest.fixture
+def conn(db_path):
+    conn = db.connect(db_path)
+    yield conn
+    conn.close()
+
+
+def test_logins_are_batched_with_enqueue_timestamps(db_path, conn):
+    writer = AuditWriter(lambda: db_path, flush_interval_ms=1000, batch_size=500)
+    for _ in range(50):
+        writer.submit('INSERT INTO logins (user_id, login_time) VALUES (?, ?)', (1, '2024-01-02 03:04:05'))
+    writer.flush()
+    rows = conn.execute('SELECT user_id, login_time FROM logins').fetchall()
+    assert [tuple(row) for row in rows] == [(1, '2024-01-02 03:04:05')] * 50
+    writer.close()
+
+
+@pytest.fixture(params=['sqlite', 'server'])
+def any_db_path(request, monkeypatch):
+    """db_path, or the same schema on the test server (conftest.py)."""
+    if request.param == 'sqlite':
+        return request.getfixturevalue('db_path')
+    path = request.getfixturevalue('server_database')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    return path
+
+
+def test_one_bad_event_does_not_drop_the_batch(any_db_path):
+    writer = AuditWriter(lambda: any_db_path, flush_interval_ms=1000)
+    writer.submit('INSERT INTO logins (user_id, login_time) VALUES (?, ?)', (1, '2024-01-01 00:00:00'))
+    writer.submit('INSERT INTO logins (user_id, login_time) VALUES (?, ?)', (999, '2024-01-01 00:00:00'))
+    writer.close()
+    conn = db.connect(any_db_path)
+    try:
+        assert [row[0] for row in conn.execute('SELECT user_id FROM logins')] == [1]
+    finally:
+        conn.close()
+
+
+def test_download_requires_ownership(db_path, conn, monkeypatch):
+    monkeypatch.setattr(rezumai, 'audit_writer', AuditWriter(lambda: db_path))
+    resume_id = conn.execute("INSERT INTO generated_resumes (user_id, resume_data) VALUES (1, '{}')").lastrowid
+    conn.commit()
+
+    rezumai.log_resume_download(1, resume_id)
+    rezumai.log_resume_download(2, resume_id)  # not the owner
+    rezumai.log_resume_download(1, resume_id + 1)  # no such resume
+    rezumai.audit_writer.close()
+
+    rows = conn.execute('SELECT user_id, resume_id FROM resume_downloads').fetchall()
+    assert [tuple(row) for row in rows] == [(1, resume_id)]
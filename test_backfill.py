@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+import db
+import app as rezumai
+import backfill
+import analysis_store
+import storage_codec
+from bench_pdf_render import SAMPLE_RESUME
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    conn = db.connect(path)
+    conn.execute("INSERT INTO uploaded_resumes (user_id, filename, filepath) VALUES (1, 'cv.pdf', ?)",
+                 (os.path.join(ROOT, 'CV_John_Doe.pdf'),))
+    conn.execute("INSERT INTO uploaded_resumes (user_id, filename, filepath) VALUES (1, 'gone.pdf', 'uploads/missing.pdf')")
+    conn.execute('INSERT INTO generated_resumes (user_id, resume_data) VALUES (1, ?)', (storage_codec.encode(SAMPLE_RESUME),))
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def analyses(conn):
+    return {(row['source'], row['resume_id']): row
+            for row in conn.execute('SELECT source, resume_id, rules_version, ats_score FROM resume_analyses')}
+
+
+def new_rules(monkeypatch, version):
+    monkeypatch.setattr(backfill, 'rules_version', lambda: version)
+    monkeypatch.setattr(analysis_store, 'rules_version', lambda: version)
+
+
+def test_backfill_scores_everything_and_caches_text(conn):
+    assert backfill.backfill_analyses(conn, workers=2, chunk_size=2, duty_cycle=1.0) == {'uploaded': 2, 'generated': 1}
+
+    stored = analyses(conn)
+    assert set(stored) == {('uploaded', 1), ('uploaded', 2), ('generated', 1)}
+    assert stored[('uploaded', 1)]['ats_score'] > 0 and stored[('uploaded', 2)]['ats_score'] is None
+    texts = [row[0] for row in conn.execute('SELECT resume_text FROM uploaded_resumes ORDER BY resume_id')]
+    assert texts[0] and texts[1] is None
+    assert conn.execute('SELECT resume_text FROM generated_resumes').fetchone()[0]
+
+    assert backfill.backfill_analyses(conn, duty_cycle=1.0) == {'uploaded': 0, 'generated': 0}
+
+
+def test_rules_change_rescores_from_cached_text(conn, monkeypatch):
+    backfill.backfill_analyses(conn, duty_cycle=1.0)
+    new_rules(monkeypatch, 'v2')
+    extracted = []
+    monkeypatch.setattr(backfill, 'extract_text_from_resume', lambda path: extracted.append(path) or '')
+    monkeypatch.setattr(backfill, 'resume_sidecar', lambda *args, **kwargs: pytest.fail('sidecar should be cached'))
+
+    assert backfill.backfill_analyses(conn, duty_cycle=1.0) == {'uploaded': 2, 'generated': 1}
+    assert extracted == ['uploads/missing.pdf']
+    assert {row['rules_version'] for row in analyses(conn).values()} == {'v2'}
+
+
+def test_interrupted_backfill_resumes_from_checkpoint(conn, monkeypatch):
+    calls = []
+    analyze_text = backfill.analyze_text
+
+    def flaky(text):
+        calls.append(text)
+        if len(calls) == 2:
+            raise RuntimeError('worker died')
+        return analyze_text(text)
+    monkeypatch.setattr(backfill, 'analyze_text', flaky)
+
+    with pytest.raises(RuntimeError):
+        backfill.backfill_analyses(conn, chunk_size=1, duty_cycle=1.0)
+    assert conn.execute("SELECT last_id FROM backfill_checkpoints WHERE job = 'analyses:uploaded'").fetchone()[0] == 1
+
+    assert backfill.backfill_analyses(conn, chunk_size=1, duty_cycle=1.0) == {'uploaded': 1, 'generated': 1}
+    assert len(analyses(conn)) == 3
+
+
+def test_dashboard_reuses_the_stored_analysis(conn, monkeypatch):
+    client = rezumai.app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    conn.execute('DELETE FROM uploaded_resumes WHERE resume_id = 2')
+    conn.commit()
+
+    assert client.get('/dashboard').status_code == 200
+    assert ('uploaded', 1) in analyses(conn)
+
+    monkeypatch.setattr(analysis_store, 'analyze_text', lambda text: pytest.fail('analysis should be reused'))
+    response = client.get('/dashboard')
+    assert response.status_code == 200 and b'Skill Gap Analysis' in response.data
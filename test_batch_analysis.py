@@ -0,0 +1,73 @@
+import io
+import os
+import json
+import shutil
+import zipfile
+
+import pytest
+
+from analysis.batch import list_resumes, load_checkpoint, run_batch
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture
+def resumes(tmp_path):
+    source = tmp_path / 'resumes'
+    for folder in ('a', 'b'):
+        (source / folder).mkdir(parents=True)
+        shutil.copy(os.path.join(ROOT, 'CV_John_Doe.pdf'), source / folder / 'cv.pdf')
+    (source / 'broken.pdf').write_bytes(b'not a pdf')
+    (source / 'notes.txt').write_text('ignored')
+    return str(source)
+
+
+def read_records(path):
+    with open(path, encoding='utf-8') as f:
+        return {record['file']: record for record in map(json.loads, f)}
+
+
+def test_directory_batch_across_workers(resumes, tmp_path):
+    output = tmp_path / 'out.jsonl'
+    with open(output, 'w', encoding='utf-8') as out:
+        summary = run_batch(resumes, out, workers=2)
+
+    assert summary['files'] == 3 and summary['statuses'] == {'ok': 2, 'no_text': 1}
+    assert summary['files_per_second'] > 0
+    records = read_records(output)
+    assert sorted(records) == ['a/cv.pdf', 'b/cv.pdf', 'broken.pdf']
+    ok = records['a/cv.pdf']
+    assert ok['ats_score'] == ok['analysis']['ats_score'] == records['b/cv.pdf']['ats_score']
+    assert 'python' in ok['keywords']
+
+
+def test_resume_from_checkpoint(resumes, tmp_path):
+    output = str(tmp_path / 'out.jsonl')
+    with open(output, 'w', encoding='utf-8') as out:
+        run_batch(resumes, out, workers=1)
+    with open(output, 'rb+') as f:  # simulate a run killed while writing its last record
+        lines = f.read().splitlines(keepends=True)
+        f.seek(0)
+        f.truncate()
+        f.write(b''.join(lines[:-1]) + lines[-1][:20])
+
+    done = load_checkpoint(output)
+    assert len(done) == 2
+    with open(output, 'a', encoding='utf-8') as out:
+        summary = run_batch(resumes, out, workers=1, done=done)
+
+    assert summary['files'] == 1 and summary['skipped'] == 2
+    assert len(read_records(output)) == 3
+
+
+def test_zip_source(tmp_path):
+    path = str(tmp_path / 'resumes.zip')
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.write(os.path.join(ROOT, 'CV_John_Doe.pdf'), 'batch/CV_John_Doe.pdf')
+        archive.writestr('batch/readme.md', 'ignored')
+    assert list_resumes(path) == ['batch/CV_John_Doe.pdf']
+
+    out = io.StringIO()
+    run_batch(path, out, workers=1)
+    record = json.loads(out.getvalue())
+    assert record['status'] == 'ok' and record['file'] == 'batch/CV_John_Doe.pdf'
@@ -0,0 +1,44 @@
+import os
+
+import db
+import app as rezumai
+import analysis_store
+from analysis import bitsets, extract_text_from_resume, extract_keywords, load_jobs_data
+from analysis.jobs import skill_ids
+from bench_skill_bitsets import match_with_sets, match_with_bitsets
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_skill_ids_round_trip():
+    ids = bitsets.SkillIds(['sql', 'python', 'aws'])
+    bits = ids.bits(['python', 'aws', 'cobol'])
+    assert bits == 0b011 and bits.bit_count() == 2
+    assert ids.decode(bits) == ['aws', 'python']
+    assert ids.in_order(['sql', 'python', 'aws'], bits) == ['python', 'aws']
+    assert bitsets.unpack(bitsets.pack(bits)) == bits and bitsets.pack(0) == b''
+
+
+def test_bitsets_match_the_set_based_code():
+    text = extract_text_from_resume(os.path.join(ROOT, 'CV_John_Doe.pdf'))
+    inputs = (extract_keywords(text), text.lower(), load_jobs_data())
+    assert match_with_bitsets(*inputs) == match_with_sets(*inputs)
+
+
+def test_stored_skill_bits_decode_with_the_stored_dictionary(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    conn = db.connect(path)
+    cursor = conn.cursor()
+    result = analysis_store.analyze_text('Python developer: django, docker and aws.')
+    analysis_store.store_analysis(cursor, analysis_store.GENERATED, 1, result)
+    analysis_store.store_analysis(cursor, analysis_store.GENERATED, 2, result)
+    conn.commit()
+
+    bits = analysis_store.load_skill_bits(cursor, analysis_store.GENERATED, 1)
+    assert skill_ids().decode(bits) == sorted(result['keywords'])
+    dictionary = dict(cursor.execute('SELECT skill_id, skill FROM skill_dictionary').fetchall())
+    assert dictionary == dict(enumerate(skill_ids().names))
+    assert sorted(dictionary[i] for i in bitsets.bit_positions(bits)) == sorted(result['keywords'])
+    conn.close()
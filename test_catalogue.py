@@ -0,0 +1,59 @@
+import math
+import os
+
+import pytest
+
+import db
+import app as rezumai
+from analysis.catalogue import JobMatrix, job_matrix
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+JOBS = [
+    {'title': 'Python Developer', 'skills': ['Python', 'django', 'sql']},
+    {'title': 'Data Analyst', 'skills': ['sql', 'excel', 'tableau']},
+    {'title': 'DevOps Engineer', 'skills': ['docker', 'kubernetes', 'python']},
+    {'title': 'Nurse', 'skills': ['nursing']},
+]
+
+
+def test_product_matches_per_job_scoring():
+    matrix = JobMatrix(JOBS)
+    resume = {'python', 'sql', 'docker', 'react'}
+    match, overlap = matrix.score(resume)
+
+    for row, job in enumerate(JOBS):
+        skills = {s.lower() for s in job['skills']}
+        idf = {s: math.log(5 / (1 + sum(s in {k.lower() for k in j['skills']} for j in JOBS))) + 1 for s in skills}
+        assert overlap[row] == len(skills & resume)
+        assert match[row] == pytest.approx(sum(idf[s] for s in skills & resume) / sum(idf.values()))
+
+
+def test_ranked_pages_cover_every_matching_job():
+    matrix = JobMatrix(JOBS)
+    first = matrix.ranked({'python', 'django', 'sql', 'excel'}, page=1, per_page=2)
+    second = matrix.ranked({'python', 'django', 'sql', 'excel'}, page=2, per_page=2)
+
+    assert first['total'] == 3 and first['pages'] == 2
+    assert [job['title'] for job in first['jobs'] + second['jobs']] == ['Python Developer', 'Data Analyst', 'DevOps Engineer']
+    assert first['jobs'][0]['match'] == 100 and first['jobs'][0]['missing_skills'] == []
+    assert second['jobs'][0]['matched_skills'] == ['python']
+
+
+def test_endpoint_ranks_the_catalogue(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    conn = db.connect(path)
+    conn.execute("INSERT INTO uploaded_resumes (user_id, filename, filepath) VALUES (1, 'cv.pdf', ?)",
+                 (os.path.join(ROOT, 'CV_John_Doe.pdf'),))
+    conn.commit()
+    conn.close()
+
+    client = rezumai.app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    data = client.get('/jobs/matches?per_page=5').get_json()
+    assert data['success'] and len(data['jobs']) == 5 and data['total'] > 5
+    assert data['total'] <= len(job_matrix().jobs)
+    matches = [job['match'] for job in data['jobs']]
+    assert matches == sorted(matches, reverse=True)
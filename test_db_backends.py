@@ -0,0 +1,250 @@
+import re
+import uuid
+import sqlite3
+
+import pytest
+
+import db
+import app as rezumai
+from storage_codec import decode, encode
+from migrations import current_version, run_migrations
+from migrations.runner import discover_migrations
+
+
+class FakeDriver:
+    """
+    Stand-in for a server DB-API module (psycopg2, PyMySQL): ``format``
+    paramstyle and its own IntegrityError, over an in-memory SQLite
+    database, so ServerConnection is exercised without a server.
+    """
+
+    class IntegrityError(Exception):
+        pass
+
+    class Cursor:
+        def __init__(self, raw):
+            self._cursor = raw.cursor()
+
+        def _run(self, method, sql, params):
+            try:
+                method(sql.replace('%s', '?').replace('%%', '%'), params)
+            except sqlite3.IntegrityError as e:
+                raise FakeDriver.IntegrityError(str(e)) from e
+
+        def execute(self, sql, params):
+            self._run(self._cursor.execute, sql, params)
+
+        def executemany(self, sql, seq_of_params):
+            self._run(self._cursor.executemany, sql, seq_of_params)
+
+        def __getattr__(self, name):
+            return getattr(self._cursor, name)
+
+    class Connection:
+        def __init__(self):
+            self._raw = sqlite3.connect(':memory:')
+
+        def cursor(self):
+            return FakeDriver.Cursor(self._raw)
+
+        def __getattr__(self, name):
+            return getattr(self._raw, name)
+
+
+@pytest.fixture(params=['sqlite', 'fake-server', 'server'])
+def conn(request, tmp_path):
+    pool = None
+    if request.param == 'fake-server':
+        # SQLite SQL in the format paramstyle, through the server wrappers
+        conn = db.ServerConnection(FakeDriver.Connection(), db.FormatDialect(), FakeDriver)
+    else:
+        database = str(tmp_path / 'backend.db') if request.param == 'sqlite' else request.getfixturevalue('server_url')
+        pool = db.ConnectionPool(database, size=2)
+        conn = pool.acquire()
+    table = f'kv_{uuid.uuid4().hex[:8]}'
+    id_column = {
+        'sqlite': 'id INTEGER PRIMARY KEY AUTOINCREMENT',
+        'postgresql': 'id SERIAL PRIMARY KEY',
+        'mysql': 'id INTEGER PRIMARY KEY AUTO_INCREMENT',
+    }[conn.dialect.name]
+    conn.execute(f'CREATE TABLE {table} ({id_column}, name VARCHAR(50) UNIQUE, hits INTEGER, seen_at TIMESTAMP)')
+    conn.commit()
+    yield conn, table
+    conn.execute(f'DROP TABLE {table}')
+    conn.commit()
+    if pool is not None:
+        pool.release(conn)
+        pool.close_all()
+
+
+def test_queries_run_through_the_dialect(conn):
+    conn, table = conn
+    dialect = conn.dialect
+    cur = conn.cursor()
+    cur.execute(f"INSERT INTO {table} (name, hits, seen_at) VALUES (?, ?, CURRENT_TIMESTAMP)", ('100% ok', 1))
+    assert cur.lastrowid == 1
+
+    upsert = dialect.upsert(table, ['name', 'hits'], key=['name'],
+                            update={'hits': f'{table}.hits + {dialect.excluded("hits")}'})
+    conn.execute(upsert, ('100% ok', 2))
+    conn.commit()
+
+    row = conn.execute(f"SELECT name, hits FROM {table} WHERE name LIKE '100%' AND {dialect.day('seen_at')} >= {dialect.days_ago(1)}").fetchone()
+    assert row['name'] == row[0] == '100% ok'
+    assert row['hits'] == 3
+
+
+def test_constraint_violations_raise_one_error_type(conn):
+    conn, table = conn
+    conn.execute(f"INSERT INTO {table} (name, hits) VALUES (?, ?)", ('taken', 1))
+    conn.commit()
+    with pytest.raises(db.IntegrityError):
+        conn.execute(f"INSERT INTO {table} (name, hits) VALUES (?, ?)", ('taken', 2))
+    conn.rollback()
+    assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 1
+
+
+def test_insert_ignore_skips_existing_keys(conn):
+    conn, table = conn
+    sql = conn.dialect.insert_ignore(table, ['name', 'hits'])
+    conn.executemany(sql, [('a', 1), ('a', 2), ('b', 3)])
+    conn.commit()
+    rows = conn.execute(f"SELECT name, hits FROM {table} ORDER BY name").fetchall()
+    assert [tuple(row) for row in rows] == [('a', 1), ('b', 3)]
+
+
+@pytest.fixture(params=['sqlite', 'server'])
+def schema(request, tmp_path, monkeypatch):
+    """A connection to a database built by init_db()."""
+    if request.param == 'sqlite':
+        database = str(tmp_path / 'rezumai_test.db')
+    else:
+        database = request.getfixturevalue('server_database')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', database)
+    rezumai.init_db()
+    rezumai.init_db()  # idempotent
+    conn = db.connect(database)
+    yield conn
+    conn.close()
+
+
+def test_init_db_builds_the_schema_and_triggers_on_every_backend(schema):
+    conn = schema
+    assert current_version(conn) == discover_migrations()[-1].VERSION
+    assert run_migrations(conn) == []
+
+    cur = conn.cursor()
+    user = ('ana@example.com', 'Ana', 'hash', 'question', 'answer')
+    cur.execute('INSERT INTO users (email, name, password_hash, security_question, security_answer_hash) '
+                'VALUES (?, ?, ?, ?, ?)', user)
+    user_id = cur.lastrowid
+    cur.execute('INSERT INTO uploaded_resumes (user_id, filename, filepath) VALUES (?, ?, ?)',
+                (user_id, 'cv.pdf', 'uploads/cv.pdf'))
+    upload_id = cur.lastrowid
+    cur.execute('INSERT INTO generated_resumes (user_id, resume_data, template_type) VALUES (?, ?, ?)',
+                (user_id, encode({'name': 'Ana'}), 'modern'))
+    resume_id = cur.lastrowid
+    cur.execute('INSERT INTO resume_downloads (user_id, resume_id) VALUES (?, ?)', (user_id, resume_id))
+    cur.executemany('INSERT INTO logins (user_id) VALUES (?)', [(user_id,), (user_id,), (None,)])
+    cur.execute('INSERT INTO feedback (user_id, rating) VALUES (?, ?)', (user_id, 4))
+    cur.execute('UPDATE feedback SET rating = 2, admin_reply = ? WHERE user_id = ?', ('Thanks', user_id))
+    # The MinHash rows go with their upload (delete trigger)
+    cur.execute('INSERT INTO resume_signatures (resume_id, signature) VALUES (?, ?)', (upload_id, b'\x00' * 8))
+    cur.execute('INSERT INTO resume_lsh_buckets (band, bucket, resume_id) VALUES (?, ?, ?)', (0, -2 ** 63, upload_id))
+    cur.execute('INSERT INTO uploaded_resumes (user_id, filename, filepath) VALUES (?, ?, ?)',
+                (user_id, 'old.pdf', 'uploads/old.pdf'))
+    cur.execute('DELETE FROM uploaded_resumes WHERE resume_id = ?', (upload_id,))
+    conn.commit()
+
+    totals = {metric: value for metric, value in conn.execute('SELECT metric, value FROM metric_totals')}
+    assert totals == {'users': 1, 'uploads': 1, 'generated_resumes': 1, 'logins': 3, 'downloads': 1,
+                      'feedback': 1, 'feedback_replied': 1, 'rating_sum': 2, 'rating_4': 0, 'rating_2': 1}
+    today = conn.dialect.days_ago(0)
+    daily = {metric: value for metric, value in conn.execute(f'SELECT metric, value FROM metric_daily WHERE day = {today}')}
+    assert daily == {'logins': 3, 'uploads': 1, 'downloads': 1}
+    assert [tuple(row) for row in conn.execute('SELECT day, user_id FROM daily_active_users')] == \
+        [(conn.execute(f'SELECT {today}').fetchone()[0], user_id)]
+    assert [tuple(row) for row in conn.execute('SELECT user_id, downloads FROM user_download_totals')] == [(user_id, 1)]
+    assert conn.execute('SELECT COUNT(*) FROM resume_lsh_buckets').fetchone()[0] == 0
+    assert conn.execute('SELECT COUNT(*) FROM resume_signatures').fetchone()[0] == 0
+    assert decode(conn.execute('SELECT resume_data FROM generated_resumes').fetchone()[0]) == {'name': 'Ana'}
+
+    with pytest.raises(db.IntegrityError):
+        conn.execute('INSERT INTO users (email, name, password_hash, security_question, security_answer_hash) '
+                     'VALUES (?, ?, ?, ?, ?)', user)
+    conn.rollback()
+
+
+def test_admin_pages_on_every_backend(schema):
+    conn = schema
+    cur = conn.cursor()
+    cur.execute("INSERT INTO users (email, name, password_hash, security_question, security_answer_hash) "
+                "VALUES ('ana@example.com', 'Ana', 'x', 'q', 'a')")
+    user_id = cur.lastrowid
+    cur.execute('INSERT INTO logins (user_id) VALUES (?)', (user_id,))
+    cur.execute("INSERT INTO uploaded_resumes (user_id, filename, filepath) VALUES (?, 'cv.pdf', 'uploads/cv.pdf')",
+                (user_id,))
+    cur.executemany('INSERT INTO feedback (user_id, rating, suggestion, admin_reply) VALUES (?, ?, ?, ?)',
+                    [(user_id, 5, 'great', 'thanks'), (user_id, 3, 'ok', None)])
+    conn.commit()
+    timestamp = re.compile(r'^\d{4}-\d\d-\d\d \d\d:\d\d:\d\d(\.\d+)?$')
+
+    client = rezumai.app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+        session['is_admin'] = True
+    page = client.get('/admin')
+    assert page.status_code == 200
+    today = conn.execute(f'SELECT {conn.dialect.days_ago(0)}').fetchone()[0]
+    assert today in page.get_data(as_text=True)
+
+    replied = client.get('/admin/feedback?replied=true').get_json()['data']['items']
+    assert [(item['rating'], item['admin_reply']) for item in replied] == [(5, 'thanks')]
+    assert timestamp.match(replied[0]['created_at'])
+    for kind in ('logins', 'uploads'):
+        [item] = client.get(f'/admin/activity/{kind}').get_json()['data']['items']
+        assert item['email'] == 'ana@example.com' and timestamp.match(item['time'])
+    metrics = client.get('/admin_metrics').get_json()
+    assert metrics['data']['kpis']['total_users'] == 1 and metrics['data']['kpis']['avg_rating'] == 4
+    assert metrics['data']['login_labels'][-1] == today and metrics['data']['login_counts'][-1] == 1
+    assert client.get('/admin/duplicates').get_json()['success']
+
+
+def test_release_rolls_back_open_transactions(tmp_path):
+    pool = db.ConnectionPool(str(tmp_path / 'pool.db'), size=1)
+    conn = pool.acquire()
+    conn.execute('CREATE TABLE t (x INTEGER)')
+    conn.commit()
+    conn.execute('INSERT INTO t VALUES (1)')
+    pool.release(conn)
+    again = pool.acquire()
+    assert again is conn
+    assert again.execute('SELECT COUNT(*) FROM t').fetchone()[0] == 0
+    pool.close_all()
+
+
+@pytest.mark.parametrize('database, sql, expected', [
+    ('rezumai.db', "SELECT * FROM t WHERE a = ? AND b LIKE '%x'", "SELECT * FROM t WHERE a = ? AND b LIKE '%x'"),
+    ('postgresql://u@localhost/rezumai', "SELECT * FROM t WHERE a = ? AND b LIKE '%?'",
+     "SELECT * FROM t WHERE a = %s AND b LIKE '%%?'"),
+    ('mysql://u@localhost/rezumai', "SELECT 'it''s ?', ? FROM t", "SELECT 'it''s ?', %s FROM t"),
+])
+def test_placeholder_translation(database, sql, expected):
+    assert db.dialect_for(database).translate(sql) == expected
+
+
+def test_upsert_syntax_per_dialect():
+    for database, clause in [('rezumai.db', 'ON CONFLICT(name) DO UPDATE SET hits = excluded.hits'),
+                             ('postgresql://localhost/r', 'ON CONFLICT(name) DO UPDATE SET hits = excluded.hits'),
+                             ('mysql://localhost/r', 'ON DUPLICATE KEY UPDATE hits = VALUES(hits)')]:
+        dialect = db.dialect_for(database)
+        sql = dialect.upsert('kv', ['name', 'hits'], key=['name'], update={'hits': dialect.excluded('hits')})
+        assert sql.endswith(clause)
+
+
+def test_mysql_triggers_test_the_updated_column():
+    dialect = db.dialect_for('mysql://localhost/r')
+    drop, create = dialect.create_trigger('trg_x', 'UPDATE OF rating', 'feedback', 'DELETE FROM t;', when='NEW.rating > 1')
+    assert drop == 'DROP TRIGGER IF EXISTS trg_x'
+    assert create == ('CREATE TRIGGER trg_x AFTER UPDATE ON feedback FOR EACH ROW BEGIN '
+                      'IF (NOT ((OLD.rating) <=> (NEW.rating))) AND (NEW.rating > 1) THEN DELETE FROM t; END IF; END')
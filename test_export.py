@@ -0,0 +1,60 @@
+import io
+import zipfile
+from concurrent.futures import Future
+
+import pytest
+
+import db
+import app as rezumai
+import storage_codec
+from pdf_cache import PdfCache
+from render_pool import RenderPool
+from bench_pdf_render import SAMPLE_RESUME
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    monkeypatch.setattr(rezumai, 'pdf_cache', PdfCache(str(tmp_path / 'pdf_cache')))
+    rezumai.init_db()
+    conn = db.connect(path)
+    for resume_data in (SAMPLE_RESUME, dict(SAMPLE_RESUME, template_type='modern')):
+        conn.execute('INSERT INTO generated_resumes (user_id, resume_data) VALUES (1, ?)', (storage_codec.encode(resume_data),))
+    conn.execute("INSERT INTO generated_resumes (user_id, resume_data) VALUES (1, 'not json')")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def export(force=False):
+    return zipfile.ZipFile(io.BytesIO(b''.join(rezumai.iter_resume_export_zip(force=force))))
+
+
+class StalledPool:
+    """A render pool whose jobs never finish."""
+    workers = 1
+    timeout = 0.01
+
+    def submit(self, fn, *args, block=False):
+        return Future()
+
+
+def test_export_streams_every_renderable_resume(conn, monkeypatch):
+    pool = RenderPool(workers=1, timeout=120)
+    monkeypatch.setattr(rezumai, 'pdf_render_pool', pool)
+    try:
+        archive = export()
+    finally:
+        pool.shutdown()
+    assert archive.namelist() == ['resume_1_user_1.pdf', 'resume_2_user_1.pdf']
+    for name in archive.namelist():
+        assert archive.read(name).startswith(b'%PDF')
+    # Both renders were cached, so a second export renders nothing
+    monkeypatch.setattr(rezumai, 'pdf_render_pool', StalledPool())
+    assert export().namelist() == archive.namelist()
+
+
+def test_export_skips_renders_that_time_out(conn, monkeypatch):
+    monkeypatch.setattr(rezumai, 'pdf_render_pool', StalledPool())
+    assert export().namelist() == []
@@ -0,0 +1,56 @@
+import pytest
+
+import db
+import app as rezumai
+from metrics_stream import MetricsBroadcaster, diff_metrics
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    return path
+
+
+def test_diff_sends_only_changed_keys():
+    old = {'kpis': {'total_users': 1, 'total_uploads': 2}, 'login_labels': ['a'], 'login_counts': [1],
+           'upload_labels': ['a'], 'upload_counts': [3]}
+    new = {'kpis': {'total_users': 1, 'total_uploads': 3}, 'login_labels': ['a'], 'login_counts': [2],
+           'upload_labels': ['a'], 'upload_counts': [3]}
+    assert diff_metrics(old, new) == {'kpis': {'total_uploads': 3}, 'login_counts': [2], 'login_labels': ['a']}
+    assert diff_metrics(new, new) == {}
+
+
+def test_broadcaster_shares_one_computation(db_path):
+    loads = []
+
+    def load(conn):
+        loads.append(1)
+        return rezumai.admin_metrics_payload(rezumai.load_admin_metrics(conn.cursor()))
+
+    broadcaster = MetricsBroadcaster(lambda: db.connect(db_path), load, interval=0.01)
+    first, second = broadcaster.subscribe(), broadcaster.subscribe()
+    snapshot = first.get(timeout=5)
+    assert second.get(timeout=5) == snapshot
+    assert snapshot['kpis']['total_uploads'] == 0
+
+    writer = db.connect(db_path)
+    writer.execute("INSERT INTO uploaded_resumes (user_id, filename, filepath) VALUES (1, 'cv.pdf', 'uploads/cv.pdf')")
+    writer.commit()
+    writer.close()
+
+    delta = first.get(timeout=5)
+    assert delta['kpis'] == {'total_uploads': 1}
+    assert second.get(timeout=5) == delta
+    assert len(loads) == 2
+
+    late = broadcaster.subscribe()
+    assert late.get(timeout=5)['kpis']['total_uploads'] == 1
+    for q in (first, second, late):
+        broadcaster.unsubscribe(q)
+
+
+def test_stream_requires_admin():
+    client = rezumai.app.test_client()
+    assert client.get('/admin_metrics/stream').status_code == 401
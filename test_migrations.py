@@ -0,0 +1,102 @@
+import pytest
+
+import db
+import app as rezumai
+from migrations import current_version, run_migrations
+from migrations.runner import discover_migrations
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    conn = db.connect(path)
+    yield conn
+    conn.close()
+
+
+def query_plan(conn, sql, params=()):
+    return ' | '.join(row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params))
+
+
+def test_all_migrations_applied_once(conn):
+    latest = max(module.VERSION for module in discover_migrations())
+    assert current_version(conn) == latest
+    assert run_migrations(conn) == []
+    versions = [row[0] for row in conn.execute('SELECT version FROM schema_version ORDER BY version')]
+    assert versions == sorted(set(versions))
+
+
+def test_latest_upload_lookup_uses_covering_index(conn):
+    plan = query_plan(conn, 'SELECT filepath, uploaded_at FROM uploaded_resumes WHERE user_id = ? ORDER BY uploaded_at DESC LIMIT 1', (1,))
+    assert 'COVERING INDEX idx_uploaded_resumes_user_latest' in plan
+    assert 'TEMP B-TREE' not in plan
+
+
+def test_latest_generated_resume_lookup_uses_index(conn):
+    plan = query_plan(conn, 'SELECT id, resume_data, created_at FROM generated_resumes WHERE user_id = ? ORDER BY created_at DESC LIMIT 1', (1,))
+    assert 'INDEX idx_generated_resumes_user_latest' in plan
+    assert 'TEMP B-TREE' not in plan
+
+
+@pytest.mark.parametrize('sql, index', [
+    ("SELECT DATE(login_time), COUNT(*) FROM logins WHERE login_time >= date('now', '-30 days') GROUP BY DATE(login_time)",
+     'COVERING INDEX idx_logins_time'),
+    ("SELECT COUNT(DISTINCT user_id) FROM daily_active_users WHERE day >= date('now', '-7 days')",
+     'USING PRIMARY KEY'),
+    ("SELECT DATE(uploaded_at), COUNT(*) FROM uploaded_resumes WHERE uploaded_at >= date('now', '-30 days') GROUP BY DATE(uploaded_at)",
+     'COVERING INDEX idx_resumes_uploaded_at'),
+    ("SELECT DATE(downloaded_at), COUNT(*) FROM resume_downloads WHERE downloaded_at >= date('now', '-30 days') GROUP BY DATE(downloaded_at)",
+     'COVERING INDEX idx_resume_downloads_time'),
+])
+def test_admin_date_range_scans_use_indexes(conn, sql, index):
+    plan = query_plan(conn, sql)
+    assert index in plan
+    assert 'SCAN logins' not in plan and 'SCAN resume_downloads' not in plan
+
+
+def test_template_usage_uses_index(conn):
+    plan = query_plan(conn, 'SELECT template_type, COUNT(*) FROM generated_resumes GROUP BY template_type')
+    assert 'COVERING INDEX idx_generated_resumes_template' in plan
+    assert 'TEMP B-TREE' not in plan
+
+
+def test_type_columns_filled_for_plain_json_writers(conn):
+    conn.execute('''INSERT INTO generated_resumes (user_id, resume_data) VALUES (1, '{"template_type": "Modern", "user_type": "fresher"}')''')
+    row = conn.execute('SELECT template_type, user_type FROM generated_resumes ORDER BY id DESC LIMIT 1').fetchone()
+    assert tuple(row) == ('modern', 'fresher')
+
+
+@pytest.mark.parametrize('where, params', [
+    ('', ()),
+    ('WHERE rating = ?', (5,)),
+    ('WHERE (admin_reply IS NOT NULL) = ? AND (created_at, id) < (?, ?)', (False, '2024-01-01', 10)),
+    ('WHERE (admin_reply IS NOT NULL) = ?', (True,)),  # load_feedback_page binds a bool
+])
+def test_feedback_pages_use_index(conn, where, params):
+    plan = query_plan(conn, f'SELECT id FROM feedback {where} ORDER BY created_at DESC, id DESC LIMIT 21', params)
+    assert 'INDEX idx_feedback_' in plan
+    assert 'TEMP B-TREE' not in plan
+
+
+def test_rating_edits_move_the_rating_rollups(conn):
+    from migrations import v012_feedback_rating_rollup
+
+    def rollups():
+        return dict(conn.execute("SELECT metric, value FROM metric_totals WHERE metric LIKE 'rating%' AND value != 0"))
+
+    def raw():
+        counts = {f'rating_{rating}': count for rating, count in conn.execute('SELECT rating, COUNT(*) FROM feedback GROUP BY rating')}
+        return dict(counts, rating_sum=conn.execute('SELECT SUM(rating) FROM feedback').fetchone()[0])
+
+    for rating in (5, 3, 3):
+        conn.execute("INSERT INTO feedback (user_id, rating, suggestion) VALUES (1, ?, 'ok')", (rating,))
+    conn.execute('UPDATE feedback SET rating = 4 WHERE id = 2')
+    conn.execute("UPDATE feedback SET rating = 5, suggestion = 'great' WHERE id = 1")
+    assert rollups() == raw() == {'rating_sum': 12, 'rating_3': 1, 'rating_4': 1, 'rating_5': 1}
+
+    # Drift left by databases that edited ratings before the trigger is recounted away
+    conn.execute("UPDATE metric_totals SET value = value + 7 WHERE metric IN ('rating_sum', 'rating_1')")
+    v012_feedback_rating_rollup.upgrade(conn)
+    assert rollups() == raw()
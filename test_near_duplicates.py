@@ -0,0 +1,96 @@
+import os
+import random
+
+import pytest
+
+import db
+import app as rezumai
+import near_duplicates
+from analysis import minhash
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+WORDS = [f'word{i}' for i in range(2000)]
+
+
+def edited(words, rng, edits):
+    words = list(words)
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return ' '.join(words)
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    monkeypatch.setitem(rezumai.app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    rezumai.init_db()
+    conn = db.connect(path)
+    yield conn
+    conn.close()
+
+
+def test_signatures_estimate_jaccard_similarity():
+    rng = random.Random(5)
+    base = rng.choices(WORDS, k=400)
+    original = ' '.join(base)
+    for edits in (0, 5, 40, 400):
+        text = edited(base, rng, edits)
+        first, second = minhash.shingles(original), minhash.shingles(text)
+        jaccard = len(first & second) / len(first | second)
+        assert minhash.similarity(minhash.signature(original), minhash.signature(text)) == pytest.approx(jaccard, abs=0.15)
+    sig = minhash.signature(original)
+    assert minhash.unpack(minhash.pack(sig)) == sig and minhash.signature('  ') is None
+    assert minhash.band_keys(sig) == minhash.band_keys(minhash.signature(original.upper()))
+
+
+def test_lsh_finds_near_duplicates_and_clusters(conn):
+    rng = random.Random(7)
+    originals = [rng.choices(WORDS, k=300) for _ in range(3)]
+    texts = [' '.join(originals[0]), edited(originals[0], rng, 3), ' '.join(originals[1]),
+             edited(originals[1], rng, 2), edited(originals[1], rng, 4), ' '.join(originals[2])]
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO users (id, email, name, password_hash, security_question, security_answer_hash) "
+                   "VALUES (2, 'two@example.com', 'Two', '', '', '')")
+    for user_id, text in zip([1, 2, 1, 1, 2, 1], texts):
+        cursor.execute("INSERT INTO uploaded_resumes (user_id, filename, filepath, resume_text) VALUES (?, 'cv.pdf', '', ?)",
+                       (user_id, text))
+        near_duplicates.index_signature(cursor, cursor.lastrowid, minhash.signature(text))
+    conn.commit()
+
+    query = minhash.signature(edited(originals[1], rng, 1))
+    assert sorted(resume_id for resume_id, _ in near_duplicates.find_duplicates(cursor, query)) == [3, 4, 5]
+    assert sorted(resume_id for resume_id, _ in near_duplicates.find_duplicates(cursor, query, user_id=1)) == [3, 4]
+    assert near_duplicates.duplicate_clusters(cursor) == [[3, 4, 5], [1, 2]]
+
+    cursor.execute('DELETE FROM uploaded_resumes WHERE resume_id = 2')
+    cursor.execute('UPDATE uploaded_resumes SET resume_text = ? WHERE resume_id = 5', ('Something else.',))
+    assert near_duplicates.duplicate_clusters(cursor) == [[3, 4]]
+
+
+def test_reupload_reuses_the_analysis_and_admins_see_the_cluster(conn):
+    conn.execute("INSERT INTO users (id, email, name, password_hash, security_question, security_answer_hash) "
+                 "VALUES (7, 'dup@example.com', 'Dup', '', '', '')")
+    conn.commit()
+    client = rezumai.app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 7
+
+    responses = []
+    for name in ('CV_John_Doe.pdf', 'CV_John_Doe_1.pdf'):
+        with open(os.path.join(ROOT, 'CV_John_Doe.pdf'), 'rb') as f:
+            responses.append(client.post('/upload_resume', data={'resume': (f, name)},
+                                         content_type='multipart/form-data').get_json())
+    assert responses[0]['success'] and responses[0]['previous_upload'] is None
+    previous = responses[1]['previous_upload']
+    assert previous['identical'] and previous['similarity'] == 100 and previous['resume_id'] == 1
+    assert previous['ats_score_change'] == 0 and previous['added_keywords'] == previous['removed_keywords'] == []
+    assert responses[1]['resume_score'] == responses[0]['resume_score']
+
+    assert client.get('/admin/duplicates').status_code == 401
+    with client.session_transaction() as session:
+        session['is_admin'] = True
+    data = client.get('/admin/duplicates').get_json()
+    assert data['total'] == 1
+    assert [r['resume_id'] for r in data['clusters'][0]['resumes']] == [1, 2]
+    assert data['clusters'][0]['resumes'][0]['user']['email'] == 'dup@example.com'
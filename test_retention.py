@@ -0,0 +1,94 @@
+import gzip
+import json
+import sqlite3
+
+import pytest
+
+import db
+import app as rezumai
+from retention import run_retention
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    conn = db.connect(path)
+    yield conn
+    conn.close()
+
+
+def seed_events(conn):
+    resume_id = conn.execute("INSERT INTO generated_resumes (user_id, resume_data) VALUES (1, '{}')").lastrowid
+    for age in ('-400 days', '-200 days', '-200 days', '-5 days'):
+        conn.execute("INSERT INTO logins (user_id, login_time) VALUES (1, datetime('now', ?))", (age,))
+        conn.execute("INSERT INTO resume_downloads (user_id, resume_id, downloaded_at) VALUES (1, ?, datetime('now', ?))",
+                     (resume_id, age))
+    conn.commit()
+
+
+def test_purge_keeps_recent_events_and_rollups(conn, tmp_path):
+    seed_events(conn)
+    totals_before = conn.execute('SELECT * FROM metric_totals ORDER BY metric').fetchall()
+    daily_before = conn.execute('SELECT * FROM metric_daily ORDER BY metric, day').fetchall()
+
+    results = run_retention(conn, days=30, chunk_size=2, archive_dir=str(tmp_path / 'archive'))
+
+    assert results == {'logins': 3, 'resume_downloads': 3}
+    assert conn.execute('SELECT COUNT(*) FROM logins').fetchone()[0] == 1
+    assert conn.execute('SELECT COUNT(*) FROM resume_downloads').fetchone()[0] == 1
+    assert conn.execute('SELECT * FROM metric_totals ORDER BY metric').fetchall() == totals_before
+    assert conn.execute('SELECT * FROM metric_daily ORDER BY metric, day').fetchall() == daily_before
+    assert conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2
+
+    archived = {}
+    for path in (tmp_path / 'archive').iterdir():
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            archived[path.name.split('-')[0]] = [json.loads(line) for line in f]
+    assert sorted(archived) == ['logins', 'resume_downloads']
+    assert all(len(rows) == 3 for rows in archived.values())
+
+
+def test_purge_restores_missing_daily_rollups(conn):
+    seed_events(conn)
+    conn.execute("DELETE FROM metric_daily WHERE metric = 'logins'")
+    conn.commit()
+
+    run_retention(conn, days=30)
+
+    days = conn.execute("SELECT day, value FROM metric_daily WHERE metric = 'logins' ORDER BY day").fetchall()
+    assert [row[1] for row in days] == [1, 2]
+
+
+def test_purge_frees_pages_without_a_full_vacuum(conn):
+    seed_events(conn)
+    conn.execute('CREATE TABLE scratch (x)')
+    conn.execute('INSERT INTO scratch VALUES (randomblob(1000000))')
+    conn.commit()
+    conn.execute('DROP TABLE scratch')
+    conn.commit()
+    assert conn.execute('PRAGMA freelist_count').fetchone()[0] > 200
+    run_retention(conn, days=30)
+    assert conn.execute('PRAGMA freelist_count').fetchone()[0] == 0
+
+
+def test_existing_databases_convert_only_through_the_maintenance_command(tmp_path, monkeypatch):
+    path = str(tmp_path / 'legacy.db')
+    legacy = sqlite3.connect(path)  # created before new files got incremental auto_vacuum
+    legacy.execute('CREATE TABLE legacy (x)')
+    legacy.commit()
+    legacy.close()
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    conn = db.connect(path)
+    seed_events(conn)
+    run_retention(conn, days=30)
+    assert conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 0  # purge never rebuilds the file
+    conn.close()
+
+    result = rezumai.app.test_cli_runner().invoke(args=['enable-incremental-vacuum'])
+    assert 'Converted' in result.output
+    conn = db.connect(path)
+    assert conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2
+    conn.close()
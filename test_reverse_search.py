@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+import db
+import app as rezumai
+import analysis_store
+import reverse_search
+from analysis.bitsets import bitmap
+
+RESUMES = [
+    'Backend engineer: python, django, postgresql, docker and kubernetes on aws.',
+    'Frontend developer: javascript, react, css and html. Some python scripting.',
+    'Nurse with radiology experience and patient care.',
+    'Python developer building django apps, docker images and aws deployments for zebrafish research labs.',
+]
+JOB = 'We are hiring a python engineer to build django services with docker on aws, ideally for zebrafish research.'
+
+
+@pytest.fixture(params=['sqlite', 'server'])
+def conn(request, tmp_path, monkeypatch):
+    # On a server database (no FTS5) the ranking is the skill part alone
+    path = str(tmp_path / 'rezumai_test.db') if request.param == 'sqlite' else request.getfixturevalue('server_database')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    conn = db.connect(path)
+    cursor = conn.cursor()
+    for text in RESUMES:
+        cursor.execute("INSERT INTO uploaded_resumes (user_id, filename, filepath, resume_text) VALUES (1, 'cv.pdf', '', ?)",
+                       (text,))
+        analysis_store.store_analysis(cursor, analysis_store.UPLOADED, cursor.lastrowid, analysis_store.analyze_text(text))
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def ranked_ids(conn, index, text=JOB, limit=10):
+    return [resume_id for resume_id, _, _ in reverse_search.rank_resumes(conn.cursor(), index, text, limit)[0]]
+
+
+def test_ranks_by_skill_overlap_and_text(conn):
+    ranked, skills = reverse_search.rank_resumes(conn.cursor(), reverse_search.SkillIndex(), JOB, limit=3)
+    assert {'python', 'django', 'docker', 'aws'} <= set(skills)
+    # 4 has every skill and mentions zebrafish; 1 misses research
+    assert [resume_id for resume_id, _, _ in ranked] == [4, 1, 2]
+    assert 0 < ranked[-1][1] < ranked[0][1] <= 1
+
+
+def test_pruned_top_k_matches_scoring_everything():
+    rng = random.Random(3)
+    skills = [f'skill{i}' for i in range(30)]
+    index = reverse_search.SkillIndex()
+    index.avgdl = 100.0
+    vectors = {}
+    for resume_id in range(1, 401):
+        vectors[resume_id] = {s: rng.randint(1, 4) for s in rng.sample(skills, rng.randint(0, 10))}
+        index.docs[resume_id] = resume_id
+        index.seq_of[resume_id] = resume_id
+    index.live = bitmap(list(index.docs))
+    for skill in skills:
+        pairs = [(rid, tf * 2.2 / (tf + 1.2 * 0.25 + 1.2 * 0.75)) for rid, vector in vectors.items()
+                 for s, tf in vector.items() if s == skill]
+        index.postings[skill] = reverse_search.Postings()
+        index.postings[skill].extend(pairs)
+
+    for _ in range(20):
+        query = rng.sample(skills, rng.randint(1, 8))
+        text_scores = {rng.randint(1, 400): rng.random() * 5 for _ in range(5)}
+        top = index.top(query, text_scores, 3.0, 10)
+
+        idfs = {s: reverse_search.idf(400, len(index.postings[s].seqs)) for s in query}
+        ceiling = (sum(idfs.values()) + 3.0) * 2.2
+        expected = sorted((
+            (0.6 * sum(s in vectors[rid] for s in query) / len(query)
+             + 0.4 * (sum(idfs[s] * index.postings[s].weights[list(index.postings[s].seqs).index(rid)]
+                          for s in query if s in vectors[rid]) + text_scores.get(rid, 0.0)) / ceiling, rid)
+            for rid in vectors), reverse=True)[:10]
+        assert [(round(score, 9), rid) for score, rid, _ in top] == [(round(score, 9), rid) for score, rid in expected]
+
+
+def test_refresh_picks_up_new_and_reindexed_resumes(conn):
+    index = reverse_search.SkillIndex()
+    assert ranked_ids(conn, index, 'nurse radiology', limit=1) == [3]
+
+    cursor = conn.cursor()
+    cursor.execute('UPDATE uploaded_resumes SET resume_text = ? WHERE resume_id = 3', ('Accountant using excel.',))
+    analysis_store.store_analysis(cursor, analysis_store.UPLOADED, 3, analysis_store.analyze_text('Accountant using excel.'))
+    text = 'Radiology nurse and medical doctor.'
+    cursor.execute("INSERT INTO uploaded_resumes (user_id, filename, filepath, resume_text) VALUES (1, 'new.pdf', '', ?)",
+                   (text,))
+    analysis_store.store_analysis(cursor, analysis_store.UPLOADED, 5, analysis_store.analyze_text(text))
+    conn.commit()
+
+    assert ranked_ids(conn, index, 'nurse radiology') == [5]
+    assert ranked_ids(conn, index, 'excel') == [3]
+    assert index.dead == 1 and len(index.docs) == 5
+
+
+def test_endpoint_is_admin_only(conn):
+    client = rezumai.app.test_client()
+    assert client.post('/admin/reverse_search', json={'job_description': JOB}).status_code == 401
+
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+        session['is_admin'] = True
+    assert client.post('/admin/reverse_search', json={}).status_code == 400
+    response = client.post('/admin/reverse_search', json={'job_description': JOB, 'k': 2})
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['resume_id'] for r in results] == [4, 1]
+    assert results[0]['matched_skills'] == ['aws', 'django', 'docker', 'python', 'research']
+
+
+def test_deleted_uploads_leave_the_search(conn):
+    index = reverse_search.SkillIndex()
+    assert ranked_ids(conn, index)[0] == 4
+    conn.execute('DELETE FROM uploaded_resumes WHERE resume_id = 4')
+    conn.commit()
+
+    assert 4 not in ranked_ids(conn, index)
+    assert 4 not in ranked_ids(conn, reverse_search.SkillIndex())
+    assert conn.execute('SELECT COUNT(*) FROM resume_skill_postings WHERE resume_id = 4').fetchone()[0] == 0
+    if conn.dialect.full_text_search:
+        assert conn.execute("SELECT COUNT(*) FROM resume_fts WHERE resume_fts MATCH 'zebrafish'").fetchone()[0] == 0
+    assert len(index.docs) == 3
+
+    conn.execute('DELETE FROM uploaded_resumes')
+    conn.commit()
+    assert ranked_ids(conn, index) == ranked_ids(conn, reverse_search.SkillIndex()) == []
+
+
+def test_migration_drops_postings_of_uploads_deleted_before_it(conn):
+    from migrations import v013_reverse_search_deletes as v013
+    conn.execute('INSERT INTO resume_skill_docs (resume_id, length) VALUES (99, 10)')
+    conn.execute("INSERT INTO resume_skill_postings (skill, resume_id, tf) VALUES ('python', 99, 1)")
+    v013.upgrade(conn)
+    conn.commit()
+    assert conn.execute('SELECT COUNT(*) FROM resume_skill_postings WHERE resume_id = 99').fetchone()[0] == 0
+    assert conn.execute('SELECT length FROM resume_skill_docs WHERE resume_id = 99').fetchone()[0] == v013.DELETED
+    index = reverse_search.SkillIndex()
+    index.refresh(conn.cursor())
+    assert 99 not in index.seq_of and len(index.docs) == 4
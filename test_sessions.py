@@ -0,0 +1,93 @@
+import pytest
+
+import db
+import app as rezumai
+from sessions import DatabaseSessionInterface
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    monkeypatch.setattr(rezumai.app, 'session_interface', DatabaseSessionInterface())
+    rezumai.init_db()
+    return rezumai.app.test_client()
+
+
+def session_rows():
+    conn = db.connect(rezumai.app.config['DATABASE'])
+    try:
+        return conn.execute('SELECT id, data FROM sessions').fetchall()
+    finally:
+        conn.close()
+
+
+def test_session_is_stored_server_side_and_shared(client):
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+        session['is_admin'] = True
+
+    rows = session_rows()
+    assert len(rows) == 1 and '"user_id":1' in rows[0]['data']
+    cookie = client.get_cookie('session').value
+    assert 'user_id' not in cookie and rows[0]['id'] in cookie
+
+    # another worker only needs the cookie
+    other = rezumai.app.test_client()
+    other.set_cookie('session', cookie)
+    assert other.get('/admin_metrics').status_code == 200
+
+
+def test_tampered_cookie_is_ignored(client):
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+        session['is_admin'] = True
+    forged = rezumai.app.test_client()
+    forged.set_cookie('session', session_rows()[0]['id'] + '.forged')
+    assert forged.get('/admin_metrics').status_code == 401
+
+
+def test_logout_clears_the_stored_session(client):
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    client.get('/logout')
+    assert all('user_id' not in row['data'] for row in session_rows())
+    with client.session_transaction() as session:
+        session.clear()
+    assert session_rows() == []
+
+
+def test_login_issues_a_new_session_id(client):
+    # An attacker's anonymous session, planted in the victim's browser
+    with client.session_transaction() as session:
+        session['reset_email'] = 'admin@rezum.ai'
+    planted = client.get_cookie('session').value
+    [(planted_sid, _)] = session_rows()
+
+    response = client.post('/login', data={'email': 'admin@rezum.ai', 'password': 'Admin@123'})
+    assert response.status_code == 302
+    cookie = client.get_cookie('session').value
+    assert cookie != planted
+    [(sid, data)] = session_rows()
+    assert sid != planted_sid and '"user_id":1' in data
+
+    attacker = rezumai.app.test_client()
+    attacker.set_cookie('session', planted)
+    assert attacker.get('/admin_metrics').status_code == 401
+
+
+def test_unchanged_identity_keeps_the_session_id(client):
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    [(sid, _)] = session_rows()
+    with client.session_transaction() as session:
+        session['user_name'] = 'Admin'
+    assert [row['id'] for row in session_rows()] == [sid]
+
+
+def test_secret_key_is_stable(tmp_path, monkeypatch):
+    monkeypatch.delenv('SECRET_KEY', raising=False)
+    first = rezumai.load_secret_key(str(tmp_path))
+    assert first == rezumai.load_secret_key(str(tmp_path))
+    monkeypatch.setenv('SECRET_KEY', 'from-env')
+    assert rezumai.load_secret_key(str(tmp_path)) == 'from-env'
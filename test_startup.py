@@ -0,0 +1,52 @@
+import os
+import sys
+import subprocess
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Loaded on first use (upload parsing, PDF rendering, template rendering), never by `import app`
+LAZY_MODULES = ('pdfplumber', 'pdfminer', 'docx', 'reportlab', 'flask_babel', 'babel')
+
+# Import time app.py may add on top of Flask's own, as a fraction of it (so
+# the budget holds on slow and fast machines alike). With -X importtime
+# app.py added 1.1-1.5x Flask's import time while it imported pdfplumber,
+# docx, ReportLab and Flask-Babel eagerly, and 0.2-0.3x after.
+IMPORT_BUDGET = 0.75
+
+
+def import_time_us(statement):
+    """Best-of-three total import time (microseconds) of ``statement`` in a fresh interpreter."""
+    best = None
+    for _ in range(3):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                                cwd=ROOT, capture_output=True, text=True, check=True)
+        total = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line.split('|')
+            if not name.startswith('   '):  # top-level imports only; nested ones are in their cumulative
+                total += int(cumulative)
+        best = total if best is None else min(best, total)
+    return best
+
+
+def test_heavy_libraries_are_not_imported_at_startup():
+    result = subprocess.run(
+        [sys.executable, '-c', f'import sys, app; print(",".join(m for m in {LAZY_MODULES!r} if m in sys.modules))'],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
+
+
+def test_import_time_budget():
+    framework = import_time_us('import flask, werkzeug.security')
+    total = import_time_us('import app')
+    assert total - framework < IMPORT_BUDGET * framework, (
+        f"import app took {total / 1000:.0f} ms, {framework / 1000:.0f} ms of it Flask")
+
+
+def test_babel_is_set_up_on_first_request():
+    import app as rezumai
+    response = rezumai.app.test_client().get('/')
+    assert response.status_code == 200 and b'Welcome' in response.data
+    assert rezumai.babel is not None
@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+import db
+import app as rezumai
+from analysis import tailoring, extract_text_from_resume, skill_vector
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+JOB = 'We need a Python developer with Django, Docker and Kubernetes experience to build microservices.'
+
+
+def test_jd_vector_weights_rare_catalogue_terms_higher():
+    vector = tailoring.build_jd_vector(JOB)
+    assert set(vector['skills']) == {'python', 'django', 'docker', 'kubernetes', 'microservices'}
+    assert sum(vector['skills'].values()) == pytest.approx(1)
+    # python appears in more catalogue jobs than kubernetes
+    assert vector['skills']['kubernetes'] > vector['skills']['python']
+    assert 'need' not in vector['terms'] and 'developer' in vector['terms']
+
+
+def test_jd_vectors_are_cached_by_hash(monkeypatch):
+    built = []
+    monkeypatch.setattr(tailoring, 'build_jd_vector', lambda text: built.append(text) or {'skills': {}, 'terms': {}})
+    monkeypatch.setattr(tailoring, '_vectors', type(tailoring._vectors)())
+
+    first = tailoring.jd_vector(JOB)
+    assert tailoring.jd_vector('  ' + JOB.upper().replace(' ', '\n')) is first
+    assert len(built) == 1
+
+
+def test_tailored_score_rewards_the_postings_skills():
+    text = extract_text_from_resume(os.path.join(ROOT, 'CV_John_Doe.pdf'))
+    skills, _ = skill_vector(text)
+    jd = tailoring.jd_vector(JOB)
+    score = tailoring.tailored_score(text, skills, jd)
+    assert 'python' in score['matched_skills'] and 'django' in score['missing_skills']
+
+    better = tailoring.tailored_score(text, set(skills) | {'django', 'kubernetes'}, jd)
+    assert better['match'] > score['match'] and better['ats_score'] >= score['ats_score']
+    assert tailoring.tailored_score(text, skills, jd, content_score=0)['ats_score'] < score['ats_score']
+
+
+def test_endpoint_scores_the_users_resume(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rezumai_test.db')
+    monkeypatch.setitem(rezumai.app.config, 'DATABASE', path)
+    rezumai.init_db()
+    conn = db.connect(path)
+    conn.execute("INSERT INTO uploaded_resumes (user_id, filename, filepath) VALUES (1, 'cv.pdf', ?)",
+                 (os.path.join(ROOT, 'CV_John_Doe.pdf'),))
+    conn.commit()
+    conn.close()
+
+    client = rezumai.app.test_client()
+    assert client.post('/tailored_score', json={'job_description': JOB}).status_code == 401
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+
+    response = client.post('/tailored_score', json={'job_description': JOB})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['resume'] == {'source': 'uploaded', 'id': 1} and 'python' in data['matched_skills']
+    assert data['jd_key'] == tailoring.jd_key(JOB)
+    assert client.post('/tailored_score', json={'job_description': JOB, 'resume_id': 2}).status_code == 404
@@ -0,0 +1,37 @@
+from analysis import implied_skills, tailored_score
+from analysis.ats import predict_job_roles_with_scores
+from analysis.bitsets import SkillIds
+from analysis.taxonomy import SkillTaxonomy, transitive_closure, implication_edges
+
+TAXONOMY = {
+    'implies': {'django': ['python'], 'pandas': ['python', 'data analysis']},
+    'parents': {'mysql': 'sql', 'sql': 'databases'},
+    'aliases': {'ml': 'machine learning'},
+}
+
+
+def test_closure_follows_every_kind_of_edge():
+    closure = transitive_closure(implication_edges(TAXONOMY))
+    assert closure['pandas'] == {'pandas', 'python', 'data analysis'}
+    assert closure['mysql'] == {'mysql', 'sql', 'databases'}
+    assert closure['ml'] == closure['machine learning'] == {'ml', 'machine learning'}
+    assert 'python' not in closure
+
+
+def test_expand_ors_the_precomputed_closures():
+    # 'databases' is outside the vocabulary: it still links, but has no bit
+    ids = SkillIds(['django', 'python', 'pandas', 'data analysis', 'mysql', 'sql', 'ml', 'machine learning'])
+    taxonomy = SkillTaxonomy(ids, TAXONOMY)
+    assert ids.decode(taxonomy.expand(ids.bits(['django', 'mysql']))) == ['django', 'mysql', 'python', 'sql']
+    assert ids.decode(taxonomy.expand(ids.bits(['python']))) == ['python']
+    assert taxonomy.expand(0) == 0
+
+
+def test_implied_skills_are_no_longer_missing():
+    assert {'python', 'data analysis'} <= set(implied_skills(['pandas']))
+    python_role = next(r for r in predict_job_roles_with_scores(['django'], 'django')
+                       if r['role'] == 'Python Developer')
+    assert 'python' in python_role['matched_skills'] and 'python' not in python_role['missing_skills']
+
+    jd = {'skills': {'python': 0.5, 'django': 0.5}, 'terms': {}}
+    assert tailored_score('Built django apps.', ['django'], jd, content_score=0)['missing_skills'] == []
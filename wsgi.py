@@ -0,0 +1,14 @@
+"""
+WSGI entry point for production:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+create_app() initialises the database once, in the gunicorn master. To run
+migrations as a separate deploy step instead, use ``flask --app app init-db``
+and start with INIT_DB_ON_START=0.
+"""
+import os
+
+from app import create_app
+
+app = create_app({'INIT_DB_ON_START': os.environ.get('INIT_DB_ON_START', '1') != '0'})